@@ -0,0 +1,69 @@
+"""Add document identity and chunk content hashes to the knowledge base
+
+Revision ID: 20261018_knowledge_hashes
+Revises: 20250127_storage_configs
+Create Date: 2026-10-18
+
+Enables incremental re-ingestion: documents are identified by (source, path)
+and only chunks whose content hash changed are re-embedded.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261018_knowledge_hashes'
+down_revision = '20250127_storage_configs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add path/content_hash columns and supporting indexes."""
+
+    op.add_column(
+        'knowledge_documents',
+        sa.Column(
+            'path',
+            sa.String(1024),
+            nullable=True,
+            comment='Document path used as identity within a source',
+        ),
+    )
+    op.add_column(
+        'knowledge_documents',
+        sa.Column(
+            'content_hash',
+            sa.String(64),
+            nullable=True,
+            comment='SHA-256 of the full document content',
+        ),
+    )
+    op.create_unique_constraint(
+        'uq_knowledge_documents_source_path',
+        'knowledge_documents',
+        ['source', 'path'],
+    )
+
+    # Existing chunks keep a NULL hash and are re-embedded on their next ingestion
+    op.add_column(
+        'knowledge_chunks',
+        sa.Column(
+            'content_hash', sa.String(64), nullable=True, comment='SHA-256 of the chunk content'
+        ),
+    )
+    op.create_index(
+        'ix_knowledge_chunks_document_id',
+        'knowledge_chunks',
+        ['document_id'],
+    )
+
+
+def downgrade() -> None:
+    """Drop knowledge identity and hash columns."""
+
+    op.drop_index('ix_knowledge_chunks_document_id', table_name='knowledge_chunks')
+    op.drop_column('knowledge_chunks', 'content_hash')
+    op.drop_constraint('uq_knowledge_documents_source_path', 'knowledge_documents', type_='unique')
+    op.drop_column('knowledge_documents', 'content_hash')
+    op.drop_column('knowledge_documents', 'path')
@@ -0,0 +1,140 @@
+"""Add write-behind task replication outbox, cursors and external refs
+
+Revision ID: 20261019_task_replication
+Revises: 20261018_knowledge_hashes
+Create Date: 2026-10-19
+
+Task changes are logged in task_replication_outbox and replicated to each
+storage backend by the scheduler worker, which tracks progress per backend.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_task_replication'
+down_revision = '20261018_knowledge_hashes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create outbox, cursor and external reference tables."""
+
+    op.create_table(
+        'task_replication_outbox',
+        sa.Column(
+            'id',
+            sa.Integer,
+            primary_key=True,
+            autoincrement=True,
+            comment='Log sequence number',
+        ),
+        sa.Column(
+            'task_id',
+            sa.Integer,
+            nullable=False,
+            comment='Task id (no FK: deletes stay replayable)',
+        ),
+        sa.Column('operation', sa.String(10), nullable=False, comment='create, update or delete'),
+        sa.Column(
+            'user_id',
+            sa.String(64),
+            nullable=True,
+            comment='Owner whose storage configs receive the change',
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('NOW()'),
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('NOW()'),
+        ),
+        comment='Write-behind log of task changes awaiting replication'
+    )
+    op.create_index('ix_task_replication_outbox_task_id', 'task_replication_outbox', ['task_id'])
+
+    op.create_table(
+        'task_replication_cursors',
+        sa.Column('config_id', sa.String(64), primary_key=True, comment='user_storage_configs.id'),
+        sa.Column('adapter_name', sa.String(50), nullable=False),
+        sa.Column(
+            'last_outbox_id',
+            sa.Integer,
+            nullable=False,
+            server_default=sa.text('0'),
+            comment='Last outbox id replicated to this backend',
+        ),
+        sa.Column('last_success_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            'failures',
+            sa.Integer,
+            nullable=False,
+            server_default=sa.text('0'),
+            comment='Consecutive failed batches',
+        ),
+        sa.Column(
+            'next_attempt_at',
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment='Backoff deadline after a failure',
+        ),
+        sa.Column('last_error', sa.String(500), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('NOW()'),
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('NOW()'),
+        ),
+        comment='Replication progress per storage backend config'
+    )
+
+    op.create_table(
+        'task_external_refs',
+        sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column('task_id', sa.Integer, nullable=False),
+        sa.Column('config_id', sa.String(64), nullable=False),
+        sa.Column('adapter_name', sa.String(50), nullable=False),
+        sa.Column(
+            'external_id',
+            sa.String(255),
+            nullable=False,
+            comment='Id assigned by the storage backend',
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('NOW()'),
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('NOW()'),
+        ),
+        sa.UniqueConstraint('task_id', 'config_id', name='uq_task_external_refs_task_config'),
+        comment='External ids of tasks per storage backend config'
+    )
+    op.create_index('ix_task_external_refs_task_id', 'task_external_refs', ['task_id'])
+
+
+def downgrade() -> None:
+    """Drop replication tables."""
+
+    op.drop_index('ix_task_external_refs_task_id', table_name='task_external_refs')
+    op.drop_table('task_external_refs')
+    op.drop_table('task_replication_cursors')
+    op.drop_index('ix_task_replication_outbox_task_id', table_name='task_replication_outbox')
+    op.drop_table('task_replication_outbox')
@@ -0,0 +1,49 @@
+"""Add last replicated projection to task external refs
+
+Revision ID: 20261020_task_ref_projection
+Revises: 20261019_task_replication
+Create Date: 2026-10-20
+
+The replicator stores the hash and values of the fields each backend holds,
+so updates that change nothing it stores are skipped and the others only
+send the changed properties.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261020_task_ref_projection'
+down_revision = '20261019_task_replication'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add content_hash and projection columns."""
+
+    op.add_column(
+        'task_external_refs',
+        sa.Column(
+            'content_hash',
+            sa.String(64),
+            nullable=True,
+            comment='SHA-256 of the last replicated projection',
+        ),
+    )
+    op.add_column(
+        'task_external_refs',
+        sa.Column(
+            'projection',
+            sa.JSON,
+            nullable=True,
+            comment='Field values last replicated to the backend',
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop content_hash and projection columns."""
+
+    op.drop_column('task_external_refs', 'projection')
+    op.drop_column('task_external_refs', 'content_hash')
@@ -0,0 +1,38 @@
+"""Track spreadsheet modifiedTime in Google Sheets sync state
+
+Revision ID: 20261021_sheets_sync_probe
+Revises: 20261020_task_ref_projection
+Create Date: 2026-10-21
+
+The sheets sync job probes the Drive modifiedTime before reading rows and
+skips the read when the spreadsheet has not changed since the last sync.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261021_sheets_sync_probe'
+down_revision = '20261020_task_ref_projection'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add source_modified_time column."""
+
+    op.add_column(
+        'sheets_sync_state',
+        sa.Column(
+            'source_modified_time',
+            sa.String(64),
+            nullable=True,
+            comment='Drive modifiedTime seen by the last complete sync',
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop source_modified_time column."""
+
+    op.drop_column('sheets_sync_state', 'source_modified_time')
@@ -0,0 +1,72 @@
+"""Add indexes for ProactivityEngine jobs, the brief and list queries
+
+Revision ID: 20261022_query_indexes
+Revises: 20261021_sheets_sync_probe
+Create Date: 2026-10-22
+
+- ix_tasks_open_due_at: partial index on open tasks (todo, in_progress) by
+  due_at, for check_deadlines, check_overdue, event_reminders and the brief.
+- ix_tasks_due_date_id: keyset pagination of GET /tasks?sort=due_date.
+- ix_events_start_at: upcoming events in the brief.
+- ix_conversation_messages_conversation_id_id: history of one conversation.
+
+Indexes are built CONCURRENTLY on PostgreSQL so large tables stay writable.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261022_query_indexes'
+down_revision = '20261021_sheets_sync_probe'
+branch_labels = None
+depends_on = None
+
+OPEN_TASKS = sa.text("status IN ('todo', 'in_progress')")
+
+
+def upgrade() -> None:
+    """Create query indexes."""
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_open_due_at',
+            'tasks',
+            ['due_at', 'id'],
+            postgresql_where=OPEN_TASKS,
+            sqlite_where=OPEN_TASKS,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_tasks_due_date_id',
+            'tasks',
+            ['due_date', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_events_start_at',
+            'events',
+            ['start_at'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_conversation_messages_conversation_id_id',
+            'conversation_messages',
+            ['conversation_id', 'id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop query indexes."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_conversation_messages_conversation_id_id',
+            table_name='conversation_messages',
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_events_start_at', table_name='events', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_due_date_id', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_open_due_at', table_name='tasks', postgresql_concurrently=True)
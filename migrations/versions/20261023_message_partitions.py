@@ -0,0 +1,140 @@
+"""Partition message tables by month of created_at
+
+Revision ID: 20261023_message_partitions
+Revises: 20261022_query_indexes
+Create Date: 2026-10-23
+
+PostgreSQL only. channel_messages, conversation_messages and
+message_embeddings become RANGE partitioned on created_at:
+
+- The existing table is attached as <table>_before_pYYYY_MM, covering every
+  row before the current month, so no data is copied.
+- Partitions for the current and next two months are created, plus a
+  <table>_default partition. The scheduler creates later months.
+- The primary key becomes (id, created_at), as PostgreSQL requires the
+  partition key in unique constraints; ids still come from one sequence.
+- message_embeddings loses its foreign key and unique constraint on
+  message_id (neither can span partitions); an index on message_id remains.
+
+Other databases are left unchanged (SQLite rolls old months into separate
+tables at runtime, see app.infrastructure.database.partitions).
+"""
+
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261023_message_partitions'
+down_revision = '20261022_query_indexes'
+branch_labels = None
+depends_on = None
+
+TABLES = ('channel_messages', 'conversation_messages', 'message_embeddings')
+MONTHS_AHEAD = 2
+
+# Secondary indexes re-created on each partitioned parent
+INDEXES = {
+    'conversation_messages': [
+        ('ix_conversation_messages_conversation_id_id', ['conversation_id', 'id']),
+    ],
+    'message_embeddings': [('ix_message_embeddings_message_id', ['message_id'])],
+}
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def upgrade() -> None:
+    """Convert message tables to monthly partitions."""
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    now = datetime.now(UTC)
+    cutover = datetime(now.year, now.month, 1, tzinfo=UTC)
+
+    op.execute(
+        'ALTER TABLE message_embeddings '
+        'DROP CONSTRAINT IF EXISTS message_embeddings_message_id_fkey'
+    )
+    op.execute(
+        'ALTER TABLE message_embeddings '
+        'DROP CONSTRAINT IF EXISTS message_embeddings_message_id_key'
+    )
+
+    for table in TABLES:
+        legacy = f'{table}_before_p{cutover:%Y_%m}'
+        sequence = bind.execute(sa.text(f"SELECT pg_get_serial_sequence('{table}', 'id')")).scalar()
+
+        # Free the index names for the new parent table
+        op.execute(f'ALTER TABLE {table} RENAME TO {legacy}')
+        index_names = bind.execute(
+            sa.text('SELECT indexname FROM pg_indexes WHERE tablename = :table'), {'table': legacy}
+        ).scalars().all()
+        for index_name in index_names:
+            op.execute(f'ALTER INDEX {index_name} RENAME TO {(legacy + "_" + index_name)[:63]}')
+
+        # Table names come from TABLES, never from user input
+        op.execute(
+            f'UPDATE {legacy} SET created_at = COALESCE(updated_at, now()) '  # noqa: S608
+            'WHERE created_at IS NULL'
+        )
+        op.execute(f'ALTER TABLE {legacy} ALTER COLUMN created_at SET NOT NULL')
+
+        op.execute(
+            f'CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING COMMENTS) '
+            'PARTITION BY RANGE (created_at)'
+        )
+        op.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)')
+        if sequence:
+            # The sequence must outlive the legacy partition once it is archived
+            op.execute(f'ALTER SEQUENCE {sequence} OWNED BY {table}.id')
+
+        op.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {legacy} "
+            f"FOR VALUES FROM (MINVALUE) TO ('{cutover.isoformat()}')"
+        )
+        for offset in range(MONTHS_AHEAD + 1):
+            month = _add_months(cutover, offset)
+            op.execute(
+                f'CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} '
+                f"FOR VALUES FROM ('{month.isoformat()}') "
+                f"TO ('{_add_months(month, 1).isoformat()}')"
+            )
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+        for index_name, columns in INDEXES.get(table, []):
+            op.create_index(index_name, table, columns)
+
+
+def downgrade() -> None:
+    """Copy partitioned message tables back into plain tables."""
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    for table in TABLES:
+        sequence = bind.execute(sa.text(f"SELECT pg_get_serial_sequence('{table}', 'id')")).scalar()
+        op.execute(
+            f'CREATE TABLE {table}_plain (LIKE {table} INCLUDING DEFAULTS INCLUDING COMMENTS)'
+        )
+        # Table names come from TABLES, never from user input
+        op.execute(f'INSERT INTO {table}_plain SELECT * FROM {table}')  # noqa: S608
+        if sequence:
+            op.execute(f'ALTER SEQUENCE {sequence} OWNED BY {table}_plain.id')
+        op.execute(f'DROP TABLE {table} CASCADE')
+        op.execute(f'ALTER TABLE {table}_plain RENAME TO {table}')
+        op.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id)')
+        for index_name, columns in INDEXES.get(table, []):
+            op.create_index(index_name, table, columns)
+
+    op.execute(
+        'ALTER TABLE message_embeddings ADD CONSTRAINT message_embeddings_message_id_fkey '
+        'FOREIGN KEY (message_id) REFERENCES channel_messages (id) ON DELETE CASCADE NOT VALID'
+    )
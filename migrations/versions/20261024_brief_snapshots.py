@@ -0,0 +1,63 @@
+"""Add materialized brief snapshot table
+
+Revision ID: 20261024_brief_snapshots
+Revises: 20261023_message_partitions
+Create Date: 2026-10-24
+
+Each brief section (pending tasks, upcoming events, recent conversations)
+is stored after a refresh, so workers start with a warm brief snapshot.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261024_brief_snapshots'
+down_revision = '20261023_message_partitions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create brief_snapshots table."""
+
+    op.create_table(
+        'brief_snapshots',
+        sa.Column(
+            'section',
+            sa.String(32),
+            primary_key=True,
+            comment='tasks, events or conversations',
+        ),
+        sa.Column(
+            'payload',
+            sa.JSON,
+            nullable=False,
+            comment='Section items as served by the brief',
+        ),
+        sa.Column(
+            'refreshed_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment='When the section was read from its source table',
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('NOW()'),
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('NOW()'),
+        ),
+        comment='Materialized brief sections'
+    )
+
+
+def downgrade() -> None:
+    """Drop brief_snapshots table."""
+
+    op.drop_table('brief_snapshots')
@@ -0,0 +1,49 @@
+"""Make message embeddings unique per message
+
+Revision ID: 20261025_message_embedding_unique
+Revises: 20261024_brief_snapshots
+Create Date: 2026-10-25
+
+20261023_message_partitions dropped the unique constraint on
+message_embeddings.message_id, which PostgreSQL cannot keep on a table
+partitioned by created_at. Embeddings now carry their message's created_at,
+so (message_id, created_at) identifies them, includes the partition key and
+backs the INSERT ... ON CONFLICT in upsert_message_embedding.
+
+Duplicates written in the meantime are removed (the newest row per message
+is kept) and existing rows take their message's created_at before the index
+is built.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261025_message_embedding_unique'
+down_revision = '20261024_brief_snapshots'
+branch_labels = None
+depends_on = None
+
+INDEX = 'uq_message_embeddings_message_id_created_at'
+
+
+def upgrade() -> None:
+    """Deduplicate message_embeddings and add the unique index."""
+
+    op.execute(
+        'DELETE FROM message_embeddings WHERE id NOT IN '
+        '(SELECT MAX(id) FROM message_embeddings GROUP BY message_id)'
+    )
+    op.execute(
+        'UPDATE message_embeddings SET created_at = '
+        '(SELECT m.created_at FROM channel_messages m WHERE m.id = message_embeddings.message_id) '
+        'WHERE EXISTS (SELECT 1 FROM channel_messages m '
+        'WHERE m.id = message_embeddings.message_id '
+        'AND m.created_at <> message_embeddings.created_at)'
+    )
+    op.create_index(INDEX, 'message_embeddings', ['message_id', 'created_at'], unique=True)
+
+
+def downgrade() -> None:
+    """Drop the unique index."""
+
+    op.drop_index(INDEX, table_name='message_embeddings')
@@ -0,0 +1,146 @@
+"""Per-operation cost of the hot repository inserts: ORM flush vs Core fast path.
+
+Usage::
+
+    DATABASE_URL=postgresql+asyncpg://... python scripts/benchmarks/hot_inserts.py --ops 5000
+
+Runs against the configured database inside transactions that are rolled back.
+Each operation inserts one channel message, one conversation message and one
+task, as ``IngestionService`` and ``TaskService`` do per incoming message.
+CPU time is measured on the event-loop thread only: it is the Python cost per
+insert, without the driver's round trip (aiosqlite runs SQLite in a thread).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime
+
+from app.config import get_settings
+from app.infrastructure.database.database import get_engine, get_session_factory
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.memory import ConversationMessage, ConversationRole
+from app.infrastructure.database.models.message import ChannelMessageORM
+from app.infrastructure.database.models.repositories import (
+    append_conversation_message,
+    create_task,
+    save_channel_message,
+)
+from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus
+from app.models.schemas import Channel, ChannelMessage, MessageType
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _payload(index: int) -> ChannelMessage:
+    return ChannelMessage(
+        channel=Channel.WEB,
+        sender="benchmark",
+        content=f"message {index}",
+        message_type=MessageType.FREE_TEXT,
+        created_at=datetime.now(UTC),
+        extra_data={"index": index},
+    )
+
+
+async def _orm(session: AsyncSession, index: int) -> None:
+    """The previous unit-of-work path: add the instance and flush."""
+
+    payload = _payload(index)
+    session.add(
+        ChannelMessageORM(
+            channel=payload.channel,
+            sender=payload.sender,
+            content=payload.content,
+            message_type=payload.message_type,
+            occurred_at=payload.created_at,
+            extra_data=payload.extra_data,
+        )
+    )
+    await session.flush()
+    session.add(
+        ConversationMessage(
+            conversation_id="benchmark",
+            channel="web",
+            sender="benchmark",
+            role=ConversationRole.USER,
+            content=payload.content,
+        )
+    )
+    await session.flush()
+    session.add(
+        TaskRecord(
+            title=payload.content,
+            description=None,
+            due_date=None,
+            channel="web",
+            sender="benchmark",
+            status=TaskStatus.TODO,
+            priority="medium",
+        )
+    )
+    await session.flush()
+
+
+async def _core(session: AsyncSession, index: int) -> None:
+    payload = _payload(index)
+    await save_channel_message(session, payload)
+    await append_conversation_message(
+        session,
+        conversation_id="benchmark",
+        channel="web",
+        sender="benchmark",
+        role=ConversationRole.USER,
+        content=payload.content,
+    )
+    await create_task(
+        session,
+        title=payload.content,
+        description=None,
+        due_at=None,
+        channel="web",
+        sender="benchmark",
+        status=TaskStatus.TODO,
+    )
+
+
+async def _run(ops: int, warmup: int) -> None:
+    async with get_engine().begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                ChannelMessageORM.__table__,
+                ConversationMessage.__table__,
+                TaskRecord.__table__,
+            ],
+        )
+
+    for name, operation in (("orm", _orm), ("core", _core)):
+        async with get_session_factory()() as session:
+            for index in range(warmup):
+                await operation(session, index)
+            started, cpu_started = time.perf_counter(), time.thread_time()
+            for index in range(ops):
+                await operation(session, index)
+            elapsed = time.perf_counter() - started
+            cpu = time.thread_time() - cpu_started
+            await session.rollback()
+        inserts = ops * 3
+        print(
+            f"{name:>5}: {ops} messages in {elapsed:.2f}s, "
+            f"{elapsed / inserts * 1e6:,.1f} µs wall / {cpu / inserts * 1e6:,.1f} µs CPU per insert"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=5_000)
+    parser.add_argument("--warmup", type=int, default=200)
+    args = parser.parse_args()
+    print(f"database: {get_settings().database_url.split('@')[-1]}")
+    asyncio.run(_run(args.ops, args.warmup))
+
+
+if __name__ == "__main__":
+    main()
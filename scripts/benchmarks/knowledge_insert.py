@@ -0,0 +1,67 @@
+"""Compare ORM and bulk insert paths for knowledge chunks.
+
+Usage::
+
+    DATABASE_URL=postgresql+asyncpg://... \
+        python scripts/benchmarks/knowledge_insert.py --chunks 100000
+
+Runs against the configured database inside a transaction that is rolled back.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+from app.config import get_settings
+from app.infrastructure.database.database import get_engine, get_session_factory
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.knowledge import KnowledgeChunkORM, KnowledgeDocumentORM
+from app.infrastructure.database.models.repositories import (
+    bulk_insert_knowledge_chunks,
+    create_knowledge_document,
+    insert_knowledge_chunks,
+)
+
+
+async def _run(total: int, batch_size: int, dimensions: int) -> None:
+    async with get_engine().begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[KnowledgeDocumentORM.__table__, KnowledgeChunkORM.__table__],
+        )
+
+    chunks = [
+        (index, f"chunk {index} " * 20, [random.random() for _ in range(dimensions)])
+        for index in range(total)
+    ]
+    for name, insert in (("orm", insert_knowledge_chunks), ("bulk", bulk_insert_knowledge_chunks)):
+        async with get_session_factory()() as session:
+            document = await create_knowledge_document(
+                session, title="benchmark", source="benchmark", metadata={}
+            )
+            started = time.perf_counter()
+            for start in range(0, total, batch_size):
+                await insert(
+                    session, document_id=document.id, chunks=chunks[start:start + batch_size]
+                )
+            await session.flush()
+            elapsed = time.perf_counter() - started
+            await session.rollback()
+        print(f"{name:>5}: {total} chunks in {elapsed:.2f}s ({total / elapsed:,.0f} chunks/s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    args = parser.parse_args()
+    print(f"database: {get_settings().database_url.split('@')[-1]}")
+    asyncio.run(_run(args.chunks, args.batch_size, args.dimensions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Check that the ProactivityEngine, brief and task list queries use their indexes.
+
+Usage::
+
+    DATABASE_URL=postgresql+asyncpg://... python scripts/benchmarks/query_indexes.py --rows 1000000
+
+Seeds ``--rows`` tasks (about 5% open) plus ``--related-rows`` events and
+conversation messages, refreshes planner statistics, then times each query
+and asserts that its plan uses the expected index rather than a full scan.
+Seeded rows are tagged with the ``benchmark`` channel and deleted at the end
+unless ``--keep`` is given. Run it against a throwaway database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import UTC, datetime, timedelta
+
+from app.config import get_settings
+from app.infrastructure.database.database import get_engine
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.events import EventRecord, EventStatus
+from app.infrastructure.database.models.memory import ConversationMessage, ConversationRole
+from app.infrastructure.database.models.repositories import dated_tasks_stmt, undated_tasks_stmt
+from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus, open_task_filter
+from app.workers.jobs import deadline_tasks_stmt, event_tasks_stmt, overdue_tasks_stmt
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+CHANNEL = "benchmark"
+BATCH_SIZE = 10_000
+
+
+def _tasks(count: int, now: datetime):
+    closed = [TaskStatus.COMPLETED.value, TaskStatus.CANCELLED.value, TaskStatus.PENDING.value]
+    for index in range(count):
+        is_open = random.random() < 0.05
+        due_at = now + timedelta(minutes=random.randint(-525_600, 525_600))
+        due_date = due_at if random.random() < 0.9 else None
+        yield {
+            "title": f"task {index}",
+            "status": random.choice(
+                [TaskStatus.TODO.value, TaskStatus.IN_PROGRESS.value] if is_open else closed
+            ),
+            "due_at": due_at if random.random() < 0.9 else None,
+            "due_date": due_date,
+            "channel": CHANNEL,
+            "sender": "benchmark",
+        }
+
+
+def _events(count: int, now: datetime):
+    for index in range(count):
+        yield {
+            "title": f"event {index}",
+            "start_at": now + timedelta(minutes=random.randint(-525_600, 525_600)),
+            "status": EventStatus.CONFIRMED,
+            "channel": CHANNEL,
+            "sender": "benchmark",
+        }
+
+
+def _messages(count: int):
+    for index in range(count):
+        yield {
+            "conversation_id": f"{CHANNEL}_{index % 1_000}",
+            "channel": CHANNEL,
+            "sender": "benchmark",
+            "role": ConversationRole.USER if index % 2 else ConversationRole.ASSISTANT,
+            "content": f"message {index}",
+        }
+
+
+async def _seed(conn: AsyncConnection, table, rows) -> None:
+    batch: list[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            await conn.execute(insert(table), batch)
+            batch = []
+    if batch:
+        await conn.execute(insert(table), batch)
+
+
+async def _plan(conn: AsyncConnection, stmt) -> str:
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    if conn.dialect.name == "postgresql":
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan = result.scalar_one()
+        return json.dumps(json.loads(plan) if isinstance(plan, str) else plan)
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+    return "\n".join(str(row[-1]) for row in result)
+
+
+async def _run(rows: int, related_rows: int, keep: bool) -> None:
+    tables = [TaskRecord.__table__, EventRecord.__table__, ConversationMessage.__table__]
+    now = datetime.now(UTC)
+    engine = get_engine()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+        started = time.perf_counter()
+        await _seed(conn, TaskRecord.__table__, _tasks(rows, now))
+        await _seed(conn, EventRecord.__table__, _events(related_rows, now))
+        await _seed(conn, ConversationMessage.__table__, _messages(related_rows))
+        print(f"seeded {rows:,} tasks in {time.perf_counter() - started:.1f}s")
+
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("ANALYZE")
+
+        queries = {
+            "check_deadlines": (
+                deadline_tasks_stmt(now, now + timedelta(hours=24)),
+                "ix_tasks_open_due_at",
+            ),
+            "check_overdue": (overdue_tasks_stmt(now), "ix_tasks_open_due_at"),
+            "event_reminders": (
+                event_tasks_stmt(now + timedelta(minutes=25), now + timedelta(minutes=35)),
+                "ix_tasks_open_due_at",
+            ),
+            "brief pending tasks": (
+                select(TaskRecord)
+                .where(open_task_filter())
+                .order_by(TaskRecord.due_at.nulls_last(), TaskRecord.id.desc())
+                .limit(20),
+                "ix_tasks_open_due_at",
+            ),
+            "brief upcoming events": (
+                select(EventRecord)
+                .where(EventRecord.start_at >= now)
+                .order_by(EventRecord.start_at.asc())
+                .limit(20),
+                "ix_events_start_at",
+            ),
+            # GET /tasks?sort=due_date, a page deep into each phase
+            "tasks by due date": (
+                dated_tasks_stmt(after=(now, 0)).limit(50),
+                "ix_tasks_due_date_id",
+            ),
+            "undated tasks": (
+                undated_tasks_stmt(after_id=rows // 2).limit(50),
+                "ix_tasks_due_date_id",
+            ),
+            "conversation history": (
+                select(ConversationMessage)
+                .where(ConversationMessage.conversation_id == f"{CHANNEL}_7")
+                .order_by(ConversationMessage.id.desc())
+                .limit(20),
+                "ix_conversation_messages_conversation_id_id",
+            ),
+        }
+
+        failures = []
+        for name, (stmt, index) in queries.items():
+            plan = await _plan(conn, stmt)
+            started = time.perf_counter()
+            count = len((await conn.execute(stmt)).all())
+            elapsed = (time.perf_counter() - started) * 1000
+            used = index in plan
+            print(f"{name:>22}: {count:>6} rows in {elapsed:8.2f}ms  {index}: {used}")
+            if not used:
+                failures.append(f"{name}:\n{plan}")
+
+    if not keep:
+        async with engine.begin() as conn:
+            for table in tables:
+                await conn.execute(delete(table).where(table.c.channel == CHANNEL))
+    await engine.dispose()
+
+    assert not failures, "queries not using their index:\n" + "\n".join(failures)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--related-rows", type=int, default=100_000)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows")
+    args = parser.parse_args()
+    print(f"database: {get_settings().database_url.split('@')[-1]}")
+    asyncio.run(_run(args.rows, args.related_rows, args.keep))
+
+
+if __name__ == "__main__":
+    main()
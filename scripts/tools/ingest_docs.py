@@ -8,40 +8,87 @@ from pathlib import Path
 
 import structlog
 
-from src.app.config import get_settings
-from src.app.core.database import get_session_factory
-from src.app.knowledge.ingestion import DocumentIngestionService
-from src.app.providers.embeddings import EmbeddingProvider
+from app.config import get_settings
+from app.domain.services.bulk_ingestion import (
+    DEFAULT_PATTERNS,
+    BulkIngestionRunner,
+    IngestionCheckpoint,
+    discover_documents,
+)
+from app.infrastructure.database.database import get_session_factory
+from app.infrastructure.embeddings import EmbeddingProvider
 
 logger = structlog.get_logger(__name__)
 
 
-async def _ingest_file(path: Path, source: str) -> None:
+async def _ingest(args: argparse.Namespace) -> None:
     settings = get_settings()
-    session_factory = get_session_factory()
     if not (settings.openai_api_key or settings.local_llm_url):
         raise RuntimeError("Embedding provider not configured. Set OPENAI_API_KEY ou LOCAL_LLM_URL.")
 
-    provider = EmbeddingProvider(settings)
+    files = discover_documents(args.paths, tuple(args.glob or DEFAULT_PATTERNS))
+    if not files:
+        raise SystemExit("No documents found")
 
-    async with session_factory() as session:
-        service = DocumentIngestionService(session=session, provider=provider)
-        text = path.read_text(encoding="utf-8")
-        result = await service.ingest_text(title=path.stem, source=source, text=text)
-        await session.commit()
-        logger.info("document_ingested", document_id=result.document_id, chunks=result.chunks_ingested)
+    concurrency = args.concurrency
+    if concurrency is None:
+        # SQLite serialises writers; concurrent sessions only add lock contention
+        concurrency = 1 if settings.database_url.startswith("sqlite") else 4
+
+    checkpoint = IngestionCheckpoint(args.checkpoint)
+    logger.info(
+        "bulk_ingestion_started",
+        documents=len(files),
+        already_checkpointed=len(checkpoint),
+        concurrency=concurrency,
+    )
+    runner = BulkIngestionRunner(
+        get_session_factory(),
+        EmbeddingProvider(settings),
+        source=args.source,
+        chunk_size=args.chunk_size,
+        concurrency=concurrency,
+        embedding_batch_size=args.batch_size,
+        process_workers=args.workers,
+        checkpoint=checkpoint,
+    )
+    stats = await runner.run(files)
+    print(
+        f"{stats.documents} documents ({stats.skipped} skipped, {stats.failed} failed), "
+        f"{stats.chunks_embedded} chunks embedded in {stats.elapsed:.1f}s — "
+        f"{stats.documents / stats.elapsed:.2f} docs/s, "
+        f"{(stats.chunks_embedded + stats.chunks_reused) / stats.elapsed:.2f} chunks/s"
+    )
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Ingest documents into SparkOne knowledge base")
-    parser.add_argument("path", type=Path, help="Path to a text/markdown file")
-    parser.add_argument("--source", default="local", help="Source identifier for the document")
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Files, directories (walked recursively) or glob expressions",
+    )
+    parser.add_argument("--source", default="local", help="Source identifier for the documents")
+    parser.add_argument(
+        "--glob",
+        action="append",
+        help="File pattern used when walking directories (repeatable, default *.md and *.txt)",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Chunking processes")
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="Documents embedded/persisted concurrently"
+    )
+    parser.add_argument("--chunk-size", type=int, default=400, help="Tokens per chunk")
+    parser.add_argument("--batch-size", type=int, default=64, help="Texts per embedding request")
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="JSON file recording finished documents so interrupted runs can resume",
+    )
     args = parser.parse_args()
 
-    if not args.path.exists():
-        raise SystemExit(f"File {args.path} not found")
-
-    asyncio.run(_ingest_file(args.path, args.source))
+    asyncio.run(_ingest(args))
 
 
 if __name__ == "__main__":
@@ -3,15 +3,23 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents.agno import AgnoBridge
 from app.agents.orchestrator import Orchestrator
 from app.channels import GoogleSheetsAdapter, MessageNormalizer, WebUIAdapter, WhatsAppAdapter
 from app.config import get_settings
-from app.infrastructure.database.database import get_session_factory
+from app.infrastructure.database.database import (
+    get_db_session,
+    get_read_session_factory,
+    get_session_factory,
+    get_writer_engine,
+)
+from app.infrastructure.database.sqlite_writer import SQLiteWriter
 from app.core.events import EventDispatcher, N8nWebhookSink
 from app.infrastructure.integrations.caldav import CalDAVClient
 from app.infrastructure.integrations.evolution_api import EvolutionAPIClient
@@ -20,12 +28,20 @@ from app.infrastructure.integrations.notion import NotionClient
 from app.infrastructure.chat import ChatProviderRouter
 from app.infrastructure.embeddings import EmbeddingProvider
 from app.domain.services.brief import BriefService
+from app.domain.services.brief_snapshot import BriefSnapshot
 from app.domain.services.calendar import CalendarService
 from app.domain.services.classification import ClassificationService
 from app.domain.services.embeddings import EmbeddingService
 from app.domain.services.ingestion import IngestionService
+from app.domain.services.ingestion_lanes import (
+    BULK_LANE,
+    INTERACTIVE_LANE,
+    IngestionLanes,
+    LaneConfig,
+)
 from app.domain.services.memory import MemoryService
 from app.domain.services.personal_coach import PersonalCoachService
+from app.domain.services.replication import TaskReplicator
 from app.domain.services.storage import StorageService
 from app.domain.services.tasks import TaskService
 from app.domain.services.whatsapp import WhatsAppService
@@ -41,32 +57,23 @@ def get_embedding_provider() -> EmbeddingProvider:
     return EmbeddingProvider(settings=get_settings())
 
 
-@lru_cache
-def _get_session_factory() -> async_sessionmaker[AsyncSession]:
-    return get_session_factory()
-
-
-async def get_ingestion_service():
-    session_factory = _get_session_factory()
-    session = session_factory()
-    try:
-        yield build_ingestion_service(session)
-        # Commit apenas se houver mudanças pendentes
-        if session.dirty or session.new or session.deleted:
-            await session.commit()
-    except Exception:
-        await session.rollback()
-        raise
-    finally:
-        await session.close()
+def get_ingestion_service(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> IngestionService:
+    # Shares the request's unit of work: endpoints that also depend on
+    # get_db_session get the same session, committed once at the end
+    return build_ingestion_service(session, commit=False)
 
 
 async def get_brief_service():
-    session_factory = _get_session_factory()
+    # Briefs only read: served by the replica when one is configured
+    session_factory = get_read_session_factory()
     session = session_factory()
     try:
         chat_provider = get_chat_provider()
-        yield BriefService(session=session, chat_provider=chat_provider)
+        yield BriefService(
+            session=session, chat_provider=chat_provider, snapshot=get_brief_snapshot()
+        )
         await session.commit()
     except Exception:
         await session.rollback()
@@ -81,12 +88,16 @@ __all__ = [
     "get_message_normalizer",
     "get_ingestion_service",
     "build_ingestion_service",
+    "get_ingestion_lanes",
+    "get_sqlite_writer",
+    "get_task_replicator",
     "get_evolution_client",
     "get_whatsapp_service",
     "get_notion_client",
     "get_google_calendar_client",
     "get_caldav_client",
     "get_brief_service",
+    "get_brief_snapshot",
 ]
 
 
@@ -120,6 +131,56 @@ def _get_event_dispatcher() -> EventDispatcher | None:
     return EventDispatcher(sinks=sinks)
 
 
+@lru_cache
+def get_ingestion_lanes() -> IngestionLanes | None:
+    settings = get_settings()
+    if not settings.ingestion_lanes_enabled:
+        return None
+    return IngestionLanes(
+        [
+            LaneConfig(
+                INTERACTIVE_LANE,
+                weight=settings.ingestion_interactive_weight,
+                workers=settings.ingestion_interactive_workers,
+                max_queue=settings.ingestion_lane_queue_size,
+            ),
+            LaneConfig(
+                BULK_LANE,
+                weight=settings.ingestion_bulk_weight,
+                workers=settings.ingestion_bulk_workers,
+                max_queue=settings.ingestion_lane_queue_size,
+            ),
+        ],
+        capacity=settings.ingestion_lane_capacity,
+    )
+
+
+@lru_cache
+def get_brief_snapshot() -> BriefSnapshot | None:
+    settings = get_settings()
+    if settings.brief_snapshot_max_age <= 0:
+        return None
+    return BriefSnapshot(
+        max_age=settings.brief_snapshot_max_age, session_factory=get_session_factory()
+    )
+
+
+@lru_cache
+def get_sqlite_writer() -> SQLiteWriter | None:
+    engine = get_writer_engine()
+    if engine is None:
+        return None
+    return SQLiteWriter(engine, max_batch=get_settings().database_sqlite_write_batch)
+
+
+@lru_cache
+def get_task_replicator() -> TaskReplicator:
+    return TaskReplicator(
+        get_session_factory(),
+        batch_size=get_settings().task_replication_batch_size,
+    )
+
+
 def get_embedding_provider_optional() -> EmbeddingProvider | None:
     settings = get_settings()
     if not settings.openai_api_key and not settings.local_llm_url:
@@ -135,7 +196,7 @@ def _get_agno_bridge() -> AgnoBridge | None:
     return AgnoBridge(chat_provider=chat_provider)
 
 
-def build_ingestion_service(session: AsyncSession) -> IngestionService:
+def build_ingestion_service(session: AsyncSession, *, commit: bool = True) -> IngestionService:
     chat_provider = get_chat_provider()
     agno = _get_agno_bridge()
     classification = _get_classification_service()
@@ -155,6 +216,7 @@ def build_ingestion_service(session: AsyncSession) -> IngestionService:
         session=session,
         storage_service=storage_service,
         user_id=None,  # Single-user mode for now
+        write_behind=settings.task_replication_enabled,
     )
     calendar_service = CalendarService(
         session=session,
@@ -179,6 +241,9 @@ def build_ingestion_service(session: AsyncSession) -> IngestionService:
         embedding_service=embedding_service,
         memory_service=memory_service,
         dispatcher=dispatcher,
+        lanes=get_ingestion_lanes(),
+        commit=commit,
+        writer=get_sqlite_writer(),
     )
 
 
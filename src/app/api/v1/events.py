@@ -9,7 +9,7 @@ from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.database.database import get_db_session
+from app.infrastructure.database.database import get_read_db_session
 from app.infrastructure.database.models.events import EventRecord, EventStatus
 
 router = APIRouter(prefix="/events", tags=["events"])
@@ -35,7 +35,7 @@ class EventResponse(BaseModel):
         )
 
 
-SessionDep = Depends(get_db_session)
+SessionDep = Depends(get_read_db_session)
 
 
 @router.get("/", response_model=list[EventResponse])
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Annotated
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
@@ -14,8 +16,20 @@ except ImportError:  # pragma: no cover - optional dependency absent
 
 from app.config import get_settings
 from app.infrastructure.database.database import get_db_session
-from app.api.dependencies import get_chat_provider, get_evolution_client, get_notion_client
-from app.models.schemas import HealthStatus, DatabaseHealthStatus, RedisHealthStatus
+from app.api.dependencies import (
+    get_chat_provider,
+    get_evolution_client,
+    get_notion_client,
+    get_task_replicator,
+)
+from app.domain.services.replication import TaskReplicator
+from app.models.schemas import (
+    DatabaseHealthStatus,
+    HealthStatus,
+    RedisHealthStatus,
+    ReplicationBackendStatus,
+    ReplicationHealthStatus,
+)
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -64,6 +78,25 @@ async def redis_health() -> RedisHealthStatus:
         await client.close()
 
 
+@router.get("/replication", response_model=ReplicationHealthStatus)
+async def replication_health(
+    replicator: Annotated[TaskReplicator, Depends(get_task_replicator)],
+) -> ReplicationHealthStatus:
+    """Outbox cursor, pending entries and lag of each storage backend."""
+
+    try:
+        backends = [ReplicationBackendStatus(**item) for item in await replicator.status()]
+    except SQLAlchemyError as exc:  # pragma: no cover - db failure path
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="database unavailable"
+        ) from exc
+    return ReplicationHealthStatus(
+        status="degraded" if any(backend.failures for backend in backends) else "ok",
+        enabled=get_settings().task_replication_enabled,
+        backends=backends,
+    )
+
+
 @router.get("/openai", response_model=HealthStatus)
 async def openai_health() -> HealthStatus:
     provider = get_chat_provider()
@@ -4,15 +4,18 @@ Fornece acesso às métricas coletadas pelo sistema de profiling.
 """
 
 import logging
+from dataclasses import asdict
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
+from app.config import get_settings
 from app.core.profiler import (
     analyze_slow_queries,
     db_profiler,
     get_profiler_stats,
 )
+from app.infrastructure.database.pool import all_pool_usage, recommend_pool_size
 
 
 # Função temporária para substituir autenticação
@@ -257,6 +260,35 @@ async def toggle_profiler(
         raise HTTPException(status_code=500, detail="Failed to toggle profiler")
 
 
+@router.get("/database/pool", response_model=dict[str, Any])
+async def get_pool_usage(current_user: dict = Depends(get_current_user)) -> dict[str, Any]:
+    """
+    Uso dos pools de conexão (PostgreSQL) e tamanhos recomendados.
+    A recomendação vem da concorrência observada nos checkouts deste processo.
+    """
+    settings = get_settings()
+    pools = {}
+    for name, usage in all_pool_usage().items():
+        recommendation = recommend_pool_size(usage)
+        pools[name] = {
+            "peak_concurrency": usage.peak,
+            "timeouts": usage.timeouts,
+            "recommendation": asdict(recommendation) if recommendation else None,
+        }
+    return {
+        "status": "success",
+        "data": {
+            "configured": {
+                "pool_size": settings.database_pool_size,
+                "max_overflow": settings.database_max_overflow,
+                "pool_timeout": settings.database_pool_timeout,
+            },
+            "pools": pools,
+        },
+        "message": "Connection pool usage retrieved successfully",
+    }
+
+
 @router.get("/health", response_model=dict[str, Any])
 async def profiler_health() -> dict[str, Any]:
     """
@@ -23,6 +23,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database.database import get_db_session
 from app.infrastructure.database.models.user_storage_config import UserStorageConfig
+from app.infrastructure.storage.config_cache import get_storage_config_cache
+from app.infrastructure.storage.pool import get_adapter_pool
 from app.infrastructure.storage.registry import StorageAdapterRegistry
 
 logger = structlog.get_logger(__name__)
@@ -193,6 +195,7 @@ async def create_storage_config(
     session.add(new_config)
     await session.commit()
     await session.refresh(new_config)
+    get_storage_config_cache().invalidate(user_id)
 
     logger.info(
         "storage_config_created",
@@ -263,6 +266,9 @@ async def update_storage_config(
 
     await session.commit()
     await session.refresh(config)
+    # Running requests keep the old adapter; new ones get a rebuilt client
+    await get_adapter_pool().invalidate(config_id)
+    get_storage_config_cache().invalidate(user_id)
 
     logger.info(
         "storage_config_updated",
@@ -320,6 +326,8 @@ async def delete_storage_config(
 
     await session.delete(config)
     await session.commit()
+    await get_adapter_pool().invalidate(config_id)
+    get_storage_config_cache().invalidate(user_id)
 
     logger.info(
         "storage_config_deleted",
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import base64
+import json
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.database.database import get_db_session
-from app.infrastructure.database.models.repositories import update_task_status
+from app.config import get_settings
+from app.infrastructure.database.database import get_db_session, get_read_db_session
+from app.infrastructure.database.models.replication import ReplicationOperation
+from app.infrastructure.database.models.repositories import (
+    TaskSort,
+    count_tasks,
+    enqueue_task_replication,
+    list_tasks_page,
+    update_task_status,
+)
 from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -65,9 +74,20 @@ class TaskListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 SessionDep = Annotated[AsyncSession, Depends(get_db_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db_session)]
+
+
+async def _replicate(
+    session: AsyncSession, task_id: int, operation: ReplicationOperation
+) -> None:
+    # Storage backends are updated by the replication worker, not in the request
+    if get_settings().task_replication_enabled:
+        await enqueue_task_replication(session, task_id=task_id, operation=operation)
 
 
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
@@ -99,6 +119,8 @@ async def create_task(
     )
 
     session.add(task_record)
+    await session.flush()
+    await _replicate(session, task_record.id, ReplicationOperation.CREATE)
     await session.commit()
     await session.refresh(task_record)
 
@@ -107,41 +129,76 @@ async def create_task(
 
 @router.get("/", response_model=TaskListResponse)
 async def list_tasks(
-    session: SessionDep,
+    session: ReadSessionDep,
     status_filter: TaskStatus | None = Query(None, alias="status"),
     channel: str | None = Query(None),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    sort: TaskSort = Query("id", description="id (newest first) or due_date"),
+    count: Literal["exact", "approximate"] = Query("exact"),
 ) -> TaskListResponse:
-    # Build query
-    stmt = select(TaskRecord).order_by(TaskRecord.id.desc())
-    count_stmt = select(TaskRecord.id)
-
-    if status_filter is not None:
-        stmt = stmt.where(TaskRecord.status == status_filter)
-        count_stmt = count_stmt.where(TaskRecord.status == status_filter)
-
-    if channel is not None:
-        stmt = stmt.where(TaskRecord.channel == channel)
-        count_stmt = count_stmt.where(TaskRecord.channel == channel)
+    after = None
+    if cursor is not None:
+        if offset:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either cursor or offset, not both",
+            )
+        after = _decode_cursor(cursor, sort)
 
-    # Get total count
-    count_result = await session.execute(count_stmt)
-    total = len(count_result.scalars().all())
+    total, estimated = await count_tasks(
+        session,
+        status=status_filter,
+        channel=channel,
+        approximate=count == "approximate",
+    )
 
-    # Apply pagination
-    stmt = stmt.offset(offset).limit(limit)
-    result = await session.execute(stmt)
-    records = result.scalars().all()
+    # One extra row tells whether there is a next page
+    records = await list_tasks_page(
+        session,
+        limit=limit + 1,
+        status=status_filter,
+        channel=channel,
+        sort=sort,
+        after=after,
+        offset=offset,
+    )
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        next_cursor = _encode_cursor(records[-1], sort)
 
     return TaskListResponse(
         tasks=[TaskResponse.from_orm(record) for record in records],
         total=total,
         limit=limit,
-        offset=offset
+        offset=offset,
+        next_cursor=next_cursor,
+        total_is_estimate=estimated,
     )
 
 
+def _encode_cursor(record: TaskRecord, sort: TaskSort) -> str:
+    key: dict[str, object] = {"sort": sort, "id": record.id}
+    if sort == "due_date":
+        key["due_date"] = record.due_date.isoformat() if record.due_date else None
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: TaskSort) -> tuple[datetime | None, int]:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if key["sort"] != sort:
+            raise ValueError("cursor belongs to another sort order")
+        due_date = key.get("due_date")
+        return (datetime.fromisoformat(due_date) if due_date else None, int(key["id"]))
+    except (ValueError, KeyError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
+
+
 @router.patch("/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: int,
@@ -153,6 +210,8 @@ async def update_task(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
+    await _replicate(session, task_id, ReplicationOperation.UPDATE)
+
     # Preparar resposta antes do commit
     response_data = TaskResponse.from_orm(record)
     await session.commit()
@@ -174,6 +233,7 @@ async def update_task_status_endpoint(
 
     # Atualizar o status
     record.status = payload.status
+    await _replicate(session, task_id, ReplicationOperation.UPDATE)
 
     # Preparar resposta ANTES do commit para evitar problemas com greenlet
     response_data = TaskResponse(
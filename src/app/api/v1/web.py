@@ -27,7 +27,7 @@ from fastapi.security import HTTPBasic
 from fastapi.templating import Jinja2Templates
 
 from app.config import Settings, get_settings
-from app.infrastructure.database.database import get_db_session
+from app.infrastructure.database.database import get_db_session, get_read_db_session
 from app.api.dependencies import get_ingestion_service
 from app.infrastructure.database.models.repositories import list_recent_conversations
 from app.models.schemas import Channel, ChannelMessage
@@ -357,7 +357,7 @@ async def logout(
 async def get_web_form(
     request: Request,
     settings: Settings = Depends(get_settings),
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_read_db_session),
 ) -> HTMLResponse:
     """Exibe o formulário web principal (requer autenticação)."""
     try:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 REQUEST_COUNT = Counter(
     "sparkone_http_requests_total",
@@ -53,6 +53,98 @@ FALLBACK_NOTIFICATION_COUNTER = Counter(
     ["status"],
 )
 
+INGESTION_LANE_QUEUE_DEPTH = Gauge(
+    "sparkone_ingestion_lane_queue_depth",
+    "Messages waiting in each ingestion priority lane",
+    ["lane"],
+)
+
+INGESTION_LANE_WAIT = Histogram(
+    "sparkone_ingestion_lane_wait_seconds",
+    "Time a message waits in its lane before a worker starts it",
+    ["lane"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+TASK_REPLICATION_COUNTER = Counter(
+    "sparkone_task_replication_total",
+    "Task changes replicated to storage backends",
+    ["backend", "status"],
+)
+
+TASK_REPLICATION_PENDING = Gauge(
+    "sparkone_task_replication_pending",
+    "Outbox entries not yet replicated to each storage backend",
+    ["backend"],
+)
+
+TASK_REPLICATION_LAG = Gauge(
+    "sparkone_task_replication_lag_seconds",
+    "Age of the oldest outbox entry not yet replicated to each storage backend",
+    ["backend"],
+)
+
+TASK_RECONCILIATION_REPAIRS = Counter(
+    "sparkone_task_reconciliation_repairs_total",
+    "Drifted tasks queued for replication by the reconciliation job",
+    ["backend", "operation"],
+)
+
+STORAGE_THROTTLE_RATE = Gauge(
+    "sparkone_storage_throttle_rate",
+    "Requests per second currently allowed by each storage backend throttle",
+    ["backend"],
+)
+
+STORAGE_RATE_LIMITED_COUNTER = Counter(
+    "sparkone_storage_rate_limited_total",
+    "HTTP 429 responses received from storage backends",
+    ["backend"],
+)
+
+GOOGLE_API_EXECUTOR_TASKS = Gauge(
+    "sparkone_google_api_executor_tasks",
+    "Google API calls waiting for (queued) or holding (running) an executor thread",
+    ["state"],
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "sparkone_db_pool_checked_out",
+    "Database connections currently checked out of each pool",
+    ["pool"],
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "sparkone_db_pool_overflow",
+    "Connections open beyond pool_size (negative while the pool is still filling)",
+    ["pool"],
+)
+
+DB_POOL_WAIT = Histogram(
+    "sparkone_db_pool_wait_seconds",
+    "Time each checkout waited for a free connection (0 when one was available)",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+DB_POOL_TIMEOUTS = Counter(
+    "sparkone_db_pool_timeouts_total",
+    "Checkouts that gave up after pool_timeout because the pool was exhausted",
+    ["pool"],
+)
+
+SQLITE_WRITE_BATCH = Histogram(
+    "sparkone_sqlite_write_batch_size",
+    "Write operations committed together by the SQLite writer task",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+SQLITE_WRITE_LATENCY = Histogram(
+    "sparkone_sqlite_write_latency_seconds",
+    "Time from queueing a write with the SQLite writer until its batch commits",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+
 
 __all__ = [
     "REQUEST_COUNT",
@@ -63,4 +155,19 @@ __all__ = [
     "SHEETS_SYNC_COUNTER",
     "WHATSAPP_NOTIFICATION_COUNTER",
     "FALLBACK_NOTIFICATION_COUNTER",
+    "INGESTION_LANE_QUEUE_DEPTH",
+    "INGESTION_LANE_WAIT",
+    "TASK_REPLICATION_COUNTER",
+    "TASK_REPLICATION_PENDING",
+    "TASK_REPLICATION_LAG",
+    "TASK_RECONCILIATION_REPAIRS",
+    "STORAGE_THROTTLE_RATE",
+    "STORAGE_RATE_LIMITED_COUNTER",
+    "GOOGLE_API_EXECUTOR_TASKS",
+    "DB_POOL_CHECKED_OUT",
+    "DB_POOL_OVERFLOW",
+    "DB_POOL_WAIT",
+    "DB_POOL_TIMEOUTS",
+    "SQLITE_WRITE_BATCH",
+    "SQLITE_WRITE_LATENCY",
 ]
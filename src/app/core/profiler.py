@@ -9,7 +9,7 @@ import logging
 import time
 import traceback
 import tracemalloc
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
@@ -56,6 +56,9 @@ SLOW_QUERIES = Counter(
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Intervalo mínimo (segundos) entre leituras de memória/CPU do processo
+RESOURCE_SAMPLE_INTERVAL = 1.0
+
 
 @dataclass
 class QueryProfile:
@@ -115,11 +118,17 @@ class DatabaseProfiler:
 
     def __init__(self, slow_query_threshold: float = 0.5):
         self.slow_query_threshold = slow_query_threshold
-        self.query_profiles: list[QueryProfile] = []
+        # Histórico limitado às últimas 1000 queries
+        self.query_profiles: deque[QueryProfile] = deque(maxlen=1000)
         self.enabled = True
 
-        # Configurar monitoramento de memória
-        tracemalloc.start()
+        # Configurar monitoramento de memória; tracemalloc (caro em toda alocação)
+        # só como fallback quando psutil não está disponível
+        self._process = psutil.Process() if psutil is not None else None
+        if self._process is None:
+            tracemalloc.start()
+        self._resources: tuple[float, float | None] = (0.0, None)
+        self._resources_sampled_at = float("-inf")
 
         # Registrar event listeners do SQLAlchemy
         self._setup_sqlalchemy_events()
@@ -133,9 +142,8 @@ class DatabaseProfiler:
             if not self.enabled:
                 return
 
-            context._query_start_time = time.time()
-            context._memory_before = self._get_memory_usage()
-            context._cpu_before = psutil.cpu_percent() if psutil is not None else None
+            context._query_start_time = time.perf_counter()
+            context._memory_before, context._cpu_before = self._sample_resources()
 
         @event.listens_for(Engine, "after_cursor_execute")
         def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -143,9 +151,8 @@ class DatabaseProfiler:
             if not self.enabled:
                 return
 
-            duration = time.time() - context._query_start_time
-            memory_after = self._get_memory_usage()
-            cpu_after = psutil.cpu_percent() if psutil is not None else None
+            duration = time.perf_counter() - context._query_start_time
+            memory_after, cpu_after = self._sample_resources()
 
             # Analisar a query para extrair informações
             query_info = self._analyze_query(statement)
@@ -218,11 +225,23 @@ class DatabaseProfiler:
 
         return {"table": table, "operation": operation, "query_type": query_type}
 
+    def _sample_resources(self) -> tuple[float, float | None]:
+        """Memória (MB) e CPU (%), lidos no máximo uma vez por intervalo.
+
+        Ler /proc a cada query custava mais que a própria query; as métricas de
+        recursos não precisam dessa resolução.
+        """
+        now = time.monotonic()
+        if now - self._resources_sampled_at >= RESOURCE_SAMPLE_INTERVAL:
+            cpu = psutil.cpu_percent() if psutil is not None else None
+            self._resources = (self._get_memory_usage(), cpu)
+            self._resources_sampled_at = now
+        return self._resources
+
     def _get_memory_usage(self) -> float:
         """Obtém uso atual de memória em MB."""
-        if psutil is not None:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
+        if self._process is not None:
+            return self._process.memory_info().rss / 1024 / 1024
         current, _ = tracemalloc.get_traced_memory()
         return current / 1024 / 1024
 
@@ -257,10 +276,6 @@ class DatabaseProfiler:
         if profile.cpu_percent is not None:
             CPU_USAGE.labels(component="database").set(profile.cpu_percent)
 
-        # Limitar histórico (manter apenas últimas 1000 queries)
-        if len(self.query_profiles) > 1000:
-            self.query_profiles = self.query_profiles[-1000:]
-
     def get_performance_report(self, last_n_queries: int | None = None) -> PerformanceReport:
         """
         Gera relatório consolidado de performance.
@@ -268,7 +283,7 @@ class DatabaseProfiler:
         Args:
             last_n_queries: Número de queries recentes a analisar (None = todas)
         """
-        queries = self.query_profiles
+        queries = list(self.query_profiles)
         if last_n_queries:
             queries = queries[-last_n_queries:]
 
@@ -343,14 +358,12 @@ def profile_query(func: F) -> F:
 
     @functools.wraps(func)
     async def async_wrapper(*args, **kwargs):
-        start_time = time.time()
-        _ = db_profiler._get_memory_usage()  # memory_before não utilizado por enquanto
+        start_time = time.perf_counter()
 
         try:
             result = await func(*args, **kwargs)
 
-            duration = time.time() - start_time
-            _ = db_profiler._get_memory_usage()  # memory_after não utilizado por enquanto
+            duration = time.perf_counter() - start_time
 
             # Registrar métrica de função
             REQUEST_LATENCY.labels(method=func.__name__, endpoint="database_function").observe(
@@ -363,20 +376,18 @@ def profile_query(func: F) -> F:
             return result
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             profiler_logger.error(f"Function {func.__name__} failed after {duration:.3f}s: {e}")
             raise
 
     @functools.wraps(func)
     def sync_wrapper(*args, **kwargs):
-        start_time = time.time()
-        _ = db_profiler._get_memory_usage()  # memory_before não utilizado por enquanto
+        start_time = time.perf_counter()
 
         try:
             result = func(*args, **kwargs)
 
-            duration = time.time() - start_time
-            _ = db_profiler._get_memory_usage()  # memory_after não utilizado por enquanto
+            duration = time.perf_counter() - start_time
 
             # Registrar métrica de função
             REQUEST_LATENCY.labels(method=func.__name__, endpoint="database_function").observe(
@@ -389,7 +400,7 @@ def profile_query(func: F) -> F:
             return result
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             profiler_logger.error(f"Function {func.__name__} failed after {duration:.3f}s: {e}")
             raise
 
@@ -412,27 +423,33 @@ async def profile_session(
             # Usar profiled_session para queries
             result = await profiled_session.execute(query)
     """
-    start_time = time.time()
-    memory_before = db_profiler._get_memory_usage()
+    start_time = time.perf_counter()
+    # Amostrar memória custa uma leitura de /proc por chamada: só em debug
+    debug = profiler_logger.isEnabledFor(logging.DEBUG)
+    memory_before = db_profiler._get_memory_usage() if debug else 0.0
 
-    profiler_logger.debug(f"Starting profiled session: {operation_name}")
+    if debug:
+        profiler_logger.debug(f"Starting profiled session: {operation_name}")
 
     try:
         yield session
 
-        duration = time.time() - start_time
-        memory_after = db_profiler._get_memory_usage()
+        duration = time.perf_counter() - start_time
 
-        profiler_logger.info(
-            f"Session {operation_name} completed in {duration:.3f}s, "
-            f"memory delta: {memory_after - memory_before:.2f}MB"
-        )
+        if duration > db_profiler.slow_query_threshold:
+            profiler_logger.warning(f"Slow session: {operation_name} took {duration:.3f}s")
+        if debug:
+            memory_after = db_profiler._get_memory_usage()
+            profiler_logger.debug(
+                f"Session {operation_name} completed in {duration:.3f}s, "
+                f"memory delta: {memory_after - memory_before:.2f}MB"
+            )
 
         # Registrar métrica de sessão
         REQUEST_LATENCY.labels(method=operation_name, endpoint="database_session").observe(duration)
 
     except Exception as e:
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         profiler_logger.error(f"Session {operation_name} failed after {duration:.3f}s: {e}")
         raise
 
@@ -10,6 +10,8 @@ Related RF: RF-019 (Multi-Storage Backend System)
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
+from datetime import UTC
 from typing import Any
 
 from app.infrastructure.database.models.tasks import TaskRecord
@@ -34,6 +36,9 @@ class StorageAdapter(ABC):
         ```
     """
 
+    #: Largest number of tasks sent in one batch call (API/request limits)
+    max_batch_size: int = 1
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -70,12 +75,20 @@ class StorageAdapter(ABC):
         ...
 
     @abstractmethod
-    async def update_task(self, external_id: str, task: TaskRecord) -> bool:
+    async def update_task(
+        self,
+        external_id: str,
+        task: TaskRecord,
+        fields: Collection[str] | None = None,
+    ) -> bool:
         """Update an existing task in the external storage backend.
 
         Args:
             external_id: The external ID returned from save_task()
             task: Updated task record
+            fields: Projected fields that changed (see project_task());
+                None sends every field. Backends that cannot patch
+                individual properties may ignore it.
 
         Returns:
             bool: True if update succeeded, False otherwise
@@ -128,6 +141,31 @@ class StorageAdapter(ABC):
         """
         ...
 
+    async def find_task(self, task: TaskRecord) -> str | None:
+        """Find this backend's existing copy of a task whose external id was lost.
+
+        Reconciliation calls it before re-creating a task that has no ref
+        for this backend, so a copy that survived is linked again instead of
+        duplicated.
+
+        Args:
+            task: The local task record
+
+        Returns:
+            str | None: External ID of the existing copy, None if there is none
+
+        Raises:
+            StorageAdapterError: If the lookup fails (the task is then left
+                for the next reconciliation rather than re-created)
+
+        Note:
+            Default implementation checks the task's legacy ``external_id``.
+            Override when the backend can search by other keys.
+        """
+        if task.external_id and await self.get_task(task.external_id) is not None:
+            return task.external_id
+        return None
+
     @abstractmethod
     async def health_check(self) -> dict[str, Any]:
         """Check the health and connectivity of the storage backend.
@@ -151,6 +189,30 @@ class StorageAdapter(ABC):
         """
         ...
 
+    def project_task(self, task: TaskRecord) -> dict[str, Any]:
+        """Return the task fields this backend stores, as JSON-safe values.
+
+        Used for change detection: an update whose projection equals the one
+        last synced is skipped, and only differing keys are sent.
+        Reconciliation also projects what get_task() reads back, so adapters
+        that support task reads must project both sides identically.
+
+        Returns:
+            dict: Field name -> value for every field the backend persists
+        """
+        status = task.status
+        due_date = task.due_date
+        if due_date is not None:
+            # SQLite hands back naive UTC timestamps
+            due_date = due_date.astimezone(UTC) if due_date.tzinfo else due_date.replace(tzinfo=UTC)
+        return {
+            "title": task.title,
+            "description": task.description,
+            "status": getattr(status, "value", status),
+            "priority": task.priority,
+            "due_date": due_date.isoformat() if due_date else None,
+        }
+
     async def supports_batch_operations(self) -> bool:
         """Indicate if this adapter supports batch operations.
 
@@ -163,6 +225,18 @@ class StorageAdapter(ABC):
         """
         return False
 
+    async def supports_task_reads(self) -> bool:
+        """Indicate if get_task() returns what the backend actually stores.
+
+        Returns:
+            bool: True if stored tasks can be read back
+
+        Note:
+            Reconciliation only verifies backends that return True; the
+            others are compared against the state they last acknowledged.
+        """
+        return True
+
     async def batch_save_tasks(self, tasks: list[TaskRecord]) -> list[str]:
         """Save multiple tasks in a single batch operation.
 
@@ -174,6 +248,32 @@ class StorageAdapter(ABC):
 
         Raises:
             NotImplementedError: If adapter doesn't support batch operations
+            StorageBatchError: If some tasks failed (carries the ids assigned)
+
+        Note:
+            Only implement if supports_batch_operations() returns True
+        """
+        raise NotImplementedError(
+            f"{self.name} adapter does not support batch operations"
+        )
+
+    async def batch_update_tasks(
+        self,
+        items: list[tuple[str, TaskRecord]],
+        fields: list[Collection[str] | None] | None = None,
+    ) -> list[bool]:
+        """Update multiple tasks in a single batch operation.
+
+        Args:
+            items: ``(external_id, task)`` pairs to update
+            fields: Changed fields per item, aligned with ``items`` (see update_task())
+
+        Returns:
+            list[bool]: Success flag per item, in same order as input
+
+        Raises:
+            NotImplementedError: If adapter doesn't support batch operations
+            StorageBatchError: If some items failed (carries partial results)
 
         Note:
             Only implement if supports_batch_operations() returns True
@@ -207,4 +307,29 @@ class StorageAdapterError(Exception):
         super().__init__(f"[{adapter_name}] {message}")
 
 
-__all__ = ["StorageAdapter", "StorageAdapterError"]
+class StorageBatchError(StorageAdapterError):
+    """Raised when only part of a batch operation succeeded.
+
+    ``results`` has one entry per input item (``None`` where it failed) and
+    ``errors`` maps failed item indexes to their exception, so callers can
+    keep the external ids the backend already assigned.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        adapter_name: str,
+        results: list[Any],
+        errors: dict[int, BaseException],
+    ) -> None:
+        self.results = results
+        self.errors = errors
+        first = next(iter(errors.values()), None)
+        super().__init__(
+            message,
+            adapter_name=adapter_name,
+            original_error=first if isinstance(first, Exception) else None,
+        )
+
+
+__all__ = ["StorageAdapter", "StorageAdapterError", "StorageBatchError"]
@@ -2,37 +2,51 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
 
 import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.services.brief_snapshot import SECTIONS, BriefSnapshot, SectionItems
 from app.infrastructure.database.models.events import EventRecord
-from app.infrastructure.database.models.memory import ConversationMessage
-from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus
+from app.infrastructure.database.models.repositories import list_recent_conversations
+from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus, open_task_filter
 from app.infrastructure.chat import ChatProviderRouter, LLMGenerationError
 
 
 class BriefService:
-    """Aggregates state from tasks, events and recent conversations."""
+    """Aggregates state from tasks, events and recent conversations.
+
+    With a ``snapshot`` the sections come from the shared
+    :class:`BriefSnapshot`, and the session is only queried for sections
+    that changed or aged out.
+    """
 
     def __init__(
-        self, session: AsyncSession, chat_provider: ChatProviderRouter | None = None
+        self,
+        session: AsyncSession,
+        chat_provider: ChatProviderRouter | None = None,
+        snapshot: BriefSnapshot | None = None,
     ) -> None:
         self._session = session
         self._chat_provider = chat_provider if chat_provider and chat_provider.available else None
+        self._snapshot = snapshot
         self._logger = structlog.get_logger(__name__)
 
     async def structured_brief(self) -> dict:
-        tasks = await self._pending_tasks()
-        events = await self._upcoming_events()
-        conversations = await self._recent_conversations()
+        if self._snapshot is not None:
+            sections = await self._snapshot.read(self._load_sections)
+        else:
+            sections = await self._load_sections(SECTIONS)
+        now = datetime.now(UTC)
         return {
-            "generated_at": datetime.now(UTC).isoformat(),
-            "tasks": tasks,
-            "events": events,
-            "conversations": conversations,
+            "generated_at": now.isoformat(),
+            "tasks": sections["tasks"],
+            # Snapshot events may have started since they were read
+            "events": [item for item in sections["events"] if _starts_after(item, now)],
+            "conversations": sections["conversations"],
         }
 
     async def textual_brief(self) -> str:
@@ -57,10 +71,19 @@ class BriefService:
             return self._fallback_text(data)
         return response
 
+    async def _load_sections(self, sections: Sequence[str]) -> dict[str, SectionItems]:
+        loaders = {
+            "tasks": self._pending_tasks,
+            "events": self._upcoming_events,
+            "conversations": self._recent_conversations,
+        }
+        # One session: the queries run one after another
+        return {section: await loaders[section]() for section in sections}
+
     async def _pending_tasks(self) -> list[dict]:
         stmt = (
             select(TaskRecord)
-            .where(TaskRecord.status.in_([TaskStatus.TODO, TaskStatus.IN_PROGRESS]))
+            .where(open_task_filter())
             .order_by(TaskRecord.due_at.nulls_last(), TaskRecord.id.desc())
             .limit(20)
         )
@@ -71,7 +94,8 @@ class BriefService:
                 {
                     "id": row.id,
                     "title": row.title,
-                    "status": row.status.value,
+                    # String column: loaded rows hold the plain value
+                    "status": TaskStatus(row.status).value,
                     "due_at": row.due_at.isoformat() if row.due_at else None,
                 }
             )
@@ -99,10 +123,8 @@ class BriefService:
         return events
 
     async def _recent_conversations(self) -> list[dict]:
-        stmt = select(ConversationMessage).order_by(ConversationMessage.id.desc()).limit(10)
-        result = await self._session.execute(stmt)
         messages: list[dict] = []
-        for row in result.scalars():
+        for row in await list_recent_conversations(self._session, limit=10):
             messages.append(
                 {
                     "role": row.role.value,
@@ -131,4 +153,11 @@ class BriefService:
         return " \n".join(parts)
 
 
+def _starts_after(event: dict, now: datetime) -> bool:
+    start_at = datetime.fromisoformat(event["start_at"])
+    if start_at.tzinfo is None:  # SQLite drops the offset
+        start_at = start_at.replace(tzinfo=UTC)
+    return start_at >= now
+
+
 __all__ = ["BriefService"]
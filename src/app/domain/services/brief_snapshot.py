@@ -0,0 +1,206 @@
+"""Materialized brief snapshot kept current by ORM change tracking.
+
+The brief's three sections (pending tasks, upcoming events, recent
+conversations) are cached per process in :class:`BriefSnapshot`. Committed
+writes to their source tables, whether flushed ORM objects or Core DML run
+through a session, mark the affected sections stale. The next brief re-reads
+only those sections; every other brief is served from memory. Sections are
+also re-read once older than ``max_age``, which bounds how long changes made
+by other processes (or replica lag) can go unseen. Refreshed sections are
+stored in ``brief_snapshots`` so a new worker starts warm.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import chain
+from typing import Any
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.infrastructure.database.models.repositories import (
+    list_brief_snapshots,
+    save_brief_snapshots,
+)
+
+logger = structlog.get_logger(__name__)
+
+SECTIONS = ("tasks", "events", "conversations")
+# Source table of each section
+SECTION_TABLES = {"tasks": "tasks", "events": "events", "conversations": "conversation_messages"}
+_TABLE_SECTIONS = {table: section for section, table in SECTION_TABLES.items()}
+# Session.info key of the sections changed by the session's open transaction
+_PENDING_KEY = "brief_sections_changed"
+
+SectionItems = list[dict[str, Any]]
+SectionRefresh = Callable[[Sequence[str]], Awaitable[Mapping[str, SectionItems]]]
+
+_snapshots: weakref.WeakSet[BriefSnapshot] = weakref.WeakSet()
+
+
+@dataclass(slots=True)
+class _Section:
+    items: SectionItems
+    refreshed_at: datetime
+    loaded_at: float  # clock() when the source query started
+
+
+class BriefSnapshot:
+    """Per-process brief sections, refreshed only when changed or older than ``max_age``.
+
+    Concurrent readers share one refresh: the first stale read takes the
+    lock and re-reads the stale sections, the others wait and then find them
+    fresh. A section invalidated while its refresh runs stays stale. With a
+    ``session_factory`` the snapshot is restored from, and saved to, the
+    ``brief_snapshots`` table; its failures are logged and never fail a brief.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age: float,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_age = max_age
+        self._session_factory = session_factory
+        self._clock = clock
+        self._sections: dict[str, _Section] = {}
+        self._dirty: set[str] = set()
+        self._generations = dict.fromkeys(SECTIONS, 0)
+        self._restored = session_factory is None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+        _snapshots.add(self)
+
+    def invalidate(self, sections: Iterable[str]) -> None:
+        for section in sections:
+            if section in self._generations:
+                self._dirty.add(section)
+                self._generations[section] += 1
+
+    def stale_sections(self) -> list[str]:
+        now = self._clock()
+        return [
+            section
+            for section in SECTIONS
+            if section in self._dirty
+            or (cached := self._sections.get(section)) is None
+            or now - cached.loaded_at > self._max_age
+        ]
+
+    async def read(self, refresh: SectionRefresh) -> dict[str, SectionItems]:
+        """Return every section, calling ``refresh`` with the stale ones first.
+
+        The returned lists are shared with concurrent readers and must not be
+        modified.
+        """
+
+        if self.stale_sections():
+            refreshed = await self._refresh(refresh)
+            if refreshed is not None:
+                await self._save(*refreshed)
+        return {section: self._sections[section].items for section in SECTIONS}
+
+    async def _refresh(
+        self, refresh: SectionRefresh
+    ) -> tuple[dict[str, SectionItems], datetime] | None:
+        async with self._get_lock():
+            if not self._restored:
+                self._restored = True
+                await self._restore()
+            # Another reader may have refreshed them while this one waited
+            stale = self.stale_sections()
+            if not stale:
+                return None
+            generations = {section: self._generations[section] for section in stale}
+            started = self._clock()
+            refreshed_at = datetime.now(UTC)
+            items = await refresh(stale)
+            for section in stale:
+                self._sections[section] = _Section(items[section], refreshed_at, started)
+                if self._generations[section] == generations[section]:
+                    self._dirty.discard(section)
+            logger.debug("brief_snapshot_refreshed", sections=stale)
+            return {section: items[section] for section in stale}, refreshed_at
+
+    async def _restore(self) -> None:
+        assert self._session_factory is not None
+        try:
+            async with self._session_factory() as session:
+                records = await list_brief_snapshots(session)
+        except SQLAlchemyError as exc:
+            logger.warning("brief_snapshot_restore_failed", error=str(exc))
+            return
+        now, wall_now = self._clock(), datetime.now(UTC)
+        for record in records:
+            refreshed_at = record.refreshed_at
+            if refreshed_at.tzinfo is None:  # SQLite drops the offset
+                refreshed_at = refreshed_at.replace(tzinfo=UTC)
+            age = (wall_now - refreshed_at).total_seconds()
+            if record.section in self._generations and age <= self._max_age:
+                self._sections[record.section] = _Section(record.payload, refreshed_at, now - age)
+
+    async def _save(self, items: dict[str, SectionItems], refreshed_at: datetime) -> None:
+        if self._session_factory is None:
+            return
+        try:
+            async with self._session_factory() as session:
+                await save_brief_snapshots(session, sections=items, refreshed_at=refreshed_at)
+                await session.commit()
+        except SQLAlchemyError as exc:
+            logger.warning("brief_snapshot_save_failed", error=str(exc))
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        return self._lock
+
+
+def _changed(session: Session) -> set[str]:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session: Session, flush_context: Any) -> None:
+    for instance in chain(session.new, session.dirty, session.deleted):
+        section = _TABLE_SECTIONS.get(getattr(instance, "__tablename__", ""))
+        if section is not None:
+            _changed(session).add(section)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_dml(orm_execute_state: ORMExecuteState) -> None:
+    # Core INSERT/UPDATE/DELETE through session.execute() never flushes
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        section = _TABLE_SECTIONS.get(getattr(table, "name", ""))
+        if section is not None:
+            _changed(orm_execute_state.session).add(section)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    sections = session.info.pop(_PENDING_KEY, None)
+    if sections:
+        for snapshot in list(_snapshots):
+            snapshot.invalidate(sections)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+__all__ = ["SECTIONS", "SECTION_TABLES", "BriefSnapshot"]
@@ -0,0 +1,390 @@
+"""Parallel bulk ingestion of document trees into the knowledge base."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import queue
+import time
+from collections.abc import AsyncIterator, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+from multiprocessing.managers import SyncManager
+from pathlib import Path
+from typing import Any, Protocol
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.services.chunking import StreamingChunker
+from app.domain.services.ingestion import DocumentIngestionService
+from app.infrastructure.embeddings import EmbeddingProvider
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_PATTERNS: tuple[str, ...] = ("*.md", "*.txt")
+
+
+class ChunkSink(Protocol):
+    """Bounded queue between a chunking worker and the embedding side.
+
+    ``queue.Queue`` for thread pools, a ``multiprocessing.Manager`` queue for
+    process pools.
+    """
+
+    def put(self, item: Any) -> None: ...
+
+    def get(self) -> Any: ...
+
+
+@dataclass(slots=True)
+class ChunkedDocument:
+    """Header a worker sends before the chunks of one file.
+
+    ``changed`` is False when the checkpoint already covers this content;
+    no chunks follow then.
+    """
+
+    path: str
+    title: str
+    content_hash: str
+    changed: bool = True
+
+
+def chunk_document(
+    path: str,
+    sink: ChunkSink,
+    *,
+    chunk_size: int,
+    chunk_overlap: int,
+    batch_size: int = 64,
+    known_hash: str | None = None,
+    encoding: str = "utf-8",
+) -> int:
+    """Hash and chunk a file into ``sink``; runs inside a process pool worker.
+
+    The sink receives a :class:`ChunkedDocument`, then lists of at most
+    ``batch_size`` chunks, then ``None`` (also on failure). A bounded sink
+    makes the worker wait for the consumer, so a large file is never held
+    in memory, or pickled, as a whole. Returns the number of chunks sent.
+    """
+
+    sent = 0
+    try:
+        file_path = Path(path)
+        digest = hashlib.sha256()
+        with file_path.open("rb") as handle:
+            while block := handle.read(1024 * 1024):
+                digest.update(block)
+        content_hash = digest.hexdigest()
+        changed = known_hash != content_hash
+        sink.put(ChunkedDocument(path, file_path.stem, content_hash, changed))
+        if changed:
+            chunker = StreamingChunker(
+                max_tokens=chunk_size,
+                overlap=min(chunk_overlap, chunk_size - 1),
+            )
+            chunks = chunker.chunk_file(file_path, encoding=encoding)
+            while batch := list(islice(chunks, batch_size)):
+                sink.put(batch)
+                sent += len(batch)
+    finally:
+        sink.put(None)
+    return sent
+
+
+def discover_documents(
+    targets: Iterable[Path | str],
+    patterns: Sequence[str] = DEFAULT_PATTERNS,
+) -> list[Path]:
+    """Expand files, directories (walked recursively) and glob expressions."""
+
+    found: dict[Path, None] = {}
+    for target in targets:
+        raw = str(target)
+        path = Path(raw)
+        if any(char in raw for char in "*?["):
+            anchor = Path(path.anchor) if path.is_absolute() else Path()
+            relative = str(path.relative_to(anchor)) if path.is_absolute() else raw
+            matches: Iterable[Path] = anchor.glob(relative)
+        elif path.is_dir():
+            matches = (match for pattern in patterns for match in path.rglob(pattern))
+        else:
+            matches = [path]
+        for match in matches:
+            if match.is_file():
+                found.setdefault(match.resolve(), None)
+    return sorted(found)
+
+
+class IngestionCheckpoint:
+    """JSON checkpoint mapping ingested paths to their content hash."""
+
+    def __init__(self, path: Path | None) -> None:
+        self._path = path
+        self._documents: dict[str, str] = {}
+        self._dirty = 0
+        if path is not None and path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self._documents = dict(data.get("documents", {}))
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get(self, path: str) -> str | None:
+        return self._documents.get(path)
+
+    def mark(self, path: str, content_hash: str) -> None:
+        self._documents[path] = content_hash
+        self._dirty += 1
+
+    def save(self, *, force: bool = False, every: int = 1) -> None:
+        if self._path is None or not self._dirty or (not force and self._dirty < every):
+            return
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp.write_text(
+            json.dumps({"version": 1, "documents": self._documents}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self._path)
+        self._dirty = 0
+
+
+@dataclass(slots=True)
+class BulkIngestionStats:
+    documents: int = 0
+    skipped: int = 0
+    failed: int = 0
+    chunks_embedded: int = 0
+    chunks_reused: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return max(time.perf_counter() - self.started_at, 1e-9)
+
+    def as_dict(self) -> dict[str, Any]:
+        elapsed = self.elapsed
+        return {
+            "documents": self.documents,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "chunks_embedded": self.chunks_embedded,
+            "chunks_reused": self.chunks_reused,
+            "elapsed_s": round(elapsed, 2),
+            "docs_per_s": round(self.documents / elapsed, 2),
+            "chunks_per_s": round((self.chunks_embedded + self.chunks_reused) / elapsed, 2),
+        }
+
+
+class BulkIngestionRunner:
+    """Pipelines chunking, embedding and persistence for many documents.
+
+    Files are hashed and chunked in a process pool; ``concurrency`` async
+    workers embed and persist documents, each with its own session and commit.
+    Chunks stream from the pool in batches of ``embedding_batch_size``
+    through a bounded queue per document, so embedding starts while the
+    file is still being chunked. A checkpoint records finished documents so
+    interrupted runs can resume.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        provider: EmbeddingProvider,
+        *,
+        source: str,
+        chunk_size: int = 400,
+        chunk_overlap: int = 0,
+        concurrency: int = 4,
+        embedding_batch_size: int = 64,
+        embedding_concurrency: int = 2,
+        process_workers: int | None = None,
+        executor: Executor | None = None,
+        checkpoint: IngestionCheckpoint | None = None,
+        checkpoint_every: int = 20,
+        progress_every: int = 50,
+    ) -> None:
+        self._session_factory = session_factory
+        self._provider = provider
+        self._source = source
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+        self._concurrency = max(1, concurrency)
+        self._embedding_batch_size = embedding_batch_size
+        self._embedding_concurrency = embedding_concurrency
+        self._process_workers = process_workers
+        self._executor = executor
+        self._checkpoint = checkpoint if checkpoint is not None else IngestionCheckpoint(None)
+        self._checkpoint_every = checkpoint_every
+        self._progress_every = progress_every
+
+    async def run(self, files: Iterable[Path]) -> BulkIngestionStats:
+        stats = BulkIngestionStats()
+        executor = self._executor or ProcessPoolExecutor(max_workers=self._process_workers)
+        # Process workers need proxied queues; threads share plain ones
+        manager = (
+            multiprocessing.Manager() if isinstance(executor, ProcessPoolExecutor) else None
+        )
+        # Jobs are queued in submission order; the bound caps documents in flight.
+        jobs: asyncio.Queue[_Job | None] = asyncio.Queue(maxsize=self._concurrency * 2)
+        try:
+            consumers = [
+                asyncio.create_task(self._consume(jobs, stats))
+                for _ in range(self._concurrency)
+            ]
+            await self._produce(jobs, executor, manager, files)
+            await asyncio.gather(*consumers)
+        finally:
+            if self._executor is None:
+                executor.shutdown(cancel_futures=True)
+            if manager is not None:
+                manager.shutdown()
+            self._checkpoint.save(force=True)
+
+        logger.info("bulk_ingestion_completed", source=self._source, **stats.as_dict())
+        return stats
+
+    async def _produce(
+        self,
+        jobs: asyncio.Queue[_Job | None],
+        executor: Executor,
+        manager: SyncManager | None,
+        files: Iterable[Path],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        for file_path in files:
+            path = str(file_path)
+            # Two batches: one being embedded, one being chunked
+            sink: ChunkSink = (
+                manager.Queue(maxsize=2) if manager is not None else queue.Queue(maxsize=2)
+            )
+            job = partial(
+                chunk_document,
+                path,
+                sink,
+                chunk_size=self._chunk_size,
+                chunk_overlap=self._chunk_overlap,
+                batch_size=self._embedding_batch_size,
+                known_hash=self._checkpoint.get(path),
+            )
+            await jobs.put(_Job(loop.run_in_executor(executor, job), sink))
+        for _ in range(self._concurrency):
+            await jobs.put(None)
+
+    async def _consume(
+        self,
+        jobs: asyncio.Queue[_Job | None],
+        stats: BulkIngestionStats,
+    ) -> None:
+        while (job := await jobs.get()) is not None:
+            try:
+                await self._handle(job, stats)
+            finally:
+                # A worker blocks on a full sink until every batch is taken
+                await job.drain()
+            self._report(stats)
+
+    async def _handle(self, job: _Job, stats: BulkIngestionStats) -> None:
+        try:
+            document = await job.receive()
+            first = await job.receive() if document is not None else None
+            if first is None:
+                await job.future  # raises the worker's error, if any
+        except Exception as exc:  # pragma: no cover - unreadable file path
+            stats.failed += 1
+            logger.warning("bulk_ingestion_parse_failed", error=str(exc))
+            return
+
+        if document is None or not document.changed:
+            stats.skipped += 1
+        elif first is None:
+            stats.skipped += 1
+            logger.info("bulk_ingestion_empty_document", path=document.path)
+        else:
+            await self._ingest(document, job.chunks(first), stats)
+
+    async def _ingest(
+        self,
+        document: ChunkedDocument,
+        chunks: AsyncIterator[str],
+        stats: BulkIngestionStats,
+    ) -> None:
+        async with self._session_factory() as session:
+            service = DocumentIngestionService(
+                session,
+                self._provider,
+                embedding_batch_size=self._embedding_batch_size,
+                embedding_concurrency=self._embedding_concurrency,
+            )
+            try:
+                result = await service.ingest_chunks(
+                    title=document.title,
+                    source=self._source,
+                    chunks=chunks,
+                    path=document.path,
+                    content_hash=document.content_hash,
+                )
+                await session.commit()
+            except Exception as exc:
+                await session.rollback()
+                stats.failed += 1
+                logger.warning("bulk_ingestion_failed", path=document.path, error=str(exc))
+                return
+
+        stats.documents += 1
+        stats.chunks_embedded += result.chunks_ingested
+        stats.chunks_reused += result.chunks_reused
+        self._checkpoint.mark(document.path, document.content_hash)
+        self._checkpoint.save(every=self._checkpoint_every)
+
+    def _report(self, stats: BulkIngestionStats) -> None:
+        processed = stats.documents + stats.skipped + stats.failed
+        if self._progress_every and processed % self._progress_every == 0:
+            logger.info("bulk_ingestion_progress", processed=processed, **stats.as_dict())
+
+
+@dataclass(slots=True)
+class _Job:
+    """A document being chunked in the pool and the sink its batches arrive on."""
+
+    future: asyncio.Future[int]
+    sink: ChunkSink
+    done: bool = False
+
+    async def receive(self) -> Any:
+        if self.done:
+            return None
+        item = await asyncio.get_running_loop().run_in_executor(None, self.sink.get)
+        self.done = item is None
+        return item
+
+    async def chunks(self, first: list[str]) -> AsyncIterator[str]:
+        batch: list[str] | None = first
+        while batch is not None:
+            for chunk in batch:
+                yield chunk
+            batch = await self.receive()
+        # A worker failing mid-file must not leave a partial document committed
+        await self.future
+
+    async def drain(self) -> None:
+        while not self.done:
+            await self.receive()
+        await asyncio.gather(self.future, return_exceptions=True)
+
+
+__all__ = [
+    "BulkIngestionRunner",
+    "BulkIngestionStats",
+    "ChunkSink",
+    "ChunkedDocument",
+    "IngestionCheckpoint",
+    "chunk_document",
+    "discover_documents",
+]
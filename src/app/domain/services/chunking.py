@@ -0,0 +1,200 @@
+"""Streaming, token-aware text chunking for knowledge ingestion."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, Protocol
+
+try:  # pragma: no cover - optional dependency
+    import tiktoken  # type: ignore[import]
+except ImportError:  # pragma: no cover - fallback when tiktoken is absent
+    tiktoken = None  # type: ignore[assignment]
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+
+class Tokenizer(Protocol):  # pragma: no cover - protocol
+    """Protocol implemented by pluggable tokenizers."""
+
+    def encode(self, text: str) -> Sequence[Any]:
+        """Split text into tokens."""
+
+    def decode(self, tokens: Sequence[Any]) -> str:
+        """Rebuild text from tokens produced by ``encode``."""
+
+
+class WhitespaceTokenizer:
+    """Counts whitespace separated words as tokens (legacy behaviour)."""
+
+    def encode(self, text: str) -> list[str]:
+        return text.split()
+
+    def decode(self, tokens: Sequence[Any]) -> str:
+        return " ".join(tokens)
+
+
+class TiktokenTokenizer:
+    """Tokenizer backed by ``tiktoken`` encodings used by OpenAI models."""
+
+    def __init__(self, encoding_name: str = "cl100k_base") -> None:
+        if tiktoken is None:
+            raise RuntimeError("tiktoken is not installed; use WhitespaceTokenizer instead")
+        self._encoding = tiktoken.get_encoding(encoding_name)
+
+    def encode(self, text: str) -> list[int]:
+        return self._encoding.encode(text, disallowed_special=())
+
+    def decode(self, tokens: Sequence[Any]) -> str:
+        return self._encoding.decode(list(tokens))
+
+
+def iter_file_blocks(
+    path: Path, *, encoding: str = "utf-8", block_size: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[str]:
+    """Yield the file as bounded line fragments without loading it entirely."""
+
+    with path.open("r", encoding=encoding) as handle:
+        while True:
+            block = handle.readline(block_size)
+            if not block:
+                return
+            yield block
+
+
+def iter_paragraph_segments(
+    lines: Iterable[str], *, max_chars: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[tuple[str, bool]]:
+    """Group lines into paragraphs separated by blank lines.
+
+    Paragraphs longer than ``max_chars`` are emitted in pieces cut at whitespace,
+    so memory stays bounded even for documents without blank lines. Each item is
+    ``(segment, continues_previous)``.
+    """
+
+    buffer: list[str] = []
+    size = 0
+    continues = False
+    for line in lines:
+        if not line.strip() and line.endswith("\n"):
+            if buffer:
+                segment = "".join(buffer).strip()
+                if segment:
+                    yield segment, continues
+            buffer, size, continues = [], 0, False
+            continue
+        buffer.append(line)
+        size += len(line)
+        while size > max_chars:
+            pending = "".join(buffer)
+            cut = max(pending.rfind(" ", 0, max_chars), pending.rfind("\n", 0, max_chars))
+            if cut <= 0:
+                cut = max_chars
+            segment = pending[:cut].strip()
+            remainder = pending[cut:]
+            if segment:
+                yield segment, continues
+                continues = True
+            buffer, size = [remainder], len(remainder)
+    if buffer:
+        segment = "".join(buffer).strip()
+        if segment:
+            yield segment, continues
+
+
+class StreamingChunker:
+    """Packs paragraphs into chunks bounded by a token budget.
+
+    Paragraphs are packed greedily; paragraphs larger than the budget are hard
+    split at token boundaries. Consecutive chunks share ``overlap`` tokens.
+    Only one chunk worth of tokens is held in memory at a time.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Tokenizer | None = None,
+        *,
+        max_tokens: int = 400,
+        overlap: int = 0,
+        max_paragraph_chars: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        if overlap < 0 or overlap >= max_tokens:
+            raise ValueError("overlap must be between 0 and max_tokens - 1")
+        self._tokenizer = tokenizer or WhitespaceTokenizer()
+        self._max_tokens = max_tokens
+        self._overlap = overlap
+        self._max_paragraph_chars = max_paragraph_chars
+        self._paragraph_separator = list(self._tokenizer.encode("\n\n"))
+        self._word_separator = list(self._tokenizer.encode(" "))
+
+    @property
+    def max_tokens(self) -> int:
+        return self._max_tokens
+
+    def count_tokens(self, text: str) -> int:
+        return len(self._tokenizer.encode(text))
+
+    def chunk_text(self, text: str) -> Iterator[str]:
+        return self.chunk_lines(text.splitlines(keepends=True))
+
+    def chunk_file(
+        self,
+        path: Path,
+        *,
+        encoding: str = "utf-8",
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> Iterator[str]:
+        return self.chunk_lines(iter_file_blocks(path, encoding=encoding, block_size=block_size))
+
+    def chunk_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        segments = iter_paragraph_segments(lines, max_chars=self._max_paragraph_chars)
+        return self.chunk_segments(segments)
+
+    def chunk_segments(self, segments: Iterable[tuple[str, bool]]) -> Iterator[str]:
+        buffer: list[Any] = []
+        fresh = 0  # tokens in buffer that are not carried-over overlap
+
+        for segment, continues in segments:
+            tokens = list(self._tokenizer.encode(segment))
+            if not tokens:
+                continue
+            separator = self._word_separator if continues else self._paragraph_separator
+            if buffer and fresh and len(buffer) + len(separator) + len(tokens) > self._max_tokens:
+                yield from self._emit(buffer)
+                buffer = self._carry_over(buffer)
+                fresh = 0
+            if buffer:
+                tokens = separator + tokens
+
+            while tokens:
+                space = self._max_tokens - len(buffer)
+                buffer.extend(tokens[:space])
+                fresh += min(space, len(tokens))
+                tokens = tokens[space:]
+                if len(buffer) >= self._max_tokens:
+                    yield from self._emit(buffer)
+                    buffer = self._carry_over(buffer)
+                    fresh = 0
+
+        if fresh:
+            yield from self._emit(buffer)
+
+    def _carry_over(self, buffer: list[Any]) -> list[Any]:
+        return buffer[-self._overlap:] if self._overlap else []
+
+    def _emit(self, tokens: list[Any]) -> Iterator[str]:
+        text = self._tokenizer.decode(tokens).strip()
+        if text:
+            yield text
+
+
+__all__ = [
+    "StreamingChunker",
+    "TiktokenTokenizer",
+    "Tokenizer",
+    "WhitespaceTokenizer",
+    "iter_file_blocks",
+    "iter_paragraph_segments",
+]
@@ -37,6 +37,7 @@ class EmbeddingService:
         await upsert_message_embedding(
             self._session,
             message_id=message.id,
+            created_at=message.created_at,
             embedding=embedding,
             content=message.content,
         )
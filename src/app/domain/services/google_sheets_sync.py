@@ -1,7 +1,16 @@
-"""Service that synchronizes Google Sheets rows into SparkOne."""
+"""Service that synchronizes Google Sheets rows into SparkOne.
+
+Only rows after the stored ``last_row_index`` are requested, in bounded pages,
+so a sync costs in proportion to the new rows rather than the sheet size.
+Before reading, the spreadsheet's Drive ``modifiedTime`` is compared with the
+one seen by the last complete sync; when it is unchanged no rows are read.
+"""
 
 from __future__ import annotations
 
+import re
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any
 
 import structlog
@@ -16,6 +25,53 @@ from app.domain.services.ingestion import IngestionService
 
 logger = structlog.get_logger(__name__)
 
+DEFAULT_PAGE_SIZE = 500
+
+_A1_RANGE = re.compile(
+    r"^(?:(?P<sheet>.+)!)?(?P<start_col>[A-Za-z]*)(?P<start_row>\d*)"
+    r"(?::(?P<end_col>[A-Za-z]*)(?P<end_row>\d*))?$"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _SheetRange:
+    """Parsed A1 range; row indexes passed to :meth:`window` are 1-based within it."""
+
+    sheet: str | None
+    start_col: str
+    end_col: str
+    first_row: int
+    last_row: int | None
+
+    @classmethod
+    def parse(cls, range_name: str) -> _SheetRange:
+        match = _A1_RANGE.match(range_name)
+        if "!" not in range_name or match is None:
+            # A bare sheet name covers the whole tab
+            return cls(range_name, "", "", 1, None)
+        end_row = match["end_row"]
+        return cls(
+            match["sheet"],
+            match["start_col"].upper(),
+            (match["end_col"] or "").upper(),
+            int(match["start_row"] or 1),
+            int(end_row) if end_row else None,
+        )
+
+    def window(self, first_index: int, count: int) -> str | None:
+        """A1 range for ``count`` rows starting at range row ``first_index``.
+
+        Returns None when ``first_index`` lies past the end of a bounded range.
+        """
+        start = self.first_row + first_index - 1
+        end = start + count - 1
+        if self.last_row is not None:
+            end = min(end, self.last_row)
+        if end < start:
+            return None
+        prefix = f"{self.sheet}!" if self.sheet else ""
+        return f"{prefix}{self.start_col}{start}:{self.end_col}{end}"
+
 
 class GoogleSheetsSyncService:
     def __init__(
@@ -27,6 +83,7 @@ class GoogleSheetsSyncService:
         ingestion_service: IngestionService,
         spreadsheet_id: str,
         range_name: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
     ) -> None:
         self._session = session
         self._client = client
@@ -34,6 +91,8 @@ class GoogleSheetsSyncService:
         self._ingestion = ingestion_service
         self._spreadsheet_id = spreadsheet_id
         self._range_name = range_name
+        self._range = _SheetRange.parse(range_name)
+        self._page_size = max(1, page_size)
 
     async def sync(self) -> dict[str, Any]:
         state = await get_sheets_sync_state(
@@ -42,14 +101,22 @@ class GoogleSheetsSyncService:
             range_name=self._range_name,
         )
         last_row_index = state.last_row_index if state else 0
-        rows = await self._client.list_rows(self._spreadsheet_id, self._range_name)
+        modified_time = await self._probe_modified_time()
+        if modified_time is not None and state and state.source_modified_time == modified_time:
+            SHEETS_SYNC_COUNTER.labels(status="skipped").inc()
+            return {
+                "processed": 0,
+                "last_row_index": last_row_index,
+                "skipped": 0,
+                "failures": 0,
+                "unchanged": True,
+            }
+
         processed = 0
         skipped = 0
         failures = 0
         last_processed_index = last_row_index
-        for index, row in enumerate(rows, start=1):
-            if index <= last_row_index:
-                continue
+        async for index, row in self._new_rows(last_row_index):
             if not self._has_meaningful_values(row):
                 skipped += 1
                 continue
@@ -70,13 +137,17 @@ class GoogleSheetsSyncService:
             last_processed_index = index
             processed += 1
 
-        if processed:
+        # Remember the probe only after a clean pass, so failed rows are retried
+        remember = modified_time if not failures else None
+        if processed or (remember and (state is None or state.source_modified_time != remember)):
             await update_sheets_sync_state(
                 self._session,
                 spreadsheet_id=self._spreadsheet_id,
                 range_name=self._range_name,
                 last_row_index=last_processed_index,
+                source_modified_time=remember,
             )
+        if processed:
             SHEETS_SYNC_COUNTER.labels(status="success").inc(processed)
         if skipped:
             SHEETS_SYNC_COUNTER.labels(status="skipped").inc(skipped)
@@ -90,8 +161,35 @@ class GoogleSheetsSyncService:
             "last_row_index": last_processed_index,
             "skipped": skipped,
             "failures": failures,
+            "unchanged": False,
         }
 
+    async def _new_rows(self, last_row_index: int) -> AsyncIterator[tuple[int, list[Any]]]:
+        """Yield ``(row_index, row)`` after ``last_row_index``, one bounded page at a time.
+
+        The API trims trailing empty rows, so a short page is the last one.
+        """
+        next_index = last_row_index + 1
+        while True:
+            window = self._range.window(next_index, self._page_size)
+            if window is None:
+                return
+            rows = await self._client.list_rows(self._spreadsheet_id, window)
+            for offset, row in enumerate(rows):
+                yield next_index + offset, row
+            if len(rows) < self._page_size:
+                return
+            next_index += self._page_size
+
+    async def _probe_modified_time(self) -> str | None:
+        """Return the spreadsheet modifiedTime, or None if the probe is unavailable."""
+        try:
+            return await self._client.get_modified_time(self._spreadsheet_id)
+        except Exception as exc:
+            # Drive API disabled or not shared: fall back to the bounded read
+            logger.debug("sheets_probe_unavailable", error=str(exc))
+            return None
+
     def _has_meaningful_values(self, row: list[Any]) -> bool:
         for cell in row:
             if isinstance(cell, str) and cell.strip():
@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from collections import defaultdict, deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from pathlib import Path
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.services.chunking import StreamingChunker, Tokenizer
+from app.domain.services.ingestion_lanes import IngestionLanes
+from app.infrastructure.database.models.knowledge import compute_content_hash
 from app.infrastructure.database.models.repositories import (
+    bulk_insert_knowledge_chunks,
     create_knowledge_document,
-    insert_knowledge_chunks,
+    delete_knowledge_chunks,
+    get_knowledge_document_by_path,
+    list_knowledge_chunk_hashes,
+    reindex_knowledge_chunks,
 )
+from app.infrastructure.database.sqlite_writer import SQLiteWriter
 from app.infrastructure.embeddings import EmbeddingProvider
 
 logger = structlog.get_logger(__name__)
@@ -18,16 +33,45 @@ logger = structlog.get_logger(__name__)
 
 @dataclass(slots=True)
 class IngestionResult:
+    """Outcome of a document ingestion.
+
+    ``chunks_ingested`` counts newly embedded chunks; on re-ingestion, chunks
+    whose content hash already existed are reported in ``chunks_reused``.
+    """
+
     document_id: int
     chunks_ingested: int
+    chunks_reused: int = 0
+    chunks_deleted: int = 0
+    unchanged: bool = False
 
 
 class DocumentIngestionService:
-    """Transforms raw text documents into semantic chunks."""
+    """Transforms raw text documents into semantic chunks.
 
-    def __init__(self, session: AsyncSession, provider: EmbeddingProvider | None) -> None:
+    Chunks are produced lazily by :class:`StreamingChunker` and embedded in
+    batches (up to ``embedding_concurrency`` requests in flight), so file
+    ingestion runs in memory bounded by the batch size and concurrency.
+    Documents ingested with a ``path`` are identified by ``(source, path)``;
+    re-ingesting them only embeds chunks whose content hash is new.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        provider: EmbeddingProvider | None,
+        *,
+        tokenizer: Tokenizer | None = None,
+        chunk_overlap: int = 0,
+        embedding_batch_size: int = 64,
+        embedding_concurrency: int = 1,
+    ) -> None:
         self._session = session
         self._provider = provider
+        self._tokenizer = tokenizer
+        self._chunk_overlap = chunk_overlap
+        self._embedding_batch_size = embedding_batch_size
+        self._embedding_concurrency = max(1, embedding_concurrency)
 
     async def ingest_text(
         self,
@@ -37,61 +81,231 @@ class DocumentIngestionService:
         text: str,
         metadata: dict | None = None,
         chunk_size: int = 400,
+        path: str | None = None,
     ) -> IngestionResult:
+        chunker = self._chunker(chunk_size)
+        return await self.ingest_chunks(
+            title=title,
+            source=source,
+            metadata=metadata,
+            chunks=chunker.chunk_text(text),
+            path=path,
+            content_hash=compute_content_hash(text),
+        )
+
+    async def ingest_file(
+        self,
+        path: Path,
+        *,
+        source: str,
+        title: str | None = None,
+        metadata: dict | None = None,
+        chunk_size: int = 400,
+        encoding: str = "utf-8",
+        document_path: str | None = None,
+    ) -> IngestionResult:
+        """Stream a file from disk into the knowledge base.
+
+        ``document_path`` overrides the identity key (defaults to ``str(path)``).
+        """
+
+        chunker = self._chunker(chunk_size)
+        return await self.ingest_chunks(
+            title=title or path.stem,
+            source=source,
+            metadata=metadata,
+            chunks=chunker.chunk_file(path, encoding=encoding),
+            path=document_path or str(path),
+            content_hash=_hash_file(path),
+        )
+
+    async def ingest_chunks(
+        self,
+        *,
+        title: str,
+        source: str,
+        chunks: Iterable[str] | AsyncIterable[str],
+        metadata: dict | None = None,
+        path: str | None = None,
+        content_hash: str | None = None,
+    ) -> IngestionResult:
+        """Embed and persist already chunked content (used by bulk ingestion).
+
+        ``chunks`` is consumed lazily, one embedding window at a time, so it
+        may stream from a worker that is still chunking.
+        """
+
         if self._provider is None:
             raise RuntimeError(
                 "Embedding provider is required to ingest knowledge documents")
 
-        chunks = self._split_text(text, chunk_size)
-        if not chunks:
+        document = None
+        if path is not None:
+            document = await get_knowledge_document_by_path(
+                self._session, source=source, path=path
+            )
+        if document is not None and content_hash and document.content_hash == content_hash:
+            logger.info("knowledge_document_unchanged", document_id=document.id, path=path)
+            return IngestionResult(document_id=document.id, chunks_ingested=0, unchanged=True)
+
+        batches = _batched_async(chunks, self._embedding_batch_size)
+        first_batch = await anext(batches, None)
+        if not first_batch:
             raise ValueError("Text is empty or could not be chunked")
 
-        vectors = await self._provider.generate(chunks)
-        if len(vectors) != len(chunks):  # pragma: no cover - sanity check
-            logger.warning("chunk_vector_mismatch",
-                           chunks=len(chunks), vectors=len(vectors))
+        # Existing chunks keyed by content hash; duplicates are matched in order.
+        existing: dict[str, deque[tuple[int, int]]] = defaultdict(deque)
+        unhashed: list[int] = []
+        reingest = document is not None
+        if document is None:
+            document = await create_knowledge_document(
+                self._session,
+                title=title,
+                source=source,
+                metadata=metadata,
+                path=path,
+                content_hash=content_hash,
+            )
+        else:
+            for chunk_id, chunk_index, chunk_hash in await list_knowledge_chunk_hashes(
+                self._session, document_id=document.id
+            ):
+                if chunk_hash:
+                    existing[chunk_hash].append((chunk_id, chunk_index))
+                else:
+                    unhashed.append(chunk_id)
 
-        document = await create_knowledge_document(
-            self._session,
-            title=title,
-            source=source,
-            metadata=metadata,
-        )
+        index = 0
+        ingested = 0
+        reused = 0
+        moves: list[tuple[int, int]] = []
+        pending: list[tuple[int, str]] = []
+        ready: list[list[tuple[int, str]]] = []
+        batch: list[str] | None = first_batch
+        while batch is not None:
+            for content in batch:
+                matches = existing.get(compute_content_hash(content))
+                if matches:
+                    chunk_id, previous_index = matches.popleft()
+                    reused += 1
+                    if previous_index != index:
+                        moves.append((chunk_id, index))
+                else:
+                    pending.append((index, content))
+                index += 1
+            while len(pending) >= self._embedding_batch_size:
+                ready.append(pending[: self._embedding_batch_size])
+                pending = pending[self._embedding_batch_size:]
+            if len(ready) >= self._embedding_concurrency:
+                ingested += await self._embed_and_store(document.id, ready)
+                ready = []
+            batch = await anext(batches, None)
+        if pending:
+            ready.append(pending)
+        if ready:
+            ingested += await self._embed_and_store(document.id, ready)
+
+        await reindex_knowledge_chunks(self._session, positions=moves)
+        stale = unhashed + [chunk_id for matches in existing.values() for chunk_id, _ in matches]
+        deleted = await delete_knowledge_chunks(self._session, chunk_ids=stale)
+
+        if reingest:
+            document.title = title
+            document.content_hash = content_hash
+            if metadata is not None:
+                document.extra_data = metadata
+            self._session.add(document)
+            await self._session.flush()
+            logger.info(
+                "knowledge_document_reingested",
+                document_id=document.id,
+                embedded=ingested,
+                reused=reused,
+                deleted=deleted,
+            )
 
-        chunk_records = [
-            (index, chunk, vector)
-            for index, (chunk, vector) in enumerate(zip(chunks, vectors, strict=False))
-        ]
-        await insert_knowledge_chunks(
-            self._session,
+        return IngestionResult(
             document_id=document.id,
-            chunks=chunk_records,
+            chunks_ingested=ingested,
+            chunks_reused=reused,
+            chunks_deleted=deleted,
         )
 
-        return IngestionResult(document_id=document.id, chunks_ingested=len(chunk_records))
+    async def _embed_and_store(
+        self, document_id: int, batches: list[list[tuple[int, str]]]
+    ) -> int:
+        assert self._provider is not None
+        # Embedding requests run concurrently; inserts stay sequential on the session.
+        results = await asyncio.gather(
+            *(self._provider.generate([content for _, content in batch]) for batch in batches)
+        )
+        stored = 0
+        for batch, vectors in zip(batches, results, strict=True):
+            if len(vectors) != len(batch):  # pragma: no cover - sanity check
+                logger.warning("chunk_vector_mismatch",
+                               chunks=len(batch), vectors=len(vectors))
+            stored += await bulk_insert_knowledge_chunks(
+                self._session,
+                document_id=document_id,
+                chunks=[
+                    (chunk_index, content, vector)
+                    for (chunk_index, content), vector in zip(batch, vectors, strict=False)
+                ],
+            )
+        return stored
+
+    def _chunker(self, chunk_size: int) -> StreamingChunker:
+        return StreamingChunker(
+            self._tokenizer,
+            max_tokens=chunk_size,
+            overlap=min(self._chunk_overlap, chunk_size - 1),
+        )
 
     def _split_text(self, text: str, chunk_size: int) -> list[str]:
-        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-        chunks: list[str] = []
-        current: list[str] = []
-        current_len = 0
-        for paragraph in paragraphs:
-            words = paragraph.split()
-            if current_len + len(words) > chunk_size and current:
-                chunks.append(" ".join(current))
-                current = []
-                current_len = 0
-            current.append(paragraph)
-            current_len += len(words)
-        if current:
-            chunks.append(" ".join(current))
-        if not chunks and text.strip():
-            return [text.strip()]
-        return chunks
+        return list(self._chunker(chunk_size).chunk_text(text))
+
+
+def _batched(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+async def _batched_async(
+    items: Iterable[str] | AsyncIterable[str], size: int
+) -> AsyncIterator[list[str]]:
+    if not isinstance(items, AsyncIterable):
+        for batch in _batched(items, size):
+            yield batch
+        return
+    pending: list[str] = []
+    async for item in items:
+        pending.append(item)
+        if len(pending) == size:
+            yield pending
+            pending = []
+    if pending:
+        yield pending
+
+
+def _hash_file(path: Path, block_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while block := handle.read(block_size):
+            digest.update(block)
+    return digest.hexdigest()
 
 
 class IngestionService:
-    """High-level ingestion service for channel messages."""
+    """High-level ingestion service for channel messages.
+
+    When ``lanes`` is provided, messages run in the priority lane of their
+    channel so bulk imports cannot delay interactive traffic. With
+    ``commit=False`` the caller owns the transaction (the request's unit of
+    work, see ``get_db_session``) and messages are only flushed. With a
+    SQLite ``writer`` (single-writer mode) the inserts are handed to its
+    batching task instead and are committed when ``ingest`` returns.
+    """
 
     def __init__(
         self,
@@ -100,15 +314,26 @@ class IngestionService:
         embedding_service=None,
         memory_service=None,
         dispatcher=None,
+        lanes: IngestionLanes | None = None,
+        commit: bool = True,
+        writer: SQLiteWriter | None = None,
     ) -> None:
         self._session = session
         self._orchestrator = orchestrator
         self._embedding_service = embedding_service
         self._memory_service = memory_service
         self._dispatcher = dispatcher
+        self._lanes = lanes
+        self._commit = commit
+        self._writer = writer
 
     async def ingest(self, message) -> dict:
         """Ingest a channel message."""
+        if self._lanes is not None:
+            return await self._lanes.submit(message.channel, partial(self._ingest, message))
+        return await self._ingest(message)
+
+    async def _ingest(self, message) -> dict:
         from app.infrastructure.database.models.repositories import (
             save_channel_message,
             append_conversation_message,
@@ -120,23 +345,32 @@ class IngestionService:
                    sender=message.sender,
                    content_length=len(message.content))
 
-        # Save channel message
-        channel_msg = await save_channel_message(
-            self._session,
-            payload=message,
-        )
+        async def persist(session: AsyncSession):
+            # Save channel message
+            channel_msg = await save_channel_message(
+                session,
+                payload=message,
+            )
 
-        # Create user message in conversation
-        user_msg = await append_conversation_message(
-            self._session,
-            conversation_id="default",  # Default conversation
-            channel=message.channel,
-            sender=message.sender,
-            role=ConversationRole.USER,
-            content=message.content,
-        )
+            # Create user message in conversation
+            user_msg = await append_conversation_message(
+                session,
+                conversation_id="default",  # Default conversation
+                channel=message.channel,
+                sender=message.sender,
+                role=ConversationRole.USER,
+                content=message.content,
+            )
+            return channel_msg, user_msg
 
-        await self._session.commit()
+        if self._writer is not None:
+            channel_msg, user_msg = await self._writer.run(persist)
+        else:
+            channel_msg, user_msg = await persist(self._session)
+            if self._commit:
+                await self._session.commit()
+            else:
+                await self._session.flush()
 
         logger.info("message_saved",
                    channel_message_id=channel_msg.id,
@@ -0,0 +1,242 @@
+"""Priority lanes that keep interactive ingestion isolated from bulk imports."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import structlog
+
+from app.core.metrics import INGESTION_LANE_QUEUE_DEPTH, INGESTION_LANE_WAIT
+from app.models.schemas import Channel
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+INTERACTIVE_LANE = "interactive"
+BULK_LANE = "bulk"
+
+DEFAULT_CHANNEL_LANES: dict[str, str] = {
+    Channel.WHATSAPP.value: INTERACTIVE_LANE,
+    Channel.WEB.value: INTERACTIVE_LANE,
+    Channel.GOOGLE_SHEETS.value: BULK_LANE,
+}
+
+
+class LaneFullError(RuntimeError):
+    """Raised when a lane queue is at capacity."""
+
+
+@dataclass(slots=True, frozen=True)
+class LaneConfig:
+    name: str
+    weight: int = 1
+    workers: int = 1
+    max_queue: int = 1000
+
+
+class WeightedFairLimiter:
+    """Shares ``capacity`` execution slots between lanes in proportion to weight.
+
+    Contended slots go to the waiting lane with the lowest virtual pass
+    (stride scheduling); a lane returning from idle starts at the current
+    virtual time, so it cannot bank credit while it had nothing to run.
+    """
+
+    def __init__(self, capacity: int, weights: Mapping[str, int]) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._free = capacity
+        self._weights = {lane: max(1, weight) for lane, weight in weights.items()}
+        self._pass = dict.fromkeys(self._weights, 0.0)
+        self._virtual_time = 0.0
+        self._waiters: dict[str, deque[asyncio.Future[None]]] = {
+            lane: deque() for lane in self._weights
+        }
+
+    @property
+    def available(self) -> int:
+        return self._free
+
+    async def acquire(self, lane: str) -> None:
+        if self._free and not any(self._waiters.values()):
+            self._grant(lane)
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._waiters[lane].remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self._free += 1
+        while self._free:
+            ready = [lane for lane, waiters in self._waiters.items() if waiters]
+            if not ready:
+                return
+            lane = min(ready, key=lambda name: self._pass[name])
+            waiter = self._waiters[lane].popleft()
+            if waiter.cancelled():
+                continue
+            self._grant(lane)
+            waiter.set_result(None)
+
+    def _grant(self, lane: str) -> None:
+        self._free -= 1
+        start = max(self._pass[lane], self._virtual_time)
+        self._virtual_time = start
+        self._pass[lane] = start + 1 / self._weights[lane]
+
+
+class IngestionLanes:
+    """Routes ingestion jobs to per-lane queues and worker pools.
+
+    Each lane has its own bounded queue and workers, so a backlog in one lane
+    never sits in front of another lane's messages. Running jobs additionally
+    share ``capacity`` slots (sized to what the database can absorb) through a
+    :class:`WeightedFairLimiter`. Workers start lazily on the running loop.
+    """
+
+    def __init__(
+        self,
+        lanes: Sequence[LaneConfig],
+        *,
+        capacity: int,
+        channel_lanes: Mapping[str, str] | None = None,
+        default_lane: str = INTERACTIVE_LANE,
+    ) -> None:
+        self._configs = {lane.name: lane for lane in lanes}
+        if default_lane not in self._configs:
+            raise ValueError(f"Unknown default lane: {default_lane}")
+        self._capacity = capacity
+        self._channel_lanes = dict(channel_lanes or DEFAULT_CHANNEL_LANES)
+        self._default_lane = default_lane
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queues: dict[str, asyncio.Queue[_Job]] = {}
+        self._workers: list[asyncio.Task[None]] = []
+        self._limiter: WeightedFairLimiter | None = None
+
+    def lane_for(self, channel: Channel | str) -> str:
+        key = channel.value if isinstance(channel, Channel) else str(channel)
+        lane = self._channel_lanes.get(key, self._default_lane)
+        return lane if lane in self._configs else self._default_lane
+
+    def queue_depths(self) -> dict[str, int]:
+        return {lane: queue.qsize() for lane, queue in self._queues.items()}
+
+    async def submit(
+        self, channel: Channel | str, job: Callable[[], Coroutine[Any, Any, T]]
+    ) -> T:
+        """Run ``job`` in the lane for ``channel`` and return its result."""
+
+        self._ensure_started()
+        lane = self.lane_for(channel)
+        queue = self._queues[lane]
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        try:
+            queue.put_nowait(_Job(job, future, contextvars.copy_context(), time.perf_counter()))
+        except asyncio.QueueFull as exc:
+            raise LaneFullError(f"Ingestion lane '{lane}' is full") from exc
+        INGESTION_LANE_QUEUE_DEPTH.labels(lane=lane).set(queue.qsize())
+        return await future
+
+    async def close(self) -> None:
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for queue in self._queues.values():
+            while not queue.empty():
+                pending = queue.get_nowait()
+                if not pending.future.done():
+                    pending.future.cancel()
+        self._queues = {}
+        self._loop = None
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # Queues and futures are bound to a loop; a new loop gets fresh workers.
+        self._workers = []
+        self._loop = loop
+        self._limiter = WeightedFairLimiter(
+            self._capacity, {name: config.weight for name, config in self._configs.items()}
+        )
+        self._queues = {
+            name: asyncio.Queue(maxsize=config.max_queue) for name, config in self._configs.items()
+        }
+        for name, config in self._configs.items():
+            for index in range(max(1, config.workers)):
+                self._workers.append(
+                    loop.create_task(self._work(name), name=f"ingestion-lane-{name}-{index}")
+                )
+        logger.info(
+            "ingestion_lanes_started",
+            lanes={name: config.workers for name, config in self._configs.items()},
+            capacity=self._capacity,
+        )
+
+    async def _work(self, lane: str) -> None:
+        queue = self._queues[lane]
+        limiter = self._limiter
+        assert limiter is not None
+        while True:
+            job = await queue.get()
+            INGESTION_LANE_QUEUE_DEPTH.labels(lane=lane).set(queue.qsize())
+            if job.future.done():  # caller went away
+                continue
+            await limiter.acquire(lane)
+            INGESTION_LANE_WAIT.labels(lane=lane).observe(time.perf_counter() - job.enqueued_at)
+            try:
+                task = asyncio.create_task(job.factory(), context=job.context)
+                # A caller that gives up (e.g. client disconnect) stops its job too.
+                job.future.add_done_callback(
+                    lambda future, task=task: future.cancelled() and task.cancel()
+                )
+                try:
+                    result = await task
+                except asyncio.CancelledError:
+                    job.future.cancel()
+                    if asyncio.current_task().cancelling():  # type: ignore[union-attr]
+                        raise
+                except Exception as exc:
+                    if not job.future.done():
+                        job.future.set_exception(exc)
+                else:
+                    if not job.future.done():
+                        job.future.set_result(result)
+            finally:
+                limiter.release()
+            # Let ready interactive work run before this worker takes another job.
+            await asyncio.sleep(0)
+
+
+@dataclass(slots=True)
+class _Job:
+    factory: Callable[[], Coroutine[Any, Any, Any]]
+    future: asyncio.Future[Any]
+    context: contextvars.Context
+    enqueued_at: float
+
+
+__all__ = [
+    "BULK_LANE",
+    "DEFAULT_CHANNEL_LANES",
+    "INTERACTIVE_LANE",
+    "IngestionLanes",
+    "LaneConfig",
+    "LaneFullError",
+    "WeightedFairLimiter",
+]
@@ -0,0 +1,756 @@
+"""Write-behind replication of tasks to external storage backends - ADR-014.
+
+Task changes are appended to ``task_replication_outbox`` in the same
+transaction as the change itself. :class:`TaskReplicator` then replays the
+log for every active storage config independently: each backend has its own
+cursor, backoff and external ids, so a slow or failing backend never delays
+the user's request or the other backends.
+
+:meth:`TaskReplicator.reconcile` catches drift the log cannot (tasks changed
+without an outbox entry, refs lost to a partial failure, copies edited or
+deleted in the backend, backends added after the tasks were created). It
+compares per-bucket digests of the local task projections with the
+projections each backend last acknowledged (``task_external_refs``), reads
+back the backend's copies in the buckets that differ plus a random sample of
+the others, and queues the repairs in the outbox, so the usual batched
+replication applies them.
+
+The API has no task delete yet, so no request enqueues a DELETE; the only
+DELETE entries come from reconciliation, for refs whose task no longer
+exists. :meth:`TaskReplicator.status` backs ``GET /health/replication``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import structlog
+from sqlalchemy import ColumnElement, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.metrics import (
+    TASK_RECONCILIATION_REPAIRS,
+    TASK_REPLICATION_COUNTER,
+    TASK_REPLICATION_LAG,
+    TASK_REPLICATION_PENDING,
+)
+from app.domain.interfaces.storage_adapter import StorageAdapter
+from app.infrastructure.database.models.replication import (
+    ReplicationOperation,
+    TaskExternalRef,
+    TaskReplicationCursor,
+    TaskReplicationOutbox,
+)
+from app.infrastructure.database.models.tasks import TaskRecord
+from app.infrastructure.database.models.user_storage_config import UserStorageConfig
+from app.infrastructure.storage.batching import (
+    gather_bounded,
+    save_in_batches,
+    update_in_batches,
+)
+from app.infrastructure.storage.pool import StorageAdapterPool, config_version, get_adapter_pool
+from app.infrastructure.storage.projection import changed_fields, projection_hash
+from app.infrastructure.storage.registry import StorageAdapterRegistry
+from app.infrastructure.storage.throttle import rate_limit_delay
+
+logger = structlog.get_logger(__name__)
+
+_Leaf = tuple[int, str]
+
+
+@dataclass(slots=True, frozen=True)
+class _Backend:
+    config_id: str
+    adapter_name: str
+    user_id: str | None
+    config_json: dict[str, Any]
+
+
+class TaskReplicator:
+    """Replays the task outbox into every active storage backend.
+
+    Replication is state based: for each task touched in a batch the current
+    row is pushed (create when the backend has no external id yet, update
+    otherwise, delete when the task is gone), so replays after a crash or a
+    failed batch are idempotent apart from at-least-once creates. Creates and
+    updates are sent through the adapter's batch operations.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        adapter_pool: StorageAdapterPool | None = None,
+        batch_size: int = 100,
+        base_backoff: float = 5.0,
+        max_backoff: float = 900.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._pool = adapter_pool or get_adapter_pool()
+        self._batch_size = batch_size
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+
+    async def drain(self, *, max_rounds: int = 10) -> dict[str, int]:
+        """Run batches until no backend has a full batch left (or ``max_rounds``)."""
+
+        totals: dict[str, int] = {}
+        for _ in range(max_rounds):
+            replicated = await self.run_once()
+            for config_id, count in replicated.items():
+                totals[config_id] = totals.get(config_id, 0) + count
+            if not any(count >= self._batch_size for count in replicated.values()):
+                break
+        return totals
+
+    async def run_once(self) -> dict[str, int]:
+        """Run one batch for every backend; returns entries replicated per config."""
+
+        backends = await self._load_backends()
+        results = await asyncio.gather(
+            *(self._replicate_backend(backend) for backend in backends),
+            return_exceptions=True,
+        )
+        replicated: dict[str, int] = {}
+        for backend, result in zip(backends, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "task_replication_backend_error",
+                    config_id=backend.config_id,
+                    error=str(result),
+                )
+                continue
+            replicated[backend.config_id] = result
+        await self._prune(backends)
+        return replicated
+
+    async def status(self) -> list[dict[str, Any]]:
+        """Cursor, pending entries and lag (seconds) for each backend."""
+
+        backends = await self._load_backends()
+        async with self._session_factory() as session:
+            return [await self._backend_status(session, backend) for backend in backends]
+
+    async def reconcile(
+        self, *, bucket_size: int = 1000, repair_batch_size: int = 500, sample_buckets: int = 1
+    ) -> dict[str, dict[str, int]]:
+        """Queue repairs for tasks whose backend copy drifted; returns counts per config.
+
+        Tasks are bucketed by id range. Each bucket gets one digest over the
+        local projection hashes and one over the hashes stored on the
+        backend's refs. Buckets whose digests differ, plus ``sample_buckets``
+        random in-sync ones, are then checked task by task against the
+        backend itself: every referenced copy is read back with
+        :meth:`StorageAdapter.get_task`, so edits and deletions made in the
+        backend are found even though the refs never saw them. Sampling
+        bounds those reads while every bucket is eventually covered.
+
+        Copies that differ from the local task are queued as updates (the ref
+        is first pointed at what the backend really holds, so only the
+        differing fields are sent), missing copies and tasks without a ref as
+        creates, and refs of deleted tasks as deletes. Before a create for a
+        task without a ref, :meth:`StorageAdapter.find_task` looks for a copy
+        that survived and links it instead. Backends that cannot read tasks
+        back are compared against their refs only.
+        """
+
+        results: dict[str, dict[str, int]] = {}
+        for backend in await self._load_backends():
+            try:
+                results[backend.config_id] = await self._reconcile_backend(
+                    backend, bucket_size, repair_batch_size, sample_buckets
+                )
+            except Exception as exc:
+                logger.warning(
+                    "task_reconciliation_failed", config_id=backend.config_id, error=str(exc)
+                )
+        return results
+
+    async def _reconcile_backend(
+        self, backend: _Backend, bucket_size: int, repair_batch_size: int, sample_buckets: int
+    ) -> dict[str, int]:
+        adapter = self._adapter(backend)
+        reads = await adapter.supports_task_reads()
+        async with self._session_factory() as session:
+            cursor = await session.get(TaskReplicationCursor, backend.config_id)
+            if cursor is None:
+                # No cursor yet: it will start at the log head, past any repair
+                # queued now. The next run backfills once it exists.
+                return {}
+            # Tasks with changes still in the log are about to be replicated
+            in_flight = set(
+                (
+                    await session.execute(
+                        _pending(backend)
+                        .with_only_columns(TaskReplicationOutbox.task_id)
+                        .where(TaskReplicationOutbox.id > cursor.last_outbox_id)
+                    )
+                ).scalars()
+            )
+
+            local = await _bucket_digests(
+                self._local_leaves(session, adapter, backend), bucket_size
+            )
+            remote = await _bucket_digests(self._ref_leaves(session, backend), bucket_size)
+            buckets = local.keys() | remote.keys()
+            mismatched = sorted(
+                bucket for bucket in buckets if local.get(bucket) != remote.get(bucket)
+            )
+            sampled: list[int] = []
+            if reads:
+                in_sync = sorted(buckets.difference(mismatched))
+                sampled = random.sample(in_sync, min(sample_buckets, len(in_sync)))
+
+            repairs: list[tuple[int, ReplicationOperation]] = []
+            relinked = unverified = 0
+            for bucket in sorted([*mismatched, *sampled]):
+                bounds = (bucket * bucket_size, (bucket + 1) * bucket_size)
+                ours = {
+                    leaf[0]: leaf[1]
+                    async for leaf in self._local_leaves(session, adapter, backend, bounds)
+                }
+                refs = {
+                    ref.task_id: ref
+                    for ref in (
+                        await session.scalars(
+                            select(TaskExternalRef).where(
+                                TaskExternalRef.config_id == backend.config_id,
+                                TaskExternalRef.task_id >= bounds[0],
+                                TaskExternalRef.task_id < bounds[1],
+                            )
+                        )
+                    ).all()
+                    if ref.task_id not in in_flight
+                }
+                copies = await _read_copies(adapter, list(refs.values())) if reads else {}
+
+                unreferenced = sorted(ours.keys() - refs.keys() - in_flight)
+                if unreferenced:
+                    found = await _find_copies(
+                        adapter,
+                        (
+                            await session.scalars(
+                                select(TaskRecord).where(TaskRecord.id.in_(unreferenced))
+                            )
+                        ).all(),
+                    )
+                    for task_id in unreferenced:
+                        external_id = found.get(task_id)
+                        if isinstance(external_id, BaseException):
+                            unverified += 1
+                        elif external_id is None:
+                            repairs.append((task_id, ReplicationOperation.CREATE))
+                        else:
+                            # Unknown content: a full update brings the copy in line
+                            session.add(
+                                TaskExternalRef(
+                                    task_id=task_id,
+                                    config_id=backend.config_id,
+                                    adapter_name=backend.adapter_name,
+                                    external_id=external_id,
+                                )
+                            )
+                            relinked += 1
+                            repairs.append((task_id, ReplicationOperation.UPDATE))
+
+                for task_id, ref in sorted(refs.items()):
+                    if task_id not in ours:
+                        repairs.append((task_id, ReplicationOperation.DELETE))
+                        continue
+                    acknowledged = ref.content_hash
+                    if reads:
+                        copy = copies[task_id]
+                        if isinstance(copy, BaseException):
+                            unverified += 1
+                            continue
+                        if copy is None:
+                            # Deleted in the backend: drop the stale id and create it again
+                            await session.delete(ref)
+                            repairs.append((task_id, ReplicationOperation.CREATE))
+                            continue
+                        acknowledged = projection_hash(copy)
+                        if acknowledged != ref.content_hash:
+                            ref.content_hash, ref.projection = acknowledged, copy
+                    if acknowledged != ours[task_id]:
+                        repairs.append((task_id, ReplicationOperation.UPDATE))
+
+            for start in range(0, len(repairs), repair_batch_size):
+                session.add_all(
+                    TaskReplicationOutbox(
+                        task_id=task_id, operation=operation.value, user_id=backend.user_id
+                    )
+                    for task_id, operation in repairs[start : start + repair_batch_size]
+                )
+                await session.commit()
+            # Refs corrected from the backend without a repair to queue
+            await session.commit()
+
+        counts = {
+            "buckets": len(buckets),
+            "mismatched": len(mismatched),
+            "sampled": len(sampled),
+            "relinked": relinked,
+            "unverified": unverified,
+        }
+        for operation in ReplicationOperation:
+            repaired = sum(1 for _, op in repairs if op is operation)
+            counts[operation.value] = repaired
+            if repaired:
+                TASK_RECONCILIATION_REPAIRS.labels(
+                    backend=backend.adapter_name, operation=operation.value
+                ).inc(repaired)
+        if repairs or unverified:
+            logger.info("task_reconciliation_repairs_queued", config_id=backend.config_id, **counts)
+        return counts
+
+    async def _local_leaves(
+        self,
+        session: AsyncSession,
+        adapter: StorageAdapter,
+        backend: _Backend,
+        bounds: tuple[int, int] | None = None,
+    ) -> AsyncIterator[_Leaf]:
+        """``(task_id, projection hash)`` of the tasks this backend should hold."""
+
+        stmt = select(TaskRecord).order_by(TaskRecord.id)
+        if backend.user_id is not None:
+            # Tasks are not owned by users: a user-scoped backend holds only
+            # what was replicated to it, so only updates and deletes apply.
+            stmt = stmt.join(
+                TaskExternalRef,
+                (TaskExternalRef.task_id == TaskRecord.id)
+                & (TaskExternalRef.config_id == backend.config_id),
+            )
+        if bounds is not None:
+            stmt = stmt.where(TaskRecord.id >= bounds[0], TaskRecord.id < bounds[1])
+        tasks = await session.stream_scalars(stmt.execution_options(yield_per=1000))
+        async for task in tasks:
+            yield task.id, projection_hash(adapter.project_task(task))
+
+    async def _ref_leaves(
+        self,
+        session: AsyncSession,
+        backend: _Backend,
+        bounds: tuple[int, int] | None = None,
+    ) -> AsyncIterator[_Leaf]:
+        """``(task_id, acknowledged projection hash)`` from the backend's refs.
+
+        Only locates candidate buckets cheaply; the backend's actual content
+        is checked bucket by bucket in :meth:`_reconcile_backend`.
+        """
+
+        stmt = (
+            select(TaskExternalRef.task_id, TaskExternalRef.content_hash)
+            .where(TaskExternalRef.config_id == backend.config_id)
+            .order_by(TaskExternalRef.task_id)
+        )
+        if bounds is not None:
+            stmt = stmt.where(
+                TaskExternalRef.task_id >= bounds[0], TaskExternalRef.task_id < bounds[1]
+            )
+        rows = await session.stream(stmt.execution_options(yield_per=1000))
+        async for task_id, content_hash in rows:
+            yield task_id, content_hash or ""
+
+    async def _load_backends(self) -> list[_Backend]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(UserStorageConfig)
+                .where(UserStorageConfig.is_active == True)  # noqa: E712
+                .order_by(UserStorageConfig.priority.desc())
+            )
+            return [
+                _Backend(
+                    config_id=str(config.id),
+                    adapter_name=config.adapter_name,
+                    user_id=str(config.user_id) if config.user_id else None,
+                    config_json=dict(config.config_json or {}),
+                )
+                for config in result.scalars()
+            ]
+
+    async def _replicate_backend(self, backend: _Backend) -> int:
+        async with self._session_factory() as session:
+            cursor = await self._lock_cursor(session, backend)
+            if cursor is None:
+                return 0  # another worker owns this backend right now
+            now = datetime.now(UTC)
+            if cursor.next_attempt_at and _aware(cursor.next_attempt_at) > now:
+                await session.commit()
+                return 0
+
+            entries = (
+                await session.execute(
+                    _pending(backend)
+                    .where(TaskReplicationOutbox.id > cursor.last_outbox_id)
+                    .order_by(TaskReplicationOutbox.id)
+                    .limit(self._batch_size)
+                )
+            ).scalars().all()
+            if not entries:
+                await session.commit()
+                await self._observe(session, backend, cursor)
+                return 0
+
+            # Coalesce: one push per task, ordered by its first log entry.
+            first_entry: dict[int, int] = {}
+            deleted: set[int] = set()
+            for entry in entries:
+                first_entry.setdefault(entry.task_id, entry.id)
+                if entry.operation == ReplicationOperation.DELETE.value:
+                    deleted.add(entry.task_id)
+                else:
+                    deleted.discard(entry.task_id)
+            task_ids = list(first_entry)
+            tasks = {
+                task.id: task
+                for task in (
+                    await session.execute(select(TaskRecord).where(TaskRecord.id.in_(task_ids)))
+                ).scalars()
+            }
+            refs = {
+                ref.task_id: ref
+                for ref in (
+                    await session.execute(
+                        select(TaskExternalRef).where(
+                            TaskExternalRef.config_id == backend.config_id,
+                            TaskExternalRef.task_id.in_(task_ids),
+                        )
+                    )
+                ).scalars()
+            }
+
+            adapter = self._adapter(backend)
+            errors = await self._push(
+                session,
+                adapter,
+                backend,
+                [
+                    (task_id, None if task_id in deleted else tasks.get(task_id))
+                    for task_id in task_ids
+                ],
+                refs,
+            )
+            TASK_REPLICATION_COUNTER.labels(backend=backend.adapter_name, status="success").inc(
+                len(task_ids) - len(errors)
+            )
+            if errors:
+                # Resume from the earliest failed task; later tasks already
+                # replicated are skipped next time by their projection hash.
+                failed = min(errors, key=first_entry.__getitem__)
+                cursor.last_outbox_id = first_entry[failed] - 1
+                self._record_failure(cursor, errors[failed], now)
+                TASK_REPLICATION_COUNTER.labels(
+                    backend=backend.adapter_name, status="failure"
+                ).inc(len(errors))
+                logger.warning(
+                    "task_replication_failed",
+                    backend=backend.adapter_name,
+                    config_id=backend.config_id,
+                    failed=len(errors),
+                    task_id=failed,
+                    retry_in=self._backoff(cursor.failures),
+                    error=str(errors[failed]),
+                )
+            else:
+                cursor.last_outbox_id = entries[-1].id
+                cursor.failures = 0
+                cursor.next_attempt_at = None
+                cursor.last_error = None
+                cursor.last_success_at = now
+
+            await session.commit()
+            replicated = sum(1 for entry in entries if entry.id <= cursor.last_outbox_id)
+            await self._observe(session, backend, cursor)
+            return replicated
+
+    async def _push(
+        self,
+        session: AsyncSession,
+        adapter: StorageAdapter,
+        backend: _Backend,
+        changes: list[tuple[int, TaskRecord | None]],
+        refs: dict[int, TaskExternalRef],
+    ) -> dict[int, BaseException]:
+        """Push the current state of each task; returns the failures by task id.
+
+        Creates and updates go through the adapter's batch operations, so a
+        bulk import costs a handful of API calls on backends that batch.
+        Updates that leave the backend's projection unchanged are skipped;
+        the rest only carry the fields that changed. An update the backend
+        rejects as not found (its copy was deleted there) creates the task
+        again and points the existing ref at the new copy.
+        """
+
+        errors: dict[int, BaseException] = {}
+        projections = {
+            task_id: adapter.project_task(task) for task_id, task in changes if task is not None
+        }
+        hashes = {task_id: projection_hash(value) for task_id, value in projections.items()}
+        creates = [(task_id, task) for task_id, task in changes if task and task_id not in refs]
+        updates = [
+            (task_id, task)
+            for task_id, task in changes
+            if task and task_id in refs and refs[task_id].content_hash != hashes[task_id]
+        ]
+        deletes = [task_id for task_id, task in changes if task is None and task_id in refs]
+        skipped = len(projections) - len(creates) - len(updates)
+        if skipped:
+            TASK_REPLICATION_COUNTER.labels(backend=backend.adapter_name, status="skipped").inc(
+                skipped
+            )
+
+        created, updated = await asyncio.gather(
+            save_in_batches(adapter, [task for _, task in creates]),
+            update_in_batches(
+                adapter,
+                [(refs[task_id].external_id, task) for task_id, task in updates],
+                [
+                    changed_fields(refs[task_id].projection, projections[task_id])
+                    for task_id, _ in updates
+                ],
+            ),
+        )
+        for (task_id, _), result in zip(creates, created, strict=True):
+            if isinstance(result, BaseException):
+                errors[task_id] = result
+                continue
+            session.add(
+                TaskExternalRef(
+                    task_id=task_id,
+                    config_id=backend.config_id,
+                    adapter_name=backend.adapter_name,
+                    external_id=result,
+                    content_hash=hashes[task_id],
+                    projection=projections[task_id],
+                )
+            )
+            await _link_legacy_external_id(session, backend, task_id, result)
+        missing: list[tuple[int, TaskRecord]] = []
+        for (task_id, task), outcome in zip(updates, updated, strict=True):
+            if isinstance(outcome, BaseException):
+                errors[task_id] = outcome
+            elif outcome is False:
+                missing.append((task_id, task))
+            else:
+                refs[task_id].content_hash = hashes[task_id]
+                refs[task_id].projection = projections[task_id]
+
+        if missing:
+            logger.warning(
+                "task_replication_remote_missing",
+                backend=backend.adapter_name,
+                config_id=backend.config_id,
+                task_ids=[task_id for task_id, _ in missing],
+            )
+            recreated = await save_in_batches(adapter, [task for _, task in missing])
+            for (task_id, _), result in zip(missing, recreated, strict=True):
+                if isinstance(result, BaseException):
+                    # The ref keeps the stale id: the retry updates, misses, re-creates
+                    errors[task_id] = result
+                    continue
+                ref = refs[task_id]
+                previous, ref.external_id = ref.external_id, result
+                ref.content_hash = hashes[task_id]
+                ref.projection = projections[task_id]
+                await _link_legacy_external_id(session, backend, task_id, result, previous)
+
+        for task_id in deletes:
+            try:
+                await adapter.delete_task(refs[task_id].external_id)
+            except Exception as exc:
+                errors[task_id] = exc
+            else:
+                await session.delete(refs[task_id])
+
+        await session.flush()
+        return errors
+
+    async def _lock_cursor(
+        self, session: AsyncSession, backend: _Backend
+    ) -> TaskReplicationCursor | None:
+        cursor = (
+            await session.execute(
+                select(TaskReplicationCursor)
+                .where(TaskReplicationCursor.config_id == backend.config_id)
+                .with_for_update(skip_locked=True)
+            )
+        ).scalar_one_or_none()
+        if cursor is not None:
+            return cursor
+        exists = await session.get(TaskReplicationCursor, backend.config_id)
+        if exists is not None:
+            return None
+        # New backends start at the head of the log: history is not backfilled.
+        head = await session.scalar(select(func.max(TaskReplicationOutbox.id)))
+        cursor = TaskReplicationCursor(
+            config_id=backend.config_id,
+            adapter_name=backend.adapter_name,
+            last_outbox_id=head or 0,
+            failures=0,
+        )
+        session.add(cursor)
+        await session.flush()
+        return cursor
+
+    async def _observe(
+        self, session: AsyncSession, backend: _Backend, cursor: TaskReplicationCursor
+    ) -> dict[str, Any]:
+        status = await self._backend_status(session, backend, cursor)
+        TASK_REPLICATION_PENDING.labels(backend=backend.adapter_name).set(status["pending"])
+        TASK_REPLICATION_LAG.labels(backend=backend.adapter_name).set(status["lag_seconds"])
+        return status
+
+    async def _backend_status(
+        self,
+        session: AsyncSession,
+        backend: _Backend,
+        cursor: TaskReplicationCursor | None = None,
+    ) -> dict[str, Any]:
+        if cursor is None:
+            cursor = await session.get(TaskReplicationCursor, backend.config_id)
+        last_id = cursor.last_outbox_id if cursor else 0
+        pending, oldest = (
+            await session.execute(
+                _pending(backend)
+                .with_only_columns(
+                    func.count(TaskReplicationOutbox.id),
+                    func.min(TaskReplicationOutbox.created_at),
+                )
+                .where(TaskReplicationOutbox.id > last_id)
+            )
+        ).one()
+        lag = (datetime.now(UTC) - _aware(oldest)).total_seconds() if oldest else 0.0
+        return {
+            "config_id": backend.config_id,
+            "adapter": backend.adapter_name,
+            "last_outbox_id": last_id,
+            "pending": pending,
+            "lag_seconds": max(lag, 0.0),
+            "failures": cursor.failures if cursor else 0,
+            "next_attempt_at": cursor.next_attempt_at if cursor else None,
+            "last_error": cursor.last_error if cursor else None,
+        }
+
+    async def _prune(self, backends: list[_Backend]) -> None:
+        """Drop log entries every active backend has replicated."""
+
+        async with self._session_factory() as session:
+            if backends:
+                floor = await session.scalar(
+                    select(func.min(TaskReplicationCursor.last_outbox_id)).where(
+                        TaskReplicationCursor.config_id.in_(
+                            [backend.config_id for backend in backends]
+                        )
+                    )
+                )
+                if floor is None:
+                    return
+            else:
+                floor = await session.scalar(select(func.max(TaskReplicationOutbox.id)))
+                if floor is None:
+                    return
+            await session.execute(
+                delete(TaskReplicationOutbox).where(TaskReplicationOutbox.id <= floor)
+            )
+            await session.commit()
+
+    def _adapter(self, backend: _Backend) -> StorageAdapter:
+        return self._pool.get(
+            backend.config_id,
+            config_version(backend.adapter_name, backend.config_json),
+            lambda: StorageAdapterRegistry.get_adapter(backend.adapter_name)(backend.config_json),
+        )
+
+    def _record_failure(
+        self, cursor: TaskReplicationCursor, exc: BaseException, now: datetime
+    ) -> None:
+        cursor.failures = (cursor.failures or 0) + 1
+        delay = self._backoff(cursor.failures)
+        # A rate-limited backend is retried no earlier than it asked for
+        retry_after = rate_limit_delay(getattr(exc, "original_error", None))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        cursor.next_attempt_at = now + timedelta(seconds=delay)
+        cursor.last_error = str(exc)[:500]
+
+    def _backoff(self, failures: int) -> float:
+        return min(self._base_backoff * (2 ** max(failures - 1, 0)), self._max_backoff)
+
+
+async def _link_legacy_external_id(
+    session: AsyncSession,
+    backend: _Backend,
+    task_id: int,
+    external_id: str,
+    previous: str | None = None,
+) -> None:
+    # Legacy single-id column keeps preferring Notion. Conditional UPDATE
+    # because backends replicate concurrently.
+    stmt = update(TaskRecord).where(TaskRecord.id == task_id)
+    if backend.adapter_name != "notion":
+        replaceable: ColumnElement[bool] = TaskRecord.external_id.is_(None)
+        if previous is not None:
+            replaceable = replaceable | (TaskRecord.external_id == previous)
+        stmt = stmt.where(replaceable)
+    await session.execute(
+        stmt.values(external_id=external_id).execution_options(synchronize_session=False)
+    )
+
+
+async def _read_copies(
+    adapter: StorageAdapter, refs: list[TaskExternalRef]
+) -> dict[int, dict[str, Any] | None | BaseException]:
+    """Projection of each ref's copy as the backend holds it (None when it is gone)."""
+
+    async def read(ref: TaskExternalRef) -> dict[str, Any] | None:
+        copy = await adapter.get_task(ref.external_id)
+        return adapter.project_task(copy) if copy is not None else None
+
+    results = await gather_bounded(read, refs)
+    return {ref.task_id: result for ref, result in zip(refs, results, strict=True)}
+
+
+async def _find_copies(
+    adapter: StorageAdapter, tasks: Sequence[TaskRecord]
+) -> dict[int, str | None | BaseException]:
+    results = await gather_bounded(adapter.find_task, tasks)
+    return {task.id: result for task, result in zip(tasks, results, strict=True)}
+
+
+def _pending(backend: _Backend):
+    stmt = select(TaskReplicationOutbox)
+    if backend.user_id is None:
+        return stmt.where(TaskReplicationOutbox.user_id.is_(None))
+    return stmt.where(TaskReplicationOutbox.user_id == backend.user_id)
+
+
+async def _bucket_digests(leaves: AsyncIterator[_Leaf], bucket_size: int) -> dict[int, str]:
+    """Digest of each ``task_id // bucket_size`` bucket; ``leaves`` must be id-ordered."""
+
+    digests: dict[int, str] = {}
+    bucket: int | None = None
+    digest = hashlib.sha256()
+    async for task_id, leaf_hash in leaves:
+        if task_id // bucket_size != bucket:
+            if bucket is not None:
+                digests[bucket] = digest.hexdigest()
+            bucket, digest = task_id // bucket_size, hashlib.sha256()
+        digest.update(f"{task_id}:{leaf_hash};".encode())
+    if bucket is not None:
+        digests[bucket] = digest.hexdigest()
+    return digests
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite hands back naive UTC timestamps
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+__all__ = ["TaskReplicator"]
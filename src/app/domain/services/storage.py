@@ -11,14 +11,19 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Collection
 from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.interfaces.storage_adapter import StorageAdapter, StorageAdapterError
+from app.infrastructure.database.models.replication import TaskExternalRef
 from app.infrastructure.database.models.tasks import TaskRecord
-from app.infrastructure.storage.registry import StorageAdapterRegistry
+from app.infrastructure.storage.config_cache import StorageConfigCache, get_storage_config_cache
+from app.infrastructure.storage.pool import StorageAdapterPool
+from app.infrastructure.storage.projection import changed_fields, projection_hash
+from app.infrastructure.storage.throttle import rate_limit_delay
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +58,8 @@ class StorageService:
         session: AsyncSession,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        adapter_pool: StorageAdapterPool | None = None,
+        config_cache: StorageConfigCache | None = None,
     ) -> None:
         """Initialize storage service.
 
@@ -60,16 +67,28 @@ class StorageService:
             session: Database session for loading configs
             max_retries: Maximum retry attempts per adapter (default: 3)
             retry_delay: Base delay for exponential backoff in seconds (default: 1.0)
+            adapter_pool: Pool of warm adapters (default: process-wide pool)
+            config_cache: Per-user config cache (default: process-wide cache
+                backed by ``adapter_pool``)
         """
         self._session = session
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._config_cache = config_cache or (
+            StorageConfigCache(adapter_pool=adapter_pool)
+            if adapter_pool is not None
+            else get_storage_config_cache()
+        )
         self._adapters: list[tuple[StorageAdapter, int]] = []  # (adapter, priority)
+        self._config_ids: dict[str, str] = {}  # adapter_name -> config_id
 
         logger.info("Initialized StorageService")
 
     async def load_configs(self, user_id: str | None = None) -> int:
-        """Load and initialize active storage adapters from database.
+        """Load active storage adapters for a user.
+
+        Configs come from the process-wide :class:`StorageConfigCache`, so
+        most calls hit neither the database nor an adapter constructor.
 
         Args:
             user_id: User ID to load configs for (None for single-user mode)
@@ -81,34 +100,9 @@ class StorageService:
             >>> count = await service.load_configs()
             >>> print(f"Loaded {count} adapters")
         """
-        # Import here to avoid circular dependency
-        from app.infrastructure.database.models.user_storage_config import (
-            UserStorageConfig,
-        )
-
-        # Query active configs for user
-        stmt = select(UserStorageConfig).where(
-            UserStorageConfig.user_id == user_id,
-            UserStorageConfig.is_active == True,  # noqa: E712
-        ).order_by(UserStorageConfig.priority.desc())
-
-        result = await self._session.execute(stmt)
-        configs = result.scalars().all()
-
-        # Initialize adapters
-        self._adapters.clear()
-        for config in configs:
-            try:
-                adapter_class = StorageAdapterRegistry.get_adapter(config.adapter_name)
-                adapter = adapter_class(config.config_json)
-                self._adapters.append((adapter, config.priority))
-                logger.info(
-                    f"Loaded adapter: {config.adapter_name} (priority: {config.priority})"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to load adapter {config.adapter_name}: {e}"
-                )
+        backends = await self._config_cache.get_backends(self._session, user_id)
+        self._adapters = [(adapter, config.priority) for config, adapter in backends]
+        self._config_ids = {adapter.name: config.config_id for config, adapter in backends}
 
         logger.info(f"Loaded {len(self._adapters)} storage adapters")
         return len(self._adapters)
@@ -131,6 +125,8 @@ class StorageService:
             logger.warning("No active storage adapters configured")
             return {}
 
+        refs = await self._load_refs(task)
+
         # Sort adapters by priority (already sorted from query)
         # Save to all adapters in parallel
         tasks = [
@@ -143,13 +139,14 @@ class StorageService:
         # Collect successful saves
         external_ids: dict[str, str] = {}
         for (adapter, _), result in zip(self._adapters, results):
-            if isinstance(result, Exception):
+            if isinstance(result, BaseException):
                 logger.error(
                     f"Failed to save to {adapter.name} after retries: {result}"
                 )
             elif result:
                 external_ids[adapter.name] = result
                 logger.info(f"Saved to {adapter.name}: {result}")
+                self._remember(refs, task, adapter, result, adapter.project_task(task))
 
         return external_ids
 
@@ -160,6 +157,10 @@ class StorageService:
     ) -> dict[str, bool]:
         """Update task in storage backends.
 
+        Like the replication worker, backends whose projection of the task
+        is unchanged since their last sync (per ``task_external_refs``) are
+        skipped, and the others only receive the fields that changed.
+
         Args:
             task: Updated task record
             external_ids: Map of adapter_name -> external_id from save_task()
@@ -175,26 +176,38 @@ class StorageService:
         if not self._adapters:
             return {}
 
-        tasks = [
-            self._update_with_retry(adapter, external_ids.get(adapter.name, ""), task)
-            for adapter, _ in self._adapters
-            if adapter.name in external_ids
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Collect results
+        refs = await self._load_refs(task)
         status: dict[str, bool] = {}
-        for (adapter, _), result in zip(self._adapters, results):
-            if adapter.name not in external_ids:
+        pending: list[tuple[StorageAdapter, dict[str, Any]]] = []
+        updates = []
+        for adapter, _ in self._adapters:
+            external_id = external_ids.get(adapter.name)
+            if not external_id:
                 continue
+            projection = adapter.project_task(task)
+            ref = refs.get(adapter.name)
+            # A ref pointing at another copy is no baseline for this one
+            baseline = ref if ref is not None and ref.external_id == external_id else None
+            if baseline is not None and baseline.content_hash == projection_hash(projection):
+                logger.debug(f"Skipped {adapter.name} update: projection unchanged")
+                status[adapter.name] = True
+                continue
+            fields = changed_fields(baseline.projection if baseline else None, projection)
+            pending.append((adapter, projection))
+            updates.append(self._update_with_retry(adapter, external_id, task, fields))
 
-            if isinstance(result, Exception):
+        results = await asyncio.gather(*updates, return_exceptions=True)
+
+        # Collect results
+        for (adapter, projection), result in zip(pending, results, strict=True):
+            if isinstance(result, BaseException):
                 logger.error(f"Failed to update {adapter.name}: {result}")
                 status[adapter.name] = False
             else:
                 status[adapter.name] = result
                 logger.info(f"Updated {adapter.name}: {result}")
+                if result:
+                    self._remember(refs, task, adapter, external_ids[adapter.name], projection)
 
         return status
 
@@ -296,7 +309,7 @@ class StorageService:
             except StorageAdapterError as e:
                 last_error = e
                 if attempt < self._max_retries - 1:
-                    delay = self._retry_delay * (2 ** attempt)  # Exponential backoff
+                    delay = self._backoff(e, attempt)
                     logger.warning(
                         f"Retry {attempt + 1}/{self._max_retries} for {adapter.name} "
                         f"after {delay}s: {e}"
@@ -313,6 +326,7 @@ class StorageService:
         adapter: StorageAdapter,
         external_id: str,
         task: TaskRecord,
+        fields: Collection[str] | None = None,
     ) -> bool:
         """Update task with exponential backoff retry.
 
@@ -320,6 +334,7 @@ class StorageService:
             adapter: Storage adapter to use
             external_id: External ID from save_task()
             task: Updated task
+            fields: Projected fields that changed (None sends every field)
 
         Returns:
             bool: True if update succeeded
@@ -330,7 +345,7 @@ class StorageService:
         last_error = None
         for attempt in range(self._max_retries):
             try:
-                success = await adapter.update_task(external_id, task)
+                success = await adapter.update_task(external_id, task, fields=fields)
                 if attempt > 0:
                     logger.info(
                         f"Retry succeeded for {adapter.name} on attempt {attempt + 1}"
@@ -339,7 +354,7 @@ class StorageService:
             except StorageAdapterError as e:
                 last_error = e
                 if attempt < self._max_retries - 1:
-                    delay = self._retry_delay * (2 ** attempt)
+                    delay = self._backoff(e, attempt)
                     logger.warning(
                         f"Retry {attempt + 1}/{self._max_retries} for {adapter.name} "
                         f"after {delay}s: {e}"
@@ -380,7 +395,7 @@ class StorageService:
             except StorageAdapterError as e:
                 last_error = e
                 if attempt < self._max_retries - 1:
-                    delay = self._retry_delay * (2 ** attempt)
+                    delay = self._backoff(e, attempt)
                     logger.warning(
                         f"Retry {attempt + 1}/{self._max_retries} for {adapter.name} "
                         f"after {delay}s: {e}"
@@ -392,16 +407,61 @@ class StorageService:
             "Delete failed with unknown error", adapter_name=adapter.name
         )
 
+    async def _load_refs(self, task: TaskRecord) -> dict[str, TaskExternalRef]:
+        """Return the task's external refs for the loaded configs, by adapter name."""
+        if task.id is None or not self._config_ids:
+            return {}
+        names = {config_id: name for name, config_id in self._config_ids.items()}
+        result = await self._session.execute(
+            select(TaskExternalRef).where(
+                TaskExternalRef.task_id == task.id,
+                TaskExternalRef.config_id.in_(names),
+            )
+        )
+        return {names[ref.config_id]: ref for ref in result.scalars()}
+
+    def _remember(
+        self,
+        refs: dict[str, TaskExternalRef],
+        task: TaskRecord,
+        adapter: StorageAdapter,
+        external_id: str,
+        projection: dict[str, Any],
+    ) -> None:
+        """Record what ``adapter`` now holds for ``task`` (committed with the request)."""
+        config_id = self._config_ids.get(adapter.name)
+        if task.id is None or config_id is None:
+            return
+        ref = refs.get(adapter.name)
+        if ref is None:
+            ref = refs[adapter.name] = TaskExternalRef(
+                task_id=task.id, config_id=config_id, adapter_name=adapter.name
+            )
+            self._session.add(ref)
+        ref.external_id = external_id
+        ref.content_hash = projection_hash(projection)
+        ref.projection = projection
+
+    def _backoff(self, error: BaseException, attempt: int) -> float:
+        """Seconds to wait before retrying after ``error``.
+
+        Rate-limited calls wait what the backend asked for (``Retry-After``);
+        other failures back off exponentially.
+        """
+        original = getattr(error, "original_error", None)
+        delay = rate_limit_delay(original)
+        if delay is not None:
+            return delay
+        return self._retry_delay * (2 ** attempt)
+
     async def close_all(self) -> None:
-        """Close all adapter connections and cleanup resources."""
-        for adapter, _ in self._adapters:
-            try:
-                if hasattr(adapter, "close"):
-                    await adapter.close()
-            except Exception as e:
-                logger.warning(f"Error closing {adapter.name}: {e}")
+        """Release adapters held by this service.
 
-        logger.info("Closed all storage adapters")
+        Adapters are owned by the shared pool, which closes them on eviction
+        or shutdown; closing them here would break concurrent requests.
+        """
+        self._adapters.clear()
+        logger.info("Released storage adapters")
 
 
 __all__ = ["StorageService"]
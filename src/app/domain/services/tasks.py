@@ -9,7 +9,11 @@ import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.metrics import NOTION_SYNC_COUNTER
-from app.infrastructure.database.models.repositories import create_task
+from app.infrastructure.database.models.replication import ReplicationOperation
+from app.infrastructure.database.models.repositories import (
+    create_task,
+    enqueue_task_replication,
+)
 from app.infrastructure.database.models.tasks import TaskStatus
 from app.models.schemas import ChannelMessage
 from app.domain.services.storage import StorageService
@@ -30,6 +34,7 @@ class TaskService:
         *,
         storage_service: StorageService | None = None,
         user_id: str | None = None,
+        write_behind: bool = False,
     ) -> None:
         """Initialize task service.
 
@@ -37,10 +42,12 @@ class TaskService:
             session: Database session
             storage_service: Optional StorageService instance (if None, legacy mode)
             user_id: User ID for loading storage configs (None = single-user mode)
+            write_behind: Queue replication in the outbox instead of syncing inline
         """
         self._session = session
         self._storage_service = storage_service
         self._user_id = user_id
+        self._write_behind = write_behind
         self._storage_loaded = False
 
     async def handle(self, payload: ChannelMessage) -> dict[str, Any]:
@@ -64,7 +71,17 @@ class TaskService:
 
         # Multi-backend sync via StorageService
         external_ids: dict[str, str] = {}
-        if self._storage_service:
+        replication = "inline"
+        if self._write_behind:
+            # Backends are updated by the replication worker after commit
+            await enqueue_task_replication(
+                self._session,
+                task_id=record.id,
+                operation=ReplicationOperation.CREATE,
+                user_id=self._user_id,
+            )
+            replication = "queued"
+        elif self._storage_service:
             try:
                 # Load storage configs if not already loaded
                 if not self._storage_loaded:
@@ -95,6 +112,7 @@ class TaskService:
             "task_id": record.id,
             "external_ids": external_ids,  # All backend IDs
             "notion_id": external_ids.get("notion"),  # Backward compatibility
+            "replication": replication,
             "due_at": due_at.isoformat() if due_at else None,
             "response": f"Tarefa criada com sucesso: '{payload.content[:100]}{'...' if len(payload.content) > 100 else ''}'. " +
             (f"Prazo: {due_at.strftime('%d/%m/%Y às %H:%M')}" if due_at else "Sem prazo definido."),
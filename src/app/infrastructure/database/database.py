@@ -1,82 +1,255 @@
-"""Database engine and session management."""
+"""Database engine and session management.
+
+Writes always go to the primary (``database_url``). When
+``database_replica_url`` is set, read-only callers can use
+:func:`get_read_session_factory` / :func:`get_read_db_session`: their
+sessions read from the replica until they write, and from then on use the
+primary (read-your-writes). A write also pins the rest of the current
+request to the primary, and :class:`ReadYourWritesMiddleware
+<app.middleware.read_your_writes.ReadYourWritesMiddleware>` carries that pin
+to the client's next requests for ``database_replica_pin_seconds``.
+
+With ``database_sqlite_single_writer`` a file SQLite database gets the same
+split: sessions read through a pool of read-only WAL connections (the
+"replica") and write through a single connection that takes the write lock
+up front (``BEGIN IMMEDIATE``), so writers queue in the pool instead of
+spinning on ``busy_timeout``. That connection is the only one that writes:
+high-volume writes go through
+:class:`SQLiteWriter <app.infrastructure.database.sqlite_writer.SQLiteWriter>`,
+which batches them into shared transactions, and it checks out the same
+connection from the primary pool (:func:`get_writer_engine`). So that one
+request cannot hold it until the end of the request, sessions in this mode
+(:class:`SingleWriterSession`) commit each write as it reaches the database.
+"""
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Literal
+from uuid import uuid4
 
+from sqlalchemy import Engine, event, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction, SessionTransactionOrigin
 from sqlalchemy.pool import StaticPool
 
 from app.config import get_settings
+from app.infrastructure.database.models.vector import PgVector, register_vector_codec
+from app.infrastructure.database.pool import InstrumentedQueuePool, instrument_pool
 
 _engine: AsyncEngine | None = None
+_replica_engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_read_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+# See Settings.database_pgbouncer_mode
+PgBouncerMode = Literal["off", "no_cache", "protocol"]
+
+
+@dataclass(slots=True)
+class PrimaryPin:
+    """Read-your-writes state shared by every session of one request or job."""
+
+    pinned: bool = False
+    wrote: bool = False
+
+
+_primary_pin: ContextVar[PrimaryPin | None] = ContextVar("primary_pin", default=None)
 
 
 def get_engine() -> AsyncEngine:
-    """Return (and cache) the global async engine."""
+    """Return (and cache) the global async engine (the primary)."""
 
     global _engine
     if _engine is None:
+        _engine = _create_engine(get_settings().database_url, "primary")
+    return _engine
+
+
+def get_replica_engine() -> AsyncEngine | None:
+    """Return (and cache) the read-replica engine, or None when not configured."""
+
+    global _replica_engine
+    if _replica_engine is None:
         settings = get_settings()
+        replica_url = settings.database_replica_url
+        if not replica_url and sqlite_single_writer_enabled(settings.database_url):
+            replica_url = sqlite_read_only_url(settings.database_url)
+        if replica_url:
+            _replica_engine = _create_engine(replica_url, "replica")
+    return _replica_engine
+
+
+def get_writer_engine() -> AsyncEngine | None:
+    """Return the SQLite writer task's engine, or None outside single-writer mode.
+
+    It is the primary engine: the writer's batches and session writes share
+    its single connection, so SQLite never sees two writers.
+    """
+
+    if sqlite_single_writer_enabled(get_settings().database_url):
+        return get_engine()
+    return None
+
+
+def sqlite_single_writer_enabled(database_url: str) -> bool:
+    """Whether ``database_url`` is a file SQLite database in single-writer mode."""
+
+    if not get_settings().database_sqlite_single_writer or "sqlite" not in database_url:
+        return False
+    database = make_url(database_url).database or ""
+    return database not in ("", ":memory:") and "mode=memory" not in database_url
+
+
+def sqlite_read_only_url(database_url: str) -> str:
+    """Read-only (``mode=ro``) URI form of a file SQLite URL."""
+
+    url = make_url(database_url)
+    return url.set(
+        database=f"file:{url.database}", query={**url.query, "mode": "ro", "uri": "true"}
+    ).render_as_string(hide_password=False)
 
-        # Configurações específicas para SQLite para evitar database locks
-        engine_kwargs = {
-            "echo": settings.debug,
-            "future": True,
-        }
-
-        # Configurações específicas por tipo de banco
-        if "sqlite" in settings.database_url:
-            engine_kwargs.update({
-                "poolclass": StaticPool,
-                "pool_pre_ping": True,
-                "pool_recycle": -1,
-                "connect_args": {
-                    "check_same_thread": False,
-                    "timeout": 30,  # Timeout de 30 segundos para evitar locks
-                },
-            })
-        elif "postgresql" in settings.database_url:
-            # Configurações para PostgreSQL
-            engine_kwargs.update({
-                "pool_pre_ping": True,
-                "pool_recycle": 3600,  # 1 hora
-                "pool_size": 10,
-                "max_overflow": 20,
-                "connect_args": {
-                    "command_timeout": 30,
-                },
-            })
-
-        _engine = create_async_engine(settings.database_url, **engine_kwargs)
-
-        # Para SQLite, configurar WAL mode para melhor concorrência
-        if "sqlite" in settings.database_url:
-            from sqlalchemy import event, text
-
-            @event.listens_for(_engine.sync_engine, "connect")
-            def set_sqlite_pragma(dbapi_connection, connection_record):
-                """Configura pragmas do SQLite para melhor performance e concorrência."""
-                cursor = dbapi_connection.cursor()
+
+def _create_engine(database_url: str, name: str) -> AsyncEngine:
+    settings = get_settings()
+
+    # Configurações específicas para SQLite para evitar database locks
+    engine_kwargs = {
+        "echo": settings.debug,
+        "future": True,
+    }
+
+    single_writer = sqlite_single_writer_enabled(database_url)
+    read_only = single_writer and name == "replica"
+
+    # Configurações específicas por tipo de banco
+    if single_writer:
+        # Uma única conexão de escrita; leituras em pool de conexões somente leitura
+        engine_kwargs.update({
+            "poolclass": InstrumentedQueuePool,
+            "pool_logging_name": name,
+            "pool_pre_ping": True,
+            "pool_size": settings.database_sqlite_read_pool_size if read_only else 1,
+            "max_overflow": 0,
+            "pool_timeout": settings.database_pool_timeout,
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": 30,
+            },
+        })
+    elif "sqlite" in database_url:
+        engine_kwargs.update({
+            "poolclass": StaticPool,
+            "pool_pre_ping": True,
+            "pool_recycle": -1,
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": 30,  # Timeout de 30 segundos para evitar locks
+            },
+        })
+    elif "postgresql" in database_url:
+        # Configurações para PostgreSQL; pool instrumentado (database/pool.py)
+        engine_kwargs.update({
+            "poolclass": InstrumentedQueuePool,
+            "pool_logging_name": name,
+            "pool_pre_ping": True,
+            "pool_recycle": settings.database_pool_recycle,
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_max_overflow,
+            "pool_timeout": settings.database_pool_timeout,
+            "connect_args": {
+                "command_timeout": 30,
+            },
+        })
+        if "asyncpg" in database_url:
+            engine_kwargs["connect_args"].update(
+                statement_cache_connect_args(
+                    settings.database_pgbouncer_mode, settings.database_statement_cache_size
+                )
+            )
+
+    engine = create_async_engine(database_url, **engine_kwargs)
+
+    # Para SQLite, configurar WAL mode para melhor concorrência
+    if "sqlite" in database_url:
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_sqlite_pragma(dbapi_connection, connection_record):
+            """Configura pragmas do SQLite para melhor performance e concorrência."""
+            cursor = dbapi_connection.cursor()
+            if read_only:
+                # Conexão de leitura: o modo WAL já foi definido pela conexão de escrita
+                cursor.execute("PRAGMA query_only=ON")
+            else:
                 # WAL mode para melhor concorrência
                 cursor.execute("PRAGMA journal_mode=WAL")
-                # Timeout para operações de lock
-                cursor.execute("PRAGMA busy_timeout=30000")  # 30 segundos
                 # Sincronização normal (balance entre performance e segurança)
                 cursor.execute("PRAGMA synchronous=NORMAL")
-                # Cache size otimizado
-                cursor.execute("PRAGMA cache_size=10000")
-                # Temp store em memória
-                cursor.execute("PRAGMA temp_store=MEMORY")
-                cursor.close()
+            # Timeout para operações de lock
+            cursor.execute("PRAGMA busy_timeout=30000")  # 30 segundos
+            # Cache size otimizado
+            cursor.execute("PRAGMA cache_size=10000")
+            # Temp store em memória
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.close()
 
-    return _engine
+    if single_writer and not read_only:
+        # Transações controladas pelo SQLAlchemy, com o lock de escrita obtido no BEGIN
+        @event.listens_for(engine.sync_engine, "connect")
+        def disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def begin_immediate(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    if engine_kwargs.get("poolclass") is InstrumentedQueuePool:
+        instrument_pool(engine.sync_engine)
+
+    # asyncpg + pgvector: vetores trafegam em binário (necessário para COPY em lote)
+    if "asyncpg" in database_url and PgVector is not None:
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def register_vector(dbapi_connection, connection_record):
+            dbapi_connection.run_async(register_vector_codec)
+
+    return engine
+
+
+def statement_cache_connect_args(mode: PgBouncerMode, cache_size: int = 100) -> dict[str, Any]:
+    """asyncpg ``connect_args`` for a ``database_pgbouncer_mode``.
+
+    Under pgbouncer transaction pooling consecutive transactions may run on
+    different server connections, each shared by many clients. asyncpg's
+    sequential statement names then collide ("prepared statement
+    __asyncpg_stmt_1__ already exists"), so the pgbouncer modes name every
+    statement uniquely. ``no_cache`` also drops both caches, since a statement
+    prepared on one server connection is unknown to the next; ``protocol``
+    keeps SQLAlchemy's per-connection cache and relies on pgbouncer (1.21+,
+    ``max_prepared_statements``) to prepare each name on whichever server
+    connection runs it.
+    """
+
+    if mode == "off":
+        return {"prepared_statement_cache_size": cache_size}
+    return {
+        "prepared_statement_name_func": _unique_statement_name,
+        "prepared_statement_cache_size": cache_size if mode == "protocol" else 0,
+        # asyncpg's own cache (used for its type introspection queries)
+        "statement_cache_size": 0,
+    }
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4().hex}__"
 
 
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
@@ -84,23 +257,186 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
 
     global _session_factory
     if _session_factory is None:
-        _session_factory = async_sessionmaker(
-            get_engine(),
+        if sqlite_single_writer_enabled(get_settings().database_url):
+            # Leituras no pool somente leitura, escritas na conexão única
+            _session_factory = async_sessionmaker(
+                sync_session_class=SingleWriterSession,
+                expire_on_commit=False,
+                autoflush=True,
+            )
+        else:
+            _session_factory = async_sessionmaker(
+                get_engine(),
+                expire_on_commit=False,
+                autoflush=True,
+                autocommit=False,
+            )
+    return _session_factory
+
+
+class RoutingSession(Session):
+    """Reads from the replica until the session (or its request) writes.
+
+    Flushes, DML, ``SELECT ... FOR UPDATE`` and textual statements go to the
+    primary and pin the session, and the current :class:`PrimaryPin`, to it.
+    """
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        pin = _primary_pin.get()
+        if self.info.get("primary") or (pin is not None and pin.pinned):
+            return get_engine().sync_engine
+        if self._flushing or not _is_plain_read(clause):
+            self.info["primary"] = True
+            if pin is not None:
+                pin.pinned = pin.wrote = True
+            return get_engine().sync_engine
+        replica = get_replica_engine()
+        return (replica or get_engine()).sync_engine
+
+
+class SingleWriterSession(RoutingSession):
+    """:class:`RoutingSession` for SQLite single-writer mode.
+
+    The primary pool holds the process's only write connection, shared with
+    the :class:`SQLiteWriter <app.infrastructure.database.sqlite_writer.SQLiteWriter>`.
+    Rather than keeping it until the end-of-request commit, the session
+    commits after every flush or statement that ran on it, unless the
+    caller opened the transaction explicitly (``begin()``/``begin_nested()``).
+    A request's writes are therefore committed one by one: an error later in
+    the request does not roll back earlier ones. Once committed they are
+    visible to the read-only pool, so reads go back to it instead of
+    following the request's primary pin.
+    """
+
+    _executing = 0
+    _committing = False
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        if self.info.get("primary") or self._flushing or not _is_plain_read(clause):
+            self.info["primary"] = True
+            return get_engine().sync_engine
+        replica = get_replica_engine()
+        return (replica or get_engine()).sync_engine
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        with self._releasing_writes():
+            return super().execute(*args, **kwargs)
+
+    def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        with self._releasing_writes():
+            return super().scalar(*args, **kwargs)
+
+    def scalars(self, *args: Any, **kwargs: Any) -> Any:
+        with self._releasing_writes():
+            return super().scalars(*args, **kwargs)
+
+    def flush(self, objects: Any = None) -> None:
+        super().flush(objects)
+        # Autoflush inside execute() is committed with the statement
+        if not self._executing:
+            self._release_write_connection()
+
+    def commit(self) -> None:
+        self._committing = True
+        try:
+            super().commit()
+        finally:
+            self._committing = False
+
+    @contextmanager
+    def _releasing_writes(self) -> Iterator[None]:
+        self._executing += 1
+        try:
+            yield
+        finally:
+            self._executing -= 1
+        # Reached only when the statement succeeded; failures roll back as usual
+        if not self._executing:
+            self._release_write_connection()
+
+    def _release_write_connection(self) -> None:
+        transaction = self._transaction
+        if (
+            self.info.get("primary")
+            and not self._committing
+            and transaction is not None
+            and transaction.origin is SessionTransactionOrigin.AUTOBEGIN
+            and transaction.is_active
+        ):
+            self.commit()
+
+
+@event.listens_for(SingleWriterSession, "after_transaction_end")
+def _unpin_after_commit(session: Session, transaction: SessionTransaction) -> None:
+    # The write connection went back to the pool with the root transaction
+    if transaction.parent is None:
+        session.info.pop("primary", None)
+
+
+def _is_plain_read(clause: Any) -> bool:
+    if clause is None:
+        # session.get() and lazy loads resolve through a mapper only
+        return True
+    return bool(getattr(clause, "is_select", False)) and (
+        getattr(clause, "_for_update_arg", None) is None
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _pin_after_write(session: Session, flush_context: Any) -> None:
+    # Any session's write, primary or routed, pins the rest of the request
+    pin = _primary_pin.get()
+    if pin is not None:
+        pin.pinned = pin.wrote = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _pin_on_dml(orm_execute_state: ORMExecuteState) -> None:
+    # Core INSERT/UPDATE/DELETE through session.execute() never flushes
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _pin_after_write(orm_execute_state.session, None)
+
+
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Session factory for read-mostly callers; the primary factory without a replica."""
+
+    global _read_session_factory
+    if get_replica_engine() is None:
+        return get_session_factory()
+    if _read_session_factory is None:
+        _read_session_factory = async_sessionmaker(
+            sync_session_class=(
+                SingleWriterSession
+                if sqlite_single_writer_enabled(get_settings().database_url)
+                else RoutingSession
+            ),
             expire_on_commit=False,
             autoflush=True,
-            autocommit=False,
         )
-    return _session_factory
+    return _read_session_factory
+
+
+def pin_to_primary(pin: PrimaryPin | None = None) -> PrimaryPin:
+    """Install read-your-writes state for the current request or job."""
+
+    pin = pin or PrimaryPin()
+    _primary_pin.set(pin)
+    return pin
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency that yields an async session."""
+    """FastAPI dependency yielding the request's unit of work.
+
+    FastAPI caches dependencies per request, so every dependency asking for a
+    session (e.g. ``get_ingestion_service``) shares this one: one pooled
+    connection per request, committed once after the endpoint returns.
+    """
 
     session = get_session_factory()()
     try:
         yield session
-        # Garantir que a sessão seja commitada se houver mudanças pendentes
-        if session.dirty or session.new or session.deleted:
+        # Inclui escritas já enviadas por flush ou por Core, sem objetos pendentes
+        if session.in_transaction() or session.dirty or session.new or session.deleted:
             await session.commit()
     except Exception:
         # Em caso de erro, fazer rollback
@@ -110,4 +446,34 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         await session.close()
 
 
-__all__ = ["get_engine", "get_session_factory", "get_db_session"]
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency for read-only endpoints; served by the replica when configured."""
+
+    session = get_read_session_factory()()
+    try:
+        yield session
+        if session.dirty or session.new or session.deleted:
+            await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+__all__ = [
+    "PrimaryPin",
+    "RoutingSession",
+    "SingleWriterSession",
+    "get_db_session",
+    "get_engine",
+    "get_read_db_session",
+    "get_read_session_factory",
+    "get_replica_engine",
+    "get_session_factory",
+    "get_writer_engine",
+    "pin_to_primary",
+    "sqlite_read_only_url",
+    "sqlite_single_writer_enabled",
+    "statement_cache_connect_args",
+]
@@ -0,0 +1,28 @@
+"""Persistence model for the materialized brief snapshot."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, TimestampMixin
+
+
+class BriefSnapshotRecord(TimestampMixin, Base):
+    """Last materialized value of one brief section (tasks, events, conversations).
+
+    Written whenever a process refreshes a section, so new workers serve
+    their first briefs without querying the source tables.
+    """
+
+    __tablename__ = "brief_snapshots"
+
+    section: Mapped[str] = mapped_column(String(32), primary_key=True)
+    payload: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+__all__ = ["BriefSnapshotRecord"]
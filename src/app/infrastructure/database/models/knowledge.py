@@ -2,23 +2,35 @@
 
 from __future__ import annotations
 
+import hashlib
 from typing import Any
 
-from sqlalchemy import JSON, ForeignKey, Integer
+from sqlalchemy import JSON, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin
 from .vector import EMBEDDING_TYPE
 
 
+def compute_content_hash(content: str) -> str:
+    """Return the stable hash used to detect unchanged documents and chunks."""
+
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 class KnowledgeDocumentORM(TimestampMixin, Base):
     """Represents a knowledge document ingested into the system."""
 
     __tablename__ = "knowledge_documents"
+    __table_args__ = (
+        UniqueConstraint("source", "path", name="uq_knowledge_documents_source_path"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(nullable=False)
     source: Mapped[str] = mapped_column(nullable=False)
+    path: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     extra_data: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
 
 
@@ -29,11 +41,12 @@ class KnowledgeChunkORM(TimestampMixin, Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     document_id: Mapped[int] = mapped_column(
-        ForeignKey("knowledge_documents.id", ondelete="CASCADE")
+        ForeignKey("knowledge_documents.id", ondelete="CASCADE"), index=True
     )
     chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
     content: Mapped[str] = mapped_column(nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     embedding: Mapped[Any] = mapped_column(EMBEDDING_TYPE, nullable=False)
 
 
-__all__ = ["KnowledgeDocumentORM", "KnowledgeChunkORM"]
+__all__ = ["KnowledgeDocumentORM", "KnowledgeChunkORM", "compute_content_hash"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from enum import Enum as PyEnum
 
-from sqlalchemy import Enum, String
+from sqlalchemy import Enum, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin
@@ -16,7 +16,11 @@ class ConversationRole(str, PyEnum):
 
 
 class ConversationMessage(TimestampMixin, Base):
+    # Partitioned by month of created_at on PostgreSQL (database/partitions.py)
     __tablename__ = "conversation_messages"
+    __table_args__ = (
+        Index("ix_conversation_messages_conversation_id_id", "conversation_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     conversation_id: Mapped[str] = mapped_column(String(255), nullable=False)
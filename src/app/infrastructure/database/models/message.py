@@ -15,6 +15,7 @@ from .base import Base, TimestampMixin
 class ChannelMessageORM(TimestampMixin, Base):
     """Normalized message stored after ingestion."""
 
+    # Partitioned by month of created_at on PostgreSQL (database/partitions.py)
     __tablename__ = "channel_messages"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -0,0 +1,75 @@
+"""Persistence models for write-behind task replication to storage backends."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum as PyEnum
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, TimestampMixin
+
+
+class ReplicationOperation(str, PyEnum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class TaskReplicationOutbox(TimestampMixin, Base):
+    """Append-only log of task changes awaiting replication.
+
+    ``id`` is the log sequence: each backend keeps a cursor with the last id it
+    replicated. No foreign key to ``tasks`` so deletes stay replayable.
+    """
+
+    __tablename__ = "task_replication_outbox"
+    # Ids must never be reused once pruned, or cursors would skip new entries
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    task_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    operation: Mapped[str] = mapped_column(String(10), nullable=False)
+    user_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+
+class TaskReplicationCursor(TimestampMixin, Base):
+    """Replication progress of one storage backend config."""
+
+    __tablename__ = "task_replication_cursors"
+
+    config_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    adapter_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    last_outbox_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_success_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    failures: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+
+
+class TaskExternalRef(TimestampMixin, Base):
+    """External id of a task in one storage backend config."""
+
+    __tablename__ = "task_external_refs"
+    __table_args__ = (
+        UniqueConstraint("task_id", "config_id", name="uq_task_external_refs_task_config"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    task_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    config_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    adapter_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    external_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Last projection the backend acknowledged, for skipping no-op updates
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    projection: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+
+
+__all__ = [
+    "ReplicationOperation",
+    "TaskExternalRef",
+    "TaskReplicationCursor",
+    "TaskReplicationOutbox",
+]
@@ -2,22 +2,97 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import Sequence
 from datetime import datetime
-
-from sqlalchemy import select
+from typing import Any, Literal, TypeVar
+
+from sqlalchemy import (
+    Select,
+    column,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    table,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, make_transient_to_detached
+from sqlalchemy.sql.dml import ReturningInsert
 
 from app.core.profiler import profile_query, profile_session
+from app.infrastructure.database.partitions import recent_window_start
 from app.models.schemas import ChannelMessage
 
+from .brief import BriefSnapshotRecord
 from .events import EventRecord, EventStatus
-from .knowledge import KnowledgeChunkORM, KnowledgeDocumentORM
+from .knowledge import KnowledgeChunkORM, KnowledgeDocumentORM, compute_content_hash
 from .memory import ConversationMessage, ConversationRole
 from .message import ChannelMessageORM
+from .replication import ReplicationOperation, TaskReplicationOutbox
 from .sheets import SheetsSyncStateORM
 from .tasks import TaskRecord, TaskStatus
-from .vector import MessageEmbeddingORM
+from .vector import MessageEmbeddingORM, has_vector_codec
+
+TaskSort = Literal["id", "due_date"]
+
+# Below this planner estimate an exact COUNT(*) is cheap enough to run
+APPROXIMATE_COUNT_THRESHOLD = 10_000
+
+_Row = TypeVar("_Row", ChannelMessageORM, ConversationMessage, TaskRecord, MessageEmbeddingORM)
+_Message = TypeVar("_Message", ChannelMessageORM, ConversationMessage)
+
+# Per-message inserts skip the unit of work: one INSERT ... RETURNING built
+# once at import, so every call reuses its compiled form from the engine cache
+_INSERT_CHANNEL_MESSAGE = insert(ChannelMessageORM.__table__).returning(
+    *ChannelMessageORM.__table__.c
+)
+_INSERT_CONVERSATION_MESSAGE = insert(ConversationMessage.__table__).returning(
+    *ConversationMessage.__table__.c
+)
+_INSERT_TASK = insert(TaskRecord.__table__).returning(*TaskRecord.__table__.c)
+_INSERT_EMBEDDING = insert(MessageEmbeddingORM)
+
+
+def _upsert_message_embedding_statement(dialect_insert: Any) -> ReturningInsert:
+    statement = dialect_insert(MessageEmbeddingORM.__table__)
+    upsert: ReturningInsert = statement.on_conflict_do_update(
+        index_elements=["message_id", "created_at"],
+        set_={
+            "embedding": statement.excluded.embedding,
+            "content": statement.excluded.content,
+            "updated_at": func.now(),
+        },
+    ).returning(*MessageEmbeddingORM.__table__.c)
+    return upsert
+
+
+_UPSERT_MESSAGE_EMBEDDING = {
+    "postgresql": _upsert_message_embedding_statement(postgresql.insert),
+    "sqlite": _upsert_message_embedding_statement(sqlite.insert),
+}
+
+
+async def _insert_returning(
+    session: AsyncSession, model: type[_Row], statement: ReturningInsert, values: dict[str, Any]
+) -> _Row:
+    """Insert one row with Core and attach it to the session as persistent.
+
+    Callers get the same ORM instance the flush used to return; changing it
+    later issues an UPDATE on the next flush.
+    """
+
+    row = (await session.execute(statement, values)).one()
+    instance = model(**row._mapping)
+    make_transient_to_detached(instance)
+    session.add(instance)
+    return instance
 
 
 @profile_query
@@ -27,17 +102,19 @@ async def save_channel_message(session: AsyncSession, payload: ChannelMessage) -
     Função crítica para performance - monitora tempo de inserção.
     """
     async with profile_session(session, "save_channel_message"):
-        instance = ChannelMessageORM(
-            channel=payload.channel,
-            sender=payload.sender,
-            content=payload.content,
-            message_type=payload.message_type,
-            occurred_at=payload.created_at,
-            extra_data=payload.extra_data,
+        return await _insert_returning(
+            session,
+            ChannelMessageORM,
+            _INSERT_CHANNEL_MESSAGE,
+            {
+                "channel": payload.channel,
+                "sender": payload.sender,
+                "content": payload.content,
+                "message_type": payload.message_type,
+                "occurred_at": payload.created_at,
+                "extra_data": payload.extra_data,
+            },
         )
-        session.add(instance)
-        await session.flush()
-        return instance
 
 
 @profile_query
@@ -49,11 +126,7 @@ async def list_recent_messages(
     Query crítica para dashboard - monitora performance de SELECT com LIMIT.
     """
     async with profile_session(session, "list_recent_messages"):
-        result = await session.execute(
-            select(ChannelMessageORM).order_by(
-                ChannelMessageORM.id.desc()).limit(limit)
-        )
-        return tuple(result.scalars())
+        return await _recent_first(session, ChannelMessageORM, limit)
 
 
 @profile_query
@@ -61,30 +134,31 @@ async def upsert_message_embedding(
     session: AsyncSession,
     *,
     message_id: int,
+    created_at: datetime,
     embedding: list[float],
     content: str,
 ) -> MessageEmbeddingORM:
     """
     Persiste embeddings de mensagens, substituindo valor anterior se necessário.
     Operação crítica para busca semântica - monitora performance de UPSERT.
+
+    ``created_at`` é o da mensagem: a chave única (message_id, created_at)
+    inclui a chave de partição, então o ON CONFLICT só toca um mês e
+    embeddings concorrentes da mesma mensagem não geram duplicatas.
     """
     async with profile_session(session, "upsert_message_embedding"):
-        result = await session.execute(
-            select(MessageEmbeddingORM).where(
-                MessageEmbeddingORM.message_id == message_id)
+        dialect = session.get_bind(clause=_INSERT_EMBEDDING).dialect.name
+        return await _insert_returning(
+            session,
+            MessageEmbeddingORM,
+            _UPSERT_MESSAGE_EMBEDDING[dialect],
+            {
+                "message_id": message_id,
+                "created_at": created_at,
+                "embedding": embedding,
+                "content": content,
+            },
         )
-        existing = result.scalar_one_or_none()
-        if existing is not None:
-            existing.embedding = embedding
-            existing.content = content
-            session.add(existing)
-            return existing
-
-        instance = MessageEmbeddingORM(
-            message_id=message_id, embedding=embedding, content=content)
-        session.add(instance)
-        await session.flush()
-        return instance
 
 
 __all__ = [
@@ -92,11 +166,23 @@ __all__ = [
     "list_recent_messages",
     "upsert_message_embedding",
     "create_knowledge_document",
+    "get_knowledge_document_by_path",
     "insert_knowledge_chunks",
+    "bulk_insert_knowledge_chunks",
+    "list_knowledge_chunk_hashes",
+    "reindex_knowledge_chunks",
+    "delete_knowledge_chunks",
     "get_sheets_sync_state",
     "update_sheets_sync_state",
+    "list_brief_snapshots",
+    "save_brief_snapshots",
     "create_task",
     "update_task_status",
+    "count_tasks",
+    "dated_tasks_stmt",
+    "undated_tasks_stmt",
+    "list_tasks_page",
+    "enqueue_task_replication",
     "create_event",
     "append_conversation_message",
     "list_recent_conversations",
@@ -109,14 +195,35 @@ async def create_knowledge_document(
     title: str,
     source: str,
     metadata: dict | None = None,
+    path: str | None = None,
+    content_hash: str | None = None,
 ) -> KnowledgeDocumentORM:
     instance = KnowledgeDocumentORM(
-        title=title, source=source, extra_data=metadata or {})
+        title=title,
+        source=source,
+        path=path,
+        content_hash=content_hash,
+        extra_data=metadata or {},
+    )
     session.add(instance)
     await session.flush()
     return instance
 
 
+async def get_knowledge_document_by_path(
+    session: AsyncSession,
+    *,
+    source: str,
+    path: str,
+) -> KnowledgeDocumentORM | None:
+    stmt = select(KnowledgeDocumentORM).where(
+        KnowledgeDocumentORM.source == source,
+        KnowledgeDocumentORM.path == path,
+    )
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none()
+
+
 async def insert_knowledge_chunks(
     session: AsyncSession,
     *,
@@ -129,6 +236,7 @@ async def insert_knowledge_chunks(
             document_id=document_id,
             chunk_index=index,
             content=content,
+            content_hash=compute_content_hash(content),
             embedding=embedding,
         )
         session.add(chunk)
@@ -137,6 +245,124 @@ async def insert_knowledge_chunks(
     return tuple(stored)
 
 
+async def bulk_insert_knowledge_chunks(
+    session: AsyncSession,
+    *,
+    document_id: int,
+    chunks: Sequence[tuple[int, str, list[float]]],
+) -> int:
+    """Insert chunks without building ORM instances.
+
+    On PostgreSQL (asyncpg with the binary vector codec registered, see
+    :func:`register_vector_codec`) rows are streamed with binary ``COPY``.
+    Other backends use a single ``executemany`` of one prepared INSERT. Both
+    run on the session's connection, inside its transaction.
+    """
+
+    if not chunks:
+        return 0
+    connection = await session.connection()
+    if connection.dialect.driver == "asyncpg":
+        raw = await connection.get_raw_connection()
+        if has_vector_codec(raw.driver_connection):
+            return await _copy_knowledge_chunks(
+                raw.driver_connection, document_id=document_id, chunks=chunks
+            )
+
+    rows = [
+        {
+            "document_id": document_id,
+            "chunk_index": index,
+            "content": content,
+            "content_hash": compute_content_hash(content),
+            "embedding": embedding,
+        }
+        for index, content, embedding in chunks
+    ]
+    await connection.execute(insert(KnowledgeChunkORM.__table__), rows)
+    return len(rows)
+
+
+_KNOWLEDGE_CHUNK_COPY_COLUMNS = (
+    "document_id",
+    "chunk_index",
+    "content",
+    "content_hash",
+    "embedding",
+)
+
+
+async def _copy_knowledge_chunks(
+    driver: Any,
+    *,
+    document_id: int,
+    chunks: Sequence[tuple[int, str, list[float]]],
+) -> int:
+    await driver.copy_records_to_table(
+        KnowledgeChunkORM.__tablename__,
+        records=[
+            (document_id, index, content, compute_content_hash(content), embedding)
+            for index, content, embedding in chunks
+        ],
+        columns=_KNOWLEDGE_CHUNK_COPY_COLUMNS,
+    )
+    return len(chunks)
+
+
+async def list_knowledge_chunk_hashes(
+    session: AsyncSession,
+    *,
+    document_id: int,
+) -> Sequence[tuple[int, int, str | None]]:
+    """Return ``(id, chunk_index, content_hash)`` for every chunk of a document."""
+
+    stmt = (
+        select(
+            KnowledgeChunkORM.id,
+            KnowledgeChunkORM.chunk_index,
+            KnowledgeChunkORM.content_hash,
+        )
+        .where(KnowledgeChunkORM.document_id == document_id)
+        .order_by(KnowledgeChunkORM.chunk_index)
+    )
+    result = await session.execute(stmt)
+    return tuple((row.id, row.chunk_index, row.content_hash) for row in result)
+
+
+async def reindex_knowledge_chunks(
+    session: AsyncSession,
+    *,
+    positions: Sequence[tuple[int, int]],
+) -> int:
+    """Move existing chunks to new positions given ``(chunk_id, chunk_index)`` pairs."""
+
+    if not positions:
+        return 0
+    await session.execute(
+        update(KnowledgeChunkORM),
+        [{"id": chunk_id, "chunk_index": index} for chunk_id, index in positions],
+    )
+    return len(positions)
+
+
+async def delete_knowledge_chunks(
+    session: AsyncSession,
+    *,
+    chunk_ids: Sequence[int],
+    batch_size: int = 1000,
+) -> int:
+    """Delete chunks by id using set-based DELETE statements."""
+
+    for start in range(0, len(chunk_ids), batch_size):
+        batch = chunk_ids[start:start + batch_size]
+        await session.execute(
+            delete(KnowledgeChunkORM)
+            .where(KnowledgeChunkORM.id.in_(batch))
+            .execution_options(synchronize_session=False)
+        )
+    return len(chunk_ids)
+
+
 async def get_sheets_sync_state(
     session: AsyncSession,
     *,
@@ -157,6 +383,7 @@ async def update_sheets_sync_state(
     spreadsheet_id: str,
     range_name: str,
     last_row_index: int,
+    source_modified_time: str | None = None,
 ) -> SheetsSyncStateORM:
     state = await get_sheets_sync_state(
         session,
@@ -171,11 +398,38 @@ async def update_sheets_sync_state(
         )
     else:
         state.last_row_index = last_row_index
+    if source_modified_time is not None:
+        state.source_modified_time = source_modified_time
     session.add(state)
     await session.flush()
     return state
 
 
+async def list_brief_snapshots(session: AsyncSession) -> Sequence[BriefSnapshotRecord]:
+    result = await session.execute(select(BriefSnapshotRecord))
+    return result.scalars().all()
+
+
+async def save_brief_snapshots(
+    session: AsyncSession,
+    *,
+    sections: dict[str, list[dict[str, Any]]],
+    refreshed_at: datetime,
+) -> None:
+    existing = {
+        record.section: record
+        for record in await session.scalars(
+            select(BriefSnapshotRecord).where(BriefSnapshotRecord.section.in_(sections))
+        )
+    }
+    for section, payload in sections.items():
+        record = existing.get(section) or BriefSnapshotRecord(section=section)
+        record.payload = payload
+        record.refreshed_at = refreshed_at
+        session.add(record)
+    await session.flush()
+
+
 async def create_task(
     session: AsyncSession,
     *,
@@ -187,18 +441,20 @@ async def create_task(
     status: TaskStatus = TaskStatus.PENDING,
     priority: str | None = "medium",
 ) -> TaskRecord:
-    record = TaskRecord(
-        title=title,
-        description=description,
-        due_date=due_at,
-        channel=channel,
-        sender=sender,
-        status=status,
-        priority=priority,
+    return await _insert_returning(
+        session,
+        TaskRecord,
+        _INSERT_TASK,
+        {
+            "title": title,
+            "description": description,
+            "due_date": due_at,
+            "channel": channel,
+            "sender": sender,
+            "status": status,
+            "priority": priority,
+        },
     )
-    session.add(record)
-    await session.flush()
-    return record
 
 
 async def update_task_status(
@@ -216,6 +472,162 @@ async def update_task_status(
     return record
 
 
+def _task_filters(status: TaskStatus | None, channel: str | None) -> list[Any]:
+    filters: list[Any] = []
+    if status is not None:
+        filters.append(TaskRecord.status == status)
+    if channel is not None:
+        filters.append(TaskRecord.channel == channel)
+    return filters
+
+
+async def count_tasks(
+    session: AsyncSession,
+    *,
+    status: TaskStatus | None = None,
+    channel: str | None = None,
+    approximate: bool = False,
+) -> tuple[int, bool]:
+    """Count matching tasks with ``COUNT(*)``.
+
+    With ``approximate`` on PostgreSQL the planner's row estimate (from table
+    statistics, via ``EXPLAIN``) is returned instead, unless it is below
+    ``APPROXIMATE_COUNT_THRESHOLD`` where an exact count is cheap anyway.
+
+    Returns:
+        tuple[int, bool]: the count and whether it is an estimate
+    """
+    filters = _task_filters(status, channel)
+    bind = session.get_bind()
+    if approximate and bind.dialect.name == "postgresql":
+        query = select(literal(1)).select_from(TaskRecord).where(*filters)
+        compiled = query.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True})
+        plan = (await session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate >= APPROXIMATE_COUNT_THRESHOLD:
+            return estimate, True
+
+    stmt = select(func.count()).select_from(TaskRecord).where(*filters)
+    return (await session.execute(stmt)).scalar_one(), False
+
+
+def dated_tasks_stmt(
+    *,
+    status: TaskStatus | None = None,
+    channel: str | None = None,
+    after: tuple[datetime, int] | None = None,
+) -> Select[tuple[TaskRecord]]:
+    """Tasks with a due date, by ``(due_date, id)``, after the ``after`` key.
+
+    The order and the row-value seek match ``ix_tasks_due_date_id``, so a
+    page is one range scan of the index wherever the cursor is.
+    """
+    stmt = select(TaskRecord).where(
+        *_task_filters(status, channel), TaskRecord.due_date.is_not(None)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(TaskRecord.due_date, TaskRecord.id) > after)
+    return stmt.order_by(TaskRecord.due_date, TaskRecord.id)
+
+
+def undated_tasks_stmt(
+    *,
+    status: TaskStatus | None = None,
+    channel: str | None = None,
+    after_id: int | None = None,
+) -> Select[tuple[TaskRecord]]:
+    """Tasks without a due date, by id, after ``after_id``.
+
+    ``due_date IS NULL`` is an equality prefix of ``ix_tasks_due_date_id``,
+    which then yields the rows in id order.
+    """
+    stmt = select(TaskRecord).where(*_task_filters(status, channel), TaskRecord.due_date.is_(None))
+    if after_id is not None:
+        stmt = stmt.where(TaskRecord.id > after_id)
+    return stmt.order_by(TaskRecord.id)
+
+
+async def list_tasks_page(
+    session: AsyncSession,
+    *,
+    limit: int,
+    status: TaskStatus | None = None,
+    channel: str | None = None,
+    sort: TaskSort = "id",
+    after: tuple[datetime | None, int] | None = None,
+    offset: int = 0,
+) -> list[TaskRecord]:
+    """Return one page of tasks using keyset pagination.
+
+    ``sort="id"`` lists newest first; ``sort="due_date"`` lists by due date
+    ascending with undated tasks last, ties broken by id. ``after`` is the
+    ``(due_date, id)`` of the last row of the previous page (``due_date`` is
+    ignored for ``sort="id"``); the seek uses the sort index, so every page
+    costs the same. ``offset`` is kept for clients that do not send a cursor.
+
+    The due date order is served in two phases, dated tasks then the undated
+    tail (:func:`dated_tasks_stmt`, :func:`undated_tasks_stmt`): a single
+    query ordering on ``due_date IS NULL`` cannot use the index.
+    """
+    if sort != "due_date":
+        stmt = select(TaskRecord).where(*_task_filters(status, channel))
+        stmt = stmt.order_by(TaskRecord.id.desc())
+        if after is not None:
+            stmt = stmt.where(TaskRecord.id < after[1])
+        if offset:
+            stmt = stmt.offset(offset)
+        result = await session.execute(stmt.limit(limit))
+        return list(result.scalars().all())
+
+    tasks: list[TaskRecord] = []
+    after_id: int | None = None
+    if after is not None and after[0] is None:
+        # The cursor is already in the undated tail
+        after_id = after[1]
+    else:
+        seek = (after[0], after[1]) if after is not None and after[0] is not None else None
+        dated = dated_tasks_stmt(status=status, channel=channel, after=seek)
+        tasks = list((await session.scalars(dated.offset(offset or None).limit(limit))).all())
+        if len(tasks) == limit:
+            return tasks
+        if offset and not tasks:
+            # The offset reaches past the dated tasks into the undated tail
+            skipped = await session.scalar(dated.with_only_columns(func.count()).order_by(None))
+            offset = max(offset - (skipped or 0), 0)
+        else:
+            offset = 0
+
+    undated = undated_tasks_stmt(status=status, channel=channel, after_id=after_id)
+    tail = await session.scalars(undated.offset(offset or None).limit(limit - len(tasks)))
+    tasks.extend(tail.all())
+    return tasks
+
+
+async def enqueue_task_replication(
+    session: AsyncSession,
+    *,
+    task_id: int,
+    operation: ReplicationOperation,
+    user_id: str | None = None,
+) -> TaskReplicationOutbox:
+    """Record a task change for the write-behind replication workers.
+
+    Runs in the caller's transaction, so the change and its outbox entry
+    commit (or roll back) together.
+    """
+
+    entry = TaskReplicationOutbox(
+        task_id=task_id,
+        operation=ReplicationOperation(operation).value,
+        user_id=user_id,
+    )
+    session.add(entry)
+    await session.flush()
+    return entry
+
+
 async def create_event(
     session: AsyncSession,
     *,
@@ -254,25 +666,75 @@ async def append_conversation_message(
     role: ConversationRole,
     content: str,
 ) -> ConversationMessage:
-    record = ConversationMessage(
-        conversation_id=conversation_id,
-        channel=channel,
-        sender=sender,
-        role=role,
-        content=content,
+    return await _insert_returning(
+        session,
+        ConversationMessage,
+        _INSERT_CONVERSATION_MESSAGE,
+        {
+            "conversation_id": conversation_id,
+            "channel": channel,
+            "sender": sender,
+            "role": role,
+            "content": content,
+        },
     )
-    session.add(record)
-    await session.flush()
-    return record
 
 
 async def list_recent_conversations(
     session: AsyncSession,
     *,
     limit: int = 20,
+    conversation_id: str | None = None,
 ) -> Sequence[ConversationMessage]:
-    result = await session.execute(
-        select(ConversationMessage).order_by(
-            ConversationMessage.id.desc()).limit(limit)
+    filters: dict[str, Any] = {}
+    if conversation_id is not None:
+        # Served by ix_conversation_messages_conversation_id_id
+        filters["conversation_id"] = conversation_id
+    return await _recent_first(session, ConversationMessage, limit, **filters)
+
+
+async def _recent_first(
+    session: AsyncSession, model: type[_Message], limit: int, **filters: Any
+) -> tuple[_Message, ...]:
+    """Newest ``model`` rows, reading the hot window first and older months only if needed.
+
+    Message tables are partitioned by month; bounding ``created_at`` lets
+    PostgreSQL prune every partition outside the window. On SQLite the older
+    months have been rolled out of the base table, so they are read from the
+    ``<table>_all`` view once it exists.
+    """
+    window_start = recent_window_start()
+
+    def newest(source: Any, *criteria: Any, count: int) -> Select[Any]:
+        return (
+            select(source)
+            .filter_by(**filters)
+            .where(*criteria)
+            .order_by(source.id.desc())
+            .limit(count)
+        )
+
+    result = await session.execute(newest(model, model.created_at >= window_start, count=limit))
+    recent = tuple(result.scalars())
+    if len(recent) == limit:
+        return recent
+    history = await _history_source(session, model)
+    older = await session.execute(
+        newest(history, history.created_at < window_start, count=limit - len(recent))
+    )
+    return recent + tuple(older.scalars())
+
+
+async def _history_source(session: AsyncSession, model: type[_Message]) -> Any:
+    """``model``, or on SQLite ``model`` mapped onto its hot-plus-rolled union view."""
+
+    if session.get_bind().dialect.name != "sqlite":
+        return model
+    view = f"{model.__tablename__}_all"
+    rolled = await session.run_sync(
+        lambda sync_session: inspect(sync_session.connection()).has_table(view)
     )
-    return tuple(result.scalars())
+    if not rolled:
+        return model
+    columns = (column(col.name, col.type) for col in model.__table__.columns)
+    return aliased(model, table(view, *columns), adapt_on_names=True)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin
@@ -14,6 +15,8 @@ class SheetsSyncStateORM(TimestampMixin, Base):
     spreadsheet_id: Mapped[str] = mapped_column(nullable=False)
     range_name: Mapped[str] = mapped_column(nullable=False)
     last_row_index: Mapped[int] = mapped_column(nullable=False, default=0)
+    # Drive modifiedTime seen by the last complete sync; unchanged means no new rows
+    source_modified_time: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
 
 __all__ = ["SheetsSyncStateORM"]
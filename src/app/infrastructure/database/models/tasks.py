@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import DateTime, Enum, String
+from sqlalchemy import ColumnElement, DateTime, Enum, Index, String, bindparam, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin
@@ -19,8 +19,26 @@ class TaskStatus(str, PyEnum):
     CANCELLED = "cancelled"
 
 
+# Statuses the ProactivityEngine jobs and the brief treat as open work
+OPEN_TASK_STATUSES = (TaskStatus.TODO.value, TaskStatus.IN_PROGRESS.value)
+_OPEN_TASKS_PREDICATE = text("status IN ('todo', 'in_progress')")
+
+
 class TaskRecord(TimestampMixin, Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Deadline, overdue and event reminders, and the brief's pending list;
+        # open tasks are a small slice of the table
+        Index(
+            "ix_tasks_open_due_at",
+            "due_at",
+            "id",
+            postgresql_where=_OPEN_TASKS_PREDICATE,
+            sqlite_where=_OPEN_TASKS_PREDICATE,
+        ),
+        # Keyset pagination of GET /tasks?sort=due_date
+        Index("ix_tasks_due_date_id", "due_date", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -44,4 +62,16 @@ class TaskRecord(TimestampMixin, Base):
     external_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
 
-__all__ = ["TaskRecord", "TaskStatus"]
+def open_task_filter() -> ColumnElement[bool]:
+    """``status IN ('todo', 'in_progress')`` with the values rendered inline.
+
+    Inline values let PostgreSQL match ``ix_tasks_open_due_at`` even when it
+    switches a prepared statement to a generic plan.
+    """
+
+    return TaskRecord.status.in_(
+        bindparam("open_statuses", list(OPEN_TASK_STATUSES), expanding=True, literal_execute=True)
+    )
+
+
+__all__ = ["OPEN_TASK_STATUSES", "TaskRecord", "TaskStatus", "open_task_filter"]
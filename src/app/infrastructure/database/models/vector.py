@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import struct
+import weakref
+from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import JSON, ForeignKey
+from sqlalchemy import JSON, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin
@@ -21,17 +24,74 @@ else:
     EMBEDDING_TYPE = JSON
 
 
+_VECTOR_CODEC_CONNECTIONS: weakref.WeakSet[Any] = weakref.WeakSet()
+
+
+def encode_vector_binary(value: Sequence[float] | str) -> bytes:
+    """Encode a vector in pgvector's binary wire format (dim, unused, float4[])."""
+
+    if isinstance(value, str):  # text literal produced by the SQLAlchemy type
+        value = [float(item) for item in value[1:-1].split(",")] if value != "[]" else []
+    return struct.pack(f">HH{len(value)}f", len(value), 0, *value)
+
+
+def decode_vector_binary(data: bytes) -> str:
+    """Decode pgvector's binary format into the text literal SQLAlchemy expects."""
+
+    dim, _ = struct.unpack_from(">HH", data)
+    values = struct.unpack_from(f">{dim}f", data, 4)
+    return "[" + ",".join(repr(item) for item in values) + "]"
+
+
+async def register_vector_codec(connection: Any) -> None:
+    """Switch an asyncpg connection to binary transfer for ``vector`` values."""
+
+    try:
+        await connection.set_type_codec(
+            "vector",
+            schema="public",
+            encoder=encode_vector_binary,
+            decoder=decode_vector_binary,
+            format="binary",
+        )
+    except ValueError:  # pragma: no cover - pgvector extension not installed
+        return
+    _VECTOR_CODEC_CONNECTIONS.add(connection)
+
+
+def has_vector_codec(connection: Any) -> bool:
+    return connection in _VECTOR_CODEC_CONNECTIONS
+
+
 class MessageEmbeddingORM(TimestampMixin, Base):
     """Stores embeddings associated with channel messages."""
 
+    # Partitioned by month of created_at on PostgreSQL (database/partitions.py).
+    # created_at is the message's, so the pair identifies the embedding and
+    # the unique index is allowed on the partitioned table.
     __tablename__ = "message_embeddings"
+    __table_args__ = (
+        Index(
+            "uq_message_embeddings_message_id_created_at",
+            "message_id",
+            "created_at",
+            unique=True,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    message_id: Mapped[int] = mapped_column(
-        ForeignKey("channel_messages.id", ondelete="CASCADE"), unique=True
-    )
+    # No foreign key: both tables are partitioned by month and expire together
+    message_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     embedding: Mapped[Any] = mapped_column(EMBEDDING_TYPE, nullable=False)
     content: Mapped[str] = mapped_column(nullable=False)
 
 
-__all__ = ["MessageEmbeddingORM", "EMBEDDING_TYPE"]
+__all__ = [
+    "MessageEmbeddingORM",
+    "EMBEDDING_TYPE",
+    "PgVector",
+    "decode_vector_binary",
+    "encode_vector_binary",
+    "has_vector_codec",
+    "register_vector_codec",
+]
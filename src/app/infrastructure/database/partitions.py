@@ -0,0 +1,325 @@
+"""Monthly partitions and retention for the message tables.
+
+``channel_messages``, ``conversation_messages`` and ``message_embeddings``
+only grow. They are split by month of ``created_at``:
+
+- PostgreSQL: declarative range partitions, one per month
+  (``<table>_pYYYY_MM``), created by migration ``20261023_message_partitions``.
+  Rows from before the migration live in ``<table>_before_pYYYY_MM`` and a
+  ``<table>_default`` partition catches anything outside the created range.
+  :func:`ensure_partitions` creates upcoming months ahead of time.
+- SQLite: no declarative partitioning. The base table is the hot table;
+  :func:`roll_sqlite_partitions` moves whole months older than the hot window
+  into ``<table>_pYYYY_MM`` tables and rebuilds the ``<table>_all`` view
+  (``UNION ALL`` of the hot and rolled tables) for history queries.
+
+:func:`archive_expired_partitions` exports partitions older than the
+retention window to ``<archive_dir>/<partition>.jsonl.gz``, then detaches and
+drops them. Hot-path reads filter on ``created_at >= recent_window_start()``
+so PostgreSQL prunes to the latest partitions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLES: tuple[str, ...] = (
+    "channel_messages",
+    "conversation_messages",
+    "message_embeddings",
+)
+
+EXPORT_BATCH_SIZE = 5_000
+
+_PARTITION_RE = re.compile(
+    r"^(?P<table>\w+?)_(?P<before>before_)?p(?P<year>\d{4})_(?P<month>\d{2})$"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Partition:
+    """A monthly partition (or rolled table) and the exclusive end of its range."""
+
+    name: str
+    table: str
+    upper: datetime
+
+
+def month_start(value: datetime) -> datetime:
+    """First instant of ``value``'s month, in UTC."""
+
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return datetime(value.year, value.month, 1, tzinfo=UTC)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def recent_window_start(now: datetime | None = None, months: int | None = None) -> datetime:
+    """Start of the hot window: the current month plus ``months - 1`` before it."""
+
+    if months is None:
+        from app.config import get_settings
+
+        months = get_settings().message_hot_months
+    return add_months(month_start(now or datetime.now(UTC)), -(max(months, 1) - 1))
+
+
+def parse_partition(name: str) -> Partition | None:
+    match = _PARTITION_RE.match(name)
+    if match is None or match["table"] not in PARTITIONED_TABLES:
+        return None
+    month = datetime(int(match["year"]), int(match["month"]), 1, tzinfo=UTC)
+    upper = month if match["before"] else add_months(month, 1)
+    return Partition(name=name, table=match["table"], upper=upper)
+
+
+async def list_partitions(conn: AsyncConnection, table: str) -> list[Partition]:
+    """Monthly partitions (PostgreSQL) or rolled tables (SQLite) of ``table``, oldest first."""
+
+    if conn.dialect.name == "postgresql":
+        result = await conn.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": table},
+        )
+    else:
+        result = await conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE :prefix"),
+            {"prefix": f"{table}_%"},
+        )
+    partitions = [parse_partition(name) for name in result.scalars()]
+    return sorted(
+        (partition for partition in partitions if partition and partition.table == table),
+        key=lambda partition: partition.upper,
+    )
+
+
+async def ensure_partitions(
+    conn: AsyncConnection, *, months_ahead: int = 2, now: datetime | None = None
+) -> list[str]:
+    """Create PostgreSQL partitions for the current and next ``months_ahead`` months.
+
+    Tables that are not partitioned (migration not applied) are skipped.
+    Returns the names of the partitions created.
+    """
+
+    if conn.dialect.name != "postgresql":
+        return []
+
+    created: list[str] = []
+    current = month_start(now or datetime.now(UTC))
+    for table in PARTITIONED_TABLES:
+        if not await _is_partitioned(conn, table):
+            continue
+        existing = {partition.name for partition in await list_partitions(conn, table)}
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            name = partition_name(table, month)
+            if name in existing:
+                continue
+            await conn.execute(
+                text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+                    f"FOR VALUES FROM ('{month.isoformat()}') "
+                    f"TO ('{add_months(month, 1).isoformat()}')"
+                )
+            )
+            created.append(name)
+    return created
+
+
+async def roll_sqlite_partitions(conn: AsyncConnection, *, now: datetime | None = None) -> int:
+    """Move SQLite rows older than the hot window into monthly tables.
+
+    Returns the number of rows moved. The ``<table>_all`` views are rebuilt.
+    """
+
+    if conn.dialect.name != "sqlite":
+        return 0
+
+    window_start = recent_window_start(now)
+    moved = 0
+    for table in PARTITIONED_TABLES:
+        if not await _sqlite_table_exists(conn, table):
+            continue
+        oldest_sql = f'SELECT MIN(created_at) FROM "{table}"'  # noqa: S608
+        oldest = (await conn.execute(text(oldest_sql))).scalar()
+        month = month_start(_parse_sqlite_datetime(oldest)) if oldest else window_start
+        while month < window_start:
+            name = partition_name(table, month)
+            bounds = {
+                "start": _sqlite_datetime(month),
+                "end": _sqlite_datetime(add_months(month, 1)),
+            }
+            where = "created_at >= :start AND created_at < :end"
+            create_sql = (
+                f'CREATE TABLE IF NOT EXISTS "{name}" AS SELECT * FROM "{table}" WHERE 0'  # noqa: S608
+            )
+            copy_sql = f'INSERT INTO "{name}" SELECT * FROM "{table}" WHERE {where}'  # noqa: S608
+            delete_sql = f'DELETE FROM "{table}" WHERE {where}'  # noqa: S608
+            await conn.execute(text(create_sql))
+            await conn.execute(text(copy_sql), bounds)
+            moved += (await conn.execute(text(delete_sql), bounds)).rowcount or 0
+            month = add_months(month, 1)
+        await _refresh_sqlite_view(conn, table)
+    return moved
+
+
+async def export_partition(conn: AsyncConnection, name: str, archive_dir: Path) -> Path:
+    """Write every row of ``name`` to ``<archive_dir>/<name>.jsonl.gz``."""
+
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{name}.jsonl.gz"
+    partial = path.with_name(f"{path.name}.partial")
+    stream = gzip.open(partial, "wt", encoding="utf-8")
+    try:
+        result = await conn.stream(text(f'SELECT * FROM "{name}"'))  # noqa: S608
+        async for rows in result.mappings().partitions(EXPORT_BATCH_SIZE):
+            lines = "".join(json.dumps(dict(row), default=str) + "\n" for row in rows)
+            await asyncio.to_thread(stream.write, lines)
+    finally:
+        await asyncio.to_thread(stream.close)
+    partial.replace(path)
+    return path
+
+
+async def archive_expired_partitions(
+    engine: AsyncEngine,
+    *,
+    retention_months: int,
+    archive_dir: Path,
+    now: datetime | None = None,
+) -> list[Path]:
+    """Export, detach and drop partitions entirely older than ``retention_months``.
+
+    The current month always counts as the first retained month. A partition
+    is exported while still attached and only detached and dropped once its
+    file is complete, so a failed export leaves it for the next run.
+    """
+
+    cutoff = add_months(month_start(now or datetime.now(UTC)), -(retention_months - 1))
+    archived: list[Path] = []
+    for table in PARTITIONED_TABLES:
+        async with engine.connect() as conn:
+            expired = [p for p in await list_partitions(conn, table) if p.upper <= cutoff]
+        for partition in expired:
+            async with engine.connect() as conn:
+                path = await export_partition(conn, partition.name, archive_dir)
+            async with engine.begin() as conn:
+                if conn.dialect.name == "postgresql":
+                    await conn.execute(
+                        text(f'ALTER TABLE "{table}" DETACH PARTITION "{partition.name}"')
+                    )
+                await conn.execute(text(f'DROP TABLE "{partition.name}"'))
+                if conn.dialect.name == "sqlite":
+                    await _refresh_sqlite_view(conn, table)
+            logger.info(f"Archived partition {partition.name} to {path}")
+            archived.append(path)
+    return archived
+
+
+async def maintain_message_partitions(
+    engine: AsyncEngine, *, now: datetime | None = None
+) -> dict[str, Any]:
+    """Create upcoming partitions (or roll SQLite tables) and apply retention."""
+
+    from app.config import get_settings
+
+    settings = get_settings()
+    async with engine.begin() as conn:
+        created = await ensure_partitions(
+            conn, months_ahead=settings.message_partitions_months_ahead, now=now
+        )
+        rolled = await roll_sqlite_partitions(conn, now=now)
+
+    archived: list[Path] = []
+    if settings.message_retention_months:
+        archived = await archive_expired_partitions(
+            engine,
+            retention_months=settings.message_retention_months,
+            archive_dir=Path(settings.message_archive_dir),
+            now=now,
+        )
+    return {"created": created, "rolled": rolled, "archived": [str(path) for path in archived]}
+
+
+async def _is_partitioned(conn: AsyncConnection, table: str) -> bool:
+    result = await conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table "
+            "JOIN pg_class ON pg_class.oid = pg_partitioned_table.partrelid "
+            "WHERE pg_class.relname = :table"
+        ),
+        {"table": table},
+    )
+    return result.scalar() is not None
+
+
+async def _sqlite_table_exists(conn: AsyncConnection, table: str) -> bool:
+    result = await conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :table"),
+        {"table": table},
+    )
+    return result.scalar() is not None
+
+
+async def _refresh_sqlite_view(conn: AsyncConnection, table: str) -> None:
+    sources = [table] + [partition.name for partition in await list_partitions(conn, table)]
+    union = " UNION ALL ".join(f'SELECT * FROM "{source}"' for source in sources)  # noqa: S608
+    await conn.execute(text(f'DROP VIEW IF EXISTS "{table}_all"'))
+    await conn.execute(text(f'CREATE VIEW "{table}_all" AS {union}'))
+
+
+def _sqlite_datetime(value: datetime) -> str:
+    # Same text layout SQLAlchemy and CURRENT_TIMESTAMP store, so comparisons hold
+    return value.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _parse_sqlite_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+__all__ = [
+    "PARTITIONED_TABLES",
+    "Partition",
+    "add_months",
+    "archive_expired_partitions",
+    "ensure_partitions",
+    "export_partition",
+    "list_partitions",
+    "maintain_message_partitions",
+    "month_start",
+    "parse_partition",
+    "partition_name",
+    "recent_window_start",
+    "roll_sqlite_partitions",
+]
@@ -0,0 +1,186 @@
+"""Connection pool instrumentation and sizing.
+
+PostgreSQL engines use :class:`InstrumentedQueuePool`, which times how long
+each checkout waits for a free connection, and :func:`instrument_pool` keeps
+the checked-out/overflow gauges current from pool events. Each pool's
+:class:`PoolUsage` keeps a window of the concurrency seen at checkout, from
+which :func:`recommend_pool_size` suggests ``database_pool_size`` and
+``database_max_overflow``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from app.core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_OVERFLOW, DB_POOL_TIMEOUTS, DB_POOL_WAIT
+
+logger = logging.getLogger(__name__)
+
+# Checkouts kept per pool for the size recommendation
+USAGE_WINDOW = 10_000
+# A 95th percentile queue wait longer than this means callers regularly queued
+SATURATED_WAIT_SECONDS = 0.01
+
+
+@dataclass
+class PoolUsage:
+    """Concurrency and wait samples for one pool, over the last USAGE_WINDOW checkouts."""
+
+    name: str
+    concurrency: deque[int] = field(default_factory=lambda: deque(maxlen=USAGE_WINDOW))
+    waits: deque[float] = field(default_factory=lambda: deque(maxlen=USAGE_WINDOW))
+    peak: int = 0
+    timeouts: int = 0
+
+    def record_checkout(self, checked_out: int) -> None:
+        self.concurrency.append(checked_out)
+        self.peak = max(self.peak, checked_out)
+
+
+@dataclass(frozen=True)
+class PoolRecommendation:
+    """Suggested pool settings and the observations they come from."""
+
+    pool_size: int
+    max_overflow: int
+    samples: int
+    p95_concurrency: int
+    peak_concurrency: int
+    p95_wait_seconds: float
+    timeouts: int
+    saturated: bool
+
+
+_usage: dict[str, PoolUsage] = {}
+
+
+def pool_usage(name: str) -> PoolUsage:
+    """Return (and create) the usage record of the pool labelled ``name``."""
+
+    usage = _usage.get(name)
+    if usage is None:
+        usage = _usage[name] = PoolUsage(name)
+    return usage
+
+
+def all_pool_usage() -> dict[str, PoolUsage]:
+    return dict(_usage)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that measures how long each checkout waits for a connection.
+
+    Pool events fire only once a connection is handed out, so the wait is
+    timed in :meth:`_do_get`, and only when the checkout found no idle
+    connection and no room to open one. Opening a connection and
+    ``pool_pre_ping`` are not waits and record 0. The metrics label is the
+    engine's ``pool_logging_name``, which :meth:`recreate` carries over.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.usage = pool_usage(kwargs.get("logging_name") or "default")
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        # Same test QueuePool uses to decide whether to block on the queue
+        queued = (
+            self._pool.empty()
+            and self._max_overflow > -1
+            and self._overflow >= self._max_overflow
+        )
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.usage.timeouts += 1
+            DB_POOL_TIMEOUTS.labels(pool=self.usage.name).inc()
+            logger.warning(
+                f"Database pool '{self.usage.name}' exhausted: {self.checkedout()} checked out, "
+                f"size {self.size()}, overflow {self.overflow()}"
+            )
+            raise
+        finally:
+            waited = time.perf_counter() - started if queued else 0.0
+            self.usage.waits.append(waited)
+            DB_POOL_WAIT.labels(pool=self.usage.name).observe(waited)
+
+
+def instrument_pool(engine: Engine) -> None:
+    """Keep the pool gauges and usage window of ``engine`` current."""
+
+    def update(checkout: bool) -> None:
+        pool = engine.pool  # replaced on dispose(); listeners carry over
+        if not isinstance(pool, InstrumentedQueuePool):
+            return
+        checked_out = pool.checkedout()
+        if checkout:
+            pool.usage.record_checkout(checked_out)
+        DB_POOL_CHECKED_OUT.labels(pool=pool.usage.name).set(checked_out)
+        DB_POOL_OVERFLOW.labels(pool=pool.usage.name).set(pool.overflow())
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        update(checkout=True)
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        update(checkout=False)
+
+
+def _percentile(values: list[Any], fraction: float) -> Any:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def recommend_pool_size(usage: PoolUsage, *, headroom: float = 1.25) -> PoolRecommendation | None:
+    """Suggest pool settings from observed checkout concurrency.
+
+    ``pool_size`` covers the 95th percentile of connections in use, plus
+    ``headroom``, so routine load keeps persistent connections; overflow
+    covers the peak, so bursts (scheduler jobs firing together) borrow
+    temporary ones. When checkouts queued or timed out the pool capped what
+    was observed and real demand is higher, so overflow is at least doubled.
+    The result is per process and per engine: multiplied by the number of
+    workers it must stay below PostgreSQL's ``max_connections``.
+    """
+
+    if not usage.concurrency:
+        return None
+    p95_concurrency = _percentile(list(usage.concurrency), 0.95)
+    p95_wait = _percentile(list(usage.waits), 0.95) if usage.waits else 0.0
+    saturated = bool(usage.timeouts) or p95_wait > SATURATED_WAIT_SECONDS
+
+    pool_size = max(1, math.ceil(p95_concurrency * headroom))
+    max_overflow = max(0, math.ceil(usage.peak * headroom) - pool_size)
+    if saturated:
+        max_overflow = max(2 * max_overflow, pool_size)
+    return PoolRecommendation(
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        samples=len(usage.concurrency),
+        p95_concurrency=p95_concurrency,
+        peak_concurrency=usage.peak,
+        p95_wait_seconds=p95_wait,
+        timeouts=usage.timeouts,
+        saturated=saturated,
+    )
+
+
+__all__ = [
+    "InstrumentedQueuePool",
+    "PoolRecommendation",
+    "PoolUsage",
+    "all_pool_usage",
+    "instrument_pool",
+    "pool_usage",
+    "recommend_pool_size",
+]
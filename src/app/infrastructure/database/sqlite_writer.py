@@ -0,0 +1,146 @@
+"""Single writer task that batches SQLite writes into shared transactions.
+
+SQLite admits one writer at a time. Rather than letting every request and
+job take the write lock for its own short transaction (and wait on
+``busy_timeout`` for the others), callers hand write operations to
+:class:`SQLiteWriter`. Its task drains up to ``max_batch`` queued
+operations, runs each in a savepoint and commits them together, so one fsync
+covers the whole batch and a write waits for at most one batch ahead of it.
+In single-writer mode the engine is the primary, whose pool holds the
+process's only write connection; session writes queue for it in the pool
+between batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.metrics import SQLITE_WRITE_BATCH, SQLITE_WRITE_LATENCY
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+WriteOperation = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class SQLiteWriter:
+    """Runs queued write operations on one connection, committing them in batches.
+
+    Each operation receives the batch's session and runs in a savepoint: one
+    that raises is rolled back alone and its caller gets the exception, while
+    the rest of the batch commits. If the commit itself fails, every caller
+    in the batch gets that error. Results come back detached, with the
+    attributes loaded when the operation returned. Callers resume only after
+    their batch has committed, so reads issued afterwards (on any connection)
+    see the write. The task starts lazily on the running loop. The engine
+    is shared, so :meth:`close` leaves it open.
+    """
+
+    def __init__(self, engine: AsyncEngine, *, max_batch: int = 64) -> None:
+        if max_batch <= 0:
+            raise ValueError("max_batch must be positive")
+        self._engine = engine
+        self._max_batch = max_batch
+        self._session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[_Write] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def run(self, operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Queue ``operation`` and return its result once its batch commits."""
+
+        queue = self._ensure_started()
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        queue.put_nowait(_Write(operation, future, time.perf_counter()))
+        return await future
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if self._queue is not None:
+            while not self._queue.empty():
+                pending = self._queue.get_nowait()
+                if not pending.future.done():
+                    pending.future.cancel()
+        self._queue = None
+        self._loop = None
+
+    def _ensure_started(self) -> asyncio.Queue[_Write]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._queue is None:
+            # Queue and futures are bound to a loop; a new loop gets a fresh task.
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._work(self._queue), name="sqlite-writer")
+        return self._queue
+
+    async def _work(self, queue: asyncio.Queue[_Write]) -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            # Callers that went away no longer need their write
+            batch = [write for write in batch if not write.future.done()]
+            if batch:
+                await self._commit(batch)
+
+    async def _commit(self, batch: list[_Write]) -> None:
+        outcomes: list[tuple[_Write, Any, BaseException | None]] = []
+        try:
+            async with self._session_factory() as session:
+                for write in batch:
+                    try:
+                        async with session.begin_nested():
+                            result = await write.operation(session)
+                    except Exception as exc:
+                        outcomes.append((write, None, exc))
+                    else:
+                        outcomes.append((write, result, None))
+                    # Savepoints flush on release; a rolled-back one expires every
+                    # instance and leaves its own rows in the identity map
+                    session.expunge_all()
+                await session.commit()
+        except asyncio.CancelledError:
+            for write in batch:
+                write.future.cancel()
+            raise
+        except Exception as exc:
+            logger.error(f"SQLite write batch of {len(batch)} failed: {exc}")
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(exc)
+            return
+
+        SQLITE_WRITE_BATCH.observe(len(batch))
+        committed_at = time.perf_counter()
+        for write, result, error in outcomes:
+            SQLITE_WRITE_LATENCY.observe(committed_at - write.enqueued_at)
+            if write.future.done():
+                continue
+            if error is not None:
+                write.future.set_exception(error)
+            else:
+                write.future.set_result(result)
+
+
+@dataclass(slots=True)
+class _Write:
+    operation: WriteOperation
+    future: asyncio.Future[Any]
+    enqueued_at: float
+
+
+__all__ = ["SQLiteWriter", "WriteOperation"]
@@ -0,0 +1,155 @@
+"""Shared plumbing for Google API clients (Sheets, Drive, Calendar).
+
+- Credentials and discovery documents are loaded once per process and
+  ``(api, version, credentials, scopes)``: building a service is expensive.
+- Blocking ``googleapiclient`` calls run on a dedicated, bounded thread pool
+  instead of the default executor, so slow Google I/O cannot starve other
+  ``to_thread`` work. Its queue is exported as ``GOOGLE_API_EXECUTOR_TASKS``.
+- ``httplib2`` is not thread-safe, so every executor thread sends requests
+  through its own authorized HTTP object; the service itself is shared.
+- :meth:`GoogleService.execute_batch` packs many requests into
+  ``BatchHttpRequest`` round trips.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, TypeVar
+
+import google_auth_httplib2
+import httplib2
+from google.oauth2.service_account import Credentials
+from googleapiclient.discovery import build
+
+from app.core.metrics import GOOGLE_API_EXECUTOR_TASKS
+
+T = TypeVar("T")
+
+# Google accepts up to 100 calls per batch; Calendar documents 50
+BATCH_LIMIT = 50
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_google_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor for blocking Google API calls."""
+
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from app.config import get_settings
+
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_settings().google_api_max_workers,
+                    thread_name_prefix="google-api",
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """Run ``func(*args)`` on the Google executor, tracking queued and running calls."""
+
+    dequeued = threading.Lock()
+
+    def _leave_queue() -> None:
+        # Exactly once: by the worker thread, or by the caller if the call
+        # was cancelled before a thread picked it up.
+        if dequeued.acquire(blocking=False):
+            GOOGLE_API_EXECUTOR_TASKS.labels(state="queued").dec()
+
+    def _tracked() -> T:
+        _leave_queue()
+        GOOGLE_API_EXECUTOR_TASKS.labels(state="running").inc()
+        try:
+            return func(*args)
+        finally:
+            GOOGLE_API_EXECUTOR_TASKS.labels(state="running").dec()
+
+    GOOGLE_API_EXECUTOR_TASKS.labels(state="queued").inc()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(get_google_executor(), _tracked)
+    except asyncio.CancelledError:
+        _leave_queue()
+        raise
+
+
+@lru_cache(maxsize=32)
+def load_credentials(credentials_path: str, scopes: tuple[str, ...]) -> Credentials:
+    """Read a service account file once per path and scope set."""
+
+    return Credentials.from_service_account_file(credentials_path, scopes=scopes)
+
+
+class GoogleService:
+    """A discovery-built service shared across threads and callers."""
+
+    def __init__(self, resource: Any, credentials: Credentials) -> None:
+        self.resource = resource
+        self._credentials = credentials
+
+    async def execute(self, request: Any) -> Any:
+        """Execute one ``HttpRequest`` on the Google executor."""
+
+        return await run_blocking(self._execute, request)
+
+    async def execute_batch(self, requests: Sequence[Any]) -> list[Any]:
+        """Execute ``requests`` in ``BatchHttpRequest`` round trips of ``BATCH_LIMIT``.
+
+        Returns a response or exception per request, in input order.
+        """
+
+        results: list[Any] = [None] * len(requests)
+        for start in range(0, len(requests), BATCH_LIMIT):
+            chunk = requests[start : start + BATCH_LIMIT]
+            await run_blocking(partial(self._execute_batch, chunk, results, start))
+        return results
+
+    def _execute(self, request: Any) -> Any:
+        return request.execute(http=self._http())
+
+    def _execute_batch(self, chunk: Sequence[Any], results: list[Any], offset: int) -> None:
+        def _callback(request_id: str, response: Any, exception: Exception | None) -> None:
+            results[offset + int(request_id)] = exception if exception is not None else response
+
+        batch = self.resource.new_batch_http_request(callback=_callback)
+        for index, request in enumerate(chunk):
+            batch.add(request, request_id=str(index))
+        batch.execute(http=self._http())
+
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        # One authorized connection per thread and credentials
+        cache: dict[int, google_auth_httplib2.AuthorizedHttp] = getattr(_local, "http", None) or {}
+        _local.http = cache
+        http = cache.get(id(self._credentials))
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            cache[id(self._credentials)] = http
+        return http
+
+
+@lru_cache(maxsize=32)
+def get_google_service(
+    api: str, version: str, credentials_path: str, scopes: tuple[str, ...]
+) -> GoogleService:
+    """Return a cached service; discovery and credentials are loaded once."""
+
+    credentials = load_credentials(credentials_path, scopes)
+    resource = build(api, version, credentials=credentials, cache_discovery=False)
+    return GoogleService(resource, credentials)
+
+
+__all__ = [
+    "BATCH_LIMIT",
+    "GoogleService",
+    "get_google_executor",
+    "get_google_service",
+    "load_credentials",
+    "run_blocking",
+]
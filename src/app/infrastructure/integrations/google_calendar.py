@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from app.infrastructure.integrations.google_api import get_google_service
 
 CALENDAR_SCOPES = ("https://www.googleapis.com/auth/calendar",)
 
@@ -15,39 +13,42 @@ class GoogleCalendarClient:
     """Async-friendly wrapper around Google Calendar API v3."""
 
     def __init__(self, credentials_path: str) -> None:
-        credentials = Credentials.from_service_account_file(
-            credentials_path, scopes=CALENDAR_SCOPES
-        )
-        self._service = build("calendar", "v3", credentials=credentials, cache_discovery=False)
+        self._calendar = get_google_service("calendar", "v3", credentials_path, CALENDAR_SCOPES)
 
     async def insert_event(self, calendar_id: str, event: dict[str, Any]) -> dict[str, Any]:
-        def _insert() -> dict[str, Any]:
-            return (
-                self._service.events()
-                .insert(calendarId=calendar_id, body=event, sendUpdates="all")
-                .execute()
-            )
-
-        return await asyncio.to_thread(_insert)
+        request = self._calendar.resource.events().insert(
+            calendarId=calendar_id, body=event, sendUpdates="all"
+        )
+        return await self._calendar.execute(request)
+
+    async def insert_events(
+        self, calendar_id: str, events: list[dict[str, Any]]
+    ) -> list[dict[str, Any] | Exception]:
+        """Insert several events sharing ``BatchHttpRequest`` round trips.
+
+        Returns the created event or the exception per input event, in order.
+        """
+
+        events_api = self._calendar.resource.events()
+        return await self._calendar.execute_batch(
+            [
+                events_api.insert(calendarId=calendar_id, body=event, sendUpdates="all")
+                for event in events
+            ]
+        )
 
     async def list_events(
         self, calendar_id: str, time_min: str, time_max: str
     ) -> list[dict[str, Any]]:
-        def _list() -> list[dict[str, Any]]:
-            result = (
-                self._service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=time_min,
-                    timeMax=time_max,
-                    singleEvents=True,
-                    orderBy="startTime",
-                )
-                .execute()
-            )
-            return result.get("items", [])
-
-        return await asyncio.to_thread(_list)
+        request = self._calendar.resource.events().list(
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=True,
+            orderBy="startTime",
+        )
+        result = await self._calendar.execute(request)
+        return result.get("items", [])
 
 
 __all__ = ["GoogleCalendarClient", "CALENDAR_SCOPES"]
@@ -2,47 +2,161 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Sequence
 from typing import Any
 
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from app.infrastructure.integrations.google_api import GoogleService, get_google_service
 
-SCOPES: Sequence[str] = ("https://www.googleapis.com/auth/spreadsheets",)
+SCOPES: Sequence[str] = (
+    "https://www.googleapis.com/auth/spreadsheets",
+    # Read-only file metadata: lets sync probe modifiedTime before reading rows
+    "https://www.googleapis.com/auth/drive.metadata.readonly",
+)
 
 
 class GoogleSheetsClient:
-    """Wrapper around Google Sheets API v4 using service account credentials."""
+    """Wrapper around Google Sheets API v4 using service account credentials.
+
+    Cheap to construct: the service is built once per credentials file and
+    shared (see :mod:`app.infrastructure.integrations.google_api`).
+    """
 
     def __init__(self, credentials_path: str) -> None:
-        self._credentials = Credentials.from_service_account_file(credentials_path, scopes=SCOPES)
-        self._service = build("sheets", "v4", credentials=self._credentials, cache_discovery=False)
+        self._credentials_path = credentials_path
+        self._sheets = get_google_service("sheets", "v4", credentials_path, tuple(SCOPES))
+        self._drive: GoogleService | None = None
+
+    @property
+    def service(self) -> GoogleService:
+        """Shared Sheets service, e.g. for :meth:`GoogleService.execute_batch`."""
+        return self._sheets
 
     async def list_rows(self, spreadsheet_id: str, range_: str) -> list[list[Any]]:
-        def _list_rows() -> list[list[Any]]:
-            result = (
-                self._service.spreadsheets()
-                .values()
-                .get(spreadsheetId=spreadsheet_id, range=range_)
-                .execute()
-            )
-            return result.get("values", [])
-
-        return await asyncio.to_thread(_list_rows)
-
-    async def append_row(self, spreadsheet_id: str, range_: str, values: list[Any]) -> None:
-        def _append_row() -> None:
-            body = {"values": [values]}
-            self._service.spreadsheets().values().append(
-                spreadsheetId=spreadsheet_id,
-                range=range_,
-                valueInputOption="USER_ENTERED",
-                insertDataOption="INSERT_ROWS",
-                body=body,
-            ).execute()
-
-        await asyncio.to_thread(_append_row)
+        request = (
+            self._sheets.resource.spreadsheets()
+            .values()
+            .get(spreadsheetId=spreadsheet_id, range=range_)
+        )
+        result = await self._sheets.execute(request)
+        return result.get("values", [])
+
+    async def get_modified_time(self, spreadsheet_id: str) -> str | None:
+        """Return the spreadsheet's Drive ``modifiedTime`` (RFC 3339), a one-field read."""
+
+        if self._drive is None:
+            self._drive = get_google_service("drive", "v3", self._credentials_path, tuple(SCOPES))
+        request = self._drive.resource.files().get(
+            fileId=spreadsheet_id,
+            fields="modifiedTime",
+            supportsAllDrives=True,
+        )
+        result = await self._drive.execute(request)
+        return result.get("modifiedTime")
+
+    async def append_row(
+        self, spreadsheet_id: str, range_: str, values: list[Any]
+    ) -> dict[str, Any]:
+        return await self.append_rows(spreadsheet_id, range_, [values])
+
+    async def append_rows(
+        self, spreadsheet_id: str, range_: str, rows: list[list[Any]]
+    ) -> dict[str, Any]:
+        """Append ``rows`` in a single ``values.append`` call; returns the API response."""
+
+        request = self._sheets.resource.spreadsheets().values().append(
+            spreadsheetId=spreadsheet_id,
+            range=range_,
+            valueInputOption="USER_ENTERED",
+            insertDataOption="INSERT_ROWS",
+            body={"values": rows},
+        )
+        return await self._sheets.execute(request)
+
+    async def batch_update_values(
+        self, spreadsheet_id: str, data: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Write several ``{"range": ..., "values": ...}`` blocks in one ``values.batchUpdate``."""
+
+        request = self._sheets.resource.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"valueInputOption": "USER_ENTERED", "data": data},
+        )
+        return await self._sheets.execute(request)
+
+    async def update_values(
+        self, spreadsheet_id: str, range_: str, rows: list[list[Any]]
+    ) -> dict[str, Any]:
+        """Overwrite ``range_`` with ``rows`` in a single ``values.update`` call."""
+
+        request = self._sheets.resource.spreadsheets().values().update(
+            spreadsheetId=spreadsheet_id,
+            range=range_,
+            valueInputOption="USER_ENTERED",
+            body={"values": rows},
+        )
+        return await self._sheets.execute(request)
+
+    async def get_sheet_id(self, spreadsheet_id: str, title: str) -> int | None:
+        """Return the numeric ``sheetId`` of the tab called ``title``."""
+
+        request = self._sheets.resource.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields="sheets.properties(sheetId,title)",
+        )
+        result = await self._sheets.execute(request)
+        for sheet in result.get("sheets", []):
+            properties = sheet.get("properties", {})
+            if properties.get("title") == title:
+                return properties.get("sheetId")
+        return None
+
+    async def delete_rows(
+        self, spreadsheet_id: str, sheet_id: int, row_numbers: Sequence[int]
+    ) -> dict[str, Any]:
+        """Delete 1-based ``row_numbers`` with one ``batchUpdate`` of ``deleteDimension``.
+
+        Rows are removed bottom-up so earlier deletions do not shift later ones.
+        """
+
+        requests = [
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "dimension": "ROWS",
+                        "startIndex": row - 1,
+                        "endIndex": row,
+                    }
+                }
+            }
+            for row in sorted(set(row_numbers), reverse=True)
+        ]
+        request = self._sheets.resource.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"requests": requests},
+        )
+        return await self._sheets.execute(request)
+
+    async def list_rows_many(
+        self, targets: Sequence[tuple[str, str]]
+    ) -> list[list[list[Any]] | Exception]:
+        """Read ``(spreadsheet_id, range)`` pairs, possibly across spreadsheets.
+
+        All reads share ``BatchHttpRequest`` round trips; returns the rows or the
+        exception per target, in input order.
+        """
+
+        values = self._sheets.resource.spreadsheets().values()
+        results = await self._sheets.execute_batch(
+            [
+                values.get(spreadsheetId=spreadsheet_id, range=range_)
+                for spreadsheet_id, range_ in targets
+            ]
+        )
+        return [
+            result if isinstance(result, Exception) else result.get("values", [])
+            for result in results
+        ]
 
 
 __all__ = ["GoogleSheetsClient", "SCOPES"]
@@ -6,11 +6,25 @@ from typing import Any
 
 import httpx
 
+from app.infrastructure.storage.throttle import AdaptiveThrottle
+
+# Notion allows an average of three requests per second per integration
+NOTION_REQUESTS_PER_SECOND = 3.0
+
 
 class NotionClient:  # pragma: no cover - http stub
     """Partial Notion REST API wrapper for tasks."""
 
-    def __init__(self, token: str, *, timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        token: str,
+        *,
+        timeout: float = 10.0,
+        requests_per_second: float = NOTION_REQUESTS_PER_SECOND,
+    ) -> None:
+        self.throttle = AdaptiveThrottle(
+            "notion", requests_per_second, max_rate=requests_per_second
+        )
         self._client = httpx.AsyncClient(
             base_url="https://api.notion.com",
             timeout=timeout,
@@ -20,6 +34,7 @@ class NotionClient:  # pragma: no cover - http stub
                 "Content-Type": "application/json",
             },
             limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            event_hooks=self.throttle.event_hooks(),
         )
 
     async def create_page(self, payload: dict[str, Any]) -> dict[str, Any]:
@@ -27,6 +42,11 @@ class NotionClient:  # pragma: no cover - http stub
         response.raise_for_status()
         return response.json()
 
+    async def update_page(self, page_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+        response = await self._client.patch(f"/v1/pages/{page_id}", json=payload)
+        response.raise_for_status()
+        return response.json()
+
     async def close(self) -> None:
         await self._client.aclose()
 
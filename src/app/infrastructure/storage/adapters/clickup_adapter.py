@@ -10,16 +10,48 @@ Related RF: RF-019 (Multi-Storage Backend System)
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+from collections.abc import Collection
+from datetime import UTC, datetime, timezone
 from typing import Any
 
 import httpx
 
 from app.domain.interfaces.storage_adapter import StorageAdapter, StorageAdapterError
 from app.infrastructure.database.models.tasks import TaskRecord
+from app.infrastructure.storage.batching import gather_bounded, raise_for_partial
+from app.infrastructure.storage.throttle import AdaptiveThrottle
 
 logger = logging.getLogger(__name__)
 
+# Projected task field -> ClickUp payload key
+_CLICKUP_FIELDS = {
+    "title": "name",
+    "description": "description",
+    "status": "status",
+    "due_date": "due_date",
+    "priority": "priority",
+}
+
+# SparkOne status -> ClickUp status, and back. ClickUp's default statuses have
+# no separate "pending", so it is stored (and projected) as "to do".
+_STATUS_TO_CLICKUP = {
+    "todo": "to do",
+    "pending": "to do",
+    "in_progress": "in progress",
+    "completed": "complete",
+    "cancelled": "cancelled",
+}
+_STATUS_FROM_CLICKUP = {
+    "to do": "todo",
+    "in progress": "in_progress",
+    "complete": "completed",
+    "cancelled": "cancelled",
+}
+# ClickUp priorities: 1=urgent, 2=high, 3=normal, 4=low
+_PRIORITY_TO_CLICKUP = {"high": 2, "medium": 3, "low": 4}
+_PRIORITY_FROM_CLICKUP = {1: "high", 2: "high", 3: "medium", 4: "low"}
+_PRIORITY_NAMES = {"urgent": 1, "high": 2, "normal": 3, "low": 4}
+
 
 class ClickUpAdapter(StorageAdapter):
     """Storage adapter for ClickUp workspace integration.
@@ -31,6 +63,8 @@ class ClickUpAdapter(StorageAdapter):
         - api_key: ClickUp personal API token
         - list_id: Target ClickUp list ID
         - timeout: API request timeout in seconds (default: 10.0)
+        - requests_per_minute: Starting request budget (default: 100, the
+          ClickUp per-token limit); refined from X-RateLimit-* headers
 
     Example:
         ```python
@@ -48,6 +82,11 @@ class ClickUpAdapter(StorageAdapter):
 
     BASE_URL = "https://api.clickup.com/api/v2"
 
+    # API v2 has no bulk create/update endpoint: batches are fanned out over
+    # the pooled client, kept well under the 100 requests/minute token limit.
+    max_batch_size = 50
+    BATCH_CONCURRENCY = 5
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize ClickUp adapter with configuration.
 
@@ -68,6 +107,8 @@ class ClickUpAdapter(StorageAdapter):
         self._api_key = config["api_key"]
         self._list_id = config["list_id"]
         self._timeout = config.get("timeout", 10.0)
+        rate = float(config.get("requests_per_minute", 100)) / 60
+        self._throttle = AdaptiveThrottle("clickup", rate)
 
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
@@ -76,6 +117,7 @@ class ClickUpAdapter(StorageAdapter):
                 "Authorization": self._api_key,
                 "Content-Type": "application/json",
             },
+            event_hooks=self._throttle.event_hooks(),
         )
 
         logger.info(f"Initialized ClickUpAdapter with list {self._list_id}")
@@ -145,14 +187,21 @@ class ClickUpAdapter(StorageAdapter):
                 original_error=e,
             ) from e
 
-    async def update_task(self, external_id: str, task: TaskRecord) -> bool:
+    async def update_task(
+        self,
+        external_id: str,
+        task: TaskRecord,
+        fields: Collection[str] | None = None,
+    ) -> bool:
         """Update existing task in ClickUp.
 
-        Updates task properties in ClickUp list.
+        Updates task properties in ClickUp list. ClickUp applies partial
+        payloads, so only ``fields`` are sent when given.
 
         Args:
             external_id: ClickUp task ID
             task: Updated task record
+            fields: Changed projected fields (None sends every field)
 
         Returns:
             bool: True if update succeeded
@@ -165,7 +214,7 @@ class ClickUpAdapter(StorageAdapter):
             >>> assert updated is True
         """
         try:
-            payload = self._build_clickup_payload(task)
+            payload = self._build_clickup_payload(task, fields)
             url = f"/task/{external_id}"
 
             response = await self._client.put(url, json=payload)
@@ -290,6 +339,54 @@ class ClickUpAdapter(StorageAdapter):
                 original_error=e,
             ) from e
 
+    async def supports_batch_operations(self) -> bool:
+        """ClickUp batches are concurrent single calls on one connection pool."""
+        return True
+
+    async def batch_save_tasks(self, tasks: list[TaskRecord]) -> list[str]:
+        """Create several tasks in the ClickUp list.
+
+        Args:
+            tasks: Task records to save
+
+        Returns:
+            list[str]: ClickUp task IDs in input order
+
+        Raises:
+            StorageBatchError: If some tasks failed (carries the IDs assigned)
+        """
+        results = await gather_bounded(
+            self.save_task, tasks, concurrency=self.BATCH_CONCURRENCY
+        )
+        logger.info(f"Batch saved {len(tasks)} tasks to ClickUp")
+        return raise_for_partial(self.name, "save", results)
+
+    async def batch_update_tasks(
+        self,
+        items: list[tuple[str, TaskRecord]],
+        fields: list[Collection[str] | None] | None = None,
+    ) -> list[bool]:
+        """Update several ClickUp tasks.
+
+        Args:
+            items: ``(clickup_task_id, task)`` pairs
+            fields: Changed fields per item (None sends every field)
+
+        Returns:
+            list[bool]: Success flag per item, in input order
+
+        Raises:
+            StorageBatchError: If some updates failed
+        """
+        changes = fields or [None] * len(items)
+        results = await gather_bounded(
+            lambda index: self.update_task(*items[index], changes[index]),
+            range(len(items)),
+            concurrency=self.BATCH_CONCURRENCY,
+        )
+        logger.info(f"Batch updated {len(items)} ClickUp tasks")
+        return raise_for_partial(self.name, "update", results)
+
     async def health_check(self) -> dict[str, Any]:
         """Check ClickUp API connectivity and health.
 
@@ -336,11 +433,15 @@ class ClickUpAdapter(StorageAdapter):
                 "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
             }
 
-    def _build_clickup_payload(self, task: TaskRecord) -> dict[str, Any]:
+    def _build_clickup_payload(
+        self, task: TaskRecord, fields: Collection[str] | None = None
+    ) -> dict[str, Any]:
         """Build ClickUp API task creation/update payload from task record.
 
         Args:
             task: Task record to convert
+            fields: Only include these projected fields (None for all); a
+                listed field that became empty is sent as a clear
 
         Returns:
             dict: ClickUp API payload
@@ -354,35 +455,55 @@ class ClickUpAdapter(StorageAdapter):
 
         if task.description:
             payload["description"] = task.description
+        elif fields is not None and "description" in fields:
+            payload["description"] = ""
 
         # Convert status to ClickUp format
         if task.status:
-            status_map = {
-                "pending": "to do",
-                "in_progress": "in progress",
-                "completed": "complete",
-                "cancelled": "cancelled",
-            }
-            payload["status"] = status_map.get(task.status, "to do")
+            payload["status"] = _STATUS_TO_CLICKUP.get(_status_value(task.status), "to do")
 
         # Add due date in milliseconds timestamp
         if task.due_date:
-            payload["due_date"] = int(task.due_date.timestamp() * 1000)
+            payload["due_date"] = _to_milliseconds(task.due_date)
+        elif fields is not None and "due_date" in fields:
+            payload["due_date"] = None
 
         # Add priority (ClickUp uses 1=urgent, 2=high, 3=normal, 4=low)
         if task.priority:
-            priority_map = {
-                "high": 2,
-                "medium": 3,
-                "low": 4,
-            }
-            payload["priority"] = priority_map.get(task.priority, 3)
+            payload["priority"] = _PRIORITY_TO_CLICKUP.get(task.priority, 3)
+        elif fields is not None and "priority" in fields:
+            payload["priority"] = None
 
+        if fields is not None:
+            keep = {_CLICKUP_FIELDS[field] for field in fields if field in _CLICKUP_FIELDS}
+            payload = {key: value for key, value in payload.items() if key in keep}
         return payload
 
+    def project_task(self, task: TaskRecord) -> dict[str, Any]:
+        """Project the values ClickUp keeps, as _parse_clickup_task() reads them back.
+
+        Statuses and priorities ClickUp cannot tell apart collapse to one
+        value, and due dates are cut to ClickUp's millisecond precision.
+        """
+        projection = super().project_task(task)
+        if task.status:
+            clickup_status = _STATUS_TO_CLICKUP.get(_status_value(task.status), "to do")
+            projection["status"] = _STATUS_FROM_CLICKUP[clickup_status]
+        if task.priority:
+            projection["priority"] = _PRIORITY_FROM_CLICKUP[
+                _PRIORITY_TO_CLICKUP.get(task.priority, 3)
+            ]
+        if task.due_date:
+            projection["due_date"] = _from_milliseconds(_to_milliseconds(task.due_date)).isoformat()
+        projection["description"] = task.description or None
+        return projection
+
     def _parse_clickup_task(self, data: dict[str, Any]) -> TaskRecord:
         """Parse ClickUp API response to TaskRecord.
 
+        Inverse of _build_clickup_payload(), so a task read back projects
+        like the local one it was written from.
+
         Args:
             data: ClickUp task data from API
 
@@ -390,35 +511,28 @@ class ClickUpAdapter(StorageAdapter):
             TaskRecord: Parsed task record
         """
         # Convert ClickUp status to SparkOne format
-        status_map = {
-            "to do": "pending",
-            "in progress": "in_progress",
-            "complete": "completed",
-            "cancelled": "cancelled",
-        }
-        status = status_map.get(data.get("status", {}).get("status", "").lower(), "pending")
-
-        # Convert priority
-        priority_map = {
-            1: "high",  # urgent
-            2: "high",
-            3: "medium",
-            4: "low",
-        }
+        clickup_status = (data.get("status") or {}).get("status", "").lower()
+        status = _STATUS_FROM_CLICKUP.get(clickup_status, "todo")
+
+        # Priority comes back as an object ({"id": "2", "priority": "high", ...})
+        priority = None
         priority_value = data.get("priority")
-        priority = priority_map.get(priority_value) if priority_value else "medium"
+        if isinstance(priority_value, dict):
+            priority_value = _PRIORITY_NAMES.get(str(priority_value.get("priority", "")).lower())
+        if priority_value:
+            priority = _PRIORITY_FROM_CLICKUP.get(int(priority_value))
 
         # Parse due date (ClickUp uses milliseconds timestamp)
         due_date = None
         if data.get("due_date"):
             try:
-                due_date = datetime.fromtimestamp(int(data["due_date"]) / 1000)
+                due_date = _from_milliseconds(int(data["due_date"]))
             except (ValueError, TypeError):
                 pass
 
         return TaskRecord(
             title=data.get("name", ""),
-            description=data.get("description"),
+            description=data.get("description") or None,
             status=status,
             priority=priority,
             due_date=due_date,
@@ -433,4 +547,19 @@ class ClickUpAdapter(StorageAdapter):
         logger.info("Closed ClickUpAdapter client")
 
 
+def _status_value(status: Any) -> str:
+    return getattr(status, "value", status)
+
+
+def _to_milliseconds(value: datetime) -> int:
+    # Naive values are UTC (SQLite drops the offset)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return int(value.timestamp() * 1000)
+
+
+def _from_milliseconds(value: int) -> datetime:
+    return datetime.fromtimestamp(value / 1000, tz=UTC)
+
+
 __all__ = ["ClickUpAdapter"]
@@ -10,15 +10,29 @@ Related RF: RF-019 (Multi-Storage Backend System)
 from __future__ import annotations
 
 import logging
+import uuid
+from collections.abc import Collection
 from datetime import datetime, timezone
 from typing import Any
 
+import httpx
+
 from app.domain.interfaces.storage_adapter import StorageAdapter, StorageAdapterError
 from app.infrastructure.database.models.tasks import TaskRecord
 from app.infrastructure.integrations.notion import NotionClient
+from app.infrastructure.storage.batching import gather_bounded, raise_for_partial
 
 logger = logging.getLogger(__name__)
 
+# Projected task field -> Notion database property
+_NOTION_PROPERTIES = {
+    "title": "Name",
+    "description": "Description",
+    "status": "Status",
+    "due_date": "Due",
+    "priority": "Priority",
+}
+
 
 class NotionAdapter(StorageAdapter):
     """Storage adapter for Notion workspace integration.
@@ -43,6 +57,11 @@ class NotionAdapter(StorageAdapter):
         ```
     """
 
+    # Notion has no bulk page endpoint and allows ~3 requests/second per
+    # integration: batches are fanned out over the pooled client at that rate.
+    max_batch_size = 30
+    BATCH_CONCURRENCY = 3
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize Notion adapter with configuration.
 
@@ -119,28 +138,48 @@ class NotionAdapter(StorageAdapter):
                 original_error=e,
             ) from e
 
-    async def update_task(self, external_id: str, task: TaskRecord) -> bool:
+    async def update_task(
+        self,
+        external_id: str,
+        task: TaskRecord,
+        fields: Collection[str] | None = None,
+    ) -> bool:
         """Update existing task in Notion.
 
-        Note:
-            Current Notion client only supports create_page().
-            This method is a placeholder for future implementation.
+        Patches the page properties (PATCH /v1/pages/{page_id}); only the
+        properties for ``fields`` are sent when given.
 
         Args:
             external_id: Notion page ID
             task: Updated task record
+            fields: Changed projected fields (None sends every property)
 
         Returns:
-            bool: False (not implemented yet)
+            bool: True if update succeeded, False if the page was not found
 
-        Todo:
-            - Implement PATCH /v1/pages/{page_id} in NotionClient
-            - Handle Notion property updates
+        Raises:
+            StorageAdapterError: If update operation fails
         """
-        logger.warning(
-            f"NotionAdapter.update_task() not implemented yet (page_id: {external_id})"
-        )
-        return False
+        try:
+            await self._client.update_page(external_id, self._build_notion_payload(task, fields))
+            logger.info(f"Updated Notion page: {external_id[:8]}...")
+            return True
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"Notion page not found: {external_id}")
+                return False
+            raise StorageAdapterError(
+                f"Notion API error ({e.response.status_code}): {e.response.text}",
+                adapter_name=self.name,
+                original_error=e,
+            ) from e
+        except Exception as e:
+            raise StorageAdapterError(
+                f"Failed to update Notion page: {e}",
+                adapter_name=self.name,
+                original_error=e,
+            ) from e
 
     async def delete_task(self, external_id: str) -> bool:
         """Delete (archive) task from Notion.
@@ -185,6 +224,74 @@ class NotionAdapter(StorageAdapter):
         )
         return None
 
+    async def supports_task_reads(self) -> bool:
+        """get_task() is not implemented yet, so pages cannot be read back."""
+        return False
+
+    async def find_task(self, task: TaskRecord) -> str | None:
+        """Return the legacy ``external_id`` when it is a Notion page ID.
+
+        The legacy column prefers Notion, so it holds the page created for
+        the task whenever there was one. Pages cannot be read back to check;
+        if the page is gone, the next update reports it missing and the task
+        is created again.
+        """
+        if not task.external_id:
+            return None
+        try:
+            uuid.UUID(task.external_id)
+        except ValueError:
+            return None
+        return task.external_id
+
+    async def supports_batch_operations(self) -> bool:
+        """Notion batches are rate-limited concurrent single calls."""
+        return True
+
+    async def batch_save_tasks(self, tasks: list[TaskRecord]) -> list[str]:
+        """Create several pages in the Notion database.
+
+        Args:
+            tasks: Task records to save
+
+        Returns:
+            list[str]: Notion page IDs in input order
+
+        Raises:
+            StorageBatchError: If some tasks failed (carries the IDs assigned)
+        """
+        results = await gather_bounded(
+            self.save_task, tasks, concurrency=self.BATCH_CONCURRENCY
+        )
+        logger.info(f"Batch saved {len(tasks)} tasks to Notion")
+        return raise_for_partial(self.name, "save", results)
+
+    async def batch_update_tasks(
+        self,
+        items: list[tuple[str, TaskRecord]],
+        fields: list[Collection[str] | None] | None = None,
+    ) -> list[bool]:
+        """Update several Notion pages.
+
+        Args:
+            items: ``(page_id, task)`` pairs
+            fields: Changed fields per item (None sends every property)
+
+        Returns:
+            list[bool]: Success flag per item, in input order
+
+        Raises:
+            StorageBatchError: If some updates failed
+        """
+        changes = fields or [None] * len(items)
+        results = await gather_bounded(
+            lambda index: self.update_task(*items[index], changes[index]),
+            range(len(items)),
+            concurrency=self.BATCH_CONCURRENCY,
+        )
+        logger.info(f"Batch updated {len(items)} Notion pages")
+        return raise_for_partial(self.name, "update", results)
+
     async def health_check(self) -> dict[str, Any]:
         """Check Notion API connectivity and health.
 
@@ -239,11 +346,15 @@ class NotionAdapter(StorageAdapter):
                 "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
             }
 
-    def _build_notion_payload(self, task: TaskRecord) -> dict[str, Any]:
+    def _build_notion_payload(
+        self, task: TaskRecord, fields: Collection[str] | None = None
+    ) -> dict[str, Any]:
         """Build Notion API page creation payload from task record.
 
         Args:
             task: Task record to convert
+            fields: Only include these projected fields (None for all); a
+                listed field that became empty is sent as a clear
 
         Returns:
             dict: Notion API payload with properties
@@ -257,11 +368,15 @@ class NotionAdapter(StorageAdapter):
 
         if task.due_date:
             properties["Due"] = {"date": {"start": task.due_date.isoformat()}}
+        elif fields is not None and "due_date" in fields:
+            properties["Due"] = {"date": None}
 
         if task.description:
             properties["Description"] = {
                 "rich_text": [{"text": {"content": task.description[:2000]}}]
             }
+        elif fields is not None and "description" in fields:
+            properties["Description"] = {"rich_text": []}
 
         # Optional: Add status if Notion database has Status property
         if task.status:
@@ -284,6 +399,9 @@ class NotionAdapter(StorageAdapter):
             notion_priority = priority_map.get(task.priority, "Medium")
             properties["Priority"] = {"select": {"name": notion_priority}}
 
+        if fields is not None:
+            keep = {_NOTION_PROPERTIES[field] for field in fields if field in _NOTION_PROPERTIES}
+            properties = {name: value for name, value in properties.items() if name in keep}
         return {"properties": properties}
 
     async def close(self) -> None:
@@ -9,8 +9,12 @@ Related RF: RF-019 (Multi-Storage Backend System)
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+import re
+import time
+from collections.abc import Callable, Collection, Iterable
+from datetime import UTC, datetime, timezone
 from typing import Any
 
 from app.domain.interfaces.storage_adapter import StorageAdapter, StorageAdapterError
@@ -19,6 +23,60 @@ from app.infrastructure.integrations.google_sheets import GoogleSheetsClient
 
 logger = logging.getLogger(__name__)
 
+# Rows can be inserted or removed by hand in the sheet; rebuild the index
+# from the ID column at least this often.
+ROW_INDEX_TTL_SECONDS = 300.0
+
+_UPDATED_RANGE_START = re.compile(r"![A-Z]+(\d+)")
+
+
+class _RowIndex:
+    """Row ID (column A) -> 1-based sheet row number.
+
+    Built from one read of the ID column and kept current as this adapter
+    appends and deletes rows, so lookups never scan the sheet.
+    """
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl = ttl
+        self._clock = clock
+        self._rows: dict[str, int] | None = None
+        self._loaded_at = 0.0
+
+    @property
+    def fresh(self) -> bool:
+        return self._rows is not None and self._clock() - self._loaded_at < self._ttl
+
+    def load(self, rows: Iterable[list[Any]], first_row: int) -> None:
+        self._rows = {
+            str(row[0]): first_row + offset for offset, row in enumerate(rows) if row and row[0]
+        }
+        self._loaded_at = self._clock()
+
+    def invalidate(self) -> None:
+        self._rows = None
+
+    def get(self, row_id: str) -> int | None:
+        return self._rows.get(row_id) if self._rows is not None else None
+
+    def add(self, row_id: str, row_number: int) -> None:
+        if self._rows is not None:
+            self._rows[row_id] = row_number
+
+    def remove(self, row_id: str) -> None:
+        """Forget ``row_id`` and shift the rows below it up by one."""
+        if self._rows is None:
+            return
+        removed = self._rows.pop(row_id, None)
+        if removed is None:
+            return
+        for key, row_number in self._rows.items():
+            if row_number > removed:
+                self._rows[key] = row_number - 1
+
+    def __len__(self) -> int:
+        return len(self._rows or {})
+
 
 class GoogleSheetsAdapter(StorageAdapter):
     """Storage adapter for Google Sheets integration.
@@ -31,6 +89,7 @@ class GoogleSheetsAdapter(StorageAdapter):
         - spreadsheet_id: Google Sheets spreadsheet ID
         - sheet_name: Sheet name/range (default: "Tasks")
         - header_row: Row number for headers (default: 1)
+        - row_index_ttl_seconds: Max age of the row-number index (default: 300)
 
     Example:
         ```python
@@ -54,6 +113,10 @@ class GoogleSheetsAdapter(StorageAdapter):
         Column G: Created At
     """
 
+    # One values.append / values.batchUpdate request per batch; 500 rows keeps
+    # the request body far below the API payload limit.
+    max_batch_size = 500
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize Google Sheets adapter with configuration.
 
@@ -63,6 +126,7 @@ class GoogleSheetsAdapter(StorageAdapter):
                 - spreadsheet_id (str): Google Sheets spreadsheet ID
                 - sheet_name (str, optional): Sheet name (default: "Tasks")
                 - header_row (int, optional): Header row number (default: 1)
+                - row_index_ttl_seconds (float, optional): Row index max age
 
         Raises:
             ValueError: If required config keys are missing
@@ -78,6 +142,12 @@ class GoogleSheetsAdapter(StorageAdapter):
         self._header_row = config.get("header_row", 1)
 
         self._client = GoogleSheetsClient(self._credentials_path)
+        self._index = _RowIndex(
+            float(config.get("row_index_ttl_seconds", ROW_INDEX_TTL_SECONDS))
+        )
+        # Serialises writes: a delete shifts every row below it
+        self._lock = asyncio.Lock()
+        self._sheet_id: int | None = None
 
         logger.info(
             f"Initialized GoogleSheetsAdapter with spreadsheet "
@@ -122,11 +192,13 @@ class GoogleSheetsAdapter(StorageAdapter):
 
             # Append to sheet
             range_name = f"{self._sheet_name}!A:G"
-            await self._client.append_row(
-                self._spreadsheet_id,
-                range_name,
-                values
-            )
+            async with self._lock:
+                response = await self._client.append_row(
+                    self._spreadsheet_id,
+                    range_name,
+                    values
+                )
+                self._record_append(response, [row_id])
 
             logger.info(
                 f"Saved task to Google Sheets: {task.title[:50]} -> {row_id}"
@@ -142,78 +214,218 @@ class GoogleSheetsAdapter(StorageAdapter):
                 original_error=e,
             ) from e
 
-    async def update_task(self, external_id: str, task: TaskRecord) -> bool:
+    async def update_task(
+        self,
+        external_id: str,
+        task: TaskRecord,
+        fields: Collection[str] | None = None,
+    ) -> bool:
         """Update existing task in Google Sheets.
 
-        Note:
-            Requires finding the row by external_id and updating it.
-            Current GoogleSheetsClient only supports append.
-            This is a placeholder for future implementation.
+        Looks the row up in the row index and rewrites columns A-F with one
+        ``values.update``; the Created At column is left untouched.
 
         Args:
             external_id: Row ID from save_task()
             task: Updated task record
+            fields: Ignored; the row is written in one range either way
 
         Returns:
-            bool: False (not implemented yet)
+            bool: True if updated, False if the row was not found
 
-        Todo:
-            - Implement update() method in GoogleSheetsClient
-            - Add row search by external_id
-            - Update specific row values
+        Raises:
+            StorageAdapterError: If reading or writing the sheet fails
         """
-        logger.warning(
-            f"GoogleSheetsAdapter.update_task() not implemented yet (row_id: {external_id})"
-        )
-        return False
+        try:
+            async with self._lock:
+                row_number = (await self._row_numbers([external_id]))[external_id]
+                if row_number is None:
+                    logger.warning(f"Google Sheets row not found: {external_id}")
+                    return False
+                await self._client.update_values(
+                    self._spreadsheet_id,
+                    f"{self._sheet_name}!A{row_number}:F{row_number}",
+                    [self._build_sheets_row(task, external_id)[:6]],
+                )
+
+            logger.info(f"Updated Google Sheets row {row_number}: {external_id}")
+            return True
+
+        except Exception as e:
+            raise StorageAdapterError(
+                f"Failed to update Google Sheets row: {e}",
+                adapter_name=self.name,
+                original_error=e,
+            ) from e
 
     async def delete_task(self, external_id: str) -> bool:
         """Delete task from Google Sheets.
 
-        Note:
-            Requires finding the row by external_id and deleting it.
-            Current GoogleSheetsClient doesn't support row deletion.
-            This is a placeholder for future implementation.
+        Removes the row with a ``deleteDimension`` request and shifts the
+        index entries below it.
 
         Args:
             external_id: Row ID from save_task()
 
         Returns:
-            bool: False (not implemented yet)
+            bool: True if deleted, False if the row was not found
 
-        Todo:
-            - Implement delete_row() method in GoogleSheetsClient
-            - Add row search by external_id
-            - Delete specific row (or mark as deleted)
+        Raises:
+            StorageAdapterError: If the sheet tab is missing or the API call fails
         """
-        logger.warning(
-            f"GoogleSheetsAdapter.delete_task() not implemented yet (row_id: {external_id})"
-        )
-        return False
+        try:
+            async with self._lock:
+                row_number = (await self._row_numbers([external_id]))[external_id]
+                if row_number is None:
+                    logger.warning(f"Google Sheets row not found: {external_id}")
+                    return False
+                sheet_id = await self._get_sheet_id()
+                await self._client.delete_rows(self._spreadsheet_id, sheet_id, [row_number])
+                self._index.remove(external_id)
+
+            logger.info(f"Deleted Google Sheets row {row_number}: {external_id}")
+            return True
+
+        except Exception as e:
+            if isinstance(e, StorageAdapterError):
+                raise
+            raise StorageAdapterError(
+                f"Failed to delete Google Sheets row: {e}",
+                adapter_name=self.name,
+                original_error=e,
+            ) from e
 
     async def get_task(self, external_id: str) -> TaskRecord | None:
         """Retrieve task from Google Sheets.
 
-        Note:
-            Requires searching rows by external_id.
-            Current GoogleSheetsClient only supports list_rows.
-            This is a placeholder for future implementation.
+        Reads only the indexed row. If the row no longer holds ``external_id``
+        (edited by hand), the index is rebuilt and the lookup retried once.
 
         Args:
             external_id: Row ID from save_task()
 
         Returns:
-            TaskRecord | None: None (not implemented yet)
+            TaskRecord | None: Parsed task, or None if not found
 
-        Todo:
-            - Search rows for matching external_id (column A)
-            - Parse row to TaskRecord
-            - Return parsed task
+        Raises:
+            StorageAdapterError: If reading the sheet fails
         """
-        logger.warning(
-            f"GoogleSheetsAdapter.get_task() not implemented yet (row_id: {external_id})"
-        )
-        return None
+        try:
+            async with self._lock:
+                for _ in range(2):
+                    row_number = (await self._row_numbers([external_id]))[external_id]
+                    if row_number is None:
+                        return None
+                    rows = await self._client.list_rows(
+                        self._spreadsheet_id,
+                        f"{self._sheet_name}!A{row_number}:G{row_number}",
+                    )
+                    if rows and rows[0] and rows[0][0] == external_id:
+                        return self._parse_sheets_row(rows[0])
+                    self._index.invalidate()
+            return None
+
+        except Exception as e:
+            raise StorageAdapterError(
+                f"Failed to get Google Sheets row: {e}",
+                adapter_name=self.name,
+                original_error=e,
+            ) from e
+
+    async def supports_batch_operations(self) -> bool:
+        """Sheets supports multi-row append and values.batchUpdate."""
+        return True
+
+    async def batch_save_tasks(self, tasks: list[TaskRecord]) -> list[str]:
+        """Append several tasks with a single ``values.append`` call.
+
+        Args:
+            tasks: Task records to save
+
+        Returns:
+            list[str]: Row IDs in input order
+
+        Raises:
+            StorageAdapterError: If the append fails (no row was written)
+        """
+        if not tasks:
+            return []
+        try:
+            base = int(datetime.now(UTC).timestamp() * 1000)
+            row_ids = [f"row_{base}_{index}" for index in range(len(tasks))]
+            rows = [
+                self._build_sheets_row(task, row_id)
+                for task, row_id in zip(tasks, row_ids, strict=True)
+            ]
+
+            range_name = f"{self._sheet_name}!A:G"
+            async with self._lock:
+                response = await self._client.append_rows(
+                    self._spreadsheet_id, range_name, rows
+                )
+                self._record_append(response, row_ids)
+
+            logger.info(f"Batch saved {len(tasks)} tasks to Google Sheets")
+            return row_ids
+
+        except Exception as e:
+            raise StorageAdapterError(
+                f"Failed to batch save tasks to Google Sheets: {e}",
+                adapter_name=self.name,
+                original_error=e,
+            ) from e
+
+    async def batch_update_tasks(
+        self,
+        items: list[tuple[str, TaskRecord]],
+        fields: list[Collection[str] | None] | None = None,
+    ) -> list[bool]:
+        """Update several rows with one ``values.batchUpdate`` located via the row index.
+
+        Columns A-F are rewritten; the Created At column is left untouched.
+
+        Args:
+            items: ``(row_id, task)`` pairs
+            fields: Ignored; a row is written in one range either way
+
+        Returns:
+            list[bool]: True per updated row, False where the row ID was not found
+
+        Raises:
+            StorageAdapterError: If reading or writing the sheet fails
+        """
+        if not items:
+            return []
+        try:
+            async with self._lock:
+                row_numbers = await self._row_numbers([row_id for row_id, _ in items])
+
+                data: list[dict[str, Any]] = []
+                found: list[bool] = []
+                for row_id, task in items:
+                    row_number = row_numbers[row_id]
+                    found.append(row_number is not None)
+                    if row_number is None:
+                        logger.warning(f"Google Sheets row not found: {row_id}")
+                        continue
+                    data.append(
+                        {
+                            "range": f"{self._sheet_name}!A{row_number}:F{row_number}",
+                            "values": [self._build_sheets_row(task, row_id)[:6]],
+                        }
+                    )
+
+                if data:
+                    await self._client.batch_update_values(self._spreadsheet_id, data)
+            logger.info(f"Batch updated {len(data)} rows in Google Sheets")
+            return found
+
+        except Exception as e:
+            raise StorageAdapterError(
+                f"Failed to batch update Google Sheets rows: {e}",
+                adapter_name=self.name,
+                original_error=e,
+            ) from e
 
     async def health_check(self) -> dict[str, Any]:
         """Check Google Sheets API connectivity and health.
@@ -267,9 +479,63 @@ class GoogleSheetsAdapter(StorageAdapter):
                 "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
             }
 
+    async def _row_numbers(self, row_ids: Iterable[str]) -> dict[str, int | None]:
+        """Resolve row IDs through the index; caller holds ``self._lock``.
+
+        A stale index is rebuilt first. IDs it does not know trigger one
+        rebuild, in case rows were appended outside this adapter.
+        """
+        reloaded = False
+        if not self._index.fresh:
+            await self._load_index()
+            reloaded = True
+        found = {row_id: self._index.get(row_id) for row_id in row_ids}
+        if not reloaded and None in found.values():
+            await self._load_index()
+            found = {row_id: self._index.get(row_id) for row_id in found}
+        return found
+
+    async def _load_index(self) -> None:
+        first_row = self._header_row + 1
+        id_column = await self._client.list_rows(
+            self._spreadsheet_id, f"{self._sheet_name}!A{first_row}:A"
+        )
+        self._index.load(id_column, first_row)
+        logger.debug(f"Indexed {len(self._index)} Google Sheets rows")
+
+    def _record_append(self, response: Any, row_ids: list[str]) -> None:
+        """Add appended rows to the index using the ``updatedRange`` of the response."""
+        updated_range = (
+            response.get("updates", {}).get("updatedRange")
+            if isinstance(response, dict)
+            else None
+        )
+        match = _UPDATED_RANGE_START.search(updated_range or "")
+        if match is None:
+            self._index.invalidate()
+            return
+        start = int(match.group(1))
+        for offset, row_id in enumerate(row_ids):
+            self._index.add(row_id, start + offset)
+
+    async def _get_sheet_id(self) -> int:
+        if self._sheet_id is None:
+            sheet_id = await self._client.get_sheet_id(self._spreadsheet_id, self._sheet_name)
+            if sheet_id is None:
+                raise StorageAdapterError(
+                    f"Sheet '{self._sheet_name}' not found in spreadsheet",
+                    adapter_name=self.name,
+                )
+            self._sheet_id = sheet_id
+        return self._sheet_id
+
     def _build_sheets_row(self, task: TaskRecord, row_id: str) -> list[Any]:
         """Build Google Sheets row values from task record.
 
+        Values are written with USER_ENTERED, so the due date gets a leading
+        apostrophe to stay the ISO text _parse_sheets_row() reads back
+        instead of becoming a locale-formatted date cell.
+
         Args:
             task: Task record to convert
             row_id: Unique row identifier
@@ -277,13 +543,17 @@ class GoogleSheetsAdapter(StorageAdapter):
         Returns:
             list: Row values [ID, Title, Description, Status, Priority, Due Date, Created At]
         """
+        status = task.status or "pending"
+        due_date = task.due_date
+        if due_date is not None and due_date.tzinfo is None:
+            due_date = due_date.replace(tzinfo=UTC)  # SQLite drops the offset
         return [
             row_id,  # Column A: Row ID
             task.title,  # Column B: Title
             task.description or "",  # Column C: Description
-            task.status or "pending",  # Column D: Status
-            task.priority or "medium",  # Column E: Priority
-            task.due_date.isoformat() if task.due_date else "",  # Column F: Due Date
+            getattr(status, "value", status),  # Column D: Status
+            task.priority or "",  # Column E: Priority
+            f"'{due_date.isoformat()}" if due_date else "",  # Column F: Due Date
             datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),  # Column G: Created At
         ]
 
@@ -306,7 +576,10 @@ class GoogleSheetsAdapter(StorageAdapter):
         try:
             # Read all rows after header
             range_name = f"{self._sheet_name}!A{self._header_row + 1}:G"
-            rows = await self._client.list_rows(self._spreadsheet_id, range_name)
+            async with self._lock:
+                rows = await self._client.list_rows(self._spreadsheet_id, range_name)
+                # Same read covers the ID column: refresh the row index for free
+                self._index.load(rows, self._header_row + 1)
 
             tasks: list[TaskRecord] = []
             for row in rows:
@@ -333,6 +606,9 @@ class GoogleSheetsAdapter(StorageAdapter):
     def _parse_sheets_row(self, row: list[Any]) -> TaskRecord:
         """Parse Google Sheets row to TaskRecord.
 
+        Inverse of _build_sheets_row(), so a task read back projects like
+        the local one it was written from.
+
         Args:
             row: Row values from sheet
 
@@ -346,17 +622,25 @@ class GoogleSheetsAdapter(StorageAdapter):
                 due_date = datetime.fromisoformat(row[5].replace("Z", "+00:00"))
             except (ValueError, AttributeError):
                 pass
+            else:
+                if due_date.tzinfo is None:
+                    due_date = due_date.replace(tzinfo=UTC)
 
         return TaskRecord(
             external_id=row[0] if len(row) > 0 else None,
             title=row[1] if len(row) > 1 else "",
             description=row[2] if len(row) > 2 and row[2] else None,
             status=row[3] if len(row) > 3 and row[3] else "pending",
-            priority=row[4] if len(row) > 4 and row[4] else "medium",
+            priority=row[4] if len(row) > 4 and row[4] else None,
             due_date=due_date,
             channel="sheets",
             sender="sheets_sync",
         )
 
+    def project_task(self, task: TaskRecord) -> dict[str, Any]:
+        """Project like the base adapter; an empty description is stored as a blank cell."""
+        projection = super().project_task(task)
+        projection["description"] = task.description or None
+        return projection
 
 __all__ = ["GoogleSheetsAdapter"]
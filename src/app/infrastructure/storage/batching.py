@@ -0,0 +1,139 @@
+"""Batch helpers shared by storage adapters and their callers - ADR-014.
+
+Callers hand over every pending create/update for one adapter; the helpers
+split them into chunks of ``adapter.max_batch_size`` and use the adapter's
+batch methods when it has them, falling back to bounded concurrent single
+calls otherwise. Results keep input order and carry per-item exceptions so a
+single bad task never discards the ids the backend already assigned.
+
+Related ADR: ADR-014 (Storage Adapter Pattern)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Collection, Iterator, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, TypeVar
+
+from app.domain.interfaces.storage_adapter import StorageAdapterError, StorageBatchError
+
+if TYPE_CHECKING:
+    from app.domain.interfaces.storage_adapter import StorageAdapter
+    from app.infrastructure.database.models.tasks import TaskRecord
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 4
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Yield consecutive slices of at most ``size`` items."""
+
+    step = max(1, size)
+    for start in range(0, len(items), step):
+        yield items[start : start + step]
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Sequence[T],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[R | BaseException]:
+    """Run ``func`` over ``items`` with at most ``concurrency`` calls in flight."""
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(_run(item) for item in items), return_exceptions=True)
+
+
+def raise_for_partial(
+    adapter_name: str, action: str, results: Sequence[R | BaseException]
+) -> list[R]:
+    """Return ``results`` or raise :class:`StorageBatchError` if any item failed."""
+
+    errors = {index: exc for index, exc in enumerate(results) if isinstance(exc, BaseException)}
+    if not errors:
+        return list(results)  # type: ignore[arg-type]
+    raise StorageBatchError(
+        f"{len(errors)}/{len(results)} tasks failed to {action}",
+        adapter_name=adapter_name,
+        results=[None if index in errors else result for index, result in enumerate(results)],
+        errors=errors,
+    )
+
+
+async def save_in_batches(
+    adapter: StorageAdapter, tasks: Sequence[TaskRecord]
+) -> list[str | BaseException]:
+    """Create ``tasks`` in ``adapter``; returns an external id or error per task."""
+
+    if not await adapter.supports_batch_operations():
+        return await gather_bounded(adapter.save_task, tasks)
+    results: list[str | BaseException] = []
+    for chunk in chunked(tasks, adapter.max_batch_size):
+        results.extend(
+            _unpack(adapter, len(chunk), await _call(adapter.batch_save_tasks, list(chunk)))
+        )
+    return results
+
+
+async def update_in_batches(
+    adapter: StorageAdapter,
+    items: Sequence[tuple[str, TaskRecord]],
+    fields: Sequence[Collection[str] | None] | None = None,
+) -> list[bool | BaseException]:
+    """Update ``(external_id, task)`` pairs; returns a success flag or error per item.
+
+    ``fields`` is aligned with ``items`` and limits each update to the changed
+    projected fields (None sends the whole task).
+    """
+
+    changes = list(fields) if fields is not None else [None] * len(items)
+    if not await adapter.supports_batch_operations():
+        return await gather_bounded(
+            lambda index: adapter.update_task(*items[index], changes[index]), range(len(items))
+        )
+    results: list[bool | BaseException] = []
+    size = adapter.max_batch_size
+    for start in range(0, len(items), size):
+        chunk = list(items[start : start + size])
+        update = partial(adapter.batch_update_tasks, fields=changes[start : start + size])
+        outcome = await _call(update, chunk)
+        results.extend(_unpack(adapter, len(chunk), outcome))
+    return results
+
+
+async def _call(method: Callable[[list[T]], Awaitable[list[R]]], chunk: list[T]):
+    try:
+        return await method(chunk)
+    except Exception as exc:
+        return exc
+
+
+def _unpack(adapter: StorageAdapter, size: int, outcome) -> list:
+    if isinstance(outcome, StorageBatchError):
+        return [outcome.errors.get(index, result) for index, result in enumerate(outcome.results)]
+    if isinstance(outcome, BaseException):
+        error = (
+            outcome
+            if isinstance(outcome, StorageAdapterError)
+            else StorageAdapterError(str(outcome), adapter.name, outcome)
+        )
+        return [error] * size
+    return list(outcome)
+
+
+__all__ = [
+    "chunked",
+    "gather_bounded",
+    "raise_for_partial",
+    "save_in_batches",
+    "update_in_batches",
+]
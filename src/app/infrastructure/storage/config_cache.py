@@ -0,0 +1,247 @@
+"""Per-user cache of active storage configs and their adapters - ADR-014.
+
+Loading a user's storage configs used to cost one query per message and a
+serial adapter build per config. :class:`StorageConfigCache` keeps the active
+configs of each user for ``ttl`` seconds, resolves their adapters through
+the :class:`StorageAdapterPool` concurrently, and remembers configs whose
+adapter failed to build so they are retried with exponential backoff rather
+than on every call.
+
+The storage-config endpoints invalidate the writing user's entry; other
+processes pick up changes when their entry expires.
+
+Related ADR: ADR-014 (Storage Adapter Pattern)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select
+
+from app.infrastructure.storage.pool import StorageAdapterPool, config_version, get_adapter_pool
+from app.infrastructure.storage.registry import StorageAdapterRegistry
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.domain.interfaces.storage_adapter import StorageAdapter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class StorageConfigSnapshot:
+    """Detached copy of an active ``UserStorageConfig`` row."""
+
+    config_id: str
+    adapter_name: str
+    config_json: dict[str, Any]
+    priority: int
+
+    @property
+    def version(self) -> str:
+        return config_version(self.adapter_name, self.config_json)
+
+
+ConfigLoader = Callable[["AsyncSession", Any], Awaitable[list[StorageConfigSnapshot]]]
+
+
+async def load_active_configs(session: AsyncSession, user_id: Any) -> list[StorageConfigSnapshot]:
+    """Query a user's active configs, highest priority first."""
+
+    # Import here to avoid circular dependency
+    from app.infrastructure.database.models.user_storage_config import UserStorageConfig
+
+    stmt = select(UserStorageConfig).where(
+        UserStorageConfig.user_id == user_id,
+        UserStorageConfig.is_active == True,  # noqa: E712
+    ).order_by(UserStorageConfig.priority.desc())
+    result = await session.execute(stmt)
+    return [
+        StorageConfigSnapshot(
+            config_id=str(config.id),
+            adapter_name=config.adapter_name,
+            config_json=dict(config.config_json or {}),
+            priority=config.priority,
+        )
+        for config in result.scalars()
+    ]
+
+
+@dataclass(slots=True)
+class _Failure:
+    attempts: int
+    retry_at: float
+
+
+class StorageConfigCache:
+    """TTL cache of ``user_id -> active storage configs``.
+
+    Example:
+        ```python
+        cache = get_storage_config_cache()
+        adapters = await cache.get_adapters(session, user_id)  # [(adapter, priority)]
+        cache.invalidate(user_id)  # after a config write
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60.0,
+        failure_backoff: float = 30.0,
+        max_failure_backoff: float = 900.0,
+        adapter_pool: StorageAdapterPool | None = None,
+        loader: ConfigLoader = load_active_configs,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._failure_backoff = failure_backoff
+        self._max_failure_backoff = max_failure_backoff
+        self._pool = adapter_pool
+        self._loader = loader
+        self._clock = clock
+        self._entries: dict[str, tuple[float, list[StorageConfigSnapshot]]] = {}
+        self._loading: dict[str, asyncio.Future[list[StorageConfigSnapshot]]] = {}
+        self._failures: dict[tuple[str, str], _Failure] = {}
+
+    async def get_configs(self, session: AsyncSession, user_id: Any) -> list[StorageConfigSnapshot]:
+        """Return the user's active configs, querying at most once per TTL.
+
+        Concurrent misses for the same user share one query.
+        """
+        key = _key(user_id)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            return entry[1]
+
+        loading = self._loading.get(key)
+        if loading is not None:
+            return await asyncio.shield(loading)
+
+        future: asyncio.Future[list[StorageConfigSnapshot]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._loading[key] = future
+        try:
+            configs = await self._loader(session, user_id)
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Retrieved here so waiters-free failures are not reported as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(configs)
+            if self._loading.get(key) is future:
+                self._entries[key] = (self._clock() + self._ttl, configs)
+            return configs
+        finally:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+
+    async def get_adapters(
+        self, session: AsyncSession, user_id: Any
+    ) -> list[tuple[StorageAdapter, int]]:
+        """Return ``(adapter, priority)`` for the user's active configs."""
+        return [
+            (adapter, config.priority)
+            for config, adapter in await self.get_backends(session, user_id)
+        ]
+
+    async def get_backends(
+        self, session: AsyncSession, user_id: Any
+    ) -> list[tuple[StorageConfigSnapshot, StorageAdapter]]:
+        """Return ``(config, adapter)`` for the user's active configs.
+
+        Adapters missing from the pool are built concurrently. A config whose
+        adapter fails to build is skipped until its backoff expires.
+        """
+        configs = await self.get_configs(session, user_id)
+        now = self._clock()
+        usable = [
+            config
+            for config in configs
+            if (failure := self._failures.get((config.config_id, config.version))) is None
+            or failure.retry_at <= now
+        ]
+        results = await asyncio.gather(
+            *(self._adapter(config) for config in usable), return_exceptions=True
+        )
+
+        backends: list[tuple[StorageConfigSnapshot, StorageAdapter]] = []
+        for config, result in zip(usable, results, strict=True):
+            failure_key = (config.config_id, config.version)
+            if isinstance(result, BaseException):
+                failure = self._failures.get(failure_key) or _Failure(0, now)
+                failure.attempts += 1
+                delay = min(
+                    self._failure_backoff * 2 ** (failure.attempts - 1),
+                    self._max_failure_backoff,
+                )
+                failure.retry_at = now + delay
+                self._failures[failure_key] = failure
+                logger.error(
+                    f"Failed to load adapter {config.adapter_name} "
+                    f"(config {config.config_id}), retrying in {delay:.0f}s: {result}"
+                )
+                continue
+            self._failures.pop(failure_key, None)
+            backends.append((config, result))
+        return backends
+
+    def invalidate(self, user_id: Any = None) -> None:
+        """Drop the cached configs of ``user_id`` and forget their build failures."""
+        key = _key(user_id)
+        entry = self._entries.pop(key, None)
+        # A load racing with the write must not repopulate the stale entry
+        self._loading.pop(key, None)
+        if entry is not None:
+            stale = {config.config_id for config in entry[1]}
+            self._failures = {
+                failure_key: failure
+                for failure_key, failure in self._failures.items()
+                if failure_key[0] not in stale
+            }
+
+    def clear(self) -> None:
+        """Drop every cached entry and failure."""
+        self._entries.clear()
+        self._loading.clear()
+        self._failures.clear()
+
+    async def _adapter(self, config: StorageConfigSnapshot) -> StorageAdapter:
+        adapter_class = StorageAdapterRegistry.get_adapter(config.adapter_name)
+        pool = self._pool if self._pool is not None else get_adapter_pool()
+        return await pool.get_async(
+            config.config_id, config.version, lambda: adapter_class(config.config_json)
+        )
+
+
+def _key(user_id: Any) -> str:
+    return "" if user_id is None else str(user_id)
+
+
+_cache: StorageConfigCache | None = None
+
+
+def get_storage_config_cache() -> StorageConfigCache:
+    """Return (and cache) the process-wide storage config cache."""
+
+    global _cache
+    if _cache is None:
+        _cache = StorageConfigCache()
+    return _cache
+
+
+__all__ = [
+    "StorageConfigCache",
+    "StorageConfigSnapshot",
+    "get_storage_config_cache",
+    "load_active_configs",
+]
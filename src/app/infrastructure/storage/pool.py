@@ -0,0 +1,168 @@
+"""Process-wide pool of storage adapter instances - ADR-014.
+
+Adapters own long-lived resources (HTTP clients, Google credentials), so they
+are built once per storage config and reused across requests. Entries are
+keyed by config id and a version derived from the adapter settings: a config
+edited in another process is rebuilt on next use, and the CRUD endpoints
+evict entries explicitly.
+
+Related ADR: ADR-014 (Storage Adapter Pattern)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.domain.interfaces.storage_adapter import StorageAdapter
+
+logger = logging.getLogger(__name__)
+
+
+def config_version(adapter_name: str, config_json: dict[str, Any]) -> str:
+    """Return a stable fingerprint of an adapter configuration."""
+
+    payload = json.dumps([adapter_name, config_json], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class StorageAdapterPool:
+    """Caches adapter instances keyed by ``(config_id, version)``.
+
+    Evicted adapters are closed after ``close_grace`` seconds so requests
+    still holding them can finish their in-flight calls.
+
+    Example:
+        ```python
+        pool = get_adapter_pool()
+        adapter = pool.get(config.id, version, lambda: NotionAdapter(config.config_json))
+        await pool.invalidate(config.id)  # after the config changes
+        ```
+    """
+
+    def __init__(self, close_grace: float = 30.0) -> None:
+        self._entries: dict[str, tuple[str, StorageAdapter]] = {}
+        self._close_grace = close_grace
+        self._retiring: dict[asyncio.Task[None], StorageAdapter] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        config_id: Any,
+        version: str,
+        factory: Callable[[], StorageAdapter],
+    ) -> StorageAdapter:
+        """Return the pooled adapter for a config, building it if needed.
+
+        Args:
+            config_id: Storage config primary key
+            version: Fingerprint from :func:`config_version`
+            factory: Builds a new adapter when none is pooled for this version
+
+        Returns:
+            StorageAdapter: Shared adapter instance
+        """
+        key = str(config_id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            cached_version, adapter = entry
+            if cached_version == version:
+                return adapter
+            self._retire(adapter)
+
+        adapter = factory()
+        self._entries[key] = (version, adapter)
+        logger.info(f"Pooled storage adapter {adapter.name} for config {key}")
+        return adapter
+
+    async def get_async(
+        self,
+        config_id: Any,
+        version: str,
+        factory: Callable[[], StorageAdapter],
+    ) -> StorageAdapter:
+        """Like :meth:`get`, but builds missing adapters in a worker thread.
+
+        Adapter constructors may block (credential files, API discovery), so
+        several configs can be built concurrently without stalling the loop.
+        """
+        key = str(config_id)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        adapter = await asyncio.to_thread(factory)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            # Built concurrently by another caller; keep theirs
+            await _close_adapter(adapter)
+            return entry[1]
+        return self.get(config_id, version, lambda: adapter)
+
+    async def invalidate(self, config_id: Any) -> bool:
+        """Evict the adapter for a config; it is closed after the grace period.
+
+        Returns:
+            bool: True if an adapter was pooled for the config
+        """
+        entry = self._entries.pop(str(config_id), None)
+        if entry is None:
+            return False
+        self._retire(entry[1])
+        logger.info(f"Invalidated pooled storage adapter for config {config_id}")
+        return True
+
+    async def close_all(self) -> None:
+        """Close every pooled and retiring adapter (application shutdown)."""
+        entries, self._entries = self._entries, {}
+        retiring, self._retiring = self._retiring, {}
+        for task in retiring:
+            task.cancel()
+        await asyncio.gather(*retiring, return_exceptions=True)
+        for adapter in [*retiring.values(), *(adapter for _, adapter in entries.values())]:
+            await _close_adapter(adapter)
+
+    def _retire(self, adapter: StorageAdapter) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # pragma: no cover - eviction outside the event loop
+            return
+        task = loop.create_task(self._close_later(adapter))
+        self._retiring[task] = adapter
+        task.add_done_callback(lambda done: self._retiring.pop(done, None))
+
+    async def _close_later(self, adapter: StorageAdapter) -> None:
+        await asyncio.sleep(self._close_grace)
+        await _close_adapter(adapter)
+
+
+async def _close_adapter(adapter: StorageAdapter) -> None:
+    close = getattr(adapter, "close", None)
+    if close is None:
+        return
+    try:
+        await close()
+    except Exception as e:
+        logger.warning(f"Error closing {adapter.name}: {e}")
+
+
+_pool: StorageAdapterPool | None = None
+
+
+def get_adapter_pool() -> StorageAdapterPool:
+    """Return (and cache) the process-wide adapter pool."""
+
+    global _pool
+    if _pool is None:
+        _pool = StorageAdapterPool()
+    return _pool
+
+
+__all__ = ["StorageAdapterPool", "config_version", "get_adapter_pool"]
@@ -0,0 +1,38 @@
+"""Change detection for task replication - ADR-014.
+
+A projection is the subset of task fields one backend stores
+(:meth:`StorageAdapter.project_task`). Its hash is kept per task and backend
+after each successful sync, so updates that do not touch anything the
+backend stores are skipped, and the others only carry the changed fields.
+
+Related ADR: ADR-014 (Storage Adapter Pattern)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any
+
+
+def projection_hash(projection: Mapping[str, Any]) -> str:
+    """Return a stable SHA-256 of a projection."""
+
+    payload = json.dumps(projection, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def changed_fields(
+    previous: Mapping[str, Any] | None, current: Mapping[str, Any]
+) -> frozenset[str] | None:
+    """Return the keys whose value differs, or None when there is no baseline."""
+
+    if previous is None:
+        return None
+    return frozenset(
+        key for key in current.keys() | previous.keys() if previous.get(key) != current.get(key)
+    )
+
+
+__all__ = ["changed_fields", "projection_hash"]
@@ -0,0 +1,183 @@
+"""Adaptive request throttling for storage backends - ADR-014.
+
+Each adapter paces its HTTP calls through a token bucket whose refill rate is
+learned from the backend's responses:
+
+- ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset`` (ClickUp) spread the
+  remaining budget evenly over the rest of the window;
+- ``429`` halves the rate and pauses the bucket for ``Retry-After``;
+- successful calls without rate headers (Notion) raise the rate additively
+  up to ``max_rate``.
+
+The throttle plugs into ``httpx`` through :meth:`AdaptiveThrottle.event_hooks`.
+
+Related ADR: ADR-014 (Storage Adapter Pattern)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+from app.core.metrics import STORAGE_RATE_LIMITED_COUNTER, STORAGE_THROTTLE_RATE
+
+
+def retry_after_seconds(
+    headers: Mapping[str, str], *, now: Callable[[], float] = time.time
+) -> float | None:
+    """Parse ``Retry-After`` (delta seconds or HTTP date) into seconds from now."""
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - now(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def rate_limit_delay(error: BaseException | None) -> float | None:
+    """Return the delay a 429 error asks for, or None if it is not a rate limit."""
+
+    if not isinstance(error, httpx.HTTPStatusError) or error.response.status_code != 429:
+        return None
+    return retry_after_seconds(error.response.headers) or 0.0
+
+
+class AdaptiveThrottle:
+    """Token bucket whose rate follows the backend's rate-limit feedback.
+
+    Example:
+        ```python
+        throttle = AdaptiveThrottle("clickup", rate=100 / 60)
+        client = httpx.AsyncClient(event_hooks=throttle.event_hooks())
+        ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        *,
+        burst: int = 1,
+        min_rate: float = 0.05,
+        max_rate: float | None = None,
+        increase: float = 0.05,
+        headroom: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.name = name
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._min_rate = min_rate
+        self._max_rate = max_rate or rate * 2
+        self._increase = increase
+        self._headroom = headroom
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._tokens = float(self._burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        STORAGE_THROTTLE_RATE.labels(backend=name).set(rate)
+
+    @property
+    def rate(self) -> float:
+        """Current requests per second."""
+        return self._rate
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds until a ``Retry-After`` pause ends (0 when not paused)."""
+        return max(self._paused_until - self._clock(), 0.0)
+
+    async def acquire(self) -> None:
+        """Wait for a request slot; callers are served in arrival order."""
+
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adjust the rate from one response."""
+
+        now = self._clock()
+        self._refill(now)
+        if status_code == 429:
+            STORAGE_RATE_LIMITED_COUNTER.labels(backend=self.name).inc()
+            self._set_rate(self._rate / 2)
+            pause = retry_after_seconds(headers, now=self._wall_clock)
+            self._pause(now, pause if pause is not None else 1 / self._rate)
+            return
+
+        remaining = _as_float(headers.get("x-ratelimit-remaining"))
+        reset = _as_float(headers.get("x-ratelimit-reset"))
+        if remaining is not None and reset is not None:
+            window = reset - self._wall_clock()
+            if window > 0:
+                if remaining < 1:
+                    self._pause(now, window)
+                else:
+                    # Spend what is left evenly over the rest of the window
+                    self._set_rate(remaining / window * self._headroom, cap=False)
+                return
+
+        if 200 <= status_code < 400:
+            self._set_rate(self._rate + self._increase)
+
+    def event_hooks(self) -> dict[str, list[Callable[..., Any]]]:
+        """``httpx`` event hooks that pace requests and learn from responses."""
+
+        async def _on_request(request: httpx.Request) -> None:
+            await self.acquire()
+
+        async def _on_response(response: httpx.Response) -> None:
+            self.observe(response.status_code, response.headers)
+
+        return {"request": [_on_request], "response": [_on_response]}
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def _pause(self, now: float, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0.0
+
+    def _set_rate(self, rate: float, *, cap: bool = True) -> None:
+        upper = self._max_rate if cap else max(self._max_rate, rate)
+        self._rate = min(max(rate, self._min_rate), upper)
+        STORAGE_THROTTLE_RATE.labels(backend=self.name).set(self._rate)
+
+
+def _as_float(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+__all__ = ["AdaptiveThrottle", "rate_limit_delay", "retry_after_seconds"]
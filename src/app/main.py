@@ -14,10 +14,17 @@ from starlette.middleware.trustedhost import TrustedHostMiddleware
 from .config import get_settings
 from .core.logging import configure_logging
 from .core.startup import register_startup_validations
-from .api.dependencies import get_evolution_client, get_notion_client
+from .api.dependencies import (
+    get_evolution_client,
+    get_ingestion_lanes,
+    get_notion_client,
+    get_sqlite_writer,
+)
+from .infrastructure.storage.pool import get_adapter_pool
 from .middleware.correlation import CorrelationIdMiddleware
 from .middleware.metrics import PrometheusMiddleware
 from .middleware.rate_limiting import RateLimitMiddleware, resolve_rate_limit_store
+from .middleware.read_your_writes import ReadYourWritesMiddleware
 from .middleware.security_headers import SecurityHeadersMiddleware
 from .middleware.security_logging import SecurityLoggingMiddleware
 from .observability import instrument_application
@@ -58,6 +65,13 @@ async def _lifespan(app: FastAPI):
         notion = get_notion_client()
         if notion is not None:
             await notion.close()
+        lanes = get_ingestion_lanes()
+        if lanes is not None:
+            await lanes.close()
+        writer = get_sqlite_writer()
+        if writer is not None:
+            await writer.close()
+        await get_adapter_pool().close_all()
 
 
 def create_application() -> FastAPI:
@@ -100,6 +114,10 @@ def create_application() -> FastAPI:
         allow_headers=["*"] if cors_headers == ["*"] else cors_headers,
     )
     app.add_middleware(CorrelationIdMiddleware)
+    if settings.database_replica_url:
+        app.add_middleware(
+            ReadYourWritesMiddleware, pin_seconds=settings.database_replica_pin_seconds
+        )
 
     # Rate limiting middleware - ajustado para desenvolvimento
     if settings.environment == "development":
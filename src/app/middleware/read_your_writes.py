@@ -0,0 +1,48 @@
+"""Keep a client on the primary database for a while after it writes."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+from app.infrastructure.database.database import PrimaryPin, pin_to_primary
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+PRIMARY_PIN_COOKIE = "sparkone_primary_until"
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Pin requests to the primary while the replica may still lag a write.
+
+    A request that writes sets a cookie holding the time until which the
+    client's reads must skip the replica; later requests carrying it start
+    pinned (see :class:`app.infrastructure.database.database.RoutingSession`).
+    """
+
+    def __init__(self, app, pin_seconds: float = 5.0) -> None:
+        super().__init__(app)
+        self._pin_seconds = pin_seconds
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        now = time.time()
+        try:
+            pinned_until = float(request.cookies.get(PRIMARY_PIN_COOKIE, 0))
+        except ValueError:
+            pinned_until = 0.0
+        pin = pin_to_primary(PrimaryPin(pinned=pinned_until > now))
+
+        response = await call_next(request)
+
+        if pin.wrote:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                f"{now + self._pin_seconds:.3f}",
+                max_age=max(int(self._pin_seconds), 1),
+                httponly=True,
+                samesite="lax",
+            )
+        return response
+
+
+__all__ = ["PRIMARY_PIN_COOKIE", "ReadYourWritesMiddleware"]
@@ -69,5 +69,28 @@ class RedisHealthStatus(BaseModel):
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
+class ReplicationBackendStatus(BaseModel):
+    """Write-behind replication state of one storage backend config."""
+
+    config_id: str
+    adapter: str
+    last_outbox_id: int = Field(description="Last outbox entry replicated")
+    pending: int = Field(description="Outbox entries not yet replicated")
+    lag_seconds: float = Field(description="Age of the oldest pending entry")
+    failures: int = Field(default=0, description="Consecutive failed attempts")
+    next_attempt_at: datetime | None = None
+    last_error: str | None = None
+
+
+class ReplicationHealthStatus(BaseModel):
+    """Response model for the task replication health check."""
+
+    status: str
+    enabled: bool = Field(description="Whether tasks replicate write-behind")
+    backends: list[ReplicationBackendStatus] = Field(default_factory=list)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
 __all__ = ["Channel", "ChannelMessage", "HealthStatus",
-           "DatabaseHealthStatus", "RedisHealthStatus", "MessageType"]
+           "DatabaseHealthStatus", "RedisHealthStatus", "MessageType",
+           "ReplicationBackendStatus", "ReplicationHealthStatus"]
@@ -15,15 +15,15 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.core.metrics import WHATSAPP_NOTIFICATION_COUNTER
 from app.domain.services.brief import BriefService
 from app.infrastructure.chat import ChatProviderRouter
-from app.infrastructure.database.database import get_session_factory
-from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus
+from app.infrastructure.database.database import get_read_session_factory, get_session_factory
+from app.infrastructure.database.models.tasks import TaskRecord, open_task_filter
 from app.infrastructure.database.models.user_preferences import UserPreferences
 
 logger = structlog.get_logger(__name__)
@@ -40,10 +40,10 @@ async def send_daily_brief(user_id: str | None = None) -> None:
 
     Related to: RF-015 (ProactivityEngine)
     """
-    from app.api.dependencies import get_whatsapp_service
+    from app.api.dependencies import get_brief_snapshot, get_whatsapp_service
 
     settings = get_settings()
-    session_factory = get_session_factory()
+    session_factory = get_read_session_factory()
 
     async with session_factory() as session:
         try:
@@ -64,7 +64,9 @@ async def send_daily_brief(user_id: str | None = None) -> None:
 
             # Generate brief
             chat_provider = ChatProviderRouter(settings=settings)
-            brief_service = BriefService(session=session, chat_provider=chat_provider)
+            brief_service = BriefService(
+                session=session, chat_provider=chat_provider, snapshot=get_brief_snapshot()
+            )
             content = await brief_service.textual_brief()
 
             # Send via WhatsApp
@@ -92,6 +94,52 @@ async def send_daily_brief(user_id: str | None = None) -> None:
             WHATSAPP_NOTIFICATION_COUNTER.labels(status="failure").inc()
 
 
+def deadline_tasks_stmt(now: datetime, window_end: datetime) -> Select[tuple[TaskRecord]]:
+    """Open, not yet reminded tasks due in ``(now, window_end]``."""
+
+    return (
+        select(TaskRecord)
+        .where(
+            TaskRecord.due_at.is_not(None),
+            TaskRecord.due_at <= window_end,
+            TaskRecord.due_at > now,
+            open_task_filter(),
+            TaskRecord.reminded_at.is_(None),  # Not already reminded
+        )
+        .order_by(TaskRecord.due_at.asc())
+    )
+
+
+def overdue_tasks_stmt(now: datetime) -> Select[tuple[TaskRecord]]:
+    """Open tasks whose due date has passed."""
+
+    return (
+        select(TaskRecord)
+        .where(
+            TaskRecord.due_at.is_not(None),
+            TaskRecord.due_at < now,
+            open_task_filter(),
+        )
+        .order_by(TaskRecord.due_at.asc())
+    )
+
+
+def event_tasks_stmt(window_start: datetime, window_end: datetime) -> Select[tuple[TaskRecord]]:
+    """Open, not yet reminded tasks due in ``[window_start, window_end]``."""
+
+    return (
+        select(TaskRecord)
+        .where(
+            TaskRecord.due_at.is_not(None),
+            TaskRecord.due_at >= window_start,
+            TaskRecord.due_at <= window_end,
+            open_task_filter(),
+            TaskRecord.reminded_at.is_(None),  # Not already reminded
+        )
+        .order_by(TaskRecord.due_at.asc())
+    )
+
+
 async def check_deadlines(user_id: str | None = None) -> None:
     """Check for tasks with deadlines approaching and send reminders.
 
@@ -124,19 +172,7 @@ async def check_deadlines(user_id: str | None = None) -> None:
             reminder_window = now + timedelta(hours=prefs.deadline_reminder_hours)
 
             # Query tasks with approaching deadlines
-            stmt = (
-                select(TaskRecord)
-                .where(
-                    TaskRecord.due_at.is_not(None),
-                    TaskRecord.due_at <= reminder_window,
-                    TaskRecord.due_at > now,
-                    TaskRecord.status.in_([TaskStatus.TODO, TaskStatus.IN_PROGRESS]),
-                    TaskRecord.reminded_at.is_(None),  # Not already reminded
-                )
-                .order_by(TaskRecord.due_at.asc())
-            )
-
-            result = await session.execute(stmt)
+            result = await session.execute(deadline_tasks_stmt(now, reminder_window))
             tasks = result.scalars().all()
 
             if not tasks:
@@ -194,7 +230,7 @@ async def check_overdue(user_id: str | None = None) -> None:
     """
     from app.api.dependencies import get_whatsapp_service
 
-    session_factory = get_session_factory()
+    session_factory = get_read_session_factory()
 
     async with session_factory() as session:
         try:
@@ -210,17 +246,7 @@ async def check_overdue(user_id: str | None = None) -> None:
 
             # Query overdue tasks
             now = datetime.now(timezone.utc)
-            stmt = (
-                select(TaskRecord)
-                .where(
-                    TaskRecord.due_at.is_not(None),
-                    TaskRecord.due_at < now,
-                    TaskRecord.status.in_([TaskStatus.TODO, TaskStatus.IN_PROGRESS]),
-                )
-                .order_by(TaskRecord.due_at.asc())
-            )
-
-            result = await session.execute(stmt)
+            result = await session.execute(overdue_tasks_stmt(now))
             tasks = result.scalars().all()
 
             if not tasks:
@@ -299,19 +325,9 @@ async def event_reminders(user_id: str | None = None) -> None:
             event_window_end = now + timedelta(minutes=35)
 
             # Query tasks/events in the window
-            stmt = (
-                select(TaskRecord)
-                .where(
-                    TaskRecord.due_at.is_not(None),
-                    TaskRecord.due_at >= event_window_start,
-                    TaskRecord.due_at <= event_window_end,
-                    TaskRecord.status.in_([TaskStatus.TODO, TaskStatus.IN_PROGRESS]),
-                    TaskRecord.reminded_at.is_(None),  # Not already reminded
-                )
-                .order_by(TaskRecord.due_at.asc())
+            result = await session.execute(
+                event_tasks_stmt(event_window_start, event_window_end)
             )
-
-            result = await session.execute(stmt)
             events = result.scalars().all()
 
             if not events:
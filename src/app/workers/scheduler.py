@@ -6,6 +6,9 @@ Manages background jobs for automated reminders and proactive notifications:
 - Overdue checks (every 6 hours)
 - Event reminders (30 min before event)
 - Google Sheets sync (every 5 min)
+- Task replication to storage backends (every few seconds)
+- Task reconciliation against storage backends (nightly)
+- Message partition maintenance and retention (nightly)
 
 Related to: ADR-016 (ProactivityEngine Architecture), RF-015
 """
@@ -22,7 +25,12 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.config import get_settings
-from app.infrastructure.database.database import get_session_factory
+from app.infrastructure.database.database import (
+    get_engine,
+    get_read_session_factory,
+    get_session_factory,
+)
+from app.infrastructure.database.partitions import maintain_message_partitions
 from app.core.metrics import (
     FALLBACK_NOTIFICATION_COUNTER,
     SHEETS_SYNC_COUNTER,
@@ -30,6 +38,7 @@ from app.core.metrics import (
 )
 from app.api.dependencies import (
     build_ingestion_service,
+    get_brief_snapshot,
     get_message_normalizer,
     get_whatsapp_service,
 )
@@ -38,6 +47,7 @@ from app.infrastructure.chat import ChatProviderRouter
 from app.domain.services.brief import BriefService
 from app.domain.services.email import send_email
 from app.domain.services.google_sheets_sync import GoogleSheetsSyncService
+from app.domain.services.replication import TaskReplicator
 
 # Import new ProactivityEngine jobs
 from app.workers.jobs import (
@@ -59,10 +69,10 @@ async def daily_brief_job() -> None:
     """Generate the daily brief placeholder using the persona."""
 
     chat_provider = _get_chat_provider()
-    session_factory = get_session_factory()
+    session_factory = get_read_session_factory()
     async with session_factory() as session:
         brief_service = BriefService(
-            session=session, chat_provider=chat_provider)
+            session=session, chat_provider=chat_provider, snapshot=get_brief_snapshot())
         try:
             content = await brief_service.textual_brief()
             await session.commit()
@@ -104,6 +114,7 @@ async def sheets_sync_job() -> None:
             ingestion_service=ingestion,
             spreadsheet_id=spreadsheet_id,
             range_name=range_name,
+            page_size=settings.google_sheets_sync_page_size,
         )
         try:
             result = await service.sync()
@@ -115,6 +126,52 @@ async def sheets_sync_job() -> None:
             logger.warning("sheets_sync_failed", error=str(exc))
 
 
+@lru_cache
+def _get_task_replicator() -> TaskReplicator:
+    return TaskReplicator(
+        get_session_factory(),
+        batch_size=get_settings().task_replication_batch_size,
+    )
+
+
+async def task_replication_job() -> None:
+    """Replicate outbox entries to every active storage backend."""
+
+    try:
+        replicated = await _get_task_replicator().drain()
+    except Exception as exc:  # pragma: no cover - runtime failure path
+        logger.warning("task_replication_failed", error=str(exc))
+        return
+    if any(replicated.values()):
+        logger.info("task_replication_completed", replicated=replicated)
+
+
+async def task_reconciliation_job() -> None:
+    """Queue replication for tasks that drifted from their storage backends."""
+
+    settings = get_settings()
+    try:
+        results = await _get_task_replicator().reconcile(
+            bucket_size=settings.task_reconciliation_bucket_size,
+            sample_buckets=settings.task_reconciliation_sample_buckets,
+        )
+    except Exception as exc:  # pragma: no cover - runtime failure path
+        logger.warning("task_reconciliation_failed", error=str(exc))
+        return
+    logger.info("task_reconciliation_completed", results=results)
+
+
+async def message_partitions_job() -> None:
+    """Create upcoming message partitions and archive expired ones."""
+
+    try:
+        results = await maintain_message_partitions(get_engine())
+    except Exception as exc:  # pragma: no cover - runtime failure path
+        logger.warning("message_partitions_failed", error=str(exc))
+        return
+    logger.info("message_partitions_completed", results=results)
+
+
 async def _notify_whatsapp(message: str) -> None:
     settings = get_settings()
     numbers_raw = settings.whatsapp_notify_numbers
@@ -159,6 +216,9 @@ async def main() -> None:
     3. Overdue checks - Every 6 hours
     4. Event reminders - Every 5 minutes
     5. Sheets sync - Every 5 minutes (legacy)
+    6. Task replication - Every few seconds (write-behind outbox)
+    7. Task reconciliation - Nightly (drift repair through the outbox)
+    8. Message partitions - Nightly (next months' partitions, retention)
 
     Graceful shutdown on SIGTERM/SIGINT.
     """
@@ -188,6 +248,43 @@ async def main() -> None:
         max_instances=1,
     )
 
+    if settings.task_replication_enabled:
+        scheduler.add_job(
+            task_replication_job,
+            trigger=IntervalTrigger(
+                seconds=settings.task_replication_interval_seconds, timezone=timezone
+            ),
+            id="task-replication",
+            replace_existing=True,
+            misfire_grace_time=30,
+            max_instances=1,
+        )
+
+    if settings.task_replication_enabled and settings.task_reconciliation_enabled:
+        scheduler.add_job(
+            task_reconciliation_job,
+            trigger=CronTrigger(
+                hour=settings.task_reconciliation_hour, minute=15, timezone=timezone
+            ),
+            id="task-reconciliation",
+            replace_existing=True,
+            misfire_grace_time=3600,
+            jitter=300,
+            max_instances=1,
+        )
+
+    if settings.message_partitions_enabled:
+        scheduler.add_job(
+            message_partitions_job,
+            trigger=CronTrigger(
+                hour=settings.message_partitions_hour, minute=30, timezone=timezone
+            ),
+            id="message-partitions",
+            replace_existing=True,
+            misfire_grace_time=3600,
+            max_instances=1,
+        )
+
     # ProactivityEngine jobs (new)
     scheduler.add_job(
         send_daily_brief,
@@ -1,5 +1,8 @@
+from unittest.mock import AsyncMock
+
 from starlette.testclient import TestClient
 
+from app.api.v1.health import replication_health
 from app.main import app
 
 
@@ -9,3 +12,25 @@ def test_health_endpoint_returns_ok() -> None:
     assert response.status_code == 200
     body = response.json()
     assert body.get("status") == "ok"
+
+
+async def test_replication_health_reports_backend_status() -> None:
+    replicator = AsyncMock()
+    replicator.status.return_value = [
+        {
+            "config_id": "cfg-1",
+            "adapter": "notion",
+            "last_outbox_id": 7,
+            "pending": 3,
+            "lag_seconds": 12.5,
+            "failures": 2,
+            "next_attempt_at": None,
+            "last_error": "rate limited",
+        }
+    ]
+
+    health = await replication_health(replicator)
+
+    assert health.status == "degraded"
+    assert [(backend.adapter, backend.pending) for backend in health.backends] == [("notion", 3)]
+    assert health.backends[0].last_error == "rate limited"
@@ -0,0 +1,129 @@
+"""Tests for the incrementally maintained brief snapshot."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from app.domain.services.brief import BriefService
+from app.domain.services.brief_snapshot import BriefSnapshot
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.brief import BriefSnapshotRecord
+from app.infrastructure.database.models.events import EventRecord
+from app.infrastructure.database.models.memory import ConversationMessage
+from app.infrastructure.database.models.repositories import create_task
+from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    # Concurrent briefs use their own sessions; an in-memory database would
+    # share one connection between them.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'brief.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                TaskRecord.__table__,
+                EventRecord.__table__,
+                ConversationMessage.__table__,
+                BriefSnapshotRecord.__table__,
+            ],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def source_queries(engine):
+    """Tables read by each SELECT on the source tables."""
+
+    queries: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "brief_snapshots" not in statement:
+            queries.append(re.search(r"\bFROM\s+(\w+)", statement).group(1))
+
+    return queries
+
+
+def _event(title: str) -> EventRecord:
+    return EventRecord(
+        title=title, start_at=datetime.now(UTC) + timedelta(days=1), channel="web", sender="me"
+    )
+
+
+async def _brief(factory, snapshot) -> dict:
+    async with factory() as session:
+        return await BriefService(session=session, snapshot=snapshot).structured_brief()
+
+
+async def test_brief_rereads_only_changed_or_expired_sections(engine, source_queries):
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    clock = _Clock()
+    snapshot = BriefSnapshot(max_age=60, session_factory=factory, clock=clock)
+
+    first = await _brief(factory, snapshot)
+    assert (first["tasks"], first["events"], first["conversations"]) == ([], [], [])
+    assert set(source_queries) == {"conversation_messages", "events", "tasks"}
+
+    source_queries.clear()
+    await _brief(factory, snapshot)
+    assert source_queries == []
+
+    async with factory() as session:
+        await create_task(
+            session, title="Write report", description=None, due_at=None, channel="web",
+            sender="me", status=TaskStatus.TODO,
+        )
+        await session.commit()
+    async with factory() as session:
+        session.add(_event("Rolled back"))
+        await session.flush()
+        await session.rollback()
+
+    brief = await _brief(factory, snapshot)
+    assert [task["title"] for task in brief["tasks"]] == ["Write report"]
+    assert source_queries == ["tasks"]
+
+    source_queries.clear()
+    clock.now += 61
+    await _brief(factory, snapshot)
+    assert set(source_queries) == {"conversation_messages", "events", "tasks"}
+
+
+async def test_concurrent_briefs_share_one_refresh(engine, source_queries):
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    snapshot = BriefSnapshot(max_age=60)
+
+    briefs = await asyncio.gather(*(_brief(factory, snapshot) for _ in range(10)))
+
+    assert len(briefs) == 10
+    assert (source_queries.count("tasks"), source_queries.count("events")) == (1, 1)
+
+
+async def test_new_process_restores_snapshot_from_table(engine, source_queries):
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add(_event("Planning"))
+        await session.commit()
+    await _brief(factory, BriefSnapshot(max_age=60, session_factory=factory))
+    source_queries.clear()
+
+    restored = await _brief(factory, BriefSnapshot(max_age=60, session_factory=factory))
+
+    assert source_queries == []
+    assert [item["title"] for item in restored["events"]] == ["Planning"]
@@ -0,0 +1,139 @@
+"""Unit tests for parallel bulk ingestion."""
+
+from __future__ import annotations
+
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from app.domain.services.bulk_ingestion import (
+    BulkIngestionRunner,
+    IngestionCheckpoint,
+    chunk_document,
+    discover_documents,
+)
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.knowledge import KnowledgeChunkORM, KnowledgeDocumentORM
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'knowledge.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[KnowledgeDocumentORM.__table__, KnowledgeChunkORM.__table__],
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def provider():
+    mock = AsyncMock()
+    mock.generate.side_effect = lambda batch: [[0.0, 1.0] for _ in batch]
+    return mock
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    root = tmp_path / "docs"
+    (root / "nested").mkdir(parents=True)
+    for i in range(3):
+        (root / f"doc{i}.md").write_text(f"alpha {i}\n\nbeta {i}", encoding="utf-8")
+    (root / "nested" / "deep.txt").write_text("gamma delta", encoding="utf-8")
+    (root / "nested" / "image.png").write_bytes(b"\x89PNG")
+    return root
+
+
+def test_discover_documents_walks_directories_and_globs(corpus: Path):
+    walked = discover_documents([corpus])
+    globbed = discover_documents([str(corpus / "*.md"), corpus / "doc0.md"])
+
+    assert [path.name for path in walked] == ["doc0.md", "doc1.md", "doc2.md", "deep.txt"]
+    assert [path.name for path in globbed] == ["doc0.md", "doc1.md", "doc2.md"]
+
+
+def _drain(sink: queue.Queue) -> list:
+    items = []
+    while (item := sink.get(timeout=5)) is not None:
+        items.append(item)
+    return items
+
+
+def test_chunk_document_skips_known_hash(corpus: Path):
+    path = str(corpus / "doc0.md")
+    sink: queue.Queue = queue.Queue()
+    assert chunk_document(path, sink, chunk_size=10, chunk_overlap=0) == 1
+    header, *batches = _drain(sink)
+
+    again: queue.Queue = queue.Queue()
+    chunk_document(path, again, chunk_size=10, chunk_overlap=0, known_hash=header.content_hash)
+
+    assert header.changed
+    assert batches == [["alpha 0 beta 0"]]
+    assert [document.changed for document in _drain(again)] == [False]
+
+
+def test_chunk_document_streams_bounded_batches(tmp_path: Path):
+    path = tmp_path / "large.md"
+    path.write_text("\n\n".join(f"paragraph {i}" for i in range(5000)), encoding="utf-8")
+    sink: queue.Queue = queue.Queue(maxsize=2)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            chunk_document, str(path), sink, chunk_size=2, chunk_overlap=0, batch_size=64
+        )
+        deadline = time.monotonic() + 5
+        while not sink.full() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # The worker waits for the consumer instead of chunking the whole file
+        assert sink.full()
+        assert not future.done()
+
+        header, *batches = _drain(sink)
+
+    assert future.result() == 5000
+    assert header.title == "large"
+    assert len(batches) == 79  # ceil(5000 / 64)
+    assert max(len(batch) for batch in batches) == 64
+
+
+async def test_runner_ingests_corpus_and_resumes_from_checkpoint(
+    corpus: Path, tmp_path: Path, session_factory, provider
+):
+    files = discover_documents([corpus])
+    checkpoint_path = tmp_path / "checkpoint.json"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        runner = BulkIngestionRunner(
+            session_factory, provider, source="docs", chunk_size=2,
+            concurrency=2, executor=executor, checkpoint=IngestionCheckpoint(checkpoint_path),
+        )
+        stats = await runner.run(files)
+
+        assert stats.documents == 4
+        assert stats.chunks_embedded == 7
+        assert len(IngestionCheckpoint(checkpoint_path)) == 4
+
+        provider.generate.reset_mock()
+        (corpus / "doc1.md").write_text("alpha 1\n\nbeta edited", encoding="utf-8")
+        resumed = BulkIngestionRunner(
+            session_factory, provider, source="docs", chunk_size=2,
+            executor=executor, checkpoint=IngestionCheckpoint(checkpoint_path),
+        )
+        second = await resumed.run(files)
+
+    assert second.skipped == 3
+    assert second.documents == 1
+    assert second.chunks_embedded == 1
+    provider.generate.assert_awaited_once_with(["beta edited"])
+    async with session_factory() as session:
+        documents = await session.scalar(select(func.count(KnowledgeDocumentORM.id)))
+        chunks = await session.scalar(select(func.count(KnowledgeChunkORM.id)))
+    assert (documents, chunks) == (4, 7)
@@ -0,0 +1,73 @@
+"""Unit tests for the streaming chunker."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from app.domain.services.chunking import (
+    StreamingChunker,
+    WhitespaceTokenizer,
+    iter_paragraph_segments,
+)
+
+
+class CharTokenizer:
+    """Tokenizer that treats every character as a token."""
+
+    def encode(self, text: str) -> list[str]:
+        return list(text)
+
+    def decode(self, tokens) -> str:
+        return "".join(tokens)
+
+
+class TestStreamingChunker:
+    def test_packs_paragraphs_until_budget(self):
+        chunker = StreamingChunker(max_tokens=5)
+        text = "one two\n\nthree four\n\nfive six seven"
+
+        assert list(chunker.chunk_text(text)) == ["one two three four", "five six seven"]
+
+    def test_hard_splits_oversized_paragraph(self):
+        chunker = StreamingChunker(max_tokens=3)
+        words = " ".join(f"w{i}" for i in range(10))
+
+        chunks = list(chunker.chunk_text(words))
+
+        assert chunks == ["w0 w1 w2", "w3 w4 w5", "w6 w7 w8", "w9"]
+        assert all(chunker.count_tokens(chunk) <= 3 for chunk in chunks)
+
+    def test_overlap_repeats_trailing_tokens(self):
+        chunker = StreamingChunker(max_tokens=4, overlap=1)
+        text = " ".join(f"w{i}" for i in range(7))
+
+        assert list(chunker.chunk_text(text)) == ["w0 w1 w2 w3", "w3 w4 w5 w6"]
+
+    def test_pluggable_tokenizer_counts_tokens(self):
+        chunker = StreamingChunker(CharTokenizer(), max_tokens=4)
+
+        assert list(chunker.chunk_text("abcdefghij")) == ["abcd", "efgh", "ij"]
+
+    def test_invalid_overlap_rejected(self):
+        with pytest.raises(ValueError, match="overlap"):
+            StreamingChunker(max_tokens=4, overlap=4)
+
+    def test_long_paragraph_segments_are_bounded(self):
+        line = "word " * 100
+
+        segments = list(iter_paragraph_segments([line], max_chars=50))
+
+        assert all(len(segment) <= 50 for segment, _ in segments)
+        assert segments[0][1] is False
+        assert all(continues for _, continues in segments[1:])
+        assert " ".join(segment for segment, _ in segments).split() == line.split()
+
+    def test_chunk_file_streams_from_disk(self, tmp_path: Path):
+        path = tmp_path / "doc.md"
+        path.write_text("alpha beta\n\ngamma\n\n" + "delta " * 6, encoding="utf-8")
+        chunker = StreamingChunker(WhitespaceTokenizer(), max_tokens=3)
+
+        chunks = list(chunker.chunk_file(path, block_size=8))
+
+        assert chunks == ["alpha beta gamma", "delta delta delta", "delta delta delta"]
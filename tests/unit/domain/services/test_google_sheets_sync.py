@@ -0,0 +1,108 @@
+"""Unit tests for incremental Google Sheets sync."""
+
+from __future__ import annotations
+
+import re
+from unittest.mock import AsyncMock
+
+import pytest
+from app.domain.services.google_sheets_sync import GoogleSheetsSyncService, _SheetRange
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.sheets import SheetsSyncStateORM
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+
+@pytest.fixture
+async def sheets_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[SheetsSyncStateORM.__table__])
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+    await engine.dispose()
+
+
+class FakeSheet:
+    """Serves bounded ``Inbox!A{start}:C{end}`` reads from an in-memory sheet."""
+
+    def __init__(self, rows: list[list[str]], modified_time: str | None = "t1") -> None:
+        self.rows = rows
+        self.modified_time = modified_time
+        self.list_rows = AsyncMock(side_effect=self._list_rows)
+        self.get_modified_time = AsyncMock(side_effect=lambda spreadsheet_id: self.modified_time)
+
+    async def _list_rows(self, spreadsheet_id: str, range_: str) -> list[list[str]]:
+        start, end = map(int, re.findall(r"\d+", range_.split("!")[1]))
+        # Data starts on sheet row 2 (below the header); trailing empties are trimmed
+        return self.rows[start - 2 : end - 1]
+
+
+def _service(session: AsyncSession, sheet: FakeSheet, page_size: int = 2):
+    normalizer = AsyncMock()
+    normalizer.normalize.side_effect = lambda channel, payload: payload
+    ingestion = AsyncMock()
+    service = GoogleSheetsSyncService(
+        session=session,
+        client=sheet,  # type: ignore[arg-type]
+        normalizer=normalizer,
+        ingestion_service=ingestion,
+        spreadsheet_id="sheet-1",
+        range_name="Inbox!A2:C",
+        page_size=page_size,
+    )
+    return service, ingestion
+
+
+class TestSheetRange:
+    def test_window_keeps_columns_and_bounds(self):
+        assert _SheetRange.parse("Inbox!A2:C").window(3, 10) == "Inbox!A4:C13"
+        assert _SheetRange.parse("Inbox!A1:C5").window(4, 10) == "Inbox!A4:C5"
+        assert _SheetRange.parse("Inbox!A1:C5").window(6, 10) is None
+        assert _SheetRange.parse("Inbox").window(1, 5) == "Inbox!1:5"
+
+
+class TestGoogleSheetsSyncService:
+    async def test_reads_only_new_rows_in_pages(self, sheets_session):
+        sheet = FakeSheet([["a"], ["b"], ["c"]])
+        service, ingestion = _service(sheets_session, sheet)
+
+        result = await service.sync()
+
+        assert result["processed"] == 3
+        assert [call.args[1] for call in sheet.list_rows.await_args_list] == [
+            "Inbox!A2:C3",
+            "Inbox!A4:C5",
+        ]
+
+        sheet.rows.append(["d"])
+        sheet.modified_time = "t2"
+        sheet.list_rows.reset_mock()
+        result = await service.sync()
+
+        assert result["processed"] == 1
+        assert result["last_row_index"] == 4
+        sheet.list_rows.assert_awaited_once_with("sheet-1", "Inbox!A5:C6")
+        assert ingestion.ingest.await_args.args[0]["row"] == ["d"]
+
+    async def test_unchanged_modified_time_skips_row_reads(self, sheets_session):
+        sheet = FakeSheet([["a"]])
+        service, ingestion = _service(sheets_session, sheet)
+        await service.sync()
+        sheet.list_rows.reset_mock()
+
+        result = await service.sync()
+
+        assert result["unchanged"] is True
+        sheet.list_rows.assert_not_awaited()
+        assert ingestion.ingest.await_count == 1
+
+    async def test_probe_failure_falls_back_to_bounded_read(self, sheets_session):
+        sheet = FakeSheet([["a"]])
+        sheet.get_modified_time.side_effect = RuntimeError("drive api disabled")
+        service, _ = _service(sheets_session, sheet)
+
+        result = await service.sync()
+
+        assert result["processed"] == 1
+        sheet.list_rows.assert_awaited_once_with("sheet-1", "Inbox!A2:C3")
@@ -0,0 +1,134 @@
+"""Unit tests for DocumentIngestionService."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from app.domain.services.ingestion import DocumentIngestionService
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.knowledge import KnowledgeChunkORM, KnowledgeDocumentORM
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+
+@pytest.fixture
+async def knowledge_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[KnowledgeDocumentORM.__table__, KnowledgeChunkORM.__table__],
+        )
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def provider():
+    mock = AsyncMock()
+    mock.generate.side_effect = lambda batch: [[0.0, 1.0] for _ in batch]
+    return mock
+
+
+async def _chunk_rows(session: AsyncSession, document_id: int) -> list[tuple[int, str]]:
+    result = await session.execute(
+        select(KnowledgeChunkORM.chunk_index, KnowledgeChunkORM.content)
+        .where(KnowledgeChunkORM.document_id == document_id)
+        .order_by(KnowledgeChunkORM.chunk_index)
+    )
+    return [tuple(row) for row in result]
+
+
+class TestDocumentIngestionService:
+    async def test_ingest_file_embeds_in_batches(
+        self, tmp_path: Path, knowledge_session: AsyncSession, provider
+    ):
+        path = tmp_path / "handbook.txt"
+        path.write_text("\n\n".join(f"paragraph {i}" for i in range(5)), encoding="utf-8")
+        service = DocumentIngestionService(knowledge_session, provider, embedding_batch_size=2)
+
+        result = await service.ingest_file(path, source="local", chunk_size=2)
+
+        assert result.chunks_ingested == 5
+        assert provider.generate.await_count == 3
+        count = await knowledge_session.scalar(select(func.count(KnowledgeChunkORM.id)))
+        assert count == 5
+
+    async def test_ingest_text_rejects_empty_input(self, knowledge_session: AsyncSession):
+        service = DocumentIngestionService(knowledge_session, AsyncMock())
+
+        with pytest.raises(ValueError, match="empty"):
+            await service.ingest_text(title="t", source="s", text="   \n\n  ")
+
+
+class TestIncrementalReingestion:
+    async def test_edit_one_paragraph_embeds_one_chunk(
+        self, knowledge_session: AsyncSession, provider
+    ):
+        service = DocumentIngestionService(knowledge_session, provider)
+        paragraphs = [f"section {i} body" for i in range(6)]
+        first = await service.ingest_text(
+            title="Handbook", source="docs", text="\n\n".join(paragraphs),
+            chunk_size=3, path="handbook.md",
+        )
+        provider.generate.reset_mock()
+
+        paragraphs[2] = "section 2 edited"
+        second = await service.ingest_text(
+            title="Handbook", source="docs", text="\n\n".join(paragraphs),
+            chunk_size=3, path="handbook.md",
+        )
+
+        assert second.document_id == first.document_id
+        assert second.chunks_ingested == 1
+        assert second.chunks_reused == 5
+        assert second.chunks_deleted == 1
+        provider.generate.assert_awaited_once_with(["section 2 edited"])
+        rows = await _chunk_rows(knowledge_session, first.document_id)
+        assert [index for index, _ in rows] == list(range(6))
+        assert rows[2] == (2, "section 2 edited")
+
+    async def test_removed_and_reordered_chunks(self, knowledge_session: AsyncSession, provider):
+        service = DocumentIngestionService(knowledge_session, provider)
+        text = "alpha one two\n\nbeta one two\n\ngamma one two"
+        first = await service.ingest_text(
+            title="d", source="docs", text=text, chunk_size=3, path="d.md"
+        )
+        provider.generate.reset_mock()
+
+        second = await service.ingest_text(
+            title="d", source="docs", text="gamma one two\n\nalpha one two",
+            chunk_size=3, path="d.md",
+        )
+
+        assert second.chunks_ingested == 0
+        assert second.chunks_deleted == 1
+        provider.generate.assert_not_awaited()
+        assert await _chunk_rows(knowledge_session, first.document_id) == [
+            (0, "gamma one two"),
+            (1, "alpha one two"),
+        ]
+
+    async def test_unchanged_document_is_skipped(self, knowledge_session: AsyncSession, provider):
+        service = DocumentIngestionService(knowledge_session, provider)
+        await service.ingest_text(title="d", source="docs", text="same text", path="d.md")
+        provider.generate.reset_mock()
+
+        result = await service.ingest_text(title="d", source="docs", text="same text", path="d.md")
+
+        assert result.unchanged is True
+        provider.generate.assert_not_awaited()
+
+    async def test_documents_without_path_are_always_new(
+        self, knowledge_session: AsyncSession, provider
+    ):
+        service = DocumentIngestionService(knowledge_session, provider)
+
+        first = await service.ingest_text(title="d", source="docs", text="same text")
+        second = await service.ingest_text(title="d", source="docs", text="same text")
+
+        assert first.document_id != second.document_id
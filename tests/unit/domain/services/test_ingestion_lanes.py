@@ -0,0 +1,112 @@
+"""Unit tests for ingestion priority lanes."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from app.domain.services.ingestion_lanes import (
+    BULK_LANE,
+    INTERACTIVE_LANE,
+    IngestionLanes,
+    LaneConfig,
+    LaneFullError,
+    WeightedFairLimiter,
+)
+from app.models.schemas import Channel
+
+
+def _lanes(*, capacity: int = 2, bulk_queue: int = 10_000) -> IngestionLanes:
+    return IngestionLanes(
+        [
+            LaneConfig(INTERACTIVE_LANE, weight=10, workers=2),
+            LaneConfig(BULK_LANE, weight=1, workers=1, max_queue=bulk_queue),
+        ],
+        capacity=capacity,
+    )
+
+
+class TestWeightedFairLimiter:
+    async def test_contended_slots_follow_weights(self):
+        limiter = WeightedFairLimiter(1, {"a": 3, "b": 1})
+        await limiter.acquire("a")
+        order: list[str] = []
+
+        async def take(lane: str) -> None:
+            await limiter.acquire(lane)
+            order.append(lane)
+
+        waiters = [asyncio.create_task(take(lane)) for lane in "bbbbaaaa"]
+        await asyncio.sleep(0)
+        for _ in waiters:
+            limiter.release()
+            await asyncio.sleep(0)
+
+        assert order[:4].count("a") == 3
+        assert sorted(order) == sorted("aaaabbbb")
+
+
+class TestIngestionLanes:
+    def test_channels_map_to_lanes(self):
+        lanes = _lanes()
+
+        assert lanes.lane_for(Channel.WHATSAPP) == INTERACTIVE_LANE
+        assert lanes.lane_for(Channel.WEB) == INTERACTIVE_LANE
+        assert lanes.lane_for(Channel.GOOGLE_SHEETS) == BULK_LANE
+        assert lanes.lane_for("unknown") == INTERACTIVE_LANE
+
+    async def test_bulk_backlog_does_not_delay_interactive(self):
+        lanes = _lanes()
+
+        async def bulk_row() -> None:
+            await asyncio.sleep(0.01)
+
+        backlog = [
+            asyncio.create_task(lanes.submit(Channel.GOOGLE_SHEETS, bulk_row))
+            for _ in range(200)
+        ]
+        await asyncio.sleep(0.02)
+
+        async def chat() -> float:
+            return time.perf_counter()
+
+        submitted = time.perf_counter()
+        started = await lanes.submit(Channel.WHATSAPP, chat)
+
+        assert started - submitted < 0.005
+        assert lanes.queue_depths()[BULK_LANE] > 150
+        await lanes.close()
+        await asyncio.gather(*backlog, return_exceptions=True)
+
+    async def test_results_and_errors_propagate(self):
+        lanes = _lanes()
+
+        async def ok() -> str:
+            return "done"
+
+        async def boom() -> None:
+            raise ValueError("bad row")
+
+        assert await lanes.submit(Channel.WEB, ok) == "done"
+        with pytest.raises(ValueError, match="bad row"):
+            await lanes.submit(Channel.GOOGLE_SHEETS, boom)
+        await lanes.close()
+
+    async def test_full_lane_rejects(self):
+        lanes = _lanes(bulk_queue=1)
+        release = asyncio.Event()
+
+        async def blocked() -> None:
+            await release.wait()
+
+        running = asyncio.create_task(lanes.submit(Channel.GOOGLE_SHEETS, blocked))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(lanes.submit(Channel.GOOGLE_SHEETS, blocked))
+        await asyncio.sleep(0)
+
+        with pytest.raises(LaneFullError):
+            await lanes.submit(Channel.GOOGLE_SHEETS, blocked)
+        release.set()
+        await asyncio.gather(running, queued)
+        await lanes.close()
@@ -0,0 +1,395 @@
+"""Unit tests for write-behind task replication."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.domain.interfaces.storage_adapter import StorageAdapter
+from app.domain.services.replication import TaskReplicator, _Backend
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.replication import (
+    ReplicationOperation,
+    TaskExternalRef,
+    TaskReplicationCursor,
+    TaskReplicationOutbox,
+)
+from app.infrastructure.database.models.repositories import create_task, enqueue_task_replication
+from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    # Backends replicate concurrently in their own sessions; an in-memory
+    # database would share one connection between them.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replication.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                TaskRecord.__table__,
+                TaskReplicationOutbox.__table__,
+                TaskReplicationCursor.__table__,
+                TaskExternalRef.__table__,
+            ],
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def _adapter(name: str) -> AsyncMock:
+    adapter = AsyncMock()
+    adapter.name = name
+    # What the backend stores, by external id
+    adapter.remote = {}
+
+    def save(task):
+        external_id = f"{name}-{task.id}"
+        adapter.remote[external_id] = _copy(task)
+        return external_id
+
+    def update(external_id, task, fields=None):
+        if external_id not in adapter.remote:
+            return False
+        adapter.remote[external_id] = _copy(task)
+        return True
+
+    async def find(task):
+        return await StorageAdapter.find_task(adapter, task)
+
+    adapter.save_task.side_effect = save
+    adapter.update_task.side_effect = update
+    adapter.delete_task.side_effect = lambda external_id: (
+        adapter.remote.pop(external_id, None) is not None
+    )
+    adapter.get_task.side_effect = lambda external_id: adapter.remote.get(external_id)
+    adapter.find_task.side_effect = find
+    adapter.supports_task_reads.return_value = True
+    adapter.supports_batch_operations.return_value = False
+    adapter.project_task = MagicMock(
+        side_effect=lambda task: StorageAdapter.project_task(adapter, task)
+    )
+    return adapter
+
+
+def _batch_adapter(name: str, max_batch_size: int) -> AsyncMock:
+    adapter = _adapter(name)
+    adapter.max_batch_size = max_batch_size
+    adapter.supports_batch_operations.return_value = True
+    adapter.batch_save_tasks.side_effect = lambda tasks: [
+        adapter.save_task.side_effect(task) for task in tasks
+    ]
+    adapter.batch_update_tasks.side_effect = lambda items, fields=None: [
+        adapter.update_task.side_effect(*item) for item in items
+    ]
+    return adapter
+
+
+def _copy(task: TaskRecord) -> TaskRecord:
+    return TaskRecord(
+        title=task.title,
+        description=task.description,
+        status=task.status,
+        priority=task.priority,
+        due_date=task.due_date,
+    )
+
+
+def _replicator(session_factory, adapters: dict[str, AsyncMock], **kwargs) -> TaskReplicator:
+    pool = MagicMock()
+    pool.get.side_effect = lambda config_id, version, factory: adapters[config_id]
+    replicator = TaskReplicator(session_factory, adapter_pool=pool, **kwargs)
+    replicator._load_backends = AsyncMock(  # type: ignore[method-assign]
+        return_value=[_Backend(name, name, None, {}) for name in adapters]
+    )
+    return replicator
+
+
+async def _task_change(
+    session_factory,
+    operation: ReplicationOperation,
+    task_id: int | None = None,
+    **values,
+) -> int:
+    async with session_factory() as session:
+        if values:
+            await session.execute(
+                update(TaskRecord).where(TaskRecord.id == task_id).values(**values)
+            )
+        if task_id is None:
+            record = await create_task(
+                session,
+                title="Pay rent",
+                description=None,
+                due_at=None,
+                channel="web",
+                sender="me",
+                status=TaskStatus.TODO,
+            )
+            task_id = record.id
+        await enqueue_task_replication(session, task_id=task_id, operation=operation)
+        await session.commit()
+    return task_id
+
+
+async def _refs(session: AsyncSession) -> set[tuple[int, str, str]]:
+    result = await session.execute(
+        select(TaskExternalRef.task_id, TaskExternalRef.config_id, TaskExternalRef.external_id)
+    )
+    return {tuple(row) for row in result}
+
+
+class TestTaskReplicator:
+    async def test_new_backend_starts_at_log_head(self, session_factory):
+        await _task_change(session_factory, ReplicationOperation.CREATE)
+        notion = _adapter("notion")
+        replicator = _replicator(session_factory, {"notion": notion})
+
+        assert await replicator.run_once() == {"notion": 0}
+        notion.save_task.assert_not_awaited()
+
+    async def test_replicates_creates_to_each_backend(self, session_factory):
+        notion, clickup = _adapter("notion"), _adapter("clickup")
+        replicator = _replicator(session_factory, {"notion": notion, "clickup": clickup})
+        await replicator.run_once()  # initialise cursors
+
+        task_id = await _task_change(session_factory, ReplicationOperation.CREATE)
+        assert await replicator.run_once() == {"notion": 1, "clickup": 1}
+
+        async with session_factory() as session:
+            assert await _refs(session) == {
+                (task_id, "notion", f"notion-{task_id}"),
+                (task_id, "clickup", f"clickup-{task_id}"),
+            }
+            task = await session.get(TaskRecord, task_id)
+            assert task.external_id == f"notion-{task_id}"
+            # Both cursors passed the entry, so it was pruned
+            assert await session.scalar(select(func.count(TaskReplicationOutbox.id))) == 0
+
+    async def test_coalesces_changes_and_uses_existing_ref(self, session_factory):
+        notion = _adapter("notion")
+        replicator = _replicator(session_factory, {"notion": notion})
+        await replicator.run_once()
+
+        task_id = await _task_change(session_factory, ReplicationOperation.CREATE)
+        await _task_change(session_factory, ReplicationOperation.UPDATE, task_id)
+        await replicator.run_once()
+        assert notion.save_task.await_count == 1
+        notion.update_task.assert_not_awaited()
+
+        await _task_change(session_factory, ReplicationOperation.UPDATE, task_id)
+        await _task_change(session_factory, ReplicationOperation.DELETE, task_id)
+        await replicator.run_once()
+        notion.update_task.assert_not_awaited()
+        notion.delete_task.assert_awaited_once_with(f"notion-{task_id}")
+        async with session_factory() as session:
+            assert await _refs(session) == set()
+
+    async def test_uses_batch_operations(self, session_factory):
+        sheets = _batch_adapter("sheets", max_batch_size=2)
+        replicator = _replicator(session_factory, {"sheets": sheets})
+        await replicator.run_once()
+
+        task_ids = [
+            await _task_change(session_factory, ReplicationOperation.CREATE) for _ in range(5)
+        ]
+        assert await replicator.run_once() == {"sheets": 5}
+        assert sheets.batch_save_tasks.await_count == 3
+        sheets.save_task.assert_not_awaited()
+
+        for task_id in task_ids:
+            await _task_change(
+                session_factory, ReplicationOperation.UPDATE, task_id, title=f"Task {task_id}"
+            )
+        await replicator.run_once()
+        assert sheets.batch_update_tasks.await_count == 3
+        sheets.update_task.assert_not_awaited()
+
+    async def test_skips_unchanged_and_sends_changed_fields(self, session_factory):
+        notion = _adapter("notion")
+        replicator = _replicator(session_factory, {"notion": notion})
+        await replicator.run_once()
+        task_id = await _task_change(session_factory, ReplicationOperation.CREATE)
+        await replicator.run_once()
+
+        # Touched but nothing the backend stores changed
+        await _task_change(session_factory, ReplicationOperation.UPDATE, task_id)
+        assert await replicator.run_once() == {"notion": 1}
+        notion.update_task.assert_not_awaited()
+
+        await _task_change(
+            session_factory, ReplicationOperation.UPDATE, task_id, status=TaskStatus.COMPLETED
+        )
+        await replicator.run_once()
+        [(external_id, task, fields)] = [call.args for call in notion.update_task.await_args_list]
+        assert external_id == f"notion-{task_id}"
+        assert fields == {"status"}
+
+        async with session_factory() as session:
+            ref = (await session.execute(select(TaskExternalRef))).scalar_one()
+            assert ref.projection["status"] == TaskStatus.COMPLETED.value
+
+    async def test_update_of_task_deleted_remotely_creates_it_again(self, session_factory):
+        notion = _adapter("notion")
+        replicator = _replicator(session_factory, {"notion": notion})
+        await replicator.run_once()
+        task_id = await _task_change(session_factory, ReplicationOperation.CREATE)
+        await replicator.run_once()
+
+        # The page was deleted in Notion: the adapter reports it as not found
+        notion.remote.clear()
+        notion.save_task.side_effect = lambda task: f"notion-{task.id}-again"
+        await _task_change(session_factory, ReplicationOperation.UPDATE, task_id, title="New title")
+        assert await replicator.run_once() == {"notion": 1}
+
+        notion.update_task.assert_awaited_once()
+        async with session_factory() as session:
+            assert await _refs(session) == {(task_id, "notion", f"notion-{task_id}-again")}
+            ref = (await session.execute(select(TaskExternalRef))).scalar_one()
+            assert ref.projection["title"] == "New title"
+            task = await session.get(TaskRecord, task_id)
+            assert task.external_id == f"notion-{task_id}-again"
+
+    async def test_failing_backend_backs_off_without_blocking_others(self, session_factory):
+        notion, sheets = _adapter("notion"), _adapter("sheets")
+        replicator = _replicator(
+            session_factory, {"notion": notion, "sheets": sheets}, base_backoff=60
+        )
+        await replicator.run_once()
+        replicate = sheets.save_task.side_effect
+        sheets.save_task.side_effect = RuntimeError("quota exceeded")
+
+        first = await _task_change(session_factory, ReplicationOperation.CREATE)
+        second = await _task_change(session_factory, ReplicationOperation.CREATE)
+        assert await replicator.run_once() == {"notion": 2, "sheets": 0}
+
+        async with session_factory() as session:
+            cursor = await session.get(TaskReplicationCursor, "sheets")
+            assert cursor.failures == 1
+            assert cursor.last_error == "quota exceeded"
+            # Unreplicated entries stay in the log for the failing backend
+            assert await session.scalar(select(func.count(TaskReplicationOutbox.id))) == 2
+
+        # Still backing off: no new attempt
+        sheets.save_task.side_effect = replicate
+        assert await replicator.run_once() == {"notion": 0, "sheets": 0}
+        assert sheets.save_task.await_count == 2  # both attempted in the first run
+
+        async with session_factory() as session:
+            cursor = await session.get(TaskReplicationCursor, "sheets")
+            cursor.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+            await session.commit()
+        assert await replicator.run_once() == {"notion": 0, "sheets": 2}
+        async with session_factory() as session:
+            assert {ref[0] for ref in await _refs(session) if ref[1] == "sheets"} == {
+                first,
+                second,
+            }
+            cursor = await session.get(TaskReplicationCursor, "sheets")
+            assert cursor.failures == 0
+
+    async def test_status_reports_pending_and_lag(self, session_factory):
+        notion = _adapter("notion")
+        replicator = _replicator(session_factory, {"notion": notion})
+        await replicator.run_once()
+        await _task_change(session_factory, ReplicationOperation.CREATE)
+
+        [status] = await replicator.status()
+
+        assert status["config_id"] == "notion"
+        assert status["pending"] == 1
+        assert status["lag_seconds"] >= 0
+
+
+class TestTaskReconciliation:
+    async def _replicated(self, session_factory, count: int):
+        notion = _adapter("notion")
+        replicator = _replicator(session_factory, {"notion": notion})
+        await replicator.run_once()
+        task_ids = [
+            await _task_change(session_factory, ReplicationOperation.CREATE) for _ in range(count)
+        ]
+        await replicator.drain()
+        return replicator, notion, task_ids
+
+    async def test_in_sync_backend_queues_nothing(self, session_factory):
+        replicator, notion, _ = await self._replicated(session_factory, 4)
+
+        [counts] = (await replicator.reconcile(bucket_size=2)).values()
+
+        assert counts["buckets"] == 3
+        assert counts["mismatched"] == 0
+        # One in-sync bucket is read back from the backend
+        assert counts["sampled"] == 1
+        assert notion.get_task.await_count in (1, 2)
+        async with session_factory() as session:
+            assert await session.scalar(select(func.count(TaskReplicationOutbox.id))) == 0
+
+    async def test_repairs_only_drifted_tasks(self, session_factory):
+        replicator, notion, task_ids = await self._replicated(session_factory, 6)
+        edited, removed, relinked, unreferenced = (
+            task_ids[0],
+            task_ids[1],
+            task_ids[3],
+            task_ids[4],
+        )
+        async with session_factory() as session:
+            # Changes that bypassed the outbox
+            await session.execute(
+                update(TaskRecord).where(TaskRecord.id == edited).values(title="Pay rent today")
+            )
+            await session.delete(await session.get(TaskRecord, removed))
+            await session.execute(
+                delete(TaskExternalRef).where(TaskExternalRef.task_id.in_([relinked, unreferenced]))
+            )
+            # Without a legacy id there is no surviving copy to find
+            await session.execute(
+                update(TaskRecord).where(TaskRecord.id == unreferenced).values(external_id=None)
+            )
+            await session.commit()
+
+        [counts] = (await replicator.reconcile(bucket_size=2, sample_buckets=0)).values()
+
+        # ids 1-6 fall in buckets {1}, {2, 3}, {4, 5}, {6}; the last is untouched
+        assert (counts["buckets"], counts["mismatched"]) == (4, 3)
+        assert (counts["create"], counts["update"], counts["delete"]) == (1, 2, 1)
+        assert counts["relinked"] == 1
+        notion.save_task.reset_mock()
+        await replicator.run_once()
+        assert {call.args[0] for call in notion.update_task.await_args_list[-2:]} == {
+            f"notion-{edited}",
+            f"notion-{relinked}",
+        }
+        notion.delete_task.assert_awaited_once_with(f"notion-{removed}")
+        assert [call.args[0].id for call in notion.save_task.await_args_list] == [unreferenced]
+
+        [counts] = (await replicator.reconcile(bucket_size=2)).values()
+        assert counts["mismatched"] == 0
+
+    async def test_detects_changes_made_in_the_backend(self, session_factory):
+        replicator, notion, task_ids = await self._replicated(session_factory, 4)
+        edited, deleted = task_ids[1], task_ids[3]
+        # Edited and deleted in Notion itself; the refs still match the tasks
+        notion.remote[f"notion-{edited}"].title = "Renamed in Notion"
+        del notion.remote[f"notion-{deleted}"]
+
+        [counts] = (await replicator.reconcile(bucket_size=2, sample_buckets=10)).values()
+
+        assert (counts["mismatched"], counts["sampled"]) == (0, 3)
+        assert (counts["create"], counts["update"], counts["delete"]) == (1, 1, 0)
+        notion.update_task.reset_mock()
+        notion.save_task.reset_mock()
+        await replicator.run_once()
+        notion.update_task.assert_awaited_once()
+        external_id, task, fields = notion.update_task.await_args.args
+        assert (external_id, task.id, set(fields)) == (f"notion-{edited}", edited, {"title"})
+        assert [call.args[0].id for call in notion.save_task.await_args_list] == [deleted]
+        assert notion.remote[f"notion-{edited}"].title == task.title
+        async with session_factory() as session:
+            assert (deleted, "notion", f"notion-{deleted}") in await _refs(session)
+
+        [counts] = (await replicator.reconcile(bucket_size=2, sample_buckets=10)).values()
+        assert (counts["create"], counts["update"], counts["delete"]) == (0, 0, 0)
@@ -0,0 +1,120 @@
+"""Unit tests for inline multi-backend sync - ADR-014."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.domain.interfaces.storage_adapter import StorageAdapter
+from app.domain.services.storage import StorageService
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.replication import TaskExternalRef
+from app.infrastructure.database.models.repositories import create_task
+from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus
+from app.infrastructure.storage.config_cache import StorageConfigSnapshot
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[TaskRecord.__table__, TaskExternalRef.__table__],
+        )
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def _adapter(name: str) -> AsyncMock:
+    adapter = AsyncMock()
+    adapter.name = name
+    adapter.save_task.side_effect = lambda task: f"{name}-{task.id}"
+    adapter.update_task.return_value = True
+    adapter.project_task = MagicMock(
+        side_effect=lambda task: StorageAdapter.project_task(adapter, task)
+    )
+    return adapter
+
+
+async def _service(session: AsyncSession, *adapters: AsyncMock) -> StorageService:
+    cache = MagicMock()
+    cache.get_backends = AsyncMock(
+        return_value=[
+            (StorageConfigSnapshot(f"cfg-{adapter.name}", adapter.name, {}, 0), adapter)
+            for adapter in adapters
+        ]
+    )
+    service = StorageService(session, max_retries=1, config_cache=cache)
+    await service.load_configs()
+    return service
+
+
+async def _task(session: AsyncSession) -> TaskRecord:
+    return await create_task(
+        session,
+        title="Draft",
+        description=None,
+        due_at=None,
+        channel="whatsapp",
+        sender="5511999999999",
+        status=TaskStatus.TODO,
+    )
+
+
+class TestUpdateTask:
+    async def test_unchanged_projection_skips_backend(self, session):
+        notion = _adapter("notion")
+        service = await _service(session, notion)
+        task = await _task(session)
+        external_ids = await service.save_task(task)
+
+        assert await service.update_task(task, external_ids) == {"notion": True}
+        notion.update_task.assert_not_awaited()
+
+    async def test_sends_only_changed_fields_and_records_them(self, session):
+        notion, clickup = _adapter("notion"), _adapter("clickup")
+        service = await _service(session, notion, clickup)
+        task = await _task(session)
+        external_ids = await service.save_task(task)
+
+        task.title = "Final"
+        assert await service.update_task(task, external_ids) == {
+            "notion": True,
+            "clickup": True,
+        }
+        for adapter in (notion, clickup):
+            adapter.update_task.assert_awaited_once_with(
+                external_ids[adapter.name], task, fields=frozenset({"title"})
+            )
+
+        refs = (await session.execute(select(TaskExternalRef))).scalars().all()
+        assert {ref.projection["title"] for ref in refs} == {"Final"}
+        # The recorded baseline makes a repeat a no-op
+        await service.update_task(task, external_ids)
+        assert notion.update_task.await_count == 1
+
+    async def test_without_baseline_sends_every_field(self, session):
+        notion = _adapter("notion")
+        service = await _service(session, notion)
+        task = await _task(session)
+
+        assert await service.update_task(task, {"notion": "page-1"}) == {"notion": True}
+        notion.update_task.assert_awaited_once_with("page-1", task, fields=None)
+        ref = (await session.execute(select(TaskExternalRef))).scalar_one()
+        assert (ref.config_id, ref.external_id) == ("cfg-notion", "page-1")
+
+    async def test_failed_update_keeps_baseline(self, session):
+        notion = _adapter("notion")
+        service = await _service(session, notion)
+        task = await _task(session)
+        external_ids = await service.save_task(task)
+        notion.update_task.return_value = False
+
+        task.title = "Final"
+        assert await service.update_task(task, external_ids) == {"notion": False}
+        ref = (await session.execute(select(TaskExternalRef))).scalar_one()
+        assert ref.projection["title"] == "Draft"
@@ -0,0 +1,63 @@
+"""Tests for the bulk knowledge chunk insert path."""
+
+from __future__ import annotations
+
+import struct
+
+import pytest
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.knowledge import (
+    KnowledgeChunkORM,
+    KnowledgeDocumentORM,
+    compute_content_hash,
+)
+from app.infrastructure.database.models.repositories import (
+    bulk_insert_knowledge_chunks,
+    create_knowledge_document,
+)
+from app.infrastructure.database.models.vector import (
+    decode_vector_binary,
+    encode_vector_binary,
+)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[KnowledgeDocumentORM.__table__, KnowledgeChunkORM.__table__],
+        )
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def test_vector_binary_codec_matches_pgvector_wire_format():
+    encoded = encode_vector_binary([1.0, -0.5, 0.25])
+
+    assert encoded[:4] == struct.pack(">HH", 3, 0)
+    assert encode_vector_binary("[1.0,-0.5,0.25]") == encoded
+    assert decode_vector_binary(encoded) == "[1.0,-0.5,0.25]"
+
+
+async def test_bulk_insert_uses_executemany_on_sqlite(session):
+    document = await create_knowledge_document(session, title="d", source="s")
+
+    stored = await bulk_insert_knowledge_chunks(
+        session,
+        document_id=document.id,
+        chunks=[(index, f"chunk {index}", [0.0, float(index)]) for index in range(3)],
+    )
+
+    rows = (
+        await session.execute(
+            select(KnowledgeChunkORM.chunk_index, KnowledgeChunkORM.content_hash)
+            .order_by(KnowledgeChunkORM.chunk_index)
+        )
+    ).all()
+    assert stored == 3
+    assert rows == [(index, compute_content_hash(f"chunk {index}")) for index in range(3)]
@@ -0,0 +1,118 @@
+"""Tests for the Core INSERT ... RETURNING path of the hot repository helpers."""
+
+from __future__ import annotations
+
+import pytest
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.memory import ConversationMessage, ConversationRole
+from app.infrastructure.database.models.message import ChannelMessageORM
+from app.infrastructure.database.models.repositories import (
+    append_conversation_message,
+    create_task,
+    save_channel_message,
+    upsert_message_embedding,
+)
+from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus
+from app.infrastructure.database.models.vector import MessageEmbeddingORM
+from app.models.schemas import Channel, ChannelMessage, MessageType
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                ChannelMessageORM.__table__,
+                ConversationMessage.__table__,
+                TaskRecord.__table__,
+                MessageEmbeddingORM.__table__,
+            ],
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def test_inserts_return_persistent_loaded_instances(session_factory):
+    async with session_factory() as session:
+        message = await save_channel_message(
+            session,
+            ChannelMessage(
+                channel=Channel.WEB,
+                sender="tester",
+                content="hello",
+                message_type=MessageType.TASK,
+                extra_data={"source": "test"},
+            ),
+        )
+        conversation = await append_conversation_message(
+            session,
+            conversation_id="web_tester",
+            channel="web",
+            sender="tester",
+            role=ConversationRole.USER,
+            content="hello",
+        )
+
+        for instance in (message, conversation):
+            assert inspect(instance).persistent
+            assert not session.dirty
+            assert instance.id is not None
+            assert instance.created_at is not None
+        assert message.channel is Channel.WEB
+        assert message.extra_data == {"source": "test"}
+        assert conversation.role is ConversationRole.USER
+        assert await session.get(ChannelMessageORM, message.id) is message
+
+
+async def test_changes_to_created_task_are_flushed_as_update(session_factory):
+    async with session_factory() as session:
+        record = await create_task(
+            session,
+            title="Pay rent",
+            description=None,
+            due_at=None,
+            channel="web",
+            sender="tester",
+            status=TaskStatus.TODO,
+        )
+        assert record.priority == "medium"
+        record.external_id = "notion-1"
+        await session.commit()
+
+    async with session_factory() as session:
+        stored = (await session.execute(select(TaskRecord))).scalar_one()
+    assert (stored.id, stored.status, stored.external_id) == (record.id, "todo", "notion-1")
+
+
+async def test_message_embedding_upsert_keeps_one_row_per_message(session_factory):
+    async with session_factory() as session:
+        message = await save_channel_message(
+            session,
+            ChannelMessage(channel=Channel.WEB, sender="tester", content="hello"),
+        )
+        await session.commit()
+
+    async def embed(vector: list[float]) -> MessageEmbeddingORM:
+        async with session_factory() as session:
+            embedding = await upsert_message_embedding(
+                session,
+                message_id=message.id,
+                created_at=message.created_at,
+                embedding=vector,
+                content=message.content,
+            )
+            await session.commit()
+            return embedding
+
+    first = await embed([0.0, 1.0])
+    second = await embed([1.0, 0.0])
+
+    assert second.id == first.id
+    assert second.created_at == message.created_at
+    async with session_factory() as session:
+        rows = (await session.execute(select(MessageEmbeddingORM))).scalars().all()
+    assert [row.embedding for row in rows] == [[1.0, 0.0]]
@@ -0,0 +1,142 @@
+"""Tests for monthly message partitions on SQLite (rolled tables) and retention."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import UTC, datetime
+
+import pytest
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.memory import ConversationMessage, ConversationRole
+from app.infrastructure.database.models.repositories import list_recent_conversations
+from app.infrastructure.database.partitions import (
+    add_months,
+    archive_expired_partitions,
+    list_partitions,
+    parse_partition,
+    recent_window_start,
+    roll_sqlite_partitions,
+)
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'messages.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[ConversationMessage.__table__])
+        # Two messages per month from June to October
+        await conn.execute(
+            insert(ConversationMessage.__table__),
+            [
+                {
+                    "conversation_id": "web_user",
+                    "channel": "web",
+                    "sender": "user",
+                    "role": ConversationRole.USER,
+                    "content": f"{month}-{day}",
+                    "created_at": datetime(2026, month, day, 9, 0),
+                }
+                for month in range(6, 11)
+                for day in (1, 28)
+            ],
+        )
+    yield engine
+    await engine.dispose()
+
+
+async def _count(conn, source: str) -> int:
+    result = await conn.execute(text(f'SELECT COUNT(*) FROM "{source}"'))  # noqa: S608
+    return result.scalar_one()
+
+
+def test_month_arithmetic_and_names():
+    assert add_months(datetime(2026, 11, 1, tzinfo=UTC), 3) == datetime(2027, 2, 1, tzinfo=UTC)
+    assert recent_window_start(NOW, months=2) == datetime(2026, 9, 1, tzinfo=UTC)
+
+    partition = parse_partition("channel_messages_p2026_02")
+    assert partition.table == "channel_messages"
+    assert partition.upper == datetime(2026, 3, 1, tzinfo=UTC)
+    legacy = parse_partition("conversation_messages_before_p2026_10")
+    assert legacy.upper == datetime(2026, 10, 1, tzinfo=UTC)
+    assert parse_partition("conversation_messages_default") is None
+    assert parse_partition("tasks_p2026_01") is None
+
+
+async def test_roll_moves_old_months_and_keeps_union_view(engine):
+    async with engine.begin() as conn:
+        moved = await roll_sqlite_partitions(conn, now=NOW)
+
+    assert moved == 6
+    async with engine.connect() as conn:
+        partitions = await list_partitions(conn, "conversation_messages")
+        assert [partition.name for partition in partitions] == [
+            "conversation_messages_p2026_06",
+            "conversation_messages_p2026_07",
+            "conversation_messages_p2026_08",
+        ]
+        assert await _count(conn, "conversation_messages") == 4
+        assert await _count(conn, "conversation_messages_p2026_07") == 2
+        assert await _count(conn, "conversation_messages_all") == 10
+
+    # Rolling again is a no-op
+    async with engine.begin() as conn:
+        assert await roll_sqlite_partitions(conn, now=NOW) == 0
+
+
+async def test_archive_exports_and_drops_expired_months(engine, tmp_path):
+    async with engine.begin() as conn:
+        await roll_sqlite_partitions(conn, now=NOW)
+
+    paths = await archive_expired_partitions(
+        engine, retention_months=4, archive_dir=tmp_path / "archive", now=NOW
+    )
+
+    assert [path.name for path in paths] == [
+        "conversation_messages_p2026_06.jsonl.gz",
+    ]
+    with gzip.open(paths[0], "rt", encoding="utf-8") as stream:
+        rows = [json.loads(line) for line in stream]
+    assert sorted(row["content"] for row in rows) == ["6-1", "6-28"]
+    async with engine.connect() as conn:
+        assert len(await list_partitions(conn, "conversation_messages")) == 2
+        assert await _count(conn, "conversation_messages_all") == 8
+
+
+async def test_recent_conversations_read_hot_window_first(engine, monkeypatch):
+    monkeypatch.setattr(
+        "app.infrastructure.database.models.repositories.recent_window_start",
+        lambda: recent_window_start(NOW, months=2),
+    )
+    async with async_sessionmaker(engine)() as session:
+        messages = await list_recent_conversations(session, limit=3)
+        everything = await list_recent_conversations(session, limit=20)
+
+    assert [message.content for message in messages] == ["10-28", "10-1", "9-28"]
+    assert len(everything) == 10
+    assert [message.id for message in everything] == sorted(
+        (message.id for message in everything), reverse=True
+    )
+
+
+async def test_recent_conversations_reach_rolled_months(engine, monkeypatch):
+    monkeypatch.setattr(
+        "app.infrastructure.database.models.repositories.recent_window_start",
+        lambda: recent_window_start(NOW, months=2),
+    )
+    async with engine.begin() as conn:
+        await roll_sqlite_partitions(conn, now=NOW)
+
+    async with async_sessionmaker(engine)() as session:
+        everything = await list_recent_conversations(session, limit=20)
+        filtered = await list_recent_conversations(session, limit=20, conversation_id="web_user")
+
+    # June to August now live in the rolled tables
+    assert [message.content for message in everything] == [
+        f"{month}-{day}" for month in range(10, 5, -1) for day in (28, 1)
+    ]
+    assert filtered == everything
@@ -0,0 +1,119 @@
+"""Tests for connection pool instrumentation and the size recommendation."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from app.infrastructure.database import pool as pool_module
+from app.infrastructure.database.pool import (
+    InstrumentedQueuePool,
+    PoolUsage,
+    instrument_pool,
+    recommend_pool_size,
+)
+from sqlalchemy import event, exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+@pytest.fixture(autouse=True)
+def isolated_usage(monkeypatch):
+    monkeypatch.setattr(pool_module, "_usage", {})
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name="test",
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.1,
+    )
+    instrument_pool(engine.sync_engine)
+    yield engine
+    await engine.dispose()
+
+
+async def test_pool_records_concurrency_waits_and_timeouts(engine):
+    usage = pool_module.pool_usage("test")
+    first = await engine.connect()
+    second = await engine.connect()
+    await first.execute(text("SELECT 1"))
+
+    with pytest.raises(exc.TimeoutError):
+        await engine.connect()
+
+    await second.close()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    await first.close()
+
+    assert list(usage.concurrency) == [1, 2, 2]
+    assert usage.peak == 2
+    assert usage.timeouts == 1
+    assert len(usage.waits) == 4
+    assert max(usage.waits) >= 0.1
+
+
+async def test_wait_covers_only_queueing_for_a_connection(engine):
+    usage = pool_module.pool_usage("test")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def slow_connect(dbapi_connection, connection_record):
+        time.sleep(0.05)
+
+    first = await engine.connect()
+    second = await engine.connect()
+
+    async def release_later():
+        await asyncio.sleep(0.05)
+        await second.close()
+
+    release = asyncio.create_task(release_later())
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    await release
+    await first.close()
+
+    # Opening the first two connections was slow but nobody queued
+    assert list(usage.waits)[:2] == [0.0, 0.0]
+    assert 0.04 <= usage.waits[2] < 0.1
+
+
+async def test_usage_survives_pool_recreation(engine):
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    await engine.dispose()
+    async with engine.connect() as conn, engine.connect():
+        await conn.execute(text("SELECT 1"))
+
+    assert list(pool_module.pool_usage("test").concurrency) == [1, 1, 2]
+
+
+def test_recommendation_covers_p95_and_bursts():
+    usage = PoolUsage("primary")
+    for checked_out in [2] * 90 + [4] * 8 + [12] * 2:
+        usage.record_checkout(checked_out)
+        usage.waits.append(0.0005)
+
+    recommendation = recommend_pool_size(usage)
+
+    assert recommendation.p95_concurrency == 4
+    assert (recommendation.pool_size, recommendation.max_overflow) == (5, 10)
+    assert not recommendation.saturated
+
+
+def test_recommendation_widens_overflow_when_pool_saturated():
+    usage = PoolUsage("primary")
+    for _ in range(20):
+        usage.record_checkout(10)
+        usage.waits.append(0.5)
+
+    recommendation = recommend_pool_size(usage)
+
+    assert recommendation.saturated
+    assert (recommendation.pool_size, recommendation.max_overflow) == (13, 13)
+    assert recommend_pool_size(PoolUsage("idle")) is None
@@ -0,0 +1,100 @@
+"""Tests for replica read routing and the read-your-writes pin."""
+
+from __future__ import annotations
+
+import pytest
+from app.infrastructure.database import database
+from app.infrastructure.database.database import (
+    PrimaryPin,
+    get_read_session_factory,
+    get_session_factory,
+    pin_to_primary,
+)
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.tasks import TaskRecord
+from app.middleware.read_your_writes import PRIMARY_PIN_COOKIE, ReadYourWritesMiddleware
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+async def _engine_with_task(path, title: str):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[TaskRecord.__table__])
+        await conn.execute(
+            TaskRecord.__table__.insert(), {"title": title, "channel": "web", "sender": "tester"}
+        )
+    return engine
+
+
+@pytest.fixture
+async def engines(tmp_path, monkeypatch):
+    primary = await _engine_with_task(tmp_path / "primary.db", "primary")
+    replica = await _engine_with_task(tmp_path / "replica.db", "replica")
+    monkeypatch.setattr(database, "_engine", primary)
+    monkeypatch.setattr(database, "_replica_engine", replica)
+    monkeypatch.setattr(database, "_session_factory", None)
+    monkeypatch.setattr(database, "_read_session_factory", None)
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+async def _titles(session) -> list[str]:
+    return list((await session.execute(select(TaskRecord.title).order_by(TaskRecord.id))).scalars())
+
+
+async def test_reads_use_replica_until_the_session_writes(engines):
+    async with get_read_session_factory()() as session:
+        assert await _titles(session) == ["replica"]
+
+        session.add(TaskRecord(title="new", channel="web", sender="tester"))
+        await session.flush()
+
+        assert await _titles(session) == ["primary", "new"]
+        await session.commit()
+
+
+async def test_write_pins_later_sessions_of_the_request(engines):
+    pin = pin_to_primary()
+    async with get_session_factory()() as session:
+        session.add(TaskRecord(title="new", channel="web", sender="tester"))
+        await session.commit()
+
+    assert pin.wrote
+    async with get_read_session_factory()() as session:
+        assert await _titles(session) == ["primary", "new"]
+
+
+async def test_without_replica_reads_use_primary_factory(engines, monkeypatch):
+    monkeypatch.setattr(database, "_replica_engine", None)
+    monkeypatch.setattr(database, "get_replica_engine", lambda: None)
+
+    assert database.get_read_session_factory() is get_session_factory()
+
+
+def test_middleware_sets_pin_cookie_after_write():
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, pin_seconds=5)
+    seen: list[bool] = []
+
+    @app.get("/read")
+    async def read() -> dict:
+        seen.append(database._primary_pin.get().pinned)
+        return {}
+
+    @app.post("/write")
+    async def write() -> dict:
+        pin: PrimaryPin = database._primary_pin.get()
+        pin.pinned = pin.wrote = True
+        return {}
+
+    client = TestClient(app)
+    assert PRIMARY_PIN_COOKIE not in client.get("/read").cookies
+    response = client.post("/write")
+    assert PRIMARY_PIN_COOKIE in response.cookies
+    client.get("/read")
+
+    assert seen == [False, True]
@@ -0,0 +1,173 @@
+"""Tests for SQLite single-writer mode: batched writer task and read-only pool."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from app.config import Settings
+from app.infrastructure.database import database
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.message import ChannelMessageORM
+from app.infrastructure.database.models.repositories import save_channel_message
+from app.infrastructure.database.sqlite_writer import SQLiteWriter
+from app.models.schemas import Channel, ChannelMessage, MessageType
+from sqlalchemy import create_engine, event, exc, func, select, text
+
+
+@pytest.fixture
+def sqlite_file(tmp_path, monkeypatch):
+    path = tmp_path / "single_writer.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync_engine, tables=[ChannelMessageORM.__table__])
+    sync_engine.dispose()
+    settings = Settings(
+        database_url=f"sqlite+aiosqlite:///{path}",
+        database_sqlite_single_writer=True,
+        database_sqlite_read_pool_size=2,
+        debug=False,
+    )
+    monkeypatch.setattr(database, "get_settings", lambda: settings)
+    for name in (
+        "_engine",
+        "_replica_engine",
+        "_session_factory",
+        "_read_session_factory",
+    ):
+        monkeypatch.setattr(database, name, None)
+    return path
+
+
+async def _dispose_engines() -> None:
+    for engine in (database._engine, database._replica_engine):
+        if engine is not None:
+            await engine.dispose()
+
+
+def _message(index: int) -> ChannelMessage:
+    return ChannelMessage(channel=Channel.WEB, sender="me", content=f"message {index}")
+
+
+async def test_writer_commits_queued_writes_in_batches(sqlite_file):
+    writer = SQLiteWriter(database.get_writer_engine(), max_batch=8)
+    commits: list[int] = []
+    event.listen(writer._engine.sync_engine, "commit", lambda conn: commits.append(1))
+
+    async def insert(index: int) -> int:
+        async def operation(session):
+            record = await save_channel_message(session, payload=_message(index))
+            if index == 5:
+                raise ValueError("rejected")
+            return record.id
+
+        return await writer.run(operation)
+
+    try:
+        results = await asyncio.gather(*(insert(i) for i in range(20)), return_exceptions=True)
+    finally:
+        await writer.close()
+        await _dispose_engines()
+
+    assert isinstance(results[5], ValueError)
+    ids = [result for i, result in enumerate(results) if i != 5]
+    assert all(isinstance(record_id, int) for record_id in ids)
+    # 20 writes queued together commit in ceil(20 / 8) transactions
+    assert len(commits) == 3
+
+    sync_engine = create_engine(f"sqlite:///{sqlite_file}")
+    with sync_engine.connect() as conn:
+        contents = conn.scalars(select(ChannelMessageORM.content)).all()
+    sync_engine.dispose()
+    assert len(contents) == 19
+    assert "message 5" not in contents
+
+
+async def test_sessions_read_from_read_only_pool_and_write_to_single_connection(sqlite_file):
+    factory = database.get_session_factory()
+    try:
+        async with factory() as session:
+            assert await session.scalar(select(func.count(ChannelMessageORM.id))) == 0
+            assert session.get_bind() is database.get_replica_engine().sync_engine
+            await save_channel_message(session, payload=_message(1))
+            await session.commit()
+
+        async with factory() as session:
+            assert await session.scalar(select(func.count(ChannelMessageORM.id))) == 1
+
+        async with database.get_replica_engine().connect() as conn:
+            assert "mode=ro" in str(conn.engine.url)
+            with pytest.raises(exc.OperationalError):
+                await conn.execute(text("DELETE FROM channel_messages"))
+
+        primary = database.get_engine()
+        assert primary.pool.size() == 1
+        async with primary.connect() as conn:
+            assert await conn.scalar(text("PRAGMA journal_mode")) == "wal"
+    finally:
+        await _dispose_engines()
+
+
+async def test_writer_and_session_writes_share_the_only_write_connection(sqlite_file):
+    primary = database.get_engine()
+    writer = SQLiteWriter(database.get_writer_engine(), max_batch=4)
+    assert writer._engine is primary
+    write_connections: set[int] = set()
+
+    @event.listens_for(primary.sync_engine, "begin")
+    def record(conn):
+        write_connections.add(id(conn.connection.dbapi_connection))
+
+    async def session_write(index: int) -> None:
+        async with database.get_session_factory()() as session:
+            await save_channel_message(session, payload=_message(index))
+            await session.commit()
+
+    async def writer_write(index: int) -> None:
+        await writer.run(lambda session: save_channel_message(session, payload=_message(index)))
+
+    try:
+        await asyncio.gather(
+            *(session_write(i) for i in range(5)), *(writer_write(i) for i in range(5, 10))
+        )
+        async with database.get_session_factory()() as session:
+            assert await session.scalar(select(func.count(ChannelMessageORM.id))) == 10
+    finally:
+        await writer.close()
+        await _dispose_engines()
+
+    assert len(write_connections) == 1
+
+
+async def test_session_write_does_not_hold_the_write_connection(sqlite_file):
+    writer = SQLiteWriter(database.get_writer_engine(), max_batch=4)
+    try:
+        async with database.get_session_factory()() as session:
+            await save_channel_message(session, payload=_message(1))
+            # The session has not committed, yet the writer gets the connection
+            await asyncio.wait_for(
+                writer.run(lambda s: save_channel_message(s, payload=_message(2))), timeout=5
+            )
+            assert await session.scalar(select(func.count(ChannelMessageORM.id))) == 2
+            assert session.get_bind() is database.get_replica_engine().sync_engine
+
+            session.add(
+                ChannelMessageORM(
+                    channel=Channel.WEB,
+                    sender="me",
+                    content="message 3",
+                    message_type=MessageType.FREE_TEXT,
+                    occurred_at=datetime.now(UTC),
+                )
+            )
+            await session.flush()
+            await asyncio.wait_for(
+                writer.run(lambda s: save_channel_message(s, payload=_message(4))), timeout=5
+            )
+            await session.commit()
+
+        async with database.get_session_factory()() as session:
+            assert await session.scalar(select(func.count(ChannelMessageORM.id))) == 4
+    finally:
+        await writer.close()
+        await _dispose_engines()
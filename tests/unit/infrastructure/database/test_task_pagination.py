@@ -0,0 +1,87 @@
+"""Tests for task counting and keyset pagination."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.repositories import count_tasks, list_tasks_page
+from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+BASE_DUE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[TaskRecord.__table__])
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        # Due dates repeat and some are missing, to exercise the tie-breaker
+        session.add_all(
+            TaskRecord(
+                title=f"task {index}",
+                channel="web" if index % 2 else "whatsapp",
+                sender="tester",
+                status=TaskStatus.COMPLETED if index % 3 == 0 else TaskStatus.PENDING,
+                due_date=None if index % 4 == 0 else BASE_DUE + timedelta(days=index % 3),
+            )
+            for index in range(1, 14)
+        )
+        await session.flush()
+        yield session
+    await engine.dispose()
+
+
+async def _walk(session, sort: str, limit: int = 3, **filters) -> list[TaskRecord]:
+    seen: list[TaskRecord] = []
+    after = None
+    while True:
+        page = await list_tasks_page(session, limit=limit, sort=sort, after=after, **filters)
+        seen.extend(page)
+        if len(page) < limit:
+            return seen
+        after = (page[-1].due_date, page[-1].id)
+
+
+async def test_count_tasks_uses_filters(session):
+    assert await count_tasks(session) == (13, False)
+    assert await count_tasks(session, channel="web") == (7, False)
+    assert await count_tasks(session, status=TaskStatus.COMPLETED, channel="web") == (2, False)
+
+
+async def test_approximate_count_is_exact_off_postgres(session):
+    assert await count_tasks(session, approximate=True) == (13, False)
+
+
+async def test_keyset_by_id_matches_offset_order(session):
+    walked = await _walk(session, "id")
+
+    assert [task.id for task in walked] == list(range(13, 0, -1))
+
+
+async def test_keyset_by_due_date_visits_every_task_once(session):
+    walked = await _walk(session, "due_date")
+
+    expected = sorted(
+        walked, key=lambda task: (task.due_date is None, task.due_date or BASE_DUE, task.id)
+    )
+    assert len(walked) == 13
+    assert [task.id for task in walked] == [task.id for task in expected]
+    assert [task.id for task in walked[-3:]] == [4, 8, 12]  # undated tasks come last
+
+
+async def test_due_date_offset_continues_into_undated_tail(session):
+    walked = await _walk(session, "due_date")
+
+    for offset in (0, 8, 10, 11, 13):
+        page = await list_tasks_page(session, limit=3, sort="due_date", offset=offset)
+        assert [task.id for task in page] == [task.id for task in walked[offset : offset + 3]]
+
+
+async def test_keyset_respects_filters(session):
+    walked = await _walk(session, "due_date", limit=2, channel="web")
+
+    assert sorted(task.id for task in walked) == list(range(1, 14, 2))
@@ -0,0 +1,59 @@
+"""Tests for the request-scoped unit of work shared by FastAPI dependencies."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+import pytest
+from app.api.dependencies import get_ingestion_service
+from app.domain.services.ingestion import IngestionService
+from app.infrastructure.database import database
+from app.infrastructure.database.database import get_db_session
+from app.infrastructure.database.models.base import Base
+from app.infrastructure.database.models.memory import ConversationMessage
+from app.infrastructure.database.models.message import ChannelMessageORM
+from app.models.schemas import Channel, ChannelMessage
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "uow.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(
+        sync_engine, tables=[ChannelMessageORM.__table__, ConversationMessage.__table__]
+    )
+    sync_engine.dispose()
+    monkeypatch.setattr(database, "_engine", create_async_engine(f"sqlite+aiosqlite:///{path}"))
+    monkeypatch.setattr(database, "_session_factory", None)
+    monkeypatch.setattr("app.api.dependencies.get_ingestion_lanes", lambda: None)
+    return path
+
+
+def test_ingestion_shares_request_session_and_commits_once(db_path):
+    app = FastAPI()
+    commits: list[int] = []
+
+    @app.post("/messages")
+    async def post_message(
+        ingestion: Annotated[IngestionService, Depends(get_ingestion_service)],
+        session: Annotated[AsyncSession, Depends(get_db_session)],
+    ) -> dict:
+        event.listen(session.sync_session, "after_commit", lambda _: commits.append(1))
+        assert ingestion._session is session
+        await ingestion.ingest(ChannelMessage(channel=Channel.WEB, sender="me", content="hi"))
+        # The request's own reads see the flushed, not yet committed rows
+        return {"messages": await session.scalar(select(func.count(ChannelMessageORM.id)))}
+
+    with TestClient(app) as client:
+        assert client.post("/messages").json() == {"messages": 1}
+
+    sync_engine = create_engine(f"sqlite:///{db_path}")
+    with sync_engine.connect() as conn:
+        assert conn.scalar(select(func.count(ChannelMessageORM.id))) == 1
+        assert conn.scalar(select(func.count(ConversationMessage.id))) == 1
+    sync_engine.dispose()
+    assert commits == [1]
@@ -0,0 +1,85 @@
+"""Unit tests for the shared Google API service factory and executor."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from app.core.metrics import GOOGLE_API_EXECUTOR_TASKS
+from app.infrastructure.integrations import google_api
+from app.infrastructure.integrations.google_api import GoogleService, get_google_service
+
+
+class FakeBatch:
+    def __init__(self, callback) -> None:
+        self._callback = callback
+        self._requests: list[tuple[str, MagicMock]] = []
+
+    def add(self, request, request_id: str) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self, http) -> None:
+        # Responses arrive out of order, as they may from the batch endpoint
+        for request_id, request in reversed(self._requests):
+            if request.fail:
+                self._callback(request_id, None, RuntimeError(request.name))
+            else:
+                self._callback(request_id, {"name": request.name}, None)
+
+
+def _request(name: str, fail: bool = False) -> MagicMock:
+    request = MagicMock()
+    request.name = name
+    request.fail = fail
+    return request
+
+
+@pytest.fixture
+def service():
+    resource = MagicMock()
+    resource.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback)
+    with patch.object(google_api, "google_auth_httplib2"):
+        yield GoogleService(resource, credentials=MagicMock())
+
+
+def _gauge(state: str) -> float:
+    return GOOGLE_API_EXECUTOR_TASKS.labels(state=state)._value.get()
+
+
+class TestGoogleService:
+    async def test_execute_runs_on_google_executor(self, service):
+        request = MagicMock()
+        request.execute.side_effect = lambda http: threading.current_thread().name
+
+        thread_name = await service.execute(request)
+
+        assert thread_name.startswith("google-api")
+        assert _gauge("queued") == 0
+        assert _gauge("running") == 0
+
+    async def test_execute_batch_keeps_order_and_errors(self, service, monkeypatch):
+        monkeypatch.setattr(google_api, "BATCH_LIMIT", 2)
+        requests = [_request("a"), _request("b", fail=True), _request("c")]
+
+        results = await service.execute_batch(requests)
+
+        assert results[0] == {"name": "a"}
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == {"name": "c"}
+        assert service.resource.new_batch_http_request.call_count == 2
+
+
+def test_get_google_service_builds_once():
+    get_google_service.cache_clear()
+    with (
+        patch.object(google_api, "load_credentials") as load_credentials,
+        patch.object(google_api, "build") as build,
+    ):
+        first = get_google_service("sheets", "v4", "/creds.json", ("scope",))
+        second = get_google_service("sheets", "v4", "/creds.json", ("scope",))
+
+    assert first is second
+    build.assert_called_once()
+    load_credentials.assert_called_once_with("/creds.json", ("scope",))
+    get_google_service.cache_clear()
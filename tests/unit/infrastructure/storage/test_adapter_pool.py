@@ -0,0 +1,71 @@
+"""Unit tests for the process-wide storage adapter pool - ADR-014."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from app.infrastructure.storage.pool import StorageAdapterPool, config_version
+
+
+def _adapter(name: str = "notion") -> MagicMock:
+    adapter = MagicMock()
+    adapter.name = name
+    adapter.close = AsyncMock()
+    return adapter
+
+
+class TestConfigVersion:
+    def test_version_is_stable_and_tracks_changes(self):
+        first = config_version("notion", {"api_key": "a", "database_id": "db"})
+        reordered = config_version("notion", {"database_id": "db", "api_key": "a"})
+        changed = config_version("notion", {"api_key": "b", "database_id": "db"})
+
+        assert first == reordered
+        assert first != changed
+
+
+class TestStorageAdapterPool:
+    async def test_reuses_adapter_for_same_version(self):
+        pool = StorageAdapterPool()
+        factory = MagicMock(side_effect=lambda: _adapter())
+
+        first = pool.get("cfg-1", "v1", factory)
+        second = pool.get("cfg-1", "v1", factory)
+
+        assert first is second
+        assert factory.call_count == 1
+
+    async def test_new_version_rebuilds_and_closes_old_adapter(self):
+        pool = StorageAdapterPool(close_grace=0)
+        old = pool.get("cfg-1", "v1", _adapter)
+
+        new = pool.get("cfg-1", "v2", _adapter)
+        await asyncio.sleep(0.01)
+
+        assert new is not old
+        old.close.assert_awaited_once()
+        new.close.assert_not_awaited()
+
+    async def test_invalidate_evicts_and_closes(self):
+        pool = StorageAdapterPool(close_grace=0)
+        adapter = pool.get("cfg-1", "v1", _adapter)
+
+        assert await pool.invalidate("cfg-1") is True
+        await asyncio.sleep(0.01)
+
+        adapter.close.assert_awaited_once()
+        assert len(pool) == 0
+        assert await pool.invalidate("cfg-1") is False
+
+    async def test_close_all_closes_pooled_and_retiring(self):
+        pool = StorageAdapterPool(close_grace=60)
+        retiring = pool.get("cfg-1", "v1", _adapter)
+        pool.get("cfg-1", "v2", _adapter)
+        other = pool.get("cfg-2", "v1", _adapter)
+
+        await pool.close_all()
+
+        retiring.close.assert_awaited_once()
+        other.close.assert_awaited_once()
+        assert len(pool) == 0
@@ -8,7 +8,7 @@ Related: ADR-014 (Storage Adapter Pattern), RF-019
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -417,6 +417,23 @@ class TestClickUpAdapterPayloadBuilder:
             payload = adapter._build_clickup_payload(task)
             assert payload["status"] == clickup_status
 
+    def test_build_payload_only_changed_fields(self, valid_config, mock_httpx_client):
+        """Test payload builder sends only changed fields and clears emptied ones."""
+        mock_httpx_client.return_value = AsyncMock()
+
+        adapter = ClickUpAdapter(valid_config)
+        task = TaskRecord(
+            id=uuid4(),
+            title="Test",
+            status="completed",
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+
+        payload = adapter._build_clickup_payload(task, {"status", "description"})
+
+        assert payload == {"status": "complete", "description": ""}
+
     def test_build_payload_priority_mapping(self, valid_config, mock_httpx_client):
         """Test correct priority mapping to ClickUp priority values."""
         mock_httpx_client.return_value = AsyncMock()
@@ -504,8 +521,65 @@ class TestClickUpAdapterTaskParser:
         task = adapter._parse_clickup_task(clickup_data)
 
         assert task.title == "Minimal Task"
-        assert task.status == "pending"  # default
-        assert task.priority == "medium"  # default
+        assert task.status == "todo"  # default
+        assert task.priority is None
+
+    def test_parse_clickup_priority_object(self, valid_config, mock_httpx_client):
+        """Test the priority object returned by the API is mapped back."""
+        mock_httpx_client.return_value = AsyncMock()
+
+        adapter = ClickUpAdapter(valid_config)
+        clickup_data = {
+            "id": "cu_priority",
+            "name": "Urgent Task",
+            "priority": {"id": "1", "priority": "urgent", "color": "#f50000"},
+        }
+
+        assert adapter._parse_clickup_task(clickup_data).priority == "high"
+
+    @pytest.mark.parametrize(
+        ("status", "priority", "due_date"),
+        [
+            (TaskStatus.TODO, None, None),
+            (TaskStatus.PENDING, "low", datetime(2025, 3, 1, 15, 30, 0, 123456)),
+            (TaskStatus.IN_PROGRESS, "high", datetime(2025, 3, 1, 15, 30, tzinfo=UTC)),
+            (TaskStatus.COMPLETED, "medium", None),
+            (TaskStatus.CANCELLED, "urgent", None),
+        ],
+    )
+    def test_read_back_task_projects_like_the_local_one(
+        self, valid_config, mock_httpx_client, status, priority, due_date
+    ):
+        """Test a written task parses back to the same projection (reconciliation)."""
+        mock_httpx_client.return_value = AsyncMock()
+
+        adapter = ClickUpAdapter(valid_config)
+        task = TaskRecord(
+            title="Round trip",
+            description=None,
+            status=status,
+            priority=priority,
+            due_date=due_date,
+        )
+        payload = adapter._build_clickup_payload(task)
+        # What the API returns for the task created from that payload
+        names = {1: "urgent", 2: "high", 3: "normal", 4: "low"}
+        clickup_data = {
+            "id": "cu_round_trip",
+            "name": payload["name"],
+            "description": "",
+            "status": {"status": payload["status"], "type": "open"},
+            "priority": (
+                {"id": str(payload["priority"]), "priority": names[payload["priority"]]}
+                if "priority" in payload
+                else None
+            ),
+            "due_date": str(payload["due_date"]) if "due_date" in payload else None,
+        }
+
+        read_back = adapter._parse_clickup_task(clickup_data)
+
+        assert adapter.project_task(read_back) == adapter.project_task(task)
 
 
 __all__ = [
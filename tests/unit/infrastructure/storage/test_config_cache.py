@@ -0,0 +1,104 @@
+"""Unit tests for the per-user storage config cache - ADR-014."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from app.infrastructure.storage.config_cache import StorageConfigCache, StorageConfigSnapshot
+from app.infrastructure.storage.pool import StorageAdapterPool
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _config(config_id: str, adapter_name: str = "notion", priority: int = 0):
+    return StorageConfigSnapshot(config_id, adapter_name, {"key": config_id}, priority)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def adapter_class():
+    def _build(config):
+        if config.get("key") == "broken":
+            raise ValueError("missing api_key")
+        adapter = MagicMock()
+        adapter.name = config["key"]
+        adapter.close = AsyncMock()
+        return adapter
+
+    factory = MagicMock(side_effect=_build)
+    with patch(
+        "app.infrastructure.storage.config_cache.StorageAdapterRegistry.get_adapter",
+        return_value=factory,
+    ):
+        yield factory
+
+
+def _cache(clock, configs, **kwargs) -> tuple[StorageConfigCache, AsyncMock]:
+    loader = AsyncMock(side_effect=lambda session, user_id: configs)
+    cache = StorageConfigCache(
+        adapter_pool=StorageAdapterPool(close_grace=0), loader=loader, clock=clock, **kwargs
+    )
+    return cache, loader
+
+
+class TestStorageConfigCache:
+    async def test_loads_once_per_ttl_and_user(self, clock, adapter_class):
+        cache, loader = _cache(clock, [_config("a", priority=2), _config("b")], ttl=60)
+
+        first = await cache.get_adapters(None, "user-1")
+        second = await cache.get_adapters(None, "user-1")
+        await cache.get_adapters(None, "user-2")
+
+        assert [(adapter.name, priority) for adapter, priority in first] == [("a", 2), ("b", 0)]
+        assert [adapter for adapter, _ in second] == [adapter for adapter, _ in first]
+        assert loader.await_count == 2
+        assert adapter_class.call_count == 2
+
+        clock.now = 61
+        await cache.get_adapters(None, "user-1")
+        assert loader.await_count == 3
+
+    async def test_concurrent_misses_share_one_query(self, clock, adapter_class):
+        cache, loader = _cache(clock, [_config("a")])
+
+        results = await asyncio.gather(*(cache.get_configs(None, None) for _ in range(5)))
+
+        assert loader.await_count == 1
+        assert all(result == results[0] for result in results)
+
+    async def test_invalidate_forces_reload(self, clock, adapter_class):
+        cache, loader = _cache(clock, [_config("a")])
+        await cache.get_configs(None, "user-1")
+
+        cache.invalidate("user-1")
+        await cache.get_configs(None, "user-1")
+
+        assert loader.await_count == 2
+
+    async def test_broken_config_backs_off(self, clock, adapter_class):
+        cache, _ = _cache(clock, [_config("broken"), _config("a")], failure_backoff=10)
+
+        assert [a.name for a, _ in await cache.get_adapters(None, None)] == ["a"]
+        assert [a.name for a, _ in await cache.get_adapters(None, None)] == ["a"]
+        assert adapter_class.call_count == 2  # broken built once, "a" once
+
+        clock.now = 11
+        await cache.get_adapters(None, None)
+        assert adapter_class.call_count == 3
+
+        # Second failure doubles the backoff
+        clock.now = 25
+        await cache.get_adapters(None, None)
+        assert adapter_class.call_count == 3
@@ -8,13 +8,14 @@ Related: ADR-014 (Storage Adapter Pattern), RF-019
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import httpx
 import pytest
 
-from app.domain.interfaces.storage_adapter import StorageAdapterError
+from app.domain.interfaces.storage_adapter import StorageAdapterError, StorageBatchError
 from app.infrastructure.database.models.tasks import TaskRecord, TaskStatus
 from app.infrastructure.storage.adapters.notion_adapter import NotionAdapter
 
@@ -176,14 +177,69 @@ class TestNotionAdapterUpdateTask:
     """Tests for NotionAdapter.update_task() method."""
 
     @pytest.mark.asyncio
-    async def test_update_task_not_implemented(self, valid_config, sample_task, mock_notion_client):
-        """Test update_task returns False (not implemented yet)."""
-        mock_notion_client.return_value = AsyncMock()
+    async def test_update_task_patches_page(self, valid_config, sample_task, mock_notion_client):
+        """Test update_task patches the page properties."""
+        mock_client = AsyncMock()
+        mock_notion_client.return_value = mock_client
 
         adapter = NotionAdapter(valid_config)
         result = await adapter.update_task("notion-page-id", sample_task)
 
-        assert result is False
+        assert result is True
+        page_id, payload = mock_client.update_page.await_args.args
+        assert page_id == "notion-page-id"
+        assert "parent" not in payload
+        assert payload["properties"]["Name"]["title"][0]["text"]["content"] == sample_task.title
+
+    @pytest.mark.asyncio
+    async def test_update_task_not_found(self, valid_config, sample_task, mock_notion_client):
+        """Test update_task returns False when the page is gone."""
+        response = httpx.Response(404, request=httpx.Request("PATCH", "https://api.notion.com"))
+        mock_client = AsyncMock()
+        mock_client.update_page.side_effect = httpx.HTTPStatusError(
+            "not found", request=response.request, response=response
+        )
+        mock_notion_client.return_value = mock_client
+
+        adapter = NotionAdapter(valid_config)
+
+        assert await adapter.update_task("notion-page-id", sample_task) is False
+
+
+class TestNotionAdapterBatch:
+    """Tests for NotionAdapter batch operations."""
+
+    @pytest.mark.asyncio
+    async def test_batch_save_tasks_keeps_order(self, valid_config, mock_notion_client):
+        """Test batch_save_tasks returns page IDs in input order."""
+        mock_client = AsyncMock()
+        mock_client.create_page.side_effect = lambda payload: {
+            "id": payload["properties"]["Name"]["title"][0]["text"]["content"]
+        }
+        mock_notion_client.return_value = mock_client
+        tasks = [TaskRecord(title=f"task-{i}", status="pending") for i in range(5)]
+
+        adapter = NotionAdapter(valid_config)
+
+        assert await adapter.supports_batch_operations() is True
+        assert await adapter.batch_save_tasks(tasks) == [f"task-{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_batch_save_tasks_reports_partial_failure(
+        self, valid_config, mock_notion_client
+    ):
+        """Test a failed page does not discard the IDs already assigned."""
+        mock_client = AsyncMock()
+        mock_client.create_page.side_effect = [{"id": "page-1"}, RuntimeError("boom")]
+        mock_notion_client.return_value = mock_client
+        tasks = [TaskRecord(title="a", status="pending"), TaskRecord(title="b", status="pending")]
+
+        adapter = NotionAdapter(valid_config)
+        with pytest.raises(StorageBatchError) as exc_info:
+            await adapter.batch_save_tasks(tasks)
+
+        assert exc_info.value.results == ["page-1", None]
+        assert set(exc_info.value.errors) == {1}
 
 
 class TestNotionAdapterDeleteTask:
@@ -338,6 +394,26 @@ class TestNotionAdapterPayloadBuilder:
             payload = adapter._build_notion_payload(task)
             assert payload["properties"]["Priority"]["select"]["name"] == notion_priority
 
+    def test_build_payload_only_changed_fields(self, valid_config, mock_notion_client):
+        """Test payload builder sends only changed properties and clears emptied ones."""
+        mock_notion_client.return_value = AsyncMock()
+
+        adapter = NotionAdapter(valid_config)
+        task = TaskRecord(
+            id=uuid4(),
+            title="Test",
+            status=TaskStatus.COMPLETED,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+
+        payload = adapter._build_notion_payload(task, {"status", "due_date"})
+
+        assert payload["properties"] == {
+            "Status": {"status": {"name": "Done"}},
+            "Due": {"date": None},
+        }
+
 
 __all__ = [
     "TestNotionAdapterInitialization",
@@ -8,7 +8,7 @@ Related: ADR-014 (Storage Adapter Pattern), RF-019
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timezone
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
@@ -165,37 +165,161 @@ class TestGoogleSheetsAdapterUpdateTask:
     """Tests for GoogleSheetsAdapter.update_task() method."""
 
     @pytest.mark.asyncio
-    async def test_update_task_not_implemented(self, valid_config, sample_task, mock_sheets_client):
-        """Test update_task returns False (not implemented yet)."""
-        mock_sheets_client.return_value = AsyncMock()
+    async def test_update_task_writes_indexed_row(
+        self, valid_config, sample_task, mock_sheets_client
+    ):
+        """Test update_task builds the row index once and writes only that row."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.list_rows.return_value = [["row_a"], ["row_123"]]
+        mock_sheets_client.return_value = mock_client_instance
+
+        adapter = GoogleSheetsAdapter(valid_config)
+        assert await adapter.update_task("row_123", sample_task) is True
+        assert await adapter.update_task("row_a", sample_task) is True
+
+        mock_client_instance.list_rows.assert_awaited_once_with("1abc123xyz", "Tasks!A2:A")
+        spreadsheet_id, range_name, rows = mock_client_instance.update_values.await_args_list[
+            0
+        ].args
+        assert (spreadsheet_id, range_name) == ("1abc123xyz", "Tasks!A3:F3")
+        assert rows[0][:2] == ["row_123", sample_task.title]
+
+    @pytest.mark.asyncio
+    async def test_update_task_not_found(self, valid_config, sample_task, mock_sheets_client):
+        """Test update_task returns False when the row ID is not in the sheet."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.list_rows.return_value = [["row_a"]]
+        mock_sheets_client.return_value = mock_client_instance
 
         adapter = GoogleSheetsAdapter(valid_config)
         result = await adapter.update_task("row_123", sample_task)
 
         assert result is False
+        mock_client_instance.update_values.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_index_tracks_appended_rows(
+        self, valid_config, sample_task, mock_sheets_client
+    ):
+        """Test rows appended by the adapter are indexed from the append response."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.list_rows.return_value = [["row_a"]]
+        mock_client_instance.append_row.return_value = {
+            "updates": {"updatedRange": "Tasks!A3:G3"}
+        }
+        mock_sheets_client.return_value = mock_client_instance
+
+        adapter = GoogleSheetsAdapter(valid_config)
+        await adapter.update_task("row_a", sample_task)
+        row_id = await adapter.save_task(sample_task)
+        assert await adapter.update_task(row_id, sample_task) is True
+
+        mock_client_instance.list_rows.assert_awaited_once()
+        assert mock_client_instance.update_values.await_args.args[1] == "Tasks!A3:F3"
+
+
+class TestGoogleSheetsAdapterBatch:
+    """Tests for GoogleSheetsAdapter batch operations."""
+
+    @pytest.mark.asyncio
+    async def test_batch_save_tasks_single_append(self, valid_config, mock_sheets_client):
+        """Test batch_save_tasks appends every row in one API call."""
+        mock_client_instance = AsyncMock()
+        mock_sheets_client.return_value = mock_client_instance
+        tasks = [TaskRecord(title=f"task-{i}", status="pending") for i in range(3)]
+
+        adapter = GoogleSheetsAdapter(valid_config)
+        row_ids = await adapter.batch_save_tasks(tasks)
+
+        assert len(set(row_ids)) == 3
+        mock_client_instance.append_rows.assert_awaited_once()
+        spreadsheet_id, range_name, rows = mock_client_instance.append_rows.await_args.args
+        assert (spreadsheet_id, range_name) == ("1abc123xyz", "Tasks!A:G")
+        assert [row[0] for row in rows] == row_ids
+        assert [row[1] for row in rows] == ["task-0", "task-1", "task-2"]
+
+    @pytest.mark.asyncio
+    async def test_batch_update_tasks_single_batch_update(
+        self, valid_config, mock_sheets_client
+    ):
+        """Test batch_update_tasks locates rows once and writes them in one call."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.list_rows.return_value = [["row_a"], [], ["row_b"]]
+        mock_sheets_client.return_value = mock_client_instance
+        task = TaskRecord(title="renamed", status="completed")
+
+        adapter = GoogleSheetsAdapter(valid_config)
+        result = await adapter.batch_update_tasks(
+            [("row_b", task), ("row_missing", task), ("row_a", task)]
+        )
+
+        assert result == [True, False, True]
+        mock_client_instance.list_rows.assert_awaited_once_with("1abc123xyz", "Tasks!A2:A")
+        _, data = mock_client_instance.batch_update_values.await_args.args
+        assert [block["range"] for block in data] == ["Tasks!A4:F4", "Tasks!A2:F2"]
+        assert data[0]["values"][0][:4] == ["row_b", "renamed", "", "completed"]
 
 
 class TestGoogleSheetsAdapterDeleteTask:
     """Tests for GoogleSheetsAdapter.delete_task() method."""
 
     @pytest.mark.asyncio
-    async def test_delete_task_not_implemented(self, valid_config, mock_sheets_client):
-        """Test delete_task returns False (not implemented yet)."""
-        mock_sheets_client.return_value = AsyncMock()
+    async def test_delete_task_removes_row_and_shifts_index(
+        self, valid_config, sample_task, mock_sheets_client
+    ):
+        """Test delete_task deletes the row and later lookups use shifted rows."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.list_rows.return_value = [["row_a"], ["row_b"], ["row_c"]]
+        mock_client_instance.get_sheet_id.return_value = 7
+        mock_sheets_client.return_value = mock_client_instance
+
+        adapter = GoogleSheetsAdapter(valid_config)
+        assert await adapter.delete_task("row_b") is True
+        assert await adapter.update_task("row_c", sample_task) is True
+
+        mock_client_instance.delete_rows.assert_awaited_once_with("1abc123xyz", 7, [3])
+        assert mock_client_instance.update_values.await_args.args[1] == "Tasks!A3:F3"
+        mock_client_instance.list_rows.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_task_not_found(self, valid_config, mock_sheets_client):
+        """Test delete_task returns False when the row ID is not in the sheet."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.list_rows.return_value = []
+        mock_sheets_client.return_value = mock_client_instance
 
         adapter = GoogleSheetsAdapter(valid_config)
         result = await adapter.delete_task("row_123")
 
         assert result is False
+        mock_client_instance.delete_rows.assert_not_awaited()
 
 
 class TestGoogleSheetsAdapterGetTask:
     """Tests for GoogleSheetsAdapter.get_task() method."""
 
     @pytest.mark.asyncio
-    async def test_get_task_not_implemented(self, valid_config, mock_sheets_client):
-        """Test get_task returns None (not implemented yet)."""
-        mock_sheets_client.return_value = AsyncMock()
+    async def test_get_task_reads_indexed_row(self, valid_config, mock_sheets_client):
+        """Test get_task reads and parses only the indexed row."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.list_rows.side_effect = [
+            [["row_a"], ["row_123"]],
+            [["row_123", "Indexed", "", "completed", "high", "", ""]],
+        ]
+        mock_sheets_client.return_value = mock_client_instance
+
+        adapter = GoogleSheetsAdapter(valid_config)
+        task = await adapter.get_task("row_123")
+
+        assert task.title == "Indexed"
+        assert mock_client_instance.list_rows.await_args.args == ("1abc123xyz", "Tasks!A3:G3")
+
+    @pytest.mark.asyncio
+    async def test_get_task_not_found(self, valid_config, mock_sheets_client):
+        """Test get_task returns None when the row ID is not in the sheet."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.list_rows.return_value = []
+        mock_sheets_client.return_value = mock_client_instance
 
         adapter = GoogleSheetsAdapter(valid_config)
         result = await adapter.get_task("row_123")
@@ -350,7 +474,7 @@ class TestGoogleSheetsAdapterRowBuilder:
         assert row[1] == "Minimal Task"
         assert row[2] == ""  # No description
         assert row[3] == "todo"
-        assert row[4] == "medium"  # Default priority
+        assert row[4] == ""  # No priority
         assert row[5] == ""  # No due date
 
 
@@ -395,7 +519,7 @@ class TestGoogleSheetsAdapterRowParser:
         assert task.external_id == "row_min"
         assert task.title == "Minimal"
         assert task.status == "pending"  # default
-        assert task.priority == "medium"  # default
+        assert task.priority is None
         assert task.due_date is None
 
     def test_parse_row_with_empty_fields(self, valid_config, mock_sheets_client):
@@ -410,7 +534,33 @@ class TestGoogleSheetsAdapterRowParser:
         assert task.title == "Task"
         assert task.description is None
         assert task.status == "pending"
-        assert task.priority == "medium"
+        assert task.priority is None
+
+    @pytest.mark.parametrize(
+        ("status", "priority", "due_date"),
+        [
+            (TaskStatus.TODO, None, None),
+            (TaskStatus.PENDING, "low", datetime(2025, 3, 1, 15, 30, 0, 123456)),
+            (TaskStatus.COMPLETED, "high", datetime(2025, 3, 1, 15, 30, tzinfo=UTC)),
+        ],
+    )
+    def test_read_back_row_projects_like_the_local_task(
+        self, valid_config, mock_sheets_client, status, priority, due_date
+    ):
+        """Test a written row parses back to the same projection (reconciliation)."""
+        mock_sheets_client.return_value = AsyncMock()
+
+        adapter = GoogleSheetsAdapter(valid_config)
+        task = TaskRecord(
+            title="Round trip", description="", status=status, priority=priority, due_date=due_date
+        )
+        row = adapter._build_sheets_row(task, "row_round_trip")
+        # USER_ENTERED keeps apostrophe-prefixed text as typed, without the apostrophe
+        stored = [value[1:] if str(value).startswith("'") else value for value in row]
+
+        read_back = adapter._parse_sheets_row(stored)
+
+        assert adapter.project_task(read_back) == adapter.project_task(task)
 
     def test_parse_row_invalid_date(self, valid_config, mock_sheets_client):
         """Test parsing row with invalid date format."""
@@ -0,0 +1,117 @@
+"""Unit tests for the adaptive storage backend throttle."""
+
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+from app.infrastructure.storage.throttle import (
+    AdaptiveThrottle,
+    rate_limit_delay,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _throttle(clock: FakeClock, rate: float = 2.0, **kwargs) -> AdaptiveThrottle:
+    return AdaptiveThrottle("test", rate, clock=clock, wall_clock=clock, **kwargs)
+
+
+class TestRetryAfter:
+    def test_parses_seconds_and_http_date(self):
+        assert retry_after_seconds({"retry-after": "2.5"}) == 2.5
+        assert retry_after_seconds({}) is None
+        in_ten = formatdate(time.time() + 10, usegmt=True)
+        assert 8 <= retry_after_seconds({"retry-after": in_ten}) <= 10
+
+    def test_rate_limit_delay_only_for_429(self):
+        request = httpx.Request("GET", "https://api.example.com")
+
+        def error(status: int, headers: dict[str, str]) -> httpx.HTTPStatusError:
+            response = httpx.Response(status, headers=headers, request=request)
+            return httpx.HTTPStatusError("error", request=request, response=response)
+
+        assert rate_limit_delay(error(429, {"Retry-After": "3"})) == 3.0
+        assert rate_limit_delay(error(429, {})) == 0.0
+        assert rate_limit_delay(error(500, {"Retry-After": "3"})) is None
+        assert rate_limit_delay(RuntimeError("boom")) is None
+
+
+class TestAdaptiveThrottle:
+    def test_429_halves_rate_and_pauses(self, clock):
+        throttle = _throttle(clock, rate=2.0)
+
+        throttle.observe(429, {"retry-after": "7"})
+
+        assert throttle.rate == 1.0
+        assert throttle.paused_for == 7
+
+    def test_rate_follows_remaining_budget(self, clock):
+        throttle = _throttle(clock, rate=1.0)
+
+        throttle.observe(
+            200, {"x-ratelimit-remaining": "50", "x-ratelimit-reset": str(clock.now + 10)}
+        )
+
+        assert throttle.rate == pytest.approx(50 / 10 * 0.9)
+
+    def test_exhausted_budget_pauses_until_reset(self, clock):
+        throttle = _throttle(clock)
+
+        throttle.observe(
+            200, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(clock.now + 30)}
+        )
+
+        assert throttle.paused_for == 30
+
+    def test_additive_increase_is_capped(self, clock):
+        throttle = _throttle(clock, rate=1.0, max_rate=1.1, increase=0.05)
+
+        throttle.observe(200, {})
+        assert throttle.rate == pytest.approx(1.05)
+        for _ in range(5):
+            throttle.observe(200, {})
+        assert throttle.rate == pytest.approx(1.1)
+
+    async def test_acquire_paces_requests(self):
+        throttle = AdaptiveThrottle("test", rate=50.0)
+
+        started = time.monotonic()
+        for _ in range(5):
+            await throttle.acquire()
+
+        # First token is banked; the next four wait 1/50s each
+        assert time.monotonic() - started >= 0.07
+
+    async def test_event_hooks_learn_from_responses(self):
+        throttle = AdaptiveThrottle("test", rate=10.0)
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "0.05"}),
+                httpx.Response(200),
+            ]
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: next(responses)),
+            event_hooks=throttle.event_hooks(),
+        ) as client:
+            assert (await client.get("https://api.example.com/")).status_code == 429
+            assert throttle.rate == 5.0
+            started = time.monotonic()
+            assert (await client.get("https://api.example.com/")).status_code == 200
+
+        assert time.monotonic() - started >= 0.04